@@ -67,6 +67,8 @@ from orchestrator.core import Orchestrator
 from orchestrator.registry import ModuleRegistry, ModuleFactory
 from orchestrator.pipeline import PipelineBuilder
 from orchestrator.cli import create_parser, validate_args, build_config, print_banner
+from monitoring.alerts import AlertManager
+from monitoring.notifications.queue import NotificationQueue
 
 
 # ============================================================
@@ -95,6 +97,7 @@ def wire_modules(orchestrator: Orchestrator, config: Dict[str, Any]) -> None:
     from database.database_module import DatabaseModule
     from data_ingestion.real_ingestion_module import RealIngestionModule
     from data_processing.processing_module import ProcessingPipelineModule
+    from data_processing.state_cache import get_market_state_cache
     from risk_scoring.engine import RiskScoringEngine
     from risk_budget_manager.engine import RiskBudgetManager
     from risk_committee.engine import RiskCommitteeEngine
@@ -104,6 +107,7 @@ def wire_modules(orchestrator: Orchestrator, config: Dict[str, Any]) -> None:
     from execution_engine.execution_service import ExecutionService
     from monitoring.dashboard_service import DashboardService
     from monitoring.notifications.telegram import TelegramNotifier
+    from monitoring.metrics import get_metrics_collector
     
     # --------------------------------------------------------
     # Core Infrastructure Modules
@@ -159,6 +163,11 @@ def wire_modules(orchestrator: Orchestrator, config: Dict[str, Any]) -> None:
         timeout_seconds=180.0,
     )
     
+    # Latest market state cache hit/miss counters
+    get_metrics_collector().register_source(
+        "market_state_cache", get_market_state_cache().metric_values
+    )
+    
     # --------------------------------------------------------
     # Risk Modules
     # --------------------------------------------------------
@@ -307,7 +316,10 @@ def wire_modules(orchestrator: Orchestrator, config: Dict[str, Any]) -> None:
     orchestrator.log_module_registration_summary()
 
 
-def wire_stage_handlers(orchestrator: Orchestrator) -> None:
+def wire_stage_handlers(
+    orchestrator: Orchestrator,
+    alert_manager: Optional[AlertManager] = None,
+) -> None:
     """
     Wire stage handlers to the orchestrator.
     
@@ -316,6 +328,7 @@ def wire_stage_handlers(orchestrator: Orchestrator) -> None:
     
     Args:
         orchestrator: The orchestrator instance
+        alert_manager: Alert rules evaluated during monitoring (optional)
     """
     logger = logging.getLogger(__name__)
     
@@ -483,9 +496,18 @@ def wire_stage_handlers(orchestrator: Orchestrator) -> None:
     async def handle_trade_guard() -> Dict[str, Any]:
         """Run trade guard absolute."""
         guard = orchestrator.registry.get_instance("trade_guard")
-        # In production: decision = guard.evaluate(guard_input)
-        logger.info("Trade guard check complete")
-        return {"guard_passed": True}
+        cycle_id = getattr(orchestrator, 'current_cycle_id', None) or ""
+
+        # Memoized guard results never outlive this stage
+        if guard and hasattr(guard, 'begin_cycle'):
+            guard.begin_cycle(cycle_id)
+        try:
+            # In production: decision = guard.evaluate(guard_input)
+            logger.info("Trade guard check complete")
+            return {"guard_passed": True}
+        finally:
+            if guard and hasattr(guard, 'end_cycle'):
+                guard.end_cycle()
     
     async def handle_risk_controller() -> Dict[str, Any]:
         """Run system risk controller."""
@@ -560,9 +582,24 @@ def wire_stage_handlers(orchestrator: Orchestrator) -> None:
     async def handle_monitoring() -> Dict[str, Any]:
         """Update monitoring state."""
         monitoring = orchestrator.registry.get_instance("monitoring")
-        # In production: update dashboard metrics
+        alerts_triggered = 0
+        
+        # Evaluate alert rules; delivery is queued, not awaited
+        if alert_manager is not None and monitoring and hasattr(monitoring, 'get_overview'):
+            try:
+                overview = await monitoring.get_overview()
+                alerts = await alert_manager.evaluate({
+                    "system_state": overview.system_state,
+                    "risk_exposure": overview.risk_exposure,
+                    "module_health": overview.module_health,
+                    "data_sources": overview.data_sources,
+                })
+                alerts_triggered = len(alerts)
+            except Exception as e:
+                logger.warning(f"Alert evaluation failed: {e}")
+        
         logger.info("Monitoring state updated")
-        return {"monitoring_updated": True}
+        return {"monitoring_updated": True, "alerts_triggered": alerts_triggered}
     
     # --------------------------------------------------------
     # Register Handlers
@@ -644,6 +681,34 @@ def _create_placeholder_module(name: str) -> type:
     return PlaceholderModule
 
 
+# ============================================================
+# ALERT NOTIFICATIONS
+# ============================================================
+
+async def start_alert_notifications(
+    orchestrator: Orchestrator,
+    alert_manager: AlertManager,
+) -> Optional[NotificationQueue]:
+    """
+    Register a started NotificationQueue as the AlertManager's Telegram handler.
+    
+    AlertManager.evaluate hands alerts to the queue and returns at
+    once; the queue's sender waits out Telegram rate limits. Call
+    after the orchestrator has started its modules.
+    
+    Returns:
+        The running queue, or None without a Telegram notifier
+    """
+    notifier = orchestrator.registry.get_instance("telegram_notifier")
+    if notifier is None or not hasattr(notifier, 'should_send'):
+        return None
+    
+    queue = NotificationQueue(notifier)
+    queue.start()
+    alert_manager.add_handler(queue)
+    return queue
+
+
 # ============================================================
 # TELEGRAM ALERT CALLBACK
 # ============================================================
@@ -704,14 +769,21 @@ async def run_application(args) -> int:
     # Wire modules
     wire_modules(orchestrator, {})
     
+    # Alert rules, evaluated in the monitoring stage
+    alert_manager = AlertManager()
+    notification_queue: Optional[NotificationQueue] = None
+    
     # Wire stage handlers
-    wire_stage_handlers(orchestrator)
+    wire_stage_handlers(orchestrator, alert_manager)
     
     # Create module factory
     factory = ModuleFactory(config={})
     orchestrator.set_module_factory(factory)
     
     try:
+        await orchestrator.start()
+        notification_queue = await start_alert_notifications(orchestrator, alert_manager)
+        
         if args.single_cycle:
             # Run single cycle
             logger.info("Running single cycle...")
@@ -740,6 +812,9 @@ async def run_application(args) -> int:
         logger.error(f"Fatal error: {e}", exc_info=True)
         return 1
     finally:
+        if notification_queue is not None:
+            alert_manager.remove_handler(notification_queue)
+            await notification_queue.stop()
         await orchestrator.stop()
 
 
@@ -6,11 +6,46 @@ Never overfit to backtest results.
 
 Modules:
 - replay_engine: Historical data replay
+- dataset: Memory-mapped columnar backtest window
 - backtest_runner: Backtest orchestration
 - parity_validator: Live/backtest parity checks
 """
 
+from .replay_engine import (
+    ReplayCheckpoint,
+    ReplayConfig,
+    ReplayEngine,
+    ReplayEvent,
+    ReplayMode,
+    ReplaySource,
+    ReplayState,
+    TableSource,
+)
+from .backtest_runner import (
+    BacktestConfig,
+    BacktestResult,
+    BacktestResultStore,
+    BacktestRunner,
+    BacktestTrade,
+)
+from .dataset import BacktestDataset
+
 # TODO: Export classes
-# from .replay_engine import ReplayEngine, ReplayState
-# from .backtest_runner import BacktestRunner, BacktestResult
 # from .parity_validator import ParityValidator, ParityResult
+
+__all__ = [
+    "BacktestConfig",
+    "BacktestDataset",
+    "BacktestResult",
+    "BacktestResultStore",
+    "BacktestRunner",
+    "BacktestTrade",
+    "ReplayCheckpoint",
+    "ReplayConfig",
+    "ReplayEngine",
+    "ReplayEvent",
+    "ReplayMode",
+    "ReplaySource",
+    "ReplayState",
+    "TableSource",
+]
@@ -23,69 +23,626 @@ DESIGN PRINCIPLES
 BACKTEST WORKFLOW
 ============================================================
 1. Configure backtest parameters
-2. Initialize replay engine
-3. Run processing and scoring
-4. Execute simulated trades
-5. Collect performance metrics
-6. Generate report
+2. Load the historical window (BacktestDataset)
+3. Evaluate every row with the StrategyEngine
+4. Size and gate intents through the RiskBudgetManager
+5. Execute simulated trades on the MockExchangeAdapter
+6. Collect performance metrics
+
+============================================================
+PARAMETER SWEEPS
+============================================================
+run_sweep() expands a grid of StrategyEngineConfig and
+RiskBudgetConfig overrides and runs every combination on a
+process pool:
+
+- The dataset is saved once as memory-mapped .npy columns;
+  workers receive only its directory and the overrides, and
+  each worker process opens the arrays once
+- Runs share nothing else, so throughput scales with cores
+- Results are handed to the result sink as each run finishes
+  (BacktestResultStore writes them to backtest_runs and
+  backtest_performance_metrics)
+
+Grid keys are dotted paths prefixed with "strategy." or
+"risk.", e.g. "strategy.combination.min_structure_strength"
+or "risk.capital_tiers.0.per_trade.max_risk_pct".
+
+============================================================
+SIMULATION RULES
+============================================================
+- Rows are processed in time order; a symbol is evaluated
+  only while it has no open position
+- Stops are checked against each row's current price; a
+  position also closes when its intent expires
+- Equity is marked to market on every row; the risk budget
+  sees it before every request
+- The daily risk budget resets when the replayed date changes
+- Positions still open at the end close at the last price
 
 ============================================================
 """
 
-# TODO: Import typing, dataclasses
-
-# TODO: Define BacktestConfig dataclass
-#   - name: str
-#   - start_date: date
-#   - end_date: date
-#   - initial_capital: Decimal
-#   - strategy_config: dict
-#   - risk_config: dict
-#   - execution_config: dict
-
-# TODO: Define BacktestResult dataclass
-#   - backtest_id: str
-#   - config: BacktestConfig
-#   - metrics: PerformanceMetrics
-#   - trades: list
-#   - equity_curve: list[Decimal]
-#   - drawdown_curve: list[float]
-#   - started_at: datetime
-#   - completed_at: datetime
-#   - duration_seconds: float
-
-# TODO: Define BacktestComparison dataclass
-#   - backtest_ids: list[str]
-#   - metrics_comparison: dict
-#   - best_performer: str
-#   - analysis: str
-
-# TODO: Implement BacktestRunner class
-#   - __init__(config, replay_engine, pipeline)
-#   - async run() -> BacktestResult
-#   - async run_sweep(param_grid) -> list[BacktestResult]
-#   - compare_results(results) -> BacktestComparison
-
-# TODO: Implement backtest execution
-#   - Initialize components
-#   - Run replay
-#   - Collect trades
-#   - Calculate metrics
-
-# TODO: Implement parameter sweeps
-#   - Grid search
-#   - Random search
-#   - Overfitting detection
-
-# TODO: Implement result analysis
-#   - Performance metrics
-#   - Statistical significance
-#   - Robustness checks
-
-# TODO: Implement overfitting guards
-#   - Out-of-sample validation
-#   - Walk-forward analysis
-#   - Parameter stability
-
-# TODO: DECISION POINT - Parameter sweep strategy
-# TODO: DECISION POINT - Overfitting detection thresholds
+import asyncio
+import itertools
+import logging
+import shutil
+import tempfile
+import time
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field, fields, is_dataclass, replace
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+from core.exceptions import InvalidConfigError
+from execution_engine.adapters.base import SubmitOrderRequest
+from execution_engine.adapters.mock import MockConfig, MockExchangeAdapter
+from execution_engine.types import OrderSide, OrderType
+from risk_budget_manager.config import RiskBudgetConfig, get_default_config as get_default_risk_config
+from risk_budget_manager.engine import RiskBudgetManager
+from risk_budget_manager.types import EquityUpdate, TradeDecision, TradeRiskRequest
+from strategy_engine.config import StrategyEngineConfig
+from strategy_engine.engine import StrategyEngine
+from strategy_engine.types import TradeDirection
+
+from .dataset import BacktestDataset
+
+
+logger = logging.getLogger(__name__)
+
+
+BACKTEST_ENGINE_VERSION = "1.0.0"
+
+# Grid key prefixes -> BacktestConfig attribute
+_CONFIG_ROOTS = {"strategy": "strategy_config", "risk": "risk_config"}
+
+
+# ============================================================
+# CONFIGURATION AND RESULTS
+# ============================================================
+
+@dataclass
+class BacktestConfig:
+    """Parameters of one backtest run."""
+    name: str
+    initial_capital: float = 1500.0
+    strategy_config: StrategyEngineConfig = field(default_factory=StrategyEngineConfig)
+    risk_config: RiskBudgetConfig = field(default_factory=get_default_risk_config)
+
+    # Execution simulation
+    stop_loss_pct: float = 2.0  # Stop distance from entry
+    target_risk_pct: float = 1.0  # Requested risk; the risk budget may reduce it
+    slippage_bps: int = 5
+
+    # Sweeps
+    max_workers: Optional[int] = None  # None = CPU count
+
+    def __post_init__(self) -> None:
+        if self.initial_capital <= 0:
+            raise InvalidConfigError("initial_capital", self.initial_capital, "must be positive")
+        if not 0 < self.stop_loss_pct < 100:
+            raise InvalidConfigError("stop_loss_pct", self.stop_loss_pct, "must be in (0, 100)")
+        if self.target_risk_pct <= 0:
+            raise InvalidConfigError("target_risk_pct", self.target_risk_pct, "must be positive")
+
+
+@dataclass
+class BacktestTrade:
+    """One simulated round trip."""
+    symbol: str
+    direction: str
+    entry_time: datetime
+    exit_time: datetime
+    entry_price: float
+    exit_price: float
+    quantity: float
+    pnl: float
+    exit_reason: str  # stop_loss, expired, end_of_data
+
+
+@dataclass
+class BacktestResult:
+    """Outcome of one backtest run."""
+    backtest_id: str
+    name: str
+    parameters: Dict[str, Any]  # Grid overrides of this run
+    metrics: Dict[str, float]
+    trades: List[BacktestTrade]
+    started_at: datetime
+    completed_at: datetime
+    duration_seconds: float
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    symbols: List[str] = field(default_factory=list)
+    initial_capital: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+# ============================================================
+# PARAMETER GRID
+# ============================================================
+
+def expand_grid(param_grid: Mapping[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """Every combination of the grid values, in a stable order."""
+    keys = list(param_grid)
+    for key in keys:
+        if not param_grid[key]:
+            raise InvalidConfigError(key, param_grid[key], "grid values must not be empty")
+    return [dict(zip(keys, values)) for values in itertools.product(*(param_grid[k] for k in keys))]
+
+
+def apply_overrides(config: BacktestConfig, overrides: Mapping[str, Any]) -> BacktestConfig:
+    """
+    Copy of config with dotted-path overrides applied.
+
+    Raises:
+        InvalidConfigError: Unknown path
+    """
+    for key, value in overrides.items():
+        root, _, path = key.partition(".")
+        if root not in _CONFIG_ROOTS or not path:
+            raise InvalidConfigError(key, value, "grid keys start with 'strategy.' or 'risk.'")
+        attribute = _CONFIG_ROOTS[root]
+        updated = _replace_path(getattr(config, attribute), path.split("."), value, key)
+        config = replace(config, **{attribute: updated})
+    return config
+
+
+def _replace_path(node: Any, parts: List[str], value: Any, key: str) -> Any:
+    """Copy of node with the value at parts replaced."""
+    head, rest = parts[0], parts[1:]
+    if isinstance(node, list):
+        if not head.isdigit() or int(head) >= len(node):
+            raise InvalidConfigError(key, value, f"no list index {head}")
+        items = list(node)
+        index = int(head)
+        items[index] = _replace_path(items[index], rest, value, key) if rest else value
+        return items
+    if not is_dataclass(node) or head not in {f.name for f in fields(node)}:
+        raise InvalidConfigError(key, value, f"unknown config field {head}")
+    child = _replace_path(getattr(node, head), rest, value, key) if rest else value
+    return replace(node, **{head: child})
+
+
+# ============================================================
+# SIMULATION
+# ============================================================
+
+@dataclass
+class _OpenPosition:
+    position_id: str
+    symbol: str
+    direction: str
+    sign: int
+    entry_time: datetime
+    entry_price: float
+    stop_price: float
+    quantity: float
+    expires_at: Optional[datetime]
+    unrealized: float = 0.0
+
+
+async def _simulate(
+    dataset: BacktestDataset,
+    config: BacktestConfig,
+    parameters: Dict[str, Any],
+) -> BacktestResult:
+    """Run one configuration over the dataset."""
+    started_at = datetime.now(timezone.utc)
+    started = time.perf_counter()
+
+    engine = StrategyEngine(config.strategy_config)
+    risk = RiskBudgetManager(config.risk_config)
+    exchange = MockExchangeAdapter(MockConfig(
+        min_latency_ms=0.0,
+        max_latency_ms=0.0,
+        initial_balance=Decimal(str(config.initial_capital)),
+        slippage_bps=config.slippage_bps,
+    ))
+    await exchange.connect()
+
+    cash = config.initial_capital
+    unrealized_total = 0.0
+    realized_today = 0.0
+    peak = cash
+    max_drawdown_pct = 0.0
+    current_day = None
+    positions: Dict[str, _OpenPosition] = {}
+    last_price: Dict[str, float] = {}
+    last_time: Optional[datetime] = None
+    trades: List[BacktestTrade] = []
+    position_ids = itertools.count(1)
+    counts = {"rows": 0, "intents": 0, "risk_rejections": 0, "risk_reductions": 0}
+    stop_fraction = config.stop_loss_pct / 100
+
+    async def fill(symbol: str, side: OrderSide, quantity: float, price: float) -> float:
+        pair = symbol.replace("/", "")
+        exchange.set_price(pair, Decimal(str(price)))
+        response = await exchange.submit_order(SubmitOrderRequest(
+            symbol=pair,
+            side=side,
+            order_type=OrderType.MARKET,
+            quantity=Decimal(str(quantity)),
+        ))
+        return float(response.average_price)
+
+    async def close(position: _OpenPosition, price: float, at: datetime, reason: str) -> float:
+        side = OrderSide.SELL if position.sign > 0 else OrderSide.BUY
+        exit_price = await fill(position.symbol, side, position.quantity, price)
+        pnl = (exit_price - position.entry_price) * position.quantity * position.sign
+        risk.register_position_closed(position.position_id, pnl)
+        del positions[position.symbol]
+        trades.append(BacktestTrade(
+            symbol=position.symbol,
+            direction=position.direction,
+            entry_time=position.entry_time,
+            exit_time=at,
+            entry_price=position.entry_price,
+            exit_price=exit_price,
+            quantity=position.quantity,
+            pnl=pnl,
+            exit_reason=reason,
+        ))
+        return pnl
+
+    for input_data in dataset.iter_inputs():
+        counts["rows"] += 1
+        symbol = input_data.symbol
+        price = input_data.market_structure.current_price
+        now = input_data.timestamp
+        last_time = now
+        if price is None or price <= 0:
+            continue
+        last_price[symbol] = price
+
+        if now.date() != current_day:
+            if current_day is not None:
+                risk.reset_daily_budget()
+                realized_today = 0.0
+            current_day = now.date()
+
+        position = positions.get(symbol)
+        if position is not None:
+            stopped = price <= position.stop_price if position.sign > 0 else price >= position.stop_price
+            expired = position.expires_at is not None and now >= position.expires_at
+            if stopped or expired:
+                unrealized_total -= position.unrealized
+                pnl = await close(position, price, now, "stop_loss" if stopped else "expired")
+                cash += pnl
+                realized_today += pnl
+            else:
+                unrealized = (price - position.entry_price) * position.quantity * position.sign
+                unrealized_total += unrealized - position.unrealized
+                position.unrealized = unrealized
+        else:
+            output = engine.evaluate(input_data)
+            intent = output.trade_intent
+            if intent is not None and intent.direction != TradeDirection.NEUTRAL:
+                counts["intents"] += 1
+                equity = cash + unrealized_total
+                risk.update_equity(EquityUpdate(
+                    account_equity=equity,
+                    available_balance=equity,
+                    unrealized_pnl=unrealized_total,
+                    realized_pnl_today=realized_today,
+                ))
+
+                sign = 1 if intent.direction == TradeDirection.LONG else -1
+                stop_price = price * (1 - sign * stop_fraction)
+                quantity = equity * config.target_risk_pct / 100 / abs(price - stop_price)
+                response = risk.evaluate_request(TradeRiskRequest(
+                    symbol=symbol,
+                    exchange=input_data.exchange,
+                    entry_price=price,
+                    stop_loss_price=stop_price,
+                    position_size=quantity,
+                    direction=intent.direction.value,
+                ))
+
+                if response.decision == TradeDecision.REJECT_TRADE:
+                    counts["risk_rejections"] += 1
+                else:
+                    if response.decision == TradeDecision.REDUCE_SIZE:
+                        counts["risk_reductions"] += 1
+                        quantity = response.allowed_position_size
+                    entry_price = await fill(
+                        symbol, OrderSide.BUY if sign > 0 else OrderSide.SELL, quantity, price
+                    )
+                    position = _OpenPosition(
+                        position_id=f"bt-{next(position_ids)}",
+                        symbol=symbol,
+                        direction=intent.direction.value,
+                        sign=sign,
+                        entry_time=now,
+                        entry_price=entry_price,
+                        stop_price=stop_price,
+                        quantity=quantity,
+                        expires_at=intent.expires_at,
+                    )
+                    risk.register_position_opened(
+                        position_id=position.position_id,
+                        symbol=symbol,
+                        exchange=input_data.exchange,
+                        direction=position.direction,
+                        entry_price=entry_price,
+                        stop_loss_price=stop_price,
+                        position_size=quantity,
+                    )
+                    positions[symbol] = position
+                    # Slippage is an immediate mark-to-market loss
+                    position.unrealized = (price - entry_price) * quantity * sign
+                    unrealized_total += position.unrealized
+
+        equity = cash + unrealized_total
+        if equity > peak:
+            peak = equity
+        elif peak > 0:
+            max_drawdown_pct = max(max_drawdown_pct, (peak - equity) / peak * 100)
+
+    for position in list(positions.values()):
+        cash += await close(position, last_price[position.symbol], last_time, "end_of_data")
+
+    await exchange.disconnect()
+
+    wins = sum(1 for t in trades if t.pnl > 0)
+    start_date, end_date = dataset.time_range()
+    metrics = {
+        "total_trades": len(trades),
+        "winning_trades": wins,
+        "win_rate": wins / len(trades) if trades else 0.0,
+        "total_pnl": cash - config.initial_capital,
+        "return_pct": (cash - config.initial_capital) / config.initial_capital * 100,
+        "max_drawdown_pct": max_drawdown_pct,
+        "final_equity": cash,
+        **counts,
+    }
+    return BacktestResult(
+        backtest_id=str(uuid.uuid4()),
+        name=config.name,
+        parameters=dict(parameters),
+        metrics=metrics,
+        trades=trades,
+        started_at=started_at,
+        completed_at=datetime.now(timezone.utc),
+        duration_seconds=time.perf_counter() - started,
+        start_date=start_date,
+        end_date=end_date,
+        symbols=dataset.symbols(),
+        initial_capital=config.initial_capital,
+    )
+
+
+# Datasets opened by this (worker) process, by directory
+_WORKER_DATASETS: Dict[str, BacktestDataset] = {}
+
+
+def _run_in_worker(dataset_path: str, config: BacktestConfig, parameters: Dict[str, Any]) -> BacktestResult:
+    """Process pool entry point: one grid combination."""
+    dataset = _WORKER_DATASETS.get(dataset_path)
+    if dataset is None:
+        dataset = _WORKER_DATASETS[dataset_path] = BacktestDataset.open(dataset_path)
+    started_at = datetime.now(timezone.utc)
+    try:
+        return asyncio.run(_simulate(dataset, apply_overrides(config, parameters), parameters))
+    except Exception as e:
+        return BacktestResult(
+            backtest_id=str(uuid.uuid4()),
+            name=config.name,
+            parameters=dict(parameters),
+            metrics={},
+            trades=[],
+            started_at=started_at,
+            completed_at=datetime.now(timezone.utc),
+            duration_seconds=0.0,
+            initial_capital=config.initial_capital,
+            error=f"{type(e).__name__}: {e}",
+        )
+
+
+# ============================================================
+# RESULT STORAGE
+# ============================================================
+
+class BacktestResultStore:
+    """
+    Writes results to backtest_runs and backtest_performance_metrics.
+
+    One transaction per result, so results are persisted as the
+    sweep produces them.
+    """
+
+    def __init__(self, session_factory: Callable[[], Any], strategy_name: str = "strategy_engine"):
+        self._session_factory = session_factory
+        self._strategy_name = strategy_name
+
+    def __call__(self, result: BacktestResult) -> None:
+        from storage.models.backtesting import BacktestPerformanceMetric, BacktestRun
+
+        run_id = uuid.UUID(result.backtest_id)
+        session = self._session_factory()
+        try:
+            session.add(BacktestRun(
+                run_id=run_id,
+                run_name=result.name,
+                strategy_name=self._strategy_name,
+                strategy_version=BACKTEST_ENGINE_VERSION,
+                start_date=result.start_date or result.started_at,
+                end_date=result.end_date or result.completed_at,
+                symbols=result.symbols,
+                exchanges=[],
+                initial_capital=Decimal(str(result.initial_capital)),
+                capital_currency="USDT",
+                config_snapshot={"parameters": _jsonable(result.parameters)},
+                data_sources={"dataset": "memory_mapped"},
+                status="completed" if result.succeeded else "failed",
+                error_message=result.error,
+                progress_percent=100,
+                started_at=result.started_at,
+                completed_at=result.completed_at,
+                duration_seconds=int(result.duration_seconds),
+                tags=["sweep"],
+                version=BACKTEST_ENGINE_VERSION,
+            ))
+            session.add_all([
+                BacktestPerformanceMetric(
+                    run_id=run_id,
+                    metric_name=name,
+                    metric_category=_metric_category(name),
+                    metric_value=Decimal(str(value)),
+                    period_type="overall",
+                )
+                for name, value in result.metrics.items()
+            ])
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+
+def _metric_category(name: str) -> str:
+    if name in ("max_drawdown_pct", "risk_rejections", "risk_reductions"):
+        return "risk"
+    if name in ("total_pnl", "return_pct", "final_equity", "win_rate"):
+        return "returns"
+    return "efficiency"
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if isinstance(value, dict):
+        return {str(k): _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    return str(value)
+
+
+# ============================================================
+# RUNNER
+# ============================================================
+
+class BacktestRunner:
+    """
+    Runs backtests of the StrategyEngine -> RiskBudgetManager ->
+    MockExchangeAdapter path over a historical window.
+
+    Usage:
+        runner = BacktestRunner(config, dataset, result_sink=BacktestResultStore(get_session))
+        result = await runner.run()
+        results = await runner.run_sweep({
+            "strategy.combination.min_structure_strength": [1, 2],
+            "risk.default_per_trade.max_risk_pct": [0.25, 0.5],
+        })
+    """
+
+    def __init__(
+        self,
+        config: BacktestConfig,
+        dataset: BacktestDataset,
+        result_sink: Optional[Callable[[BacktestResult], Any]] = None,
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            config: Base configuration (sweeps override it)
+            dataset: Historical window
+            result_sink: Called with every finished result
+        """
+        self.config = config
+        self.dataset = dataset
+        self._result_sink = result_sink
+
+    async def run(self, overrides: Optional[Mapping[str, Any]] = None) -> BacktestResult:
+        """Run one configuration in this process."""
+        overrides = dict(overrides or {})
+        result = await _simulate(self.dataset, apply_overrides(self.config, overrides), overrides)
+        self._emit(result)
+        return result
+
+    async def run_sweep(
+        self,
+        param_grid: Mapping[str, Sequence[Any]],
+        executor: Optional[Executor] = None,
+    ) -> List[BacktestResult]:
+        """
+        Run every grid combination on a process pool.
+
+        Args:
+            param_grid: Dotted config path -> values
+            executor: Pool to use (default: a ProcessPoolExecutor
+                      with config.max_workers workers)
+
+        Returns:
+            Results in grid order (failed runs carry error)
+        """
+        combinations = expand_grid(param_grid)
+        for parameters in combinations:
+            apply_overrides(self.config, parameters)  # Fail fast on bad keys
+
+        temp_dir = None
+        dataset_path = self.dataset.path
+        if dataset_path is None:
+            temp_dir = tempfile.mkdtemp(prefix="backtest_")
+            dataset_path = self.dataset.save(temp_dir).path
+
+        owns_executor = executor is None
+        if owns_executor:
+            executor = ProcessPoolExecutor(max_workers=self.config.max_workers)
+
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        logger.info(f"Backtest sweep: {len(combinations)} runs over {len(self.dataset):,} rows")
+        try:
+            futures = {
+                loop.run_in_executor(executor, _run_in_worker, dataset_path, self.config, parameters): i
+                for i, parameters in enumerate(combinations)
+            }
+            results: List[Optional[BacktestResult]] = [None] * len(combinations)
+            pending = set(futures)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    results[futures[future]] = result
+                    if result.error:
+                        logger.warning(f"Backtest run failed {result.parameters}: {result.error}")
+                    self._emit(result)
+        finally:
+            if owns_executor:
+                executor.shutdown(wait=True, cancel_futures=True)
+            if temp_dir is not None:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+
+        logger.info(
+            f"Backtest sweep complete: {len(combinations)} runs in "
+            f"{time.perf_counter() - started:.1f}s"
+        )
+        return results
+
+    def _emit(self, result: BacktestResult) -> None:
+        if self._result_sink is None:
+            return
+        try:
+            self._result_sink(result)
+        except Exception as e:
+            logger.error(f"Failed to store backtest result {result.backtest_id}: {e}")
+
+
+__all__ = [
+    "BacktestConfig",
+    "BacktestTrade",
+    "BacktestResult",
+    "BacktestResultStore",
+    "BacktestRunner",
+    "apply_overrides",
+    "expand_grid",
+]
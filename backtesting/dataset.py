@@ -0,0 +1,278 @@
+"""
+Backtesting - Columnar Dataset.
+
+============================================================
+RESPONSIBILITY
+============================================================
+Holds a historical window of Strategy Engine inputs as
+columnar numpy arrays, so it is loaded once and shared by
+every backtest run of a parameter sweep.
+
+- One column per StrategyInput field
+  (e.g. "market_structure.current_price")
+- Rows are ordered by timestamp
+- save() writes one .npy file per column; open() memory-maps
+  them read-only, so worker processes share the pages through
+  the OS page cache instead of each holding a copy
+
+============================================================
+ENCODING
+============================================================
+- float: float64, NaN = None
+- int: int64, INT64_MIN = None
+- bool: int8, -1 = None
+- str: int32 code into a per-column vocabulary, -1 = None
+- datetime: int64 microseconds since the epoch, INT64_MIN = None
+  (naive or aware UTC, per column)
+
+iter_inputs() rebuilds StrategyInput objects equal to the
+ones the dataset was built from.
+
+============================================================
+"""
+
+import json
+import os
+import typing
+from dataclasses import fields
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from strategy_engine.types import (
+    EnvironmentalContext,
+    MarketStructureInput,
+    SentimentInput,
+    StrategyInput,
+    VolumeFlowInput,
+)
+
+
+# Nested inputs of StrategyInput
+_GROUPS = (
+    ("market_structure", MarketStructureInput),
+    ("volume_flow", VolumeFlowInput),
+    ("sentiment", SentimentInput),
+    ("environment", EnvironmentalContext),
+)
+
+_NULL_INT = np.iinfo(np.int64).min
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_EPOCH_AWARE = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+_DTYPES = {
+    "float": np.float64,
+    "int": np.int64,
+    "bool": np.int8,
+    "str": np.int32,
+    "datetime": np.int64,
+}
+
+MANIFEST_FILE = "manifest.json"
+
+
+def _field_kind(hint: Any) -> str:
+    """Column kind of a (possibly Optional) field type."""
+    args = [a for a in typing.get_args(hint) if a is not type(None)]
+    if args:
+        hint = args[0]
+    for kind, python_type in (("bool", bool), ("int", int), ("float", float),
+                              ("str", str), ("datetime", datetime)):
+        if hint is python_type:
+            return kind
+    raise TypeError(f"Unsupported field type: {hint}")
+
+
+def _layout() -> List[Tuple[str, Optional[str], str, str]]:
+    """(column, group, field, kind) for every StrategyInput field."""
+    layout = []
+    for name, cls in _GROUPS:
+        hints = typing.get_type_hints(cls)
+        for f in fields(cls):
+            layout.append((f"{name}.{f.name}", name, f.name, _field_kind(hints[f.name])))
+    hints = typing.get_type_hints(StrategyInput)
+    group_names = {name for name, _ in _GROUPS}
+    for f in fields(StrategyInput):
+        if f.name not in group_names:
+            layout.append((f.name, None, f.name, _field_kind(hints[f.name])))
+    return layout
+
+
+_LAYOUT = _layout()
+
+
+# ============================================================
+# DATASET
+# ============================================================
+
+class BacktestDataset:
+    """
+    Columnar, time-ordered window of StrategyInput rows.
+
+    Usage:
+        dataset = BacktestDataset.from_inputs(inputs)
+        dataset.save("/tmp/window")
+        shared = BacktestDataset.open("/tmp/window")
+        for input_data in shared.iter_inputs():
+            ...
+    """
+
+    def __init__(
+        self,
+        columns: Dict[str, np.ndarray],
+        vocab: Dict[str, List[str]],
+        aware: Dict[str, bool],
+        path: Optional[str] = None,
+    ):
+        lengths = {len(c) for c in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("Dataset columns differ in length")
+        missing = [name for name, _, _, _ in _LAYOUT if name not in columns]
+        if missing:
+            raise ValueError(f"Dataset is missing columns: {missing}")
+        self.columns = columns
+        self.vocab = vocab
+        self.aware = aware
+        self.path = path
+
+    def __len__(self) -> int:
+        return len(self.columns["timestamp"])
+
+    # =========================================================
+    # CONSTRUCTION
+    # =========================================================
+
+    @classmethod
+    def from_inputs(cls, inputs: Sequence[StrategyInput]) -> "BacktestDataset":
+        """Encode inputs (stably sorted by timestamp)."""
+        values: Dict[str, List[Any]] = {}
+        for column, group, name, _ in _LAYOUT:
+            if group is None:
+                values[column] = [getattr(i, name) for i in inputs]
+            else:
+                values[column] = [getattr(getattr(i, group), name) for i in inputs]
+
+        columns: Dict[str, np.ndarray] = {}
+        vocab: Dict[str, List[str]] = {}
+        aware: Dict[str, bool] = {}
+        for column, _, _, kind in _LAYOUT:
+            columns[column] = _encode(column, kind, values[column], vocab, aware)
+
+        order = np.argsort(columns["timestamp"], kind="stable")
+        return cls({name: array[order] for name, array in columns.items()}, vocab, aware)
+
+    # =========================================================
+    # SHARED STORAGE
+    # =========================================================
+
+    def save(self, directory: str) -> "BacktestDataset":
+        """Write columns as .npy files; returns the memory-mapped copy."""
+        os.makedirs(directory, exist_ok=True)
+        for name, array in self.columns.items():
+            np.save(os.path.join(directory, f"{name}.npy"), np.ascontiguousarray(array))
+        manifest = {
+            "rows": len(self),
+            "columns": {name: kind for name, _, _, kind in _LAYOUT},
+            "vocab": self.vocab,
+            "aware": self.aware,
+        }
+        with open(os.path.join(directory, MANIFEST_FILE), "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        return self.open(directory)
+
+    @classmethod
+    def open(cls, directory: str) -> "BacktestDataset":
+        """Memory-map a saved dataset (read-only)."""
+        with open(os.path.join(directory, MANIFEST_FILE), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        columns = {
+            name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+            for name in manifest["columns"]
+        }
+        return cls(columns, manifest["vocab"], manifest["aware"], path=directory)
+
+    # =========================================================
+    # ROWS
+    # =========================================================
+
+    def iter_inputs(self, block_size: int = 4096) -> Iterator[StrategyInput]:
+        """Rebuild StrategyInput rows in time order, block by block."""
+        for start in range(0, len(self), block_size):
+            stop = min(start + block_size, len(self))
+            decoded = {
+                column: self._decode(column, kind, self.columns[column][start:stop].tolist())
+                for column, _, _, kind in _LAYOUT
+            }
+            for i in range(stop - start):
+                groups: Dict[str, Dict[str, Any]] = {name: {} for name, _ in _GROUPS}
+                top: Dict[str, Any] = {}
+                for column, group, name, _ in _LAYOUT:
+                    target = top if group is None else groups[group]
+                    target[name] = decoded[column][i]
+                yield StrategyInput(
+                    **{name: cls(**groups[name]) for name, cls in _GROUPS},
+                    **top,
+                )
+
+    def time_range(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """First and last row timestamp."""
+        if not len(self):
+            return None, None
+        first, last = self._decode(
+            "timestamp", "datetime", [int(self.columns["timestamp"][0]), int(self.columns["timestamp"][-1])]
+        )
+        return first, last
+
+    def symbols(self) -> List[str]:
+        """Symbols present in the window."""
+        codes = np.unique(self.columns["symbol"])
+        return [self.vocab["symbol"][c] for c in codes.tolist() if c >= 0]
+
+    def _decode(self, column: str, kind: str, raw: List[Any]) -> List[Any]:
+        if kind == "float":
+            return [None if v != v else v for v in raw]
+        if kind == "int":
+            return [None if v == _NULL_INT else v for v in raw]
+        if kind == "bool":
+            return [None if v < 0 else bool(v) for v in raw]
+        if kind == "str":
+            words = self.vocab[column]
+            return [None if v < 0 else words[v] for v in raw]
+        epoch = _EPOCH_AWARE if self.aware.get(column) else _EPOCH_NAIVE
+        return [None if v == _NULL_INT else epoch + v * _MICROSECOND for v in raw]
+
+
+def _encode(
+    column: str,
+    kind: str,
+    values: List[Any],
+    vocab: Dict[str, List[str]],
+    aware: Dict[str, bool],
+) -> np.ndarray:
+    dtype = _DTYPES[kind]
+    if kind == "float":
+        return np.array([np.nan if v is None else v for v in values], dtype=dtype)
+    if kind == "int":
+        return np.array([_NULL_INT if v is None else v for v in values], dtype=dtype)
+    if kind == "bool":
+        return np.array([-1 if v is None else int(v) for v in values], dtype=dtype)
+    if kind == "str":
+        codes: Dict[str, int] = {}
+        encoded = [-1 if v is None else codes.setdefault(v, len(codes)) for v in values]
+        vocab[column] = list(codes)
+        return np.array(encoded, dtype=dtype)
+
+    present = [v for v in values if v is not None]
+    is_aware = bool(present) and present[0].tzinfo is not None
+    if any((v.tzinfo is not None) != is_aware for v in present):
+        raise ValueError(f"Column {column} mixes naive and aware datetimes")
+    aware[column] = is_aware
+    epoch = _EPOCH_AWARE if is_aware else _EPOCH_NAIVE
+    return np.array(
+        [_NULL_INT if v is None else (v - epoch) // _MICROSECOND for v in values], dtype=dtype
+    )
+
+
+__all__ = ["BacktestDataset"]
@@ -19,66 +19,1077 @@ DESIGN PRINCIPLES
 - Configurable replay speed
 - State checkpoint support
 
+============================================================
+DATA LOADING
+============================================================
+Each source (market_data, onchain_flow_raw, raw_news) is read
+in time order through a server-side cursor, chunk_size rows at a
+time. The sources are k-way merged by (timestamp, source order),
+so memory stays at one chunk per source regardless of the
+replayed range. Batches are fetched in a worker thread one batch
+ahead of delivery.
+
+With a columnar cache (storage.columnar_cache), candles and
+on-chain flows are read from the cache files one day at a time
+instead of the database.
+
+Events carry the time the data became available: candles are
+stamped at candle close (open time + interval), on-chain flows
+at event_time, news at published_at (fetched_at if missing).
+
 ============================================================
 REPLAY MODES
 ============================================================
-- Sequential: Process data in order
-- Time-based: Simulate real-time delays
-- Instant: Process as fast as possible
+- Sequential: Process data in order. Every subscriber finishes
+  a tick (all events with one timestamp) before the next tick
+- Time-based: Simulate real-time delays. Ticks are released
+  when the replay clock (speed_multiplier x wall time) reaches
+  them
+- Instant: Process as fast as possible. Subscribers consume
+  batches concurrently through bounded queues
+
+The replay clock follows the data: in sequential and instant
+mode it is set to the tick the slowest subscriber is handling,
+so modules reading the clock never see the future.
+
+============================================================
+BACKPRESSURE
+============================================================
+Every subscriber has a queue of at most max_pending_batches
+batches. The producer waits when a queue is full, so a slow
+subscriber slows the replay instead of buffering it in memory.
+
+============================================================
+CHECKPOINTS
+============================================================
+Checkpoints record, per source, the (time, id) key of the last
+delivered event. Resuming reopens each cursor after its key,
+which reproduces the exact remaining sequence. Checkpoints are
+taken when all subscriber queues are drained, every
+checkpoint_interval_seconds of replay time and when the replay
+ends.
+
+Storage format: JSON with a SHA-256 checksum of the payload,
+written atomically (temp file + rename).
 
 ============================================================
 """
 
-# TODO: Import typing, dataclasses, asyncio
-
-# TODO: Define ReplayConfig dataclass
-#   - start_time: datetime
-#   - end_time: datetime
-#   - replay_mode: str
-#   - speed_multiplier: float
-#   - checkpoint_interval_seconds: int
-
-# TODO: Define ReplayState dataclass
-#   - current_time: datetime
-#   - events_processed: int
-#   - is_running: bool
-#   - last_checkpoint: datetime
-#   - progress_percent: float
-
-# TODO: Define ReplayEvent dataclass
-#   - event_type: str
-#   - timestamp: datetime
-#   - data: dict
-#   - source: str
-
-# TODO: Implement ReplayEngine class
-#   - __init__(config, storage, clock)
-#   - async start() -> None
-#   - async stop() -> None
-#   - async pause() -> None
-#   - async resume() -> None
-#   - get_state() -> ReplayState
-#   - async seek(timestamp) -> None
-
-# TODO: Implement data loading
-#   - Load data for time range
-#   - Sort by timestamp
-#   - Handle multiple sources
-
-# TODO: Implement time simulation
-#   - Advance simulated clock
-#   - Respect replay speed
-#   - Maintain event ordering
-
-# TODO: Implement event emission
-#   - Emit events to subscribers
-#   - Maintain temporal order
-#   - Handle backpressure
-
-# TODO: Implement checkpointing
-#   - Save state periodically
-#   - Resume from checkpoint
-#   - Validate checkpoint integrity
-
-# TODO: DECISION POINT - Checkpoint storage format
-# TODO: DECISION POINT - Maximum replay speed
+import asyncio
+import hashlib
+import heapq
+import inspect
+import json
+import logging
+import os
+import re
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Table, func, select, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+from core.clock import ClockFactory, ReplayClock
+from core.exceptions import DataValidationError, InvalidConfigError
+
+
+logger = logging.getLogger(__name__)
+
+
+# Upper bound for time-scaled replays (1 year in under an hour)
+MAX_SPEED_MULTIPLIER = 10_000.0
+
+CHECKPOINT_VERSION = 1
+
+_INTERVAL_UNITS = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+
+def interval_to_timedelta(interval: str) -> timedelta:
+    """Candle interval ("1m", "4h", "1d") as a timedelta."""
+    match = re.fullmatch(r"(\d+)([mhdw])", interval)
+    if not match:
+        raise InvalidConfigError("market_interval", interval, "expected e.g. 1m, 1h, 1d")
+    return timedelta(**{_INTERVAL_UNITS[match.group(2)]: int(match.group(1))})
+
+
+def _as_utc(dt: datetime) -> datetime:
+    """Aware UTC datetime (naive values are UTC)."""
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def _as_naive(dt: datetime) -> datetime:
+    """Naive UTC datetime, as stored in the tables."""
+    return _as_utc(dt).replace(tzinfo=None)
+
+
+# ============================================================
+# CONFIGURATION AND STATE
+# ============================================================
+
+class ReplayMode(str, Enum):
+    """How fast events are released."""
+    SEQUENTIAL = "sequential"
+    TIME_SCALED = "time_scaled"
+    INSTANT = "instant"
+
+
+@dataclass
+class ReplayConfig:
+    """Replay range, pacing and resource limits."""
+
+    start_time: datetime
+    end_time: datetime
+    replay_mode: ReplayMode = ReplayMode.SEQUENTIAL
+    speed_multiplier: float = 1.0  # TIME_SCALED only
+    checkpoint_interval_seconds: int = 3600  # Replay time; 0 = only at the end
+    checkpoint_path: Optional[str] = None
+
+    # Streaming
+    chunk_size: int = 5000  # Rows per cursor fetch, per source
+    batch_size: int = 1000  # Events per delivery batch
+    max_pending_batches: int = 8  # Per subscriber
+
+    # Default sources
+    symbols: Optional[List[str]] = None  # None = all
+    market_interval: str = "1m"
+
+    # Install the replay clock as the global clock while running
+    install_clock: bool = True
+
+    def __post_init__(self) -> None:
+        self.start_time = _as_utc(self.start_time)
+        self.end_time = _as_utc(self.end_time)
+        self.replay_mode = ReplayMode(self.replay_mode)
+
+        if self.end_time <= self.start_time:
+            raise InvalidConfigError("end_time", self.end_time, "must be after start_time")
+        if not 0 < self.speed_multiplier <= MAX_SPEED_MULTIPLIER:
+            raise InvalidConfigError(
+                "speed_multiplier", self.speed_multiplier,
+                f"must be in (0, {MAX_SPEED_MULTIPLIER:g}]",
+            )
+        for name in ("chunk_size", "batch_size", "max_pending_batches"):
+            if getattr(self, name) < 1:
+                raise InvalidConfigError(name, getattr(self, name), "must be positive")
+        if self.checkpoint_interval_seconds < 0:
+            raise InvalidConfigError(
+                "checkpoint_interval_seconds", self.checkpoint_interval_seconds, "must be >= 0"
+            )
+        interval_to_timedelta(self.market_interval)
+
+
+@dataclass
+class ReplayState:
+    """Progress snapshot."""
+    current_time: datetime
+    events_processed: int = 0
+    is_running: bool = False
+    is_paused: bool = False
+    last_checkpoint: Optional[datetime] = None
+    progress_percent: float = 0.0
+
+
+@dataclass
+class ReplayEvent:
+    """One historical record, stamped with its availability time."""
+    event_type: str
+    timestamp: datetime  # Aware UTC
+    data: Dict[str, Any]
+    source: str
+    key: Tuple[Any, Any] = ()  # (time, id) resume key within the source
+
+
+# ============================================================
+# SOURCES
+# ============================================================
+
+class ReplaySource(ABC):
+    """
+    A time-ordered stream of one kind of historical data.
+
+    Subclasses yield events with start <= timestamp < end, ordered
+    by key, where key = (time, id) is unique and increases with
+    timestamp.
+    """
+
+    name: str
+    event_type: str
+
+    @abstractmethod
+    def stream(
+        self,
+        start: datetime,
+        end: datetime,
+        after: Optional[Tuple[Any, Any]] = None,
+        chunk_size: int = 5000,
+    ) -> Iterator[ReplayEvent]:
+        """
+        Stream events in key order.
+
+        Args:
+            start: Inclusive lower bound (aware UTC)
+            end: Exclusive upper bound (aware UTC)
+            after: Only events with key > after (checkpoint resume)
+            chunk_size: Rows fetched per round trip
+        """
+        pass
+
+
+class TableSource(ReplaySource):
+    """
+    Streams a table through a server-side cursor.
+
+    Rows are ordered by (time_column, id_column), which should be
+    backed by an index. Event timestamps are time value + time_offset
+    (e.g. candle open time + interval = close time).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        event_type: str,
+        session_factory: Callable[[], Any],
+        table: Table,
+        time_column: ColumnElement,
+        id_column: ColumnElement,
+        filters: Sequence[ColumnElement] = (),
+        time_offset: timedelta = timedelta(0),
+    ):
+        self.name = name
+        self.event_type = event_type
+        self._session_factory = session_factory
+        self._table = table
+        self._time_column = time_column
+        self._id_column = id_column
+        self._id_key = id_column.key
+        self._filters = list(filters)
+        self._time_offset = time_offset
+
+    def build_query(
+        self,
+        start: datetime,
+        end: datetime,
+        after: Optional[Tuple[Any, Any]] = None,
+    ):
+        """Range query in key order (times are shifted by time_offset)."""
+        time_expr = self._time_column
+        stmt = (
+            select(*self._table.c, time_expr.label("_replay_time"))
+            .where(
+                time_expr >= _as_naive(start) - self._time_offset,
+                time_expr < _as_naive(end) - self._time_offset,
+                *self._filters,
+            )
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(time_expr, self._id_column) > tuple_(*after))
+        return stmt.order_by(time_expr, self._id_column)
+
+    def stream(
+        self,
+        start: datetime,
+        end: datetime,
+        after: Optional[Tuple[Any, Any]] = None,
+        chunk_size: int = 5000,
+    ) -> Iterator[ReplayEvent]:
+        stmt = self.build_query(start, end, after).execution_options(yield_per=chunk_size)
+        offset = self._time_offset
+        session = self._session_factory()
+        try:
+            result = session.execute(stmt)
+            for partition in result.mappings().partitions(chunk_size):
+                for row in partition:
+                    data = dict(row)
+                    order_value = data.pop("_replay_time")
+                    yield ReplayEvent(
+                        event_type=self.event_type,
+                        timestamp=_as_utc(order_value + offset),
+                        data=data,
+                        source=self.name,
+                        key=(order_value, data[self._id_key]),
+                    )
+        finally:
+            session.close()
+
+
+class CacheSource(ReplaySource):
+    """
+    Streams a table from a storage.columnar_cache.ColumnarCache.
+
+    Events and keys are the same as TableSource's for the same
+    table, so checkpoints are interchangeable.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        event_type: str,
+        cache: Any,
+        table: str,
+        time_offset: timedelta = timedelta(0),
+        symbols: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ):
+        from storage.columnar_cache import CACHE_TABLES
+
+        self.name = name
+        self.event_type = event_type
+        self._cache = cache
+        self._table = table
+        self._spec = CACHE_TABLES[table]
+        self._time_offset = time_offset
+        self._symbols = list(symbols) if symbols else None
+        self._filters = filters
+
+    def stream(
+        self,
+        start: datetime,
+        end: datetime,
+        after: Optional[Tuple[Any, Any]] = None,
+        chunk_size: int = 5000,
+    ) -> Iterator[ReplayEvent]:
+        offset = self._time_offset
+        range_start = _as_naive(start) - offset
+        if after is not None:
+            range_start = max(range_start, after[0])
+        time_column, id_column = self._spec.time_column, self._spec.id_column
+
+        records = self._cache.iter_records(
+            self._table, range_start, _as_naive(end) - offset, self._symbols, self._filters
+        )
+        for data in records:
+            key = (data[time_column], data[id_column])
+            if after is not None and key <= tuple(after):
+                continue
+            yield ReplayEvent(
+                event_type=self.event_type,
+                timestamp=_as_utc(key[0] + offset),
+                data=data,
+                source=self.name,
+                key=key,
+            )
+
+
+def default_sources(
+    session_factory: Callable[[], Any],
+    config: ReplayConfig,
+    cache: Optional[Any] = None,
+) -> List[ReplaySource]:
+    """
+    market_data, onchain_flow_raw and raw_news sources.
+
+    Order breaks timestamp ties: candles, then flows, then news.
+    Each table query walks an idx_*_replay index in key order.
+    With a ColumnarCache, candles and flows are read from the
+    cache (news always comes from the database).
+    """
+    from database.models import MarketData, OnchainFlowRaw
+
+    interval = interval_to_timedelta(config.market_interval)
+    if cache is not None:
+        market_source: ReplaySource = CacheSource(
+            "market_data", "market_candle", cache, "market_data", interval,
+            symbols=config.symbols, filters={"interval": config.market_interval},
+        )
+        onchain_source: ReplaySource = CacheSource(
+            "onchain_flow_raw", "onchain_flow", cache, "onchain_flow_raw", symbols=config.symbols,
+        )
+        return [market_source, onchain_source, _news_source(session_factory)]
+
+    market_filters = [MarketData.interval == config.market_interval]
+    onchain_filters = []
+    if config.symbols:
+        market_filters.append(MarketData.symbol.in_(config.symbols))
+        onchain_filters.append(OnchainFlowRaw.token.in_(config.symbols))
+
+    return [
+        TableSource(
+            "market_data", "market_candle", session_factory, MarketData.__table__,
+            MarketData.candle_open_time, MarketData.id, market_filters,
+            time_offset=interval,
+        ),
+        TableSource(
+            "onchain_flow_raw", "onchain_flow", session_factory, OnchainFlowRaw.__table__,
+            OnchainFlowRaw.event_time, OnchainFlowRaw.id, onchain_filters,
+        ),
+        _news_source(session_factory),
+    ]
+
+
+def _news_source(session_factory: Callable[[], Any]) -> ReplaySource:
+    from database.models import RawNews
+
+    return TableSource(
+        "raw_news", "news", session_factory, RawNews.__table__,
+        func.coalesce(RawNews.published_at, RawNews.fetched_at), RawNews.id,
+    )
+
+
+# ============================================================
+# CHECKPOINTS
+# ============================================================
+
+def _encode_key(key: Tuple[Any, Any]) -> List[Any]:
+    order_value, record_id = key
+    if isinstance(order_value, datetime):
+        return [{"datetime": order_value.isoformat()}, record_id]
+    return [order_value, record_id]
+
+
+def _decode_key(value: List[Any]) -> Tuple[Any, Any]:
+    order_value, record_id = value
+    if isinstance(order_value, dict):
+        order_value = datetime.fromisoformat(order_value["datetime"])
+    return order_value, record_id
+
+
+@dataclass
+class ReplayCheckpoint:
+    """Delivered position of a replay."""
+    replay_time: datetime
+    events_processed: int
+    cursors: Dict[str, Tuple[Any, Any]]  # Source -> key of last delivered event
+    start_time: datetime
+    end_time: datetime
+    sources: List[str]
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": CHECKPOINT_VERSION,
+            "replay_time": self.replay_time.isoformat(),
+            "events_processed": self.events_processed,
+            "cursors": {name: _encode_key(key) for name, key in self.cursors.items()},
+            "start_time": self.start_time.isoformat(),
+            "end_time": self.end_time.isoformat(),
+            "sources": list(self.sources),
+            "created_at": self.created_at.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ReplayCheckpoint":
+        if data.get("version") != CHECKPOINT_VERSION:
+            raise DataValidationError(f"Unsupported checkpoint version: {data.get('version')}")
+        return cls(
+            replay_time=datetime.fromisoformat(data["replay_time"]),
+            events_processed=data["events_processed"],
+            cursors={name: _decode_key(key) for name, key in data["cursors"].items()},
+            start_time=datetime.fromisoformat(data["start_time"]),
+            end_time=datetime.fromisoformat(data["end_time"]),
+            sources=list(data["sources"]),
+            created_at=datetime.fromisoformat(data["created_at"]),
+        )
+
+    def save(self, path: str) -> None:
+        """Write atomically with a payload checksum."""
+        payload = self.to_dict()
+        document = {"payload": payload, "checksum": _checksum(payload)}
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(document, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "ReplayCheckpoint":
+        """Read and verify a checkpoint file."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                document = json.load(f)
+            payload = document["payload"]
+            checksum = document["checksum"]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            raise DataValidationError(f"Unreadable checkpoint {path}: {e}") from e
+        if _checksum(payload) != checksum:
+            raise DataValidationError(f"Checkpoint checksum mismatch: {path}")
+        return cls.from_dict(payload)
+
+
+def _checksum(payload: Dict[str, Any]) -> str:
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# ============================================================
+# SUBSCRIPTIONS
+# ============================================================
+
+EventHandler = Callable[[Any], Any]
+
+
+class ReplaySubscription:
+    """
+    A subscriber with its own bounded queue.
+
+    The handler receives one ReplayEvent at a time, or a list of
+    events when batch=True. Sync and async handlers are supported.
+    """
+
+    def __init__(
+        self,
+        handler: EventHandler,
+        event_types: Optional[Sequence[str]] = None,
+        batch: bool = False,
+        max_pending_batches: int = 8,
+    ):
+        self.handler = handler
+        self.event_types = frozenset(event_types) if event_types else None
+        self.batch = batch
+        self.max_pending_batches = max_pending_batches
+        self.events_delivered = 0
+        self.position: Optional[datetime] = None  # Tick being handled
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def select(self, events: List[ReplayEvent]) -> List[ReplayEvent]:
+        if self.event_types is None:
+            return events
+        return [e for e in events if e.event_type in self.event_types]
+
+    async def deliver(self, events: List[ReplayEvent]) -> None:
+        """Run the handler on events (already selected)."""
+        if not events:
+            return
+        if self.batch:
+            result = self.handler(events)
+            if inspect.isawaitable(result):
+                await result
+        else:
+            for event in events:
+                result = self.handler(event)
+                if inspect.isawaitable(result):
+                    await result
+        self.events_delivered += len(events)
+
+
+# ============================================================
+# REPLAY ENGINE
+# ============================================================
+
+class ReplayEngine:
+    """
+    Replays stored market, on-chain and news data in time order.
+
+    Usage:
+        engine = ReplayEngine(config, session_factory=get_session)
+        engine.subscribe(on_event)
+        await engine.start()
+
+    start() runs until the range is exhausted or stop() is called;
+    pause(), resume(), seek() and stop() may be called from other
+    tasks (or handlers) while it runs.
+    """
+
+    def __init__(
+        self,
+        config: ReplayConfig,
+        session_factory: Optional[Callable[[], Any]] = None,
+        clock: Optional[ReplayClock] = None,
+        sources: Optional[Sequence[ReplaySource]] = None,
+        cache: Optional[Any] = None,
+    ):
+        """
+        Initialize the replay engine.
+
+        Args:
+            config: Replay configuration
+            session_factory: Creates read sessions for the default sources
+            clock: Replay clock to drive (a new one if not given)
+            sources: Custom sources (default: market_data,
+                     onchain_flow_raw and raw_news tables)
+            cache: ColumnarCache for the default candle and flow sources
+        """
+        if sources is None:
+            if session_factory is None:
+                raise InvalidConfigError("session_factory", None, "required without explicit sources")
+            sources = default_sources(session_factory, config, cache)
+        names = [s.name for s in sources]
+        if len(set(names)) != len(names):
+            raise InvalidConfigError("sources", names, "source names must be unique")
+
+        self.config = config
+        self._sources: List[ReplaySource] = list(sources)
+        self._clock = clock or ReplayClock(config.start_time, config.speed_multiplier)
+        self._subscriptions: List[ReplaySubscription] = []
+
+        # Position
+        self._state = ReplayState(current_time=config.start_time)
+        self._cursors: Dict[str, Tuple[Any, Any]] = {}
+        self._open_time = config.start_time
+        self._next_checkpoint: Optional[datetime] = None
+        self._last_checkpoint: Optional[ReplayCheckpoint] = None
+
+        # Control
+        self._resume_event = asyncio.Event()
+        self._resume_event.set()
+        self._stop_requested = False
+        self._seek_target: Optional[datetime] = None
+        self._error: Optional[BaseException] = None
+
+        # Stream state (owned by the fetch thread while a fetch runs)
+        self._streams: List[Iterator[ReplayEvent]] = []
+        self._merged: Optional[Iterator[Tuple[datetime, int, ReplayEvent]]] = None
+        self._lookahead: Optional[Tuple[datetime, int, ReplayEvent]] = None
+
+    # =========================================================
+    # SUBSCRIBERS
+    # =========================================================
+
+    def subscribe(
+        self,
+        handler: EventHandler,
+        event_types: Optional[Sequence[str]] = None,
+        batch: bool = False,
+        max_pending_batches: Optional[int] = None,
+    ) -> ReplaySubscription:
+        """
+        Register a subscriber.
+
+        Args:
+            handler: Called with each event (or each list of events
+                     when batch=True); may be async
+            event_types: Only these event types (None = all)
+            batch: Deliver lists of events instead of single events
+            max_pending_batches: Queue bound (default from config)
+        """
+        if self._state.is_running:
+            raise RuntimeError("Cannot subscribe while the replay is running")
+        subscription = ReplaySubscription(
+            handler,
+            event_types=event_types,
+            batch=batch,
+            max_pending_batches=max_pending_batches or self.config.max_pending_batches,
+        )
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: ReplaySubscription) -> None:
+        if self._state.is_running:
+            raise RuntimeError("Cannot unsubscribe while the replay is running")
+        self._subscriptions.remove(subscription)
+
+    # =========================================================
+    # CONTROL
+    # =========================================================
+
+    async def start(self) -> ReplayState:
+        """
+        Replay from the current position to the end of the range.
+
+        Returns:
+            Final state (also after stop())
+        """
+        if self._state.is_running:
+            raise RuntimeError("Replay already running")
+
+        config = self.config
+        self._state.is_running = True
+        self._stop_requested = False
+        self._error = None
+        previous_clock = ClockFactory.get_clock() if config.install_clock else None
+        if config.install_clock:
+            ClockFactory.set_clock(self._clock)
+        self._start_clock()
+
+        queued = config.replay_mode != ReplayMode.SEQUENTIAL
+        if queued:
+            for subscription in self._subscriptions:
+                subscription._queue = asyncio.Queue(maxsize=subscription.max_pending_batches)
+                subscription.position = self._open_time
+                subscription._task = asyncio.create_task(self._consume(subscription))
+
+        started = time.monotonic()
+        events_before = self._state.events_processed
+        logger.info(
+            f"Replay started: {config.replay_mode.value} "
+            f"{self._open_time.isoformat()} -> {config.end_time.isoformat()}"
+        )
+
+        completed = False
+        try:
+            await self._run()
+            completed = self._error is None
+        finally:
+            if queued:
+                await self._stop_consumers(drain=completed)
+            self._clock.pause()
+            self._state.is_running = False
+            self._state.is_paused = False
+            if config.install_clock:
+                ClockFactory.set_clock(previous_clock)
+
+        if self._error is not None:
+            raise self._error
+
+        self._take_checkpoint()
+        elapsed = time.monotonic() - started
+        processed = self._state.events_processed - events_before
+        logger.info(
+            f"Replay {'stopped' if self._stop_requested else 'complete'}: "
+            f"{processed:,} events in {elapsed:.1f}s "
+            f"({processed / max(elapsed, 1e-9):,.0f} events/s), "
+            f"at {self._state.current_time.isoformat()}"
+        )
+        return self.get_state()
+
+    async def stop(self) -> None:
+        """Stop after the current tick; delivered position is checkpointed."""
+        self._stop_requested = True
+        self._resume_event.set()
+
+    async def pause(self) -> None:
+        """Hold delivery (and the clock) until resume()."""
+        self._resume_event.clear()
+        self._state.is_paused = True
+        if self.config.replay_mode == ReplayMode.TIME_SCALED:
+            self._clock.pause()
+
+    async def resume(self) -> None:
+        """Continue after pause()."""
+        if self.config.replay_mode == ReplayMode.TIME_SCALED and self._state.is_running:
+            self._clock.resume()
+        self._state.is_paused = False
+        self._resume_event.set()
+
+    async def seek(self, timestamp: datetime) -> None:
+        """
+        Continue the replay from timestamp.
+
+        While running, takes effect after the current tick; events
+        already handed to subscribers are still delivered.
+        """
+        timestamp = _as_utc(timestamp)
+        if not self.config.start_time <= timestamp <= self.config.end_time:
+            raise ValueError(f"Seek target {timestamp.isoformat()} outside replay range")
+        if self._state.is_running:
+            self._seek_target = timestamp
+            return
+        self._reposition(timestamp)
+
+    def get_state(self) -> ReplayState:
+        """Copy of the current state."""
+        state = self._state
+        span = (self.config.end_time - self.config.start_time).total_seconds()
+        state.progress_percent = min(
+            100.0, (state.current_time - self.config.start_time).total_seconds() / span * 100
+        )
+        return ReplayState(**vars(state))
+
+    @property
+    def clock(self) -> ReplayClock:
+        return self._clock
+
+    # =========================================================
+    # CHECKPOINTS
+    # =========================================================
+
+    def get_checkpoint(self) -> Optional[ReplayCheckpoint]:
+        """Most recent checkpoint (None before the first one)."""
+        return self._last_checkpoint
+
+    def restore(self, checkpoint: ReplayCheckpoint) -> None:
+        """
+        Continue from a checkpoint on the next start().
+
+        Raises:
+            DataValidationError: Checkpoint belongs to another replay
+        """
+        if self._state.is_running:
+            raise RuntimeError("Cannot restore while the replay is running")
+        expected = (self.config.start_time, self.config.end_time, [s.name for s in self._sources])
+        actual = (_as_utc(checkpoint.start_time), _as_utc(checkpoint.end_time), checkpoint.sources)
+        if actual != expected:
+            raise DataValidationError("Checkpoint does not match this replay's range and sources")
+        replay_time = _as_utc(checkpoint.replay_time)
+        if not self.config.start_time <= replay_time <= self.config.end_time:
+            raise DataValidationError("Checkpoint time outside replay range")
+
+        # Every event up to replay_time was delivered (checkpoints are
+        # taken on tick boundaries), so streams reopen there
+        self._reposition(replay_time)
+        self._cursors = dict(checkpoint.cursors)
+        self._state.events_processed = checkpoint.events_processed
+        self._state.last_checkpoint = replay_time
+        self._last_checkpoint = checkpoint
+
+    def _take_checkpoint(self) -> ReplayCheckpoint:
+        """Snapshot the delivered position (queues must be drained)."""
+        checkpoint = ReplayCheckpoint(
+            replay_time=self._state.current_time,
+            events_processed=self._state.events_processed,
+            cursors=dict(self._cursors),
+            start_time=self.config.start_time,
+            end_time=self.config.end_time,
+            sources=[s.name for s in self._sources],
+        )
+        if self.config.checkpoint_path:
+            checkpoint.save(self.config.checkpoint_path)
+        self._last_checkpoint = checkpoint
+        self._state.last_checkpoint = checkpoint.replay_time
+        return checkpoint
+
+    async def _maybe_checkpoint(self) -> None:
+        interval = self.config.checkpoint_interval_seconds
+        if not interval:
+            return
+        current = self._state.current_time
+        if self._next_checkpoint is None:
+            self._next_checkpoint = current + timedelta(seconds=interval)
+            return
+        if current < self._next_checkpoint:
+            return
+        await self._drain()
+        if self._error is None:
+            self._take_checkpoint()
+        self._next_checkpoint = current + timedelta(seconds=interval)
+
+    # =========================================================
+    # STREAMS
+    # =========================================================
+
+    def _open_streams(self) -> None:
+        start, end = self._open_time, self.config.end_time
+        chunk_size = self.config.chunk_size
+
+        def keyed(rank: int, events: Iterator[ReplayEvent]):
+            for event in events:
+                yield event.timestamp, rank, event
+
+        self._streams = [
+            source.stream(start, end, after=self._cursors.get(source.name), chunk_size=chunk_size)
+            for source in self._sources
+        ]
+        self._merged = heapq.merge(*(keyed(rank, s) for rank, s in enumerate(self._streams)))
+        self._lookahead = None
+
+    def _close_streams(self) -> None:
+        for stream in self._streams:
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+        self._streams = []
+        self._merged = None
+        self._lookahead = None
+
+    def _fetch_batch(self) -> List[ReplayEvent]:
+        """
+        Next batch of about batch_size events, ending on a tick boundary.
+
+        Runs in a worker thread; only one fetch runs at a time.
+        """
+        size = self.config.batch_size
+        batch: List[ReplayEvent] = []
+        if self._lookahead is not None:
+            batch.append(self._lookahead[2])
+            self._lookahead = None
+        for item in self._merged:
+            if len(batch) >= size and item[0] != batch[-1].timestamp:
+                self._lookahead = item
+                break
+            batch.append(item[2])
+        return batch
+
+    # =========================================================
+    # MAIN LOOP
+    # =========================================================
+
+    async def _run(self) -> None:
+        while True:
+            self._open_streams()
+            fetch = asyncio.ensure_future(asyncio.to_thread(self._fetch_batch))
+            try:
+                while True:
+                    batch = await fetch
+                    fetch = None
+                    if not batch:
+                        return
+                    if self._interrupted():
+                        break
+                    # Prefetch the next batch while this one is delivered
+                    fetch = asyncio.ensure_future(asyncio.to_thread(self._fetch_batch))
+                    await self._emit(batch)
+                    if self._interrupted():
+                        break
+                    await self._maybe_checkpoint()
+            finally:
+                if fetch is not None:
+                    await asyncio.gather(fetch, return_exceptions=True)
+                self._close_streams()
+
+            if self._seek_target is None or self._stop_requested or self._error is not None:
+                return
+            await self._drain()
+            target, self._seek_target = self._seek_target, None
+            self._reposition(target)
+            self._start_clock()
+
+    def _interrupted(self) -> bool:
+        return self._stop_requested or self._seek_target is not None or self._error is not None
+
+    def _reposition(self, timestamp: datetime) -> None:
+        self._open_time = timestamp
+        self._cursors = {}
+        self._state.current_time = timestamp
+        self._next_checkpoint = None
+        for subscription in self._subscriptions:
+            subscription.position = timestamp
+        self._clock.set_time(timestamp)
+
+    def _start_clock(self) -> None:
+        clock = self._clock
+        if self.config.replay_mode == ReplayMode.TIME_SCALED:
+            clock.set_speed(self.config.speed_multiplier)
+            clock.set_time(self._state.current_time)
+            if self._resume_event.is_set():
+                clock.resume()
+            else:
+                clock.pause()
+        else:
+            # Data-driven: the clock only moves with delivered ticks
+            clock.pause()
+            clock.set_time(self._state.current_time)
+
+    async def _emit(self, batch: List[ReplayEvent]) -> None:
+        mode = self.config.replay_mode
+        if mode == ReplayMode.INSTANT:
+            await self._wait_if_paused()
+            await self._enqueue(batch)
+            return
+
+        for tick in _ticks(batch):
+            await self._wait_if_paused()
+            if self._interrupted():
+                return
+            if mode == ReplayMode.TIME_SCALED:
+                await self._wait_for_clock(tick[0].timestamp)
+                if self._interrupted():
+                    return
+                await self._enqueue(tick)
+            else:
+                self._clock.set_time(tick[0].timestamp)
+                for subscription in self._subscriptions:
+                    await subscription.deliver(subscription.select(tick))
+                self._advance(tick)
+
+    async def _wait_if_paused(self) -> None:
+        if not self._resume_event.is_set():
+            await self._resume_event.wait()
+
+    async def _wait_for_clock(self, timestamp: datetime) -> None:
+        """Sleep until the running clock reaches timestamp."""
+        while not self._interrupted():
+            await self._wait_if_paused()
+            remaining = (timestamp - self._clock.now()).total_seconds()
+            if remaining <= 0:
+                return
+            await asyncio.sleep(min(remaining / self._clock.speed_multiplier, 0.5))
+
+    async def _enqueue(self, events: List[ReplayEvent]) -> None:
+        """Hand events to every subscriber queue (waits while a queue is full)."""
+        end = events[-1].timestamp
+        for subscription in self._subscriptions:
+            await subscription._queue.put((subscription.select(events), end))
+        if not self._subscriptions and self.config.replay_mode == ReplayMode.INSTANT:
+            self._clock.set_time(end)
+        self._advance(events)
+
+    def _advance(self, events: List[ReplayEvent]) -> None:
+        for event in events:
+            self._cursors[event.source] = event.key
+        self._state.events_processed += len(events)
+        self._state.current_time = events[-1].timestamp
+
+    # =========================================================
+    # CONSUMERS (INSTANT / TIME_SCALED)
+    # =========================================================
+
+    async def _consume(self, subscription: ReplaySubscription) -> None:
+        queue = subscription._queue
+        instant = self.config.replay_mode == ReplayMode.INSTANT
+        while True:
+            item = await queue.get()
+            try:
+                if item is None:
+                    return
+                events, end = item
+                if self._error is not None:
+                    continue  # Discard, keep the producer unblocked
+                await self._wait_if_paused()
+                try:
+                    if instant and not subscription.batch:
+                        for tick in _ticks(events):
+                            self._set_position(subscription, tick[0].timestamp)
+                            await subscription.deliver(tick)
+                    else:
+                        if events:
+                            self._set_position(subscription, events[0].timestamp)
+                        await subscription.deliver(events)
+                    self._set_position(subscription, end)
+                except Exception as e:
+                    logger.error(f"Replay subscriber failed: {e}")
+                    self._error = e
+                    self._resume_event.set()
+            finally:
+                queue.task_done()
+
+    def _set_position(self, subscription: ReplaySubscription, timestamp: datetime) -> None:
+        """Advance the clock to the slowest subscriber's tick (INSTANT)."""
+        if timestamp == subscription.position:
+            return
+        lagging = subscription.position == min(s.position for s in self._subscriptions)
+        subscription.position = timestamp
+        if lagging and self.config.replay_mode == ReplayMode.INSTANT:
+            self._clock.set_time(min(s.position for s in self._subscriptions))
+
+    async def _drain(self) -> None:
+        """Wait until every subscriber queue is empty."""
+        for subscription in self._subscriptions:
+            if subscription._queue is not None:
+                await subscription._queue.join()
+
+    async def _stop_consumers(self, drain: bool) -> None:
+        if drain:
+            await self._drain()
+        for subscription in self._subscriptions:
+            task = subscription._task
+            if task is None:
+                continue
+            if drain:
+                await subscription._queue.put(None)
+                await task
+            else:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+            subscription._task = None
+            subscription._queue = None
+
+
+def _ticks(events: List[ReplayEvent]) -> Iterator[List[ReplayEvent]]:
+    """Split time-ordered events into runs with one timestamp."""
+    start = 0
+    for i in range(1, len(events) + 1):
+        if i == len(events) or events[i].timestamp != events[start].timestamp:
+            yield events[start:i]
+            start = i
+
+
+__all__ = [
+    "MAX_SPEED_MULTIPLIER",
+    "ReplayMode",
+    "ReplayConfig",
+    "ReplayState",
+    "ReplayEvent",
+    "ReplaySource",
+    "TableSource",
+    "CacheSource",
+    "default_sources",
+    "ReplayCheckpoint",
+    "ReplaySubscription",
+    "ReplayEngine",
+    "interval_to_timedelta",
+]
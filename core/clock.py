@@ -211,14 +211,18 @@ class ReplayClock(ClockProtocol):
     def now(self) -> datetime:
         """Get current replay time."""
         with self._lock:
-            if self._paused:
-                return self._current_time
-            
-            # Calculate elapsed real time
-            elapsed_real = time.time() - self._real_start
-            elapsed_replay = elapsed_real * self._speed_multiplier
-            
-            return self._start_time + timedelta(seconds=elapsed_replay)
+            return self._now_locked()
+    
+    def _now_locked(self) -> datetime:
+        """Current replay time; caller holds self._lock."""
+        if self._paused:
+            return self._current_time
+        
+        # Calculate elapsed real time
+        elapsed_real = time.time() - self._real_start
+        elapsed_replay = elapsed_real * self._speed_multiplier
+        
+        return self._start_time + timedelta(seconds=elapsed_replay)
     
     def timestamp(self) -> float:
         """Get current replay timestamp."""
@@ -240,12 +244,14 @@ class ReplayClock(ClockProtocol):
     def pause(self) -> None:
         """Pause the replay."""
         with self._lock:
-            self._current_time = self.now()
+            self._current_time = self._now_locked()
             self._paused = True
     
     def resume(self) -> None:
         """Resume the replay."""
         with self._lock:
+            if not self._paused:
+                return
             self._start_time = self._current_time
             self._real_start = time.time()
             self._paused = False
@@ -254,7 +260,7 @@ class ReplayClock(ClockProtocol):
         """Set replay speed multiplier."""
         with self._lock:
             # Preserve current position
-            current = self.now()
+            current = self._now_locked()
             self._current_time = current
             self._start_time = current
             self._real_start = time.time()
@@ -0,0 +1,527 @@
+"""
+Core Module - Shared HTTP Client Pool.
+
+============================================================
+RESPONSIBILITY
+============================================================
+Provides one long-lived, connection-pooled HTTP layer for the
+whole process.
+
+- One httpx.AsyncClient (HTTP/2 when `h2` is installed)
+- One aiohttp TCPConnector shared by every aiohttp session
+- Keep-alive and per-host connection limits
+- Per-provider token-bucket rate limiting (delays, never drops)
+
+============================================================
+DESIGN PRINCIPLES
+============================================================
+- Sockets, TLS sessions and DNS results are reused across cycles
+- Lifecycle is reference counted: owners call open()/release();
+  long-lived aiohttp sessions hold a reference of their own
+  (open_session()/close_session())
+- Pools are bound to the running event loop and rebuilt if the
+  loop changes (e.g. scripts calling asyncio.run() repeatedly)
+- Callers keep their existing httpx / aiohttp call syntax
+
+============================================================
+"""
+
+import asyncio
+import importlib.util
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+import httpx
+
+
+logger = logging.getLogger("core.http_pool")
+
+
+# ============================================================
+# CONFIGURATION
+# ============================================================
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Token-bucket rate limit for one provider."""
+
+    rate_per_second: float
+    burst: int = 1
+
+
+# Known provider limits (free / public tiers)
+DEFAULT_PROVIDER_RATE_LIMITS: Dict[str, RateLimit] = {
+    "coingecko": RateLimit(rate_per_second=0.5, burst=5),     # 30 req/min
+    "binance": RateLimit(rate_per_second=20.0, burst=40),     # 1200 weight/min
+    "cryptonews": RateLimit(rate_per_second=1.0, burst=3),
+    "cryptopanic": RateLimit(rate_per_second=2.0, burst=5),
+    "whalealert": RateLimit(rate_per_second=10 / 60, burst=2),  # 10 req/min
+    "etherscan": RateLimit(rate_per_second=5.0, burst=5),     # 5 calls/sec
+    "nansen": RateLimit(rate_per_second=2.0, burst=4),
+}
+
+
+@dataclass
+class HttpPoolConfig:
+    """Configuration for the shared HTTP pool."""
+
+    # Connection pooling
+    max_connections: int = 100
+    max_connections_per_host: int = 10
+    max_keepalive_connections: int = 40
+    keepalive_expiry_seconds: float = 30.0
+    dns_cache_ttl_seconds: int = 300
+
+    # Protocol
+    http2: bool = True  # Only effective when the `h2` package is installed
+
+    # Default request timeout
+    timeout_seconds: float = 30.0
+
+    # Per-provider rate limits
+    provider_rate_limits: Dict[str, RateLimit] = field(
+        default_factory=lambda: dict(DEFAULT_PROVIDER_RATE_LIMITS)
+    )
+
+    user_agent: str = "InstitutionalTradingSystem/1.0"
+
+
+# ============================================================
+# TOKEN BUCKET
+# ============================================================
+
+class TokenBucket:
+    """
+    Async token bucket.
+
+    acquire() waits until a token is available instead of failing,
+    so bursts are smoothed rather than dropped.
+    """
+
+    def __init__(self, rate_per_second: float, burst: int = 1) -> None:
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+        self._rate = rate_per_second
+        self._capacity = float(max(1, burst))
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._total_wait_seconds = 0.0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket, waiting if necessary.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                delay = (tokens - self._tokens) / self._rate
+                await asyncio.sleep(delay)
+                waited += delay
+                self._refill()
+            self._tokens -= tokens
+        self._total_wait_seconds += waited
+        return waited
+
+    @property
+    def available(self) -> float:
+        """Tokens currently available (approximate)."""
+        self._refill()
+        return self._tokens
+
+    @property
+    def total_wait_seconds(self) -> float:
+        """Cumulative time callers spent waiting on this bucket."""
+        return self._total_wait_seconds
+
+
+# ============================================================
+# PROVIDER-BOUND CLIENTS
+# ============================================================
+
+class PooledHttpxClient:
+    """
+    httpx client view bound to one provider.
+
+    Exposes the familiar get/post/request coroutines; every call is
+    rate limited and per-host bounded before hitting the shared pool.
+    """
+
+    def __init__(
+        self,
+        registry: "HttpClientRegistry",
+        provider: str,
+        timeout: Optional[float],
+    ) -> None:
+        self._registry = registry
+        self._provider = provider
+        self._timeout = timeout
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request through the shared client."""
+        if self._timeout is not None:
+            kwargs.setdefault("timeout", self._timeout)
+        client = await self._registry.get_httpx_client()
+        await self._registry.throttle(self._provider)
+        async with self._registry.host_slot(url):
+            return await client.request(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+
+class PooledAiohttpSession:
+    """
+    aiohttp session view bound to one provider.
+
+    get/post/request are async context managers, mirroring
+    aiohttp.ClientSession, so `async with session.get(...) as resp`
+    works unchanged.
+    """
+
+    def __init__(
+        self,
+        registry: "HttpClientRegistry",
+        provider: str,
+        session: aiohttp.ClientSession,
+    ) -> None:
+        self._registry = registry
+        self._provider = provider
+        self._session = session
+
+    @asynccontextmanager
+    async def request(
+        self,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Send a request through the shared connector."""
+        await self._registry.throttle(self._provider)
+        async with self._session.request(method, url, **kwargs) as response:
+            yield response
+
+    def get(self, url: str, **kwargs: Any):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any):
+        return self.request("POST", url, **kwargs)
+
+
+# ============================================================
+# REGISTRY
+# ============================================================
+
+class HttpClientRegistry:
+    """
+    Process-wide registry of pooled HTTP clients and rate limiters.
+
+    Usage:
+        registry = get_http_registry()
+        await registry.open()  # owner lifecycle (optional, lazy otherwise)
+
+        async with registry.client("binance") as client:
+            response = await client.get(url, params=params)
+
+        async with registry.session("cryptopanic", timeout=30) as session:
+            async with session.get(url) as response:
+                ...
+
+        await registry.release()
+    """
+
+    def __init__(self, config: Optional[HttpPoolConfig] = None) -> None:
+        self._config = config or HttpPoolConfig()
+        self._httpx_client: Optional[httpx.AsyncClient] = None
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._refcount = 0
+
+        # Stats
+        self._requests_by_provider: Dict[str, int] = {}
+
+    @property
+    def config(self) -> HttpPoolConfig:
+        return self._config
+
+    @property
+    def http2_enabled(self) -> bool:
+        """Whether the httpx client negotiates HTTP/2."""
+        return self._config.http2 and importlib.util.find_spec("h2") is not None
+
+    # --------------------------------------------------------
+    # LIFECYCLE
+    # --------------------------------------------------------
+
+    async def open(self) -> None:
+        """Register an owner and make sure the pools exist."""
+        self._refcount += 1
+        await self._ensure_pools()
+
+    async def release(self) -> None:
+        """Unregister an owner; pools close when the last owner leaves."""
+        self._refcount = max(0, self._refcount - 1)
+        if self._refcount == 0:
+            await self.close()
+
+    async def close(self) -> None:
+        """Close all pooled connections immediately."""
+        client, connector = self._httpx_client, self._connector
+        self._httpx_client = None
+        self._connector = None
+        self._loop = None
+        self._host_semaphores.clear()
+        self._buckets.clear()
+
+        if client is not None:
+            try:
+                await client.aclose()
+            except RuntimeError as e:  # Loop already gone
+                logger.debug(f"httpx client close skipped: {e}")
+        if connector is not None and not connector.closed:
+            try:
+                await connector.close()
+            except RuntimeError as e:
+                logger.debug(f"aiohttp connector close skipped: {e}")
+
+    def _bound_to_current_loop(self) -> bool:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return self._loop is loop and not loop.is_closed()
+
+    async def _ensure_pools(self) -> None:
+        if self._bound_to_current_loop() and self._httpx_client is not None:
+            return
+
+        if self._loop is not None:
+            # Event loop changed - previous pools are unusable
+            logger.debug("Event loop changed, rebuilding HTTP pools")
+            self._httpx_client = None
+            self._connector = None
+            self._host_semaphores.clear()
+            self._buckets.clear()
+
+        cfg = self._config
+        self._loop = asyncio.get_running_loop()
+        self._httpx_client = httpx.AsyncClient(
+            http2=self.http2_enabled,
+            timeout=cfg.timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=cfg.max_connections,
+                max_keepalive_connections=cfg.max_keepalive_connections,
+                keepalive_expiry=cfg.keepalive_expiry_seconds,
+            ),
+            headers={"User-Agent": cfg.user_agent},
+        )
+        self._connector = aiohttp.TCPConnector(
+            limit=cfg.max_connections,
+            limit_per_host=cfg.max_connections_per_host,
+            keepalive_timeout=cfg.keepalive_expiry_seconds,
+            ttl_dns_cache=cfg.dns_cache_ttl_seconds,
+        )
+        logger.info(
+            f"HTTP pool ready | http2={self.http2_enabled} | "
+            f"max_connections={cfg.max_connections} | "
+            f"per_host={cfg.max_connections_per_host}"
+        )
+
+    # --------------------------------------------------------
+    # POOL ACCESS
+    # --------------------------------------------------------
+
+    async def get_httpx_client(self) -> httpx.AsyncClient:
+        """Get the shared httpx client (do not close it)."""
+        await self._ensure_pools()
+        return self._httpx_client
+
+    async def get_connector(self) -> aiohttp.TCPConnector:
+        """
+        Get the shared aiohttp connector.
+
+        The connector closes when the last owner releases it, so
+        long-lived sessions should come from open_session() instead.
+        """
+        await self._ensure_pools()
+        return self._connector
+
+    async def open_session(
+        self,
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> aiohttp.ClientSession:
+        """
+        Create a long-lived aiohttp session on the shared connector.
+
+        The session holds an owner reference, so the connector stays
+        open until close_session() is called for it.
+        """
+        await self.open()
+        return aiohttp.ClientSession(
+            connector=self._connector,
+            connector_owner=False,  # Shared process-wide pool
+            timeout=aiohttp.ClientTimeout(total=timeout or self._config.timeout_seconds),
+            headers=headers,
+        )
+
+    async def close_session(self, session: aiohttp.ClientSession) -> None:
+        """Close a session from open_session() and drop its reference."""
+        try:
+            if not session.closed:
+                await session.close()
+        except RuntimeError as e:  # Created on a loop that is gone
+            logger.debug(f"aiohttp session close skipped: {e}")
+        finally:
+            await self.release()
+
+    def session_is_live(self, session: aiohttp.ClientSession) -> bool:
+        """Whether a session from open_session() still uses the live connector."""
+        return (
+            not session.closed
+            and session.connector is self._connector
+            and self._bound_to_current_loop()
+        )
+
+    @asynccontextmanager
+    async def client(
+        self,
+        provider: str,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[PooledHttpxClient]:
+        """Yield an httpx client view bound to a provider."""
+        await self._ensure_pools()
+        yield PooledHttpxClient(self, provider, timeout)
+
+    @asynccontextmanager
+    async def session(
+        self,
+        provider: str,
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> AsyncIterator[PooledAiohttpSession]:
+        """Yield an aiohttp session view on the shared connector."""
+        connector = await self.get_connector()
+        session = aiohttp.ClientSession(
+            connector=connector,
+            connector_owner=False,
+            timeout=aiohttp.ClientTimeout(total=timeout or self._config.timeout_seconds),
+            headers=headers,
+        )
+        try:
+            yield PooledAiohttpSession(self, provider, session)
+        finally:
+            await session.close()
+
+    # --------------------------------------------------------
+    # LIMITING
+    # --------------------------------------------------------
+
+    def rate_limiter(self, provider: str) -> Optional[TokenBucket]:
+        """Get the token bucket for a provider (None if unlimited)."""
+        bucket = self._buckets.get(provider)
+        if bucket is None:
+            limit = self._config.provider_rate_limits.get(provider)
+            if limit is None:
+                return None
+            bucket = TokenBucket(limit.rate_per_second, limit.burst)
+            self._buckets[provider] = bucket
+        return bucket
+
+    async def throttle(self, provider: str) -> None:
+        """Wait for the provider's rate limiter, if any."""
+        self._requests_by_provider[provider] = self._requests_by_provider.get(provider, 0) + 1
+        bucket = self.rate_limiter(provider)
+        if bucket is not None:
+            waited = await bucket.acquire()
+            if waited > 0:
+                logger.debug(f"[{provider}] rate limited, waited {waited:.2f}s")
+
+    @asynccontextmanager
+    async def host_slot(self, url: str) -> AsyncIterator[None]:
+        """Bound concurrent httpx requests per host."""
+        host = urlsplit(url).netloc
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._config.max_connections_per_host)
+            self._host_semaphores[host] = semaphore
+        async with semaphore:
+            yield
+
+    # --------------------------------------------------------
+    # STATUS
+    # --------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics for monitoring."""
+        return {
+            "open": self._httpx_client is not None,
+            "owners": self._refcount,
+            "http2": self.http2_enabled,
+            "requests_by_provider": dict(self._requests_by_provider),
+            "rate_limit_wait_seconds": {
+                name: round(bucket.total_wait_seconds, 3)
+                for name, bucket in self._buckets.items()
+            },
+        }
+
+
+# ============================================================
+# GLOBAL ACCESS
+# ============================================================
+
+_registry: Optional[HttpClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_http_registry() -> HttpClientRegistry:
+    """Get the process-wide HTTP client registry."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = HttpClientRegistry()
+        return _registry
+
+
+def set_http_registry(registry: HttpClientRegistry) -> None:
+    """Replace the process-wide HTTP client registry (testing/config)."""
+    global _registry
+    with _registry_lock:
+        _registry = registry
+
+
+# ============================================================
+# EXPORTS
+# ============================================================
+
+__all__ = [
+    "RateLimit",
+    "DEFAULT_PROVIDER_RATE_LIMITS",
+    "HttpPoolConfig",
+    "TokenBucket",
+    "PooledHttpxClient",
+    "PooledAiohttpSession",
+    "HttpClientRegistry",
+    "get_http_registry",
+    "set_http_registry",
+]
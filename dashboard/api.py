@@ -15,8 +15,12 @@ from typing import Dict, Any, List, Optional
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 
+from monitoring.metrics import PROMETHEUS_CONTENT_TYPE, get_metrics_collector
+from monitoring.tracing import Trace, get_tracer
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,13 +43,6 @@ class StatusResponse(BaseModel):
     trading_allowed: bool
 
 
-class MetricsResponse(BaseModel):
-    total_cycles: int = 0
-    successful_cycles: int = 0
-    failed_cycles: int = 0
-    last_error: Optional[str] = None
-
-
 # ============================================================
 # FastAPI Application
 # ============================================================
@@ -106,10 +103,13 @@ async def get_status():
     )
 
 
-@app.get("/metrics", response_model=MetricsResponse, tags=["Metrics"])
+@app.get("/metrics", response_class=PlainTextResponse, tags=["Metrics"])
 async def get_metrics():
-    """Get system metrics."""
-    return MetricsResponse()
+    """System metrics in the Prometheus text exposition format."""
+    return PlainTextResponse(
+        get_metrics_collector().render_prometheus(),
+        media_type=PROMETHEUS_CONTENT_TYPE,
+    )
 
 
 @app.get("/api/health", tags=["API"])
@@ -118,6 +118,36 @@ async def api_health():
     return {"status": "ok", "timestamp": datetime.utcnow().isoformat()}
 
 
+# ============================================================
+# Tracing Endpoints
+# ============================================================
+
+def _get_trace(trace_id: str) -> Trace:
+    trace = get_tracer().exporter.get(trace_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail=f"Trace not found: {trace_id}")
+    return trace
+
+
+@app.get("/traces", tags=["Tracing"])
+async def list_traces(limit: int = 20):
+    """Recently finished cycle traces, newest first."""
+    return [trace.summary() for trace in get_tracer().exporter.recent(limit)]
+
+
+@app.get("/traces/{trace_id}", tags=["Tracing"])
+async def get_trace_breakdown(trace_id: str):
+    """Flame-style breakdown of one cycle: total and self time per call path."""
+    trace = _get_trace(trace_id)
+    return {**trace.summary(), "breakdown": trace.breakdown()}
+
+
+@app.get("/traces/{trace_id}/chrome", tags=["Tracing"])
+async def get_chrome_trace(trace_id: str):
+    """One cycle as Chrome trace JSON (load in chrome://tracing or Perfetto)."""
+    return _get_trace(trace_id).to_chrome_trace()
+
+
 # ============================================================
 # Review Queue Endpoints (from human_review)
 # ============================================================
@@ -0,0 +1,403 @@
+"""
+Live Dashboard Snapshot Publisher.
+
+============================================================
+PURPOSE
+============================================================
+Compute the dashboard views once per change and push them to
+every connected viewer.
+
+- One set of DashboardService queries per change, however many
+  dashboards are open
+- Changes are detected from cycle completion and alert events:
+  in-process via notify(), across processes via a single
+  watermark query (newest row id of every table the views read)
+- Subscribers receive a full snapshot, then deltas holding only
+  the views that changed
+- A slow subscriber is never waited on: if its queue fills up
+  it is resynchronised with a fresh snapshot
+
+With no subscribers the publisher stays idle and issues no
+queries at all.
+
+============================================================
+"""
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from dashboard.services import DashboardService
+from database.engine import get_session
+from database.models import (
+    CleanedNews,
+    EntryDecision,
+    ExecutionRecord,
+    OnchainFlowRaw,
+    PositionSizing,
+    RawNews,
+    RiskState,
+    SentimentScore,
+    SystemMonitoring,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================
+# VIEWS
+# =============================================================
+
+# View name -> query on the dashboard service
+VIEWS: Dict[str, Callable[[DashboardService], Any]] = {
+    "health": lambda service: service.get_system_health(),
+    "pipeline": lambda service: service.get_pipeline_stats(),
+    "risk": lambda service: service.get_latest_risk_state(),
+    "decisions": lambda service: service.get_recent_decisions(limit=50),
+    "positions": lambda service: service.get_position_execution_stats(),
+    "alerts": lambda service: service.get_active_alerts(limit=50),
+}
+
+# Event -> views it can change
+EVENT_VIEWS: Dict[str, Tuple[str, ...]] = {
+    "cycle": tuple(VIEWS),
+    "alert": ("alerts", "health"),
+}
+
+# Tables read by the views; their newest ids form the change watermark
+WATERMARK_MODELS = (
+    SystemMonitoring, RawNews, CleanedNews, SentimentScore, OnchainFlowRaw,
+    RiskState, EntryDecision, PositionSizing, ExecutionRecord,
+)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return str(value)
+
+
+@dataclass
+class PublisherConfig:
+    """Configuration for the snapshot publisher."""
+    poll_interval_seconds: float = 2.0    # Watermark check interval
+    max_staleness_seconds: float = 60.0   # Full refresh even without changes
+    subscriber_queue_size: int = 16       # Messages buffered per subscriber
+
+
+# =============================================================
+# SUBSCRIPTION
+# =============================================================
+
+class Subscription:
+    """
+    One viewer's message stream.
+
+    Iterate it (async for) to receive messages; close it when the
+    viewer disconnects.
+    """
+
+    def __init__(self, publisher: "SnapshotPublisher", queue_size: int):
+        self._publisher = publisher
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.needs_snapshot = True
+
+    def _offer(self, message: Dict[str, Any]) -> None:
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Too far behind for deltas: start over from a snapshot
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(self._publisher.snapshot())
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Next message, or None if none arrives within timeout."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self._publisher._unsubscribe(self)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        return await self._queue.get()
+
+
+# =============================================================
+# PUBLISHER
+# =============================================================
+
+class SnapshotPublisher:
+    """
+    Server-side owner of the live dashboard views.
+
+    Also usable as an AlertManager notification handler: each
+    alert marks the alert-driven views for refresh.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = get_session,
+        config: Optional[PublisherConfig] = None,
+        views: Optional[Dict[str, Callable[[DashboardService], Any]]] = None,
+    ):
+        self._session_factory = session_factory
+        self._config = config or PublisherConfig()
+        self._views = views or VIEWS
+
+        self._version = 0
+        self._generated_at: Optional[datetime] = None
+        self._data: Dict[str, Any] = {}
+        self._encoded: Dict[str, str] = {}
+        self._watermark: Optional[Tuple] = None
+        self._refreshed_at = 0.0
+        self._pending_refresh: Optional[asyncio.Task] = None
+
+        self._subscribers: Set[Subscription] = set()
+        self._dirty: Set[str] = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+        # Statistics
+        self.refreshes = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """The full current state of every view."""
+        return self._message("snapshot", self._data)
+
+    def _message(self, kind: str, views: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "type": kind,
+            "version": self._version,
+            "generated_at": self._generated_at.isoformat() if self._generated_at else None,
+            "views": dict(views),
+        }
+
+    # ---------------------------------------------------------
+    # EVENTS
+    # ---------------------------------------------------------
+
+    def notify(self, event: str = "cycle", views: Optional[Iterable[str]] = None) -> None:
+        """Mark the views an event can change for refresh."""
+        self._dirty.update(views if views is not None else EVENT_VIEWS.get(event, self._views))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def __call__(self, alert: Any) -> bool:
+        self.notify("alert")
+        return True
+
+    # ---------------------------------------------------------
+    # SUBSCRIBERS
+    # ---------------------------------------------------------
+
+    def subscribe(self) -> Subscription:
+        """
+        Register a viewer.
+
+        The first message is a full snapshot: immediately if one
+        exists, otherwise as soon as the first refresh completes.
+        """
+        subscription = Subscription(self, self._config.subscriber_queue_size)
+        self._subscribers.add(subscription)
+        if self._version > 0:
+            subscription.needs_snapshot = False
+            subscription._offer(self.snapshot())
+        self.start()
+        self._wakeup.set()
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        self._subscribers.discard(subscription)
+
+    def _publish(self, changed: Dict[str, Any]) -> None:
+        delta = self._message("delta", changed) if changed else None
+        for subscription in list(self._subscribers):
+            if subscription.needs_snapshot:
+                subscription.needs_snapshot = False
+                subscription._offer(self.snapshot())
+            elif delta is not None:
+                subscription._offer(delta)
+
+    # ---------------------------------------------------------
+    # REFRESH
+    # ---------------------------------------------------------
+
+    @staticmethod
+    def _query_watermark(session: Session) -> Tuple:
+        stmt = select(*(
+            select(func.max(model.id)).scalar_subquery() for model in WATERMARK_MODELS
+        ))
+        return tuple(session.execute(stmt).one())
+
+    def _read_watermark(self) -> Tuple:
+        session = self._session_factory()
+        try:
+            return self._query_watermark(session)
+        finally:
+            session.close()
+
+    def _compute(self, names: List[str]) -> Dict[str, Any]:
+        session = self._session_factory()
+        try:
+            if set(names) == set(self._views):
+                # Read first: a row landing mid-refresh triggers another one
+                try:
+                    self._watermark = self._query_watermark(session)
+                except Exception as e:
+                    logger.error(f"Dashboard watermark query failed: {e}")
+                    session.rollback()
+            service = DashboardService(session)
+            results = {}
+            for name in names:
+                try:
+                    results[name] = self._views[name](service)
+                except Exception as e:
+                    logger.error(f"Dashboard view {name} failed: {e}")
+                    session.rollback()
+            return results
+        finally:
+            session.close()
+
+    async def refresh(self, names: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Recompute views (all by default) and publish those that changed.
+
+        Returns the changed views.
+        """
+        names = [name for name in (names or self._views) if name in self._views]
+        results = await asyncio.to_thread(self._compute, names)
+        self._refreshed_at = time.monotonic()
+        self.refreshes += 1
+
+        changed = {}
+        for name, data in results.items():
+            encoded = json.dumps(data, default=_json_default, sort_keys=True)
+            if encoded != self._encoded.get(name):
+                self._encoded[name] = encoded
+                self._data[name] = json.loads(encoded)
+                changed[name] = self._data[name]
+
+        if changed or self._version == 0:
+            self._version += 1
+            self._generated_at = datetime.utcnow()
+        self._publish(changed)
+        return changed
+
+    async def ensure_fresh(self) -> None:
+        """
+        Bring the snapshot up to date for a one-off read.
+
+        A snapshot younger than max_staleness_seconds is served as is;
+        otherwise every view is recomputed, once for all concurrent
+        callers.
+        """
+        if self._version and (
+            time.monotonic() - self._refreshed_at < self._config.max_staleness_seconds
+        ):
+            return
+
+        loop = asyncio.get_running_loop()
+        pending = self._pending_refresh
+        if pending is None or pending.done() or pending.get_loop() is not loop:
+            pending = self._pending_refresh = loop.create_task(
+                self.refresh(), name="dashboard-snapshot-refresh"
+            )
+        # A caller that goes away must not cancel the others' refresh
+        await asyncio.shield(pending)
+
+    async def _due_views(self) -> Set[str]:
+        """Views to refresh this tick, if any."""
+        due, self._dirty = self._dirty, set()
+        if self._version == 0:
+            return set(self._views)
+
+        try:
+            watermark = await asyncio.to_thread(self._read_watermark)
+        except Exception as e:
+            logger.error(f"Dashboard watermark query failed: {e}")
+            watermark = self._watermark
+        if watermark != self._watermark:
+            return set(self._views)
+
+        if time.monotonic() - self._refreshed_at >= self._config.max_staleness_seconds:
+            return set(self._views)
+        return due
+
+    async def _run(self) -> None:
+        while True:
+            if self._subscribers:
+                try:
+                    due = await self._due_views()
+                    if due:
+                        await self.refresh(due)
+                except Exception as e:
+                    logger.error(f"Dashboard refresh failed: {e}")
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._config.poll_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    # ---------------------------------------------------------
+    # LIFECYCLE
+    # ---------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the refresh loop on the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            # Bound to the loop the task runs on
+            self._wakeup = asyncio.Event()
+            self._task = loop.create_task(
+                self._run(), name="dashboard-snapshot-publisher"
+            )
+
+    async def stop(self) -> None:
+        """Stop the refresh loop; subscribers keep their last state."""
+        if self._task is not None and self._task.get_loop() is asyncio.get_running_loop():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+
+# =============================================================
+# PROCESS-WIDE PUBLISHER
+# =============================================================
+
+_publisher: Optional[SnapshotPublisher] = None
+
+
+def get_snapshot_publisher() -> SnapshotPublisher:
+    """Get the process-wide snapshot publisher."""
+    global _publisher
+    if _publisher is None:
+        _publisher = SnapshotPublisher()
+    return _publisher
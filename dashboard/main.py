@@ -1,12 +1,24 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from dashboard.routers import health, pipeline, risk, decisions, positions, alerts
+from dashboard.live import get_snapshot_publisher
+from dashboard.routers import health, pipeline, risk, decisions, positions, alerts, live
 from human_review.router import router as review_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The live publisher starts with its first subscriber
+    yield
+    await get_snapshot_publisher().stop()
+
+
 app = FastAPI(
     title="Institutional Trading Dashboard API",
     description="Operational control panel for monitoring system health, risk, and decisions.",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS (Allow local frontend development)
@@ -25,6 +37,7 @@ app.include_router(risk.router)
 app.include_router(decisions.router)
 app.include_router(positions.router)
 app.include_router(alerts.router)
+app.include_router(live.router)
 app.include_router(review_router)
 
 @app.get("/")
@@ -1,6 +1,6 @@
 """
 Dashboard API Routers.
 """
-from . import health, pipeline, risk, decisions, positions, alerts
+from . import health, pipeline, risk, decisions, positions, alerts, live
 
-__all__ = ["health", "pipeline", "risk", "decisions", "positions", "alerts"]
+__all__ = ["health", "pipeline", "risk", "decisions", "positions", "alerts", "live"]
@@ -0,0 +1,86 @@
+import asyncio
+import json
+from typing import Optional
+
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+
+from dashboard.live import SnapshotPublisher, _json_default, get_snapshot_publisher
+
+router = APIRouter(prefix="/live", tags=["Live Stream"])
+
+KEEPALIVE_SECONDS = 15.0
+
+
+def get_publisher():
+    return get_snapshot_publisher()
+
+
+@router.get("/snapshot")
+async def get_live_snapshot(publisher: SnapshotPublisher = Depends(get_publisher)):
+    """
+    Get the current state of every dashboard view.
+
+    Served from memory; once it is older than max_staleness_seconds
+    the views are recomputed first (once for concurrent requests).
+    Live clients should follow /live/stream instead of polling this.
+    """
+    await publisher.ensure_fresh()
+    return publisher.snapshot()
+
+
+@router.get("/stream")
+async def stream_live(since: Optional[int] = None, publisher: SnapshotPublisher = Depends(get_publisher)):
+    """
+    Server-Sent Events stream of dashboard updates.
+
+    The first event is a full snapshot, skipped if the client already
+    holds version `since`; every following event is a delta of the
+    views that changed. A `since` ahead of the server (e.g. after a
+    restart) is ignored and a snapshot is sent.
+    """
+    if since is not None and since > publisher.version:
+        since = None
+    subscription = publisher.subscribe()
+
+    async def events():
+        try:
+            while True:
+                message = await subscription.get(timeout=KEEPALIVE_SECONDS)
+                if message is None:
+                    yield ": keepalive\n\n"
+                    continue
+                if since is not None and message["version"] <= since:
+                    continue
+                data = json.dumps(message, default=_json_default)
+                yield f"event: {message['type']}\nid: {message['version']}\ndata: {data}\n\n"
+        finally:
+            subscription.close()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/ws")
+async def websocket_live(websocket: WebSocket, publisher: SnapshotPublisher = Depends(get_publisher)):
+    """WebSocket stream of dashboard updates: a snapshot, then deltas."""
+    await websocket.accept()
+    subscription = publisher.subscribe()
+
+    async def pump():
+        async for message in subscription:
+            await websocket.send_text(json.dumps(message, default=_json_default))
+
+    sender = asyncio.create_task(pump())
+    try:
+        # Clients only listen; receiving detects the disconnect
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        sender.cancel()
+        subscription.close()
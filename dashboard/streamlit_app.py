@@ -13,6 +13,8 @@ Run with:
     streamlit run dashboard/streamlit_app.py
 """
 
+import json
+
 import streamlit as st
 import requests
 import pandas as pd
@@ -24,7 +26,8 @@ import time
 # =============================================================
 
 API_BASE_URL = "http://127.0.0.1:8000"
-REFRESH_INTERVAL = 5  # seconds
+REFRESH_INTERVAL = 5  # seconds, fallback when the live stream is unavailable
+STREAM_READ_TIMEOUT = 30  # seconds, server keepalives arrive every 15
 
 st.set_page_config(
     page_title="Trading Dashboard",
@@ -47,6 +50,59 @@ def fetch_api(endpoint: str) -> dict:
         st.error(f"API Error: {e}")
         return None
 
+
+def fetch_view(snapshot: dict, name: str, limit: int = None) -> dict:
+    """
+    One view from the live snapshot, in its REST endpoint's shape.
+
+    All panels read from a single snapshot computed server-side, so
+    the database load does not grow with the number of viewers.
+    """
+    if not snapshot or name not in snapshot.get("views", {}):
+        return None
+    data = snapshot["views"][name]
+    if name == "positions":
+        return {"success": True, **data}
+    if name == "risk" and not data:
+        return {"success": False}
+    if limit is not None:
+        data = data[:limit]
+    return {"success": True, "data": data}
+
+
+def apply_update(snapshot: dict, message: dict) -> dict:
+    """Our snapshot with a streamed snapshot or delta applied (None if out of sync)."""
+    if message.get("type") == "snapshot":
+        return message
+    if not snapshot or message.get("version") != snapshot.get("version", 0) + 1:
+        return None
+    return {**message, "type": "snapshot", "views": {**snapshot["views"], **message["views"]}}
+
+
+def wait_for_update(snapshot: dict) -> dict:
+    """
+    Block until the server publishes a version newer than ours.
+
+    Returns our snapshot with the streamed update applied, so the next
+    run renders without fetching /live/snapshot again (None if the
+    stream failed and the next run should fetch it).
+    """
+    version = snapshot.get("version", 0) if snapshot else 0
+    try:
+        with requests.get(
+            f"{API_BASE_URL}/live/stream",
+            params={"since": version},
+            stream=True,
+            timeout=(5, STREAM_READ_TIMEOUT),
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines(decode_unicode=True):
+                if line and line.startswith("data:"):
+                    return apply_update(snapshot, json.loads(line[len("data:"):]))
+    except (requests.exceptions.RequestException, ValueError):
+        time.sleep(REFRESH_INTERVAL)
+    return None
+
 # =============================================================
 # SIDEBAR
 # =============================================================
@@ -54,10 +110,8 @@ def fetch_api(endpoint: str) -> dict:
 with st.sidebar:
     st.title("⚙️ Dashboard Settings")
     
-    # Auto-refresh toggle
-    auto_refresh = st.checkbox("Auto-refresh", value=True)
-    if auto_refresh:
-        refresh_rate = st.slider("Refresh rate (seconds)", 5, 60, 10)
+    # Live updates toggle (pushed by the API, no polling)
+    auto_refresh = st.checkbox("Live updates", value=True)
     
     st.divider()
     
@@ -85,7 +139,10 @@ st.caption("Operational Control Panel for Live Trading Supervision")
 st.header("1️⃣ System Health Panel")
 st.caption("Source: `system_monitoring` table | Module: All")
 
-health_data = fetch_api("/health/system")
+# Rendered from the live stream when it woke us; fetched otherwise
+snapshot = st.session_state.pop("live_snapshot", None) or fetch_api("/live/snapshot")
+
+health_data = fetch_view(snapshot, "health")
 
 if health_data and health_data.get("success"):
     modules = health_data.get("data", [])
@@ -124,7 +181,7 @@ st.divider()
 st.header("2️⃣ Data Pipeline Visibility")
 st.caption("Source: `raw_news`, `cleaned_news`, `sentiment_scores`, `onchain_flow_raw` | Window: 24h")
 
-pipeline_data = fetch_api("/pipeline/stats")
+pipeline_data = fetch_view(snapshot, "pipeline")
 
 if pipeline_data and pipeline_data.get("success"):
     stats = pipeline_data.get("data", [])
@@ -166,7 +223,7 @@ st.divider()
 st.header("3️⃣ Risk State Panel")
 st.caption("Source: `risk_state` table | Module: `risk_scoring`")
 
-risk_data = fetch_api("/risk/state")
+risk_data = fetch_view(snapshot, "risk")
 
 if risk_data and risk_data.get("success"):
     data = risk_data.get("data", {})
@@ -232,7 +289,7 @@ st.divider()
 st.header("4️⃣ Decision Trace Panel")
 st.caption("Source: `entry_decision` table | Module: `decision_engine`")
 
-decision_data = fetch_api("/decisions/latest?limit=10")
+decision_data = fetch_view(snapshot, "decisions", limit=10)
 
 if decision_data and decision_data.get("success"):
     decisions = decision_data.get("data", [])
@@ -285,7 +342,7 @@ st.divider()
 st.header("5️⃣ Position & Execution Monitor")
 st.caption("Source: `execution_records`, `position_sizing` | Module: `execution`")
 
-position_data = fetch_api("/positions/monitor")
+position_data = fetch_view(snapshot, "positions")
 
 if position_data and position_data.get("success"):
     # Recent Executions
@@ -326,7 +383,7 @@ st.divider()
 st.header("6️⃣ Alert & Incident Panel")
 st.caption("Source: `system_monitoring` (severity: warning/error/critical) | Module: Various")
 
-alert_data = fetch_api("/alerts/active?limit=20")
+alert_data = fetch_view(snapshot, "alerts", limit=20)
 
 if alert_data and alert_data.get("success"):
     alerts = alert_data.get("data", [])
@@ -468,5 +525,5 @@ with col3:
 # =============================================================
 
 if auto_refresh:
-    time.sleep(refresh_rate)
+    st.session_state["live_snapshot"] = wait_for_update(snapshot)
     st.rerun()
@@ -38,6 +38,7 @@ from uuid import UUID
 
 from sqlalchemy.orm import Session
 
+from core.http_pool import get_http_registry
 from data_ingestion.collectors.base import BaseCollector
 from data_ingestion.types import (
     DataType,
@@ -105,7 +106,7 @@ class CoinGeckoCollector(BaseCollector[RawMarketItem]):
         import httpx
         
         try:
-            async with httpx.AsyncClient(timeout=self._config.timeout_seconds) as client:
+            async with get_http_registry().client("coingecko", timeout=self._config.timeout_seconds) as client:
                 url = f"{self._cg_config.base_url}/coins/markets"
                 params = {
                     "vs_currency": "usd",
@@ -38,6 +38,7 @@ from uuid import UUID
 
 from sqlalchemy.orm import Session
 
+from core.http_pool import get_http_registry
 from data_ingestion.collectors.base import BaseCollector
 from data_ingestion.types import (
     DataType,
@@ -109,7 +110,7 @@ class CryptoNewsApiCollector(BaseCollector[RawNewsItem]):
         import httpx
         
         try:
-            async with httpx.AsyncClient(timeout=self._config.timeout_seconds) as client:
+            async with get_http_registry().client("cryptonews", timeout=self._config.timeout_seconds) as client:
                 # CryptoNews API uses /category endpoint
                 url = f"{self._news_config.base_url}/category"
                 
@@ -46,6 +46,7 @@ from uuid import UUID
 
 from sqlalchemy.orm import Session
 
+from core.http_pool import get_http_registry
 from data_ingestion.collectors.base import BaseCollector
 from data_ingestion.types import (
     DataType,
@@ -158,7 +159,7 @@ class OnChainCollector(BaseCollector[RawOnChainItem]):
         
         all_chain_data: List[Dict[str, Any]] = []
         
-        async with httpx.AsyncClient(timeout=self._config.timeout_seconds) as client:
+        async with get_http_registry().client("onchain_free", timeout=self._config.timeout_seconds) as client:
             for endpoint_info in endpoints:
                 try:
                     response = await client.get(
@@ -0,0 +1,330 @@
+"""
+Data Ingestion - Incremental Exchange Flow Aggregator.
+
+============================================================
+RESPONSIBILITY
+============================================================
+Turns onchain_flow_raw rows into per-exchange flow aggregates
+(1h, 4h, 24h) without re-reading the raw table every cycle.
+
+- Raw rows are summed into fixed-width buckets (default 5
+  minutes). Every bucket that gained rows since the watermark
+  is recomputed from ALL of its raw rows with ONE INSERT ...
+  SELECT ... GROUP BY statement, replacing it on conflict
+- The watermark is a created_at time re-read with a trailing
+  commit lag, so rows that commit late (after a concurrent
+  writer's newer rows were already seen) are still picked up;
+  re-reading a row is harmless because buckets are replaced,
+  not incremented
+- Window aggregates are rolled up from the buckets with ONE
+  GROUP BY per window (bucket table stays small)
+
+============================================================
+DESIGN PRINCIPLES
+============================================================
+- Cost proportional to the rows of recently touched buckets,
+  not to the raw table size
+- All aggregation happens in SQL; Python only shapes results
+- Window boundaries are aligned to bucket boundaries
+- Buckets older than the longest window are pruned
+
+============================================================
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import (
+    Select, Subquery, case, delete, extract, func, literal, literal_column, select, tuple_,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from database.models import ExchangeFlowBucket, OnchainFlowRaw
+from database.persistence import load_watermarks, save_watermarks
+
+
+logger = logging.getLogger("ingestion.exchange_flow")
+
+
+# Watermark identifiers
+WATERMARK_COMPONENT = "exchange_flow_buckets"
+WATERMARK_STREAM = "onchain_flow_raw"
+
+FLOW_TYPES = ("exchange_inflow", "exchange_outflow")
+
+
+# ============================================================
+# CONFIGURATION
+# ============================================================
+
+@dataclass
+class ExchangeFlowAggregatorConfig:
+    """Configuration for the incremental exchange flow aggregator."""
+
+    tokens: List[str] = field(default_factory=lambda: ["BTC", "ETH", "USDT", "USDC", "USDD", "DAI"])
+    time_windows: Dict[str, timedelta] = field(default_factory=lambda: {
+        "1h": timedelta(hours=1),
+        "4h": timedelta(hours=4),
+        "24h": timedelta(hours=24),
+    })
+    min_tx_count: int = 1  # Minimum transactions to create aggregate
+    bucket_seconds: int = 300  # 5-minute buckets
+    commit_lag_seconds: int = 300  # Longest created_at -> commit delay of a raw row
+    source_name: str = "whale_alert"
+
+    @property
+    def retention(self) -> timedelta:
+        """How far back buckets must be kept."""
+        longest = max(self.time_windows.values(), default=timedelta(hours=24))
+        return longest + timedelta(seconds=self.bucket_seconds)
+
+
+# ============================================================
+# AGGREGATOR
+# ============================================================
+
+class ExchangeFlowAggregator:
+    """
+    Incremental, SQL-side exchange flow aggregation.
+
+    Usage:
+        aggregator = ExchangeFlowAggregator(config)
+        aggregates = aggregator.aggregate(session, now)  # caller commits
+    """
+
+    def __init__(self, config: Optional[ExchangeFlowAggregatorConfig] = None) -> None:
+        self._config = config or ExchangeFlowAggregatorConfig()
+
+    # --------------------------------------------------------
+    # PUBLIC API
+    # --------------------------------------------------------
+
+    def aggregate(self, session: Session, now: datetime) -> List[Dict[str, Any]]:
+        """
+        Fold new raw flows into buckets and roll up every window.
+
+        Args:
+            session: Database session (caller commits)
+            now: Aggregation time (naive UTC)
+
+        Returns:
+            List of aggregate records ready for persistence
+        """
+        recomputed = self.update_buckets(session, now)
+        self.prune_buckets(session, now)
+
+        aggregates: List[Dict[str, Any]] = []
+        for time_window, window_delta in self._config.time_windows.items():
+            aggregates.extend(self.rollup(session, time_window, window_delta, now))
+
+        logger.debug(
+            f"[ExchangeFlow] Recomputed {recomputed} buckets; generated {len(aggregates)} "
+            f"aggregates across {len(self._config.time_windows)} time windows"
+        )
+        return aggregates
+
+    # --------------------------------------------------------
+    # BUCKETS
+    # --------------------------------------------------------
+
+    def update_buckets(self, session: Session, now: datetime) -> int:
+        """
+        Recompute the buckets that gained raw rows since the watermark.
+
+        Rows created within commit_lag_seconds before the watermark
+        are read again, so rows committed late are not skipped.
+
+        Returns:
+            Number of buckets recomputed
+        """
+        mark = load_watermarks(session, WATERMARK_COMPONENT).get(WATERMARK_STREAM)
+        since = None
+        if mark is not None and mark.watermark_time is not None:
+            since = mark.watermark_time - timedelta(seconds=self._config.commit_lag_seconds)
+
+        columns = [
+            "token", "exchange", "bucket_start",
+            "inflow_amount", "outflow_amount", "inflow_usd", "outflow_usd",
+            "inflow_tx_count", "outflow_tx_count", "updated_at",
+        ]
+        stmt = pg_insert(ExchangeFlowBucket.__table__).from_select(
+            columns, self.bucket_totals(since, now)
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_exchange_flow_bucket",
+            set_={col: stmt.excluded[col] for col in columns[3:]},
+        )
+        result = session.execute(stmt)
+
+        save_watermarks(session, WATERMARK_COMPONENT, {
+            WATERMARK_STREAM: {"watermark_time": now},
+        })
+        return result.rowcount or 0
+
+    def _flows(self, now: datetime, *criteria: Any) -> Subquery:
+        """Exchange flows in retention, reduced to (token, exchange, bucket) dimensions."""
+        cfg = self._config
+        raw = OnchainFlowRaw.__table__.c
+        entity = case(
+            (raw.flow_type == "exchange_inflow", raw.to_entity),
+            else_=raw.from_entity,
+        )
+        exchange = func.lower(func.trim(entity))
+        epoch = extract("epoch", raw.event_time)
+        bucket_seconds = literal_column(str(int(cfg.bucket_seconds)))
+
+        return select(
+            raw.token,
+            exchange.label("exchange"),
+            func.timezone(
+                "UTC", func.to_timestamp(func.floor(epoch / bucket_seconds) * bucket_seconds)
+            ).label("bucket_start"),
+            (raw.flow_type == "exchange_inflow").label("is_inflow"),
+            func.coalesce(raw.amount, 0).label("amount"),
+            func.coalesce(raw.amount_usd, 0).label("amount_usd"),
+        ).where(
+            raw.event_time >= now - cfg.retention,
+            raw.token.in_(cfg.tokens),
+            raw.flow_type.in_(FLOW_TYPES),
+            entity.isnot(None),
+            exchange.notin_(["", "unknown"]),
+            *criteria,
+        ).subquery()
+
+    def bucket_totals(self, since: Optional[datetime], now: datetime) -> Select:
+        """
+        Full totals of every bucket holding raw rows created at or after since.
+
+        Touched buckets are summed over all of their raw rows, old and
+        new, so the result does not depend on how often a row was read.
+        since=None touches every bucket in retention. One row per
+        (token, exchange, bucket_start), in the column order
+        update_buckets inserts them.
+        """
+        raw = OnchainFlowRaw.__table__.c
+        new = self._flows(now, *([raw.created_at >= since] if since is not None else []))
+        touched = select(new.c.token, new.c.exchange, new.c.bucket_start).distinct().cte("touched")
+        first_bucket = select(func.min(touched.c.bucket_start)).scalar_subquery()
+
+        f = self._flows(now, raw.event_time >= first_bucket).c
+        return select(
+            f.token,
+            f.exchange,
+            f.bucket_start,
+            func.sum(case((f.is_inflow, f.amount), else_=0)).label("inflow_amount"),
+            func.sum(case((f.is_inflow, 0), else_=f.amount)).label("outflow_amount"),
+            func.sum(case((f.is_inflow, f.amount_usd), else_=0)).label("inflow_usd"),
+            func.sum(case((f.is_inflow, 0), else_=f.amount_usd)).label("outflow_usd"),
+            func.count().filter(f.is_inflow).label("inflow_tx_count"),
+            func.count().filter(~f.is_inflow).label("outflow_tx_count"),
+            literal(now).label("updated_at"),
+        ).where(
+            tuple_(f.token, f.exchange, f.bucket_start).in_(select(touched))
+        ).group_by(f.token, f.exchange, f.bucket_start)
+
+    def prune_buckets(self, session: Session, now: datetime) -> int:
+        """Delete buckets older than the longest window."""
+        result = session.execute(
+            delete(ExchangeFlowBucket).where(
+                ExchangeFlowBucket.bucket_start < now - self._config.retention
+            )
+        )
+        return result.rowcount or 0
+
+    # --------------------------------------------------------
+    # ROLLUP
+    # --------------------------------------------------------
+
+    def _window_start(self, now: datetime, window_delta: timedelta) -> datetime:
+        """Window start aligned down to a bucket boundary."""
+        start = now - window_delta
+        epoch = int((start - datetime(1970, 1, 1)).total_seconds())
+        return datetime(1970, 1, 1) + timedelta(seconds=epoch - epoch % self._config.bucket_seconds)
+
+    def rollup(
+        self,
+        session: Session,
+        time_window: str,
+        window_delta: timedelta,
+        now: datetime,
+    ) -> List[Dict[str, Any]]:
+        """Roll buckets up into per-(token, exchange) aggregates for one window."""
+        cfg = self._config
+        window_start = self._window_start(now, window_delta)
+        b = ExchangeFlowBucket
+
+        rows = session.execute(
+            select(
+                b.token,
+                b.exchange,
+                func.sum(b.inflow_amount),
+                func.sum(b.outflow_amount),
+                func.sum(b.inflow_usd),
+                func.sum(b.outflow_usd),
+                func.sum(b.inflow_tx_count),
+                func.sum(b.outflow_tx_count),
+            ).where(
+                b.bucket_start >= window_start,
+                b.bucket_start <= now,
+                b.token.in_(cfg.tokens),
+            ).group_by(b.token, b.exchange)
+        ).all()
+
+        # Total USD flow per token for dominance percentage
+        total_flow_usd: Dict[str, float] = {}
+        for row in rows:
+            total_flow_usd[row[0]] = total_flow_usd.get(row[0], 0.0) + (row[4] or 0.0) + (row[5] or 0.0)
+
+        aggregates: List[Dict[str, Any]] = []
+        for token, exchange, inflow, outflow, inflow_usd, outflow_usd, inflow_tx, outflow_tx in rows:
+            inflow_tx = int(inflow_tx or 0)
+            outflow_tx = int(outflow_tx or 0)
+            total_tx = inflow_tx + outflow_tx
+
+            # Skip if below minimum transaction count
+            if total_tx < cfg.min_tx_count:
+                continue
+
+            inflow = inflow or 0.0
+            outflow = outflow or 0.0
+            inflow_usd = inflow_usd or 0.0
+            outflow_usd = outflow_usd or 0.0
+            net_flow_usd = inflow_usd - outflow_usd
+
+            dominance_pct = None
+            if total_flow_usd[token] > 0:
+                dominance_pct = ((inflow_usd + outflow_usd) / total_flow_usd[token]) * 100
+
+            aggregates.append({
+                "token": token,
+                "exchange": exchange,
+                "time_window": time_window,
+                "inflow_amount": inflow,
+                "outflow_amount": outflow,
+                "net_flow": inflow - outflow,
+                "inflow_usd": inflow_usd if inflow_usd > 0 else None,
+                "outflow_usd": outflow_usd if outflow_usd > 0 else None,
+                "net_flow_usd": net_flow_usd if abs(net_flow_usd) > 0 else None,
+                "inflow_tx_count": inflow_tx,
+                "outflow_tx_count": outflow_tx,
+                "total_tx_count": total_tx,
+                "flow_ratio": inflow / outflow if outflow > 0 else None,
+                "dominance_pct": dominance_pct,
+                "window_start": window_start,
+                "window_end": now,
+                "source_name": cfg.source_name,
+                "data_points_count": total_tx,
+                "aggregated_at": now,
+            })
+
+        return aggregates
+
+
+__all__ = [
+    "WATERMARK_COMPONENT",
+    "ExchangeFlowAggregatorConfig",
+    "ExchangeFlowAggregator",
+]
@@ -0,0 +1,394 @@
+"""
+Data Ingestion - Incremental Kline Fetcher.
+
+============================================================
+RESPONSIBILITY
+============================================================
+Fetches Binance OHLCV klines for many symbols concurrently,
+requesting only candles newer than a persisted cursor.
+
+- One cursor per (symbol, interval): open time of the last
+  CLOSED candle that was persisted
+- Requests start at cursor + interval via `startTime`
+- Gaps (downtime, new symbols) are backfilled in large pages
+- Cursors are saved in the same transaction as the records and
+  advance only after it commits
+
+============================================================
+DESIGN PRINCIPLES
+============================================================
+- Append-only writes: only the still-forming candle is re-upserted
+- Bounded concurrency, rate limited by the shared HTTP pool
+- Per-symbol failure isolation: one bad symbol never drops the rest
+- Cursors seeded from market_data on first run (no re-backfill)
+
+============================================================
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from core.http_pool import HttpClientRegistry
+from database.engine import get_db_session
+from database.models import MarketData
+from database.persistence import load_watermarks, save_watermarks
+
+
+logger = logging.getLogger("ingestion.klines")
+
+
+# Binance interval -> milliseconds
+INTERVAL_MS: Dict[str, int] = {
+    "1m": 60_000,
+    "3m": 3 * 60_000,
+    "5m": 5 * 60_000,
+    "15m": 15 * 60_000,
+    "30m": 30 * 60_000,
+    "1h": 3_600_000,
+    "2h": 2 * 3_600_000,
+    "4h": 4 * 3_600_000,
+    "6h": 6 * 3_600_000,
+    "8h": 8 * 3_600_000,
+    "12h": 12 * 3_600_000,
+    "1d": 86_400_000,
+}
+
+
+# ============================================================
+# CONFIGURATION
+# ============================================================
+
+@dataclass
+class KlineFetcherConfig:
+    """Configuration for the incremental kline fetcher."""
+
+    base_url: str = "https://fapi.binance.com"
+    endpoint: str = "/fapi/v1/klines"
+    exchange: str = "binance_futures"
+    interval: str = "1h"
+
+    # Concurrency across symbols
+    max_concurrency: int = 10
+
+    # Paging (Binance max: 1500 futures / 1000 spot)
+    page_limit: int = 1000
+    max_pages_per_cycle: int = 10  # Remaining backlog continues next cycle
+
+    # First-run lookback when no cursor exists
+    initial_lookback_candles: int = 5
+
+    timeout_seconds: float = 30.0
+
+    @property
+    def interval_ms(self) -> int:
+        if self.interval not in INTERVAL_MS:
+            raise ValueError(f"Unsupported kline interval: {self.interval}")
+        return INTERVAL_MS[self.interval]
+
+    @property
+    def cursor_component(self) -> str:
+        return f"{self.exchange}_klines"
+
+
+@dataclass
+class KlineFetchResult:
+    """Outcome of one concurrent fetch across all symbols."""
+
+    records: List[Dict[str, Any]]
+    symbols_ok: int = 0
+    symbols_failed: int = 0
+    requests_made: int = 0
+    errors: Optional[List[str]] = None
+
+
+# ============================================================
+# FETCHER
+# ============================================================
+
+class KlineFetcher:
+    """
+    Concurrent, cursor-driven Binance kline fetcher.
+
+    Usage:
+        fetcher = KlineFetcher(config, http_registry)
+        result = await fetcher.fetch(symbols)
+        advanced = fetcher.cursor_advances(result.records)
+
+        def write(session):
+            persist(session, result.records)
+            fetcher.save_cursors(session, advanced)
+
+        await writer.submit(write)  # One transaction
+        fetcher.commit_cursors(advanced)
+    """
+
+    def __init__(
+        self,
+        config: KlineFetcherConfig,
+        http_registry: HttpClientRegistry,
+    ) -> None:
+        self._config = config
+        self._http = http_registry
+
+        # (PAIR) -> open time (ms) of last persisted closed candle
+        self._cursors: Dict[str, int] = {}
+        self._cursors_loaded = False
+
+    # --------------------------------------------------------
+    # CURSORS
+    # --------------------------------------------------------
+
+    def _stream_key(self, pair: str) -> str:
+        return f"{pair}:{self._config.interval}"
+
+    def _load_cursors(self, pairs: List[str]) -> None:
+        """
+        Load cursors from pipeline_watermarks.
+
+        Pairs without a watermark are seeded from the newest closed
+        candle already in market_data, so existing deployments do not
+        re-fetch history they already have.
+        """
+        cfg = self._config
+        with get_db_session() as session:
+            marks = load_watermarks(session, cfg.cursor_component)
+            for pair in pairs:
+                mark = marks.get(self._stream_key(pair))
+                if mark is not None and mark.watermark_time is not None:
+                    self._cursors[pair] = _to_ms(mark.watermark_time)
+
+            missing = [pair for pair in pairs if pair not in self._cursors]
+            if missing:
+                now = datetime.utcnow()
+                rows = session.query(
+                    MarketData.pair,
+                    func.max(MarketData.candle_open_time),
+                ).filter(
+                    MarketData.exchange == cfg.exchange,
+                    MarketData.interval == cfg.interval,
+                    MarketData.pair.in_(missing),
+                    MarketData.candle_close_time < now,
+                ).group_by(MarketData.pair).all()
+                for pair, last_open in rows:
+                    if last_open is not None:
+                        self._cursors[pair] = _to_ms(last_open)
+
+        self._cursors_loaded = True
+        logger.info(
+            f"[Klines] Loaded {len(self._cursors)}/{len(pairs)} cursors "
+            f"({cfg.cursor_component})"
+        )
+
+    def get_cursor(self, pair: str) -> Optional[datetime]:
+        """Get the in-memory cursor for a pair (None if unknown)."""
+        cursor_ms = self._cursors.get(pair.upper())
+        return _from_ms(cursor_ms) if cursor_ms is not None else None
+
+    def cursor_advances(self, records: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Cursors the closed candles in records would advance.
+
+        Returns:
+            Dict of PAIR -> open time (ms) of its newest closed candle,
+            only for pairs whose cursor moves forward
+        """
+        advanced: Dict[str, int] = {}
+        for record in records:
+            if record.get("interval") != self._config.interval:
+                continue
+            if record["candle_close_time"] > record["fetched_at"]:
+                continue  # Still forming
+            pair = record["pair"]
+            open_ms = _to_ms(record["candle_open_time"])
+            if open_ms > max(self._cursors.get(pair, -1), advanced.get(pair, -1)):
+                advanced[pair] = open_ms
+        return advanced
+
+    def save_cursors(self, session: Session, advanced: Dict[str, int]) -> int:
+        """
+        Write advanced cursors to pipeline_watermarks.
+
+        Runs in the caller's transaction (the market_data write job),
+        so a cursor is never stored without its candles. Does not commit.
+
+        Returns:
+            Number of cursors written
+        """
+        return save_watermarks(
+            session,
+            self._config.cursor_component,
+            {
+                self._stream_key(pair): {"watermark_time": _from_ms(open_ms).replace(tzinfo=None)}
+                for pair, open_ms in advanced.items()
+            },
+        )
+
+    def commit_cursors(self, advanced: Dict[str, int]) -> int:
+        """
+        Adopt advanced cursors for the next fetch.
+
+        Must be called only after the transaction that saved them
+        committed.
+
+        Returns:
+            Number of cursors advanced
+        """
+        self._cursors.update(advanced)
+        return len(advanced)
+
+    # --------------------------------------------------------
+    # FETCHING
+    # --------------------------------------------------------
+
+    async def fetch(self, symbols: List[str]) -> KlineFetchResult:
+        """
+        Fetch new klines for all symbols concurrently.
+
+        Raises:
+            Exception: The first symbol's error, if every symbol failed
+        """
+        pairs = [symbol.upper() for symbol in symbols]
+        if not pairs:
+            return KlineFetchResult(records=[])
+
+        if not self._cursors_loaded:
+            await asyncio.to_thread(self._load_cursors, pairs)
+
+        semaphore = asyncio.Semaphore(max(1, self._config.max_concurrency))
+        fetched_at = datetime.now(timezone.utc)
+
+        async def run(pair: str) -> Tuple[str, List[Dict[str, Any]], int]:
+            async with semaphore:
+                records, requests = await self._fetch_symbol(pair, fetched_at)
+                return pair, records, requests
+
+        outcomes = await asyncio.gather(*(run(pair) for pair in pairs), return_exceptions=True)
+
+        result = KlineFetchResult(records=[], errors=[])
+        first_error: Optional[BaseException] = None
+        for pair, outcome in zip(pairs, outcomes):
+            if isinstance(outcome, BaseException):
+                first_error = first_error or outcome
+                result.symbols_failed += 1
+                result.errors.append(f"{pair}: {type(outcome).__name__}: {outcome}")
+                logger.warning(f"[Klines] {pair} failed: {outcome}")
+                continue
+            _, records, requests = outcome
+            result.records.extend(records)
+            result.requests_made += requests
+            result.symbols_ok += 1
+
+        if result.symbols_ok == 0:
+            raise first_error
+
+        logger.info(
+            f"[Klines] {result.symbols_ok}/{len(pairs)} symbols | "
+            f"{len(result.records)} candles | {result.requests_made} requests"
+        )
+        return result
+
+    async def _fetch_symbol(
+        self,
+        pair: str,
+        fetched_at: datetime,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Fetch all candles after the pair's cursor, paging forward."""
+        cfg = self._config
+        interval_ms = cfg.interval_ms
+        now_ms = _to_ms(fetched_at)
+
+        cursor_ms = self._cursors.get(pair)
+        if cursor_ms is None:
+            start_ms = (now_ms // interval_ms - cfg.initial_lookback_candles + 1) * interval_ms
+        else:
+            start_ms = cursor_ms + interval_ms
+
+        records: List[Dict[str, Any]] = []
+        requests = 0
+        url = f"{cfg.base_url}{cfg.endpoint}"
+
+        async with self._http.client("binance", timeout=cfg.timeout_seconds) as client:
+            while requests < cfg.max_pages_per_cycle and start_ms <= now_ms:
+                response = await client.get(url, params={
+                    "symbol": pair,
+                    "interval": cfg.interval,
+                    "startTime": start_ms,
+                    "limit": cfg.page_limit,
+                })
+                requests += 1
+                response.raise_for_status()
+
+                klines = response.json()
+                if not isinstance(klines, list):
+                    raise RuntimeError(f"Unexpected Binance response for {pair}")
+
+                for kline in klines:
+                    records.append(self._to_record(pair, kline, fetched_at))
+
+                if len(klines) < cfg.page_limit:
+                    break  # Caught up
+                start_ms = int(klines[-1][0]) + interval_ms
+
+        if requests >= cfg.max_pages_per_cycle and start_ms <= now_ms:
+            logger.info(
+                f"[Klines] {pair} backfill continues next cycle "
+                f"(at {_from_ms(start_ms).isoformat()})"
+            )
+        return records, requests
+
+    def _to_record(
+        self,
+        pair: str,
+        kline: List[Any],
+        fetched_at: datetime,
+    ) -> Dict[str, Any]:
+        """Convert a Binance kline row into a market_data record."""
+        # Binance kline format: [open_time, open, high, low, close, volume, close_time, quote_volume, trades, ...]
+        return {
+            "symbol": pair.replace("USDT", ""),
+            "pair": pair,
+            "exchange": self._config.exchange,
+            "open_price": float(kline[1]),
+            "high_price": float(kline[2]),
+            "low_price": float(kline[3]),
+            "close_price": float(kline[4]),
+            "volume": float(kline[5]),
+            "quote_volume": float(kline[7]),
+            "vwap": None,
+            "trade_count": int(kline[8]) if len(kline) > 8 else None,
+            "interval": self._config.interval,
+            "candle_open_time": _from_ms(int(kline[0])),
+            "candle_close_time": _from_ms(int(kline[6])),
+            "source_module": "RealIngestionModule.binance",
+            "fetched_at": fetched_at,
+        }
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+def _to_ms(dt: datetime) -> int:
+    """Datetime (naive = UTC) to epoch milliseconds."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp() * 1000)
+
+
+def _from_ms(ms: int) -> datetime:
+    """Epoch milliseconds to aware UTC datetime."""
+    return datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(milliseconds=ms)
+
+
+__all__ = [
+    "INTERVAL_MS",
+    "KlineFetcherConfig",
+    "KlineFetchResult",
+    "KlineFetcher",
+]
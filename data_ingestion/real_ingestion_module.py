@@ -27,17 +27,23 @@ import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
 from uuid import uuid4
 
 import aiohttp
 
 from sqlalchemy.orm import Session
-from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy import func
 
+from core.http_pool import HttpClientRegistry, get_http_registry
+from data_ingestion.exchange_flow_aggregator import ExchangeFlowAggregator, ExchangeFlowAggregatorConfig
+from data_ingestion.kline_fetcher import KlineFetcher, KlineFetcherConfig
+from database.async_writer import AsyncBatchWriter, get_async_writer
+from database.bulk import DEFAULT_COPY_THRESHOLD, bulk_upsert, existing_keys, multirow_upsert
 from database.engine import get_session, get_db_session
 from database.models import MarketData, RawNews, OnchainFlowRaw, ExchangeFlowAggregate
+from monitoring.metrics import MetricsCollector, get_metrics_collector, log_buckets
+from monitoring.tracing import get_tracer
 
 
 # ============================================================
@@ -71,6 +77,11 @@ class RealIngestionConfig:
     binance_use_futures: bool = True
     binance_base_url: str = "https://fapi.binance.com"
     binance_spot_url: str = "https://api.binance.com"
+    binance_interval: str = "1h"
+    binance_max_concurrency: int = 10  # Concurrent symbol fetches
+    binance_page_limit: int = 1000  # Candles per request (backfill page size)
+    binance_max_pages_per_cycle: int = 10  # Backfill pages per symbol per cycle
+    binance_initial_lookback_candles: int = 5  # First run without a cursor
     
     # CryptoNews API settings
     cryptonews_enabled: bool = True
@@ -123,12 +134,23 @@ class RealIngestionConfig:
     exchange_flow_tokens: List[str] = field(default_factory=lambda: ["BTC", "ETH", "USDT", "USDC", "USDD", "DAI"])
     exchange_flow_time_windows: List[str] = field(default_factory=lambda: ["1h", "4h", "24h"])
     exchange_flow_min_tx_count: int = 1  # Minimum transactions to create aggregate
+    exchange_flow_bucket_seconds: int = 300  # Rollup bucket width (windows align to it)
+    
+    # Persistence
+    persist_batch_size: int = 2000  # Rows per multi-row upsert statement
+    copy_threshold: int = DEFAULT_COPY_THRESHOLD  # Batches this large use COPY (0 = never)
     
     # Timeouts and retries
     timeout_seconds: float = 30.0
     max_retries: int = 3
     retry_delay_seconds: float = 60.0  # Wait 60s on rate limit
     
+    # Source fan-out: run all enabled sources concurrently
+    parallel_collection: bool = True
+    max_concurrent_sources: int = 8
+    source_deadline_seconds: float = 90.0  # Per-source fetch + persist budget
+    source_deadline_overrides: Dict[str, float] = field(default_factory=dict)  # e.g. {"nansen": 120.0}
+    
     # Failure mode: if True, any fetch failure stops ingestion
     # Set to False to allow partial data collection
     fail_fast: bool = False
@@ -172,6 +194,12 @@ class IngestionCycleResult:
     total_stored: int = 0
     total_errors: int = 0
     
+    # Per-source wall time (seconds) and failures
+    source_timings: Dict[str, float] = field(default_factory=dict)
+    failed_sources: List[str] = field(default_factory=list)
+    # Deadline hit mid-persist: the queued write may still commit
+    unconfirmed_sources: List[str] = field(default_factory=list)
+    
     # Error details
     errors: List[str] = field(default_factory=list)
     
@@ -181,6 +209,55 @@ class IngestionCycleResult:
         return self.total_errors == 0 and self.total_fetched > 0
 
 
+# ============================================================
+# SOURCE SPEC
+# ============================================================
+
+# Columns refreshed when an upsert hits an existing row
+MARKET_DATA_UPDATE_COLUMNS = (
+    "correlation_id", "open_price", "high_price", "low_price", "close_price",
+    "volume", "quote_volume", "vwap", "trade_count", "candle_close_time",
+    "source_module", "fetched_at",
+)
+EXCHANGE_FLOW_UPDATE_COLUMNS = (
+    "correlation_id", "inflow_amount", "outflow_amount", "net_flow",
+    "inflow_usd", "outflow_usd", "net_flow_usd", "inflow_tx_count",
+    "outflow_tx_count", "total_tx_count", "flow_ratio", "dominance_pct",
+    "window_end", "data_points_count", "aggregated_at",
+)
+
+# Source names, in collection order. Each has matching
+# <name>_fetched / <name>_stored fields on IngestionCycleResult.
+SOURCE_NAMES = (
+    "coingecko",
+    "binance",
+    "cryptonews",
+    "cryptopanic",
+    "whalealert",
+    "etherscan",
+    "nansen",
+)
+
+# 10ms .. 10min
+INGESTION_DURATION_BUCKETS = log_buckets(0.01, 600)
+
+
+@dataclass(frozen=True)
+class _SourceSpec:
+    """A single fetch -> persist unit of an ingestion cycle."""
+    
+    name: str
+    label: str
+    enabled: bool
+    fetch: Callable[[], Awaitable[List[Dict[str, Any]]]]
+    persist: Callable[[List[Dict[str, Any]]], Awaitable[int]]
+    market_data: bool = False  # Critical source; records returned to the caller
+
+
+class _CriticalSourceError(RuntimeError):
+    """Critical source failures already recorded in the cycle result."""
+
+
 # ============================================================
 # REAL INGESTION MODULE
 # ============================================================
@@ -215,6 +292,9 @@ class RealIngestionModule:
         self,
         config: Optional[RealIngestionConfig] = None,
         session_factory=None,
+        http_registry: Optional[HttpClientRegistry] = None,
+        async_writer: Optional[AsyncBatchWriter] = None,
+        metrics: Optional[MetricsCollector] = None,
         **kwargs,
     ) -> None:
         """
@@ -223,12 +303,65 @@ class RealIngestionModule:
         Args:
             config: Ingestion configuration
             session_factory: Optional factory for database sessions
+            http_registry: Shared HTTP pool (defaults to the process-wide one)
+            async_writer: DB writer thread (defaults to the process-wide one)
+            metrics: Metrics registry (defaults to the process-wide one)
             **kwargs: Additional arguments (for orchestrator compatibility)
         """
         self._config = config or RealIngestionConfig()
         self._session_factory = session_factory or get_session
+        self._http = http_registry or get_http_registry()
+        self._writer = async_writer or get_async_writer()
+        self._flow_aggregator = ExchangeFlowAggregator(
+            ExchangeFlowAggregatorConfig(
+                tokens=list(self._config.exchange_flow_tokens),
+                time_windows={
+                    window: self._parse_time_window(window)
+                    for window in self._config.exchange_flow_time_windows
+                },
+                min_tx_count=self._config.exchange_flow_min_tx_count,
+                bucket_seconds=self._config.exchange_flow_bucket_seconds,
+            )
+        )
+        self._kline_fetcher = KlineFetcher(
+            KlineFetcherConfig(
+                base_url=(
+                    self._config.binance_base_url
+                    if self._config.binance_use_futures
+                    else self._config.binance_spot_url
+                ),
+                endpoint="/fapi/v1/klines" if self._config.binance_use_futures else "/api/v3/klines",
+                exchange="binance_futures" if self._config.binance_use_futures else "binance_spot",
+                interval=self._config.binance_interval,
+                max_concurrency=self._config.binance_max_concurrency,
+                page_limit=self._config.binance_page_limit,
+                max_pages_per_cycle=self._config.binance_max_pages_per_cycle,
+                initial_lookback_candles=self._config.binance_initial_lookback_candles,
+                timeout_seconds=self._config.timeout_seconds,
+            ),
+            self._http,
+        )
         self._logger = logging.getLogger("ingestion.real")
         
+        # Metrics
+        metrics = metrics or get_metrics_collector()
+        self._metric_cycle_duration = metrics.histogram(
+            "ingestion_cycle_duration_seconds", "Ingestion cycle wall time",
+            buckets=INGESTION_DURATION_BUCKETS,
+        )
+        self._metric_source_duration = metrics.histogram(
+            "ingestion_source_duration_seconds", "Fetch + persist time per source",
+            labels=("source",), buckets=INGESTION_DURATION_BUCKETS,
+        )
+        self._metric_records = metrics.counter(
+            "ingestion_records_total", "Records fetched / stored per source",
+            labels=("source", "stage"),
+        )
+        self._metric_failures = metrics.counter(
+            "ingestion_source_failures_total", "Failed source collections",
+            labels=("source",),
+        )
+        
         # State
         self._running = False
         self._last_result: Optional[IngestionCycleResult] = None
@@ -427,12 +560,21 @@ class RealIngestionModule:
         self._validate_configuration()
         self._validate_database_connection()
         
+        # Open the shared connection pool (kept alive across cycles)
+        await self._http.open()
+        
+        # Writes run on a dedicated thread so the event loop never blocks on the DB
+        self._writer.start()
+        
         self._running = True
         self._logger.info("RealIngestionModule started")
     
     async def stop(self) -> None:
         """Stop the ingestion module."""
         self._logger.info("Stopping RealIngestionModule...")
+        if self._running:
+            await self._http.release()
+            await self._writer.flush()
         self._running = False
         self._logger.info("RealIngestionModule stopped")
     
@@ -444,6 +586,8 @@ class RealIngestionModule:
             "is_placeholder": False,
             "total_cycles": self._total_cycles,
             "total_records": self._total_records,
+            "http_pool": self._http.get_stats(),
+            "db_writer": self._writer.get_stats(),
             "last_cycle": {
                 "success": self._last_result.success if self._last_result else None,
                 "fetched": self._last_result.total_fetched if self._last_result else 0,
@@ -469,10 +613,15 @@ class RealIngestionModule:
         Run a complete data collection cycle.
         
         This method:
-        1. Fetches data from CoinGecko (ticker data)
-        2. Fetches data from Binance (OHLCV klines)
-        3. Persists all data to market_data table
-        4. Returns list of stored records
+        1. Fetches data from every enabled source (market, news, on-chain)
+        2. Persists each source's records as soon as they arrive
+        3. Aggregates exchange flows from the persisted on-chain data
+        4. Returns list of stored market data records
+        
+        With parallel_collection enabled, sources are fanned out
+        concurrently (bounded by max_concurrent_sources) and each one
+        runs under its own deadline, so cycle latency approaches the
+        slowest single provider instead of the sum of all of them.
         
         Returns:
             List of stored market data records
@@ -485,126 +634,29 @@ class RealIngestionModule:
             started_at=datetime.now(timezone.utc),
         )
         
-        self._logger.info(f"=== INGESTION CYCLE {result.cycle_id} STARTED ===")
+        self._logger.info(
+            f"=== INGESTION CYCLE {result.cycle_id} STARTED "
+            f"({'parallel' if self._config.parallel_collection else 'sequential'}) ==="
+        )
         start_time = time.time()
         
         stored_records = []
         
         try:
-            # Fetch from CoinGecko
-            if self._config.coingecko_enabled:
-                cg_records = await self._fetch_coingecko()
-                result.coingecko_fetched = len(cg_records)
-                
-                stored = await self._persist_records(cg_records, "coingecko")
-                result.coingecko_stored = stored
-                stored_records.extend(cg_records[:stored])
-                
-                self._logger.info(
-                    f"[CoinGecko] Fetched: {result.coingecko_fetched}, "
-                    f"Stored: {result.coingecko_stored}"
-                )
-            
-            # Fetch from Binance
-            if self._config.binance_enabled:
-                bn_records = await self._fetch_binance()
-                result.binance_fetched = len(bn_records)
-                
-                stored = await self._persist_records(bn_records, "binance")
-                result.binance_stored = stored
-                stored_records.extend(bn_records[:stored])
-                
-                self._logger.info(
-                    f"[Binance] Fetched: {result.binance_fetched}, "
-                    f"Stored: {result.binance_stored}"
-                )
-            
-            # Fetch from CryptoNews API
-            if self._config.cryptonews_enabled:
-                try:
-                    cn_records = await self._fetch_cryptonews()
-                    result.cryptonews_fetched = len(cn_records)
-                    
-                    stored = await self._persist_news_records(cn_records, "cryptonews_api")
-                    result.cryptonews_stored = stored
-                    
-                    self._logger.info(
-                        f"[CryptoNews] Fetched: {result.cryptonews_fetched}, "
-                        f"Stored: {result.cryptonews_stored}"
-                    )
-                except Exception as e:
-                    self._logger.warning(f"[CryptoNews] Error: {e}")
-                    result.errors.append(f"CryptoNews: {e}")
-            
-            # Fetch from CryptoPanic
-            if self._config.cryptopanic_enabled:
-                try:
-                    cp_records = await self._fetch_cryptopanic()
-                    result.cryptopanic_fetched = len(cp_records)
-                    
-                    stored = await self._persist_news_records(cp_records, "cryptopanic")
-                    result.cryptopanic_stored = stored
-                    
-                    self._logger.info(
-                        f"[CryptoPanic] Fetched: {result.cryptopanic_fetched}, "
-                        f"Stored: {result.cryptopanic_stored}"
-                    )
-                except Exception as e:
-                    self._logger.warning(f"[CryptoPanic] Error: {e}")
-                    result.errors.append(f"CryptoPanic: {e}")
+            sources = self._get_enabled_sources()
             
-            # Fetch from Whale Alert
-            if self._config.whalealert_enabled:
-                try:
-                    wa_records = await self._fetch_whale_alert()
-                    result.whalealert_fetched = len(wa_records)
-                    
-                    stored = await self._persist_onchain_flow_records(wa_records, "whale_alert")
-                    result.whalealert_stored = stored
-                    
-                    self._logger.info(
-                        f"[WhaleAlert] Fetched: {result.whalealert_fetched}, "
-                        f"Stored: {result.whalealert_stored}"
-                    )
-                except Exception as e:
-                    self._logger.warning(f"[WhaleAlert] Error: {e}")
-                    result.errors.append(f"WhaleAlert: {e}")
-            
-            # Fetch from Etherscan (free tier on-chain data)
-            if self._config.etherscan_enabled:
-                try:
-                    eth_records = await self._fetch_etherscan_flows()
-                    result.etherscan_fetched = len(eth_records)
-                    
-                    stored = await self._persist_onchain_flow_records(eth_records, "etherscan")
-                    result.etherscan_stored = stored
-                    
-                    self._logger.info(
-                        f"[Etherscan] Fetched: {result.etherscan_fetched}, "
-                        f"Stored: {result.etherscan_stored}"
-                    )
-                except Exception as e:
-                    self._logger.warning(f"[Etherscan] Error: {e}")
-                    result.errors.append(f"Etherscan: {e}")
+            if self._config.parallel_collection:
+                per_source = await self._collect_sources_parallel(sources, result)
+            else:
+                per_source = await self._collect_sources_sequential(sources, result)
             
-            # Fetch from Nansen Smart Money API (PREMIUM)
-            if self._config.nansen_enabled:
-                try:
-                    nansen_records = await self._fetch_nansen()
-                    result.nansen_fetched = len(nansen_records)
-                    
-                    stored = await self._persist_onchain_flow_records(nansen_records, "nansen")
-                    result.nansen_stored = stored
-                    
-                    self._logger.info(
-                        f"[Nansen] Fetched: {result.nansen_fetched}, "
-                        f"Stored: {result.nansen_stored}"
-                    )
-                except Exception as e:
-                    self._logger.warning(f"[Nansen] Error: {e}")
-                    result.errors.append(f"Nansen: {e}")
+            # Return market records in source declaration order
+            for source in sources:
+                if source.market_data:
+                    stored_records.extend(per_source.get(source.name, []))
             
             # Aggregate exchange flows from raw onchain data
+            # (runs after all on-chain sources have been persisted)
             if self._config.exchange_flow_enabled:
                 try:
                     aggregates = await self._aggregate_exchange_flows()
@@ -621,38 +673,40 @@ class RealIngestionModule:
                     self._logger.warning(f"[ExchangeFlow] Error: {e}")
                     result.errors.append(f"ExchangeFlow: {e}")
             
-            # Calculate totals
-            result.total_fetched = (
-                result.coingecko_fetched + result.binance_fetched +
-                result.cryptonews_fetched + result.cryptopanic_fetched +
-                result.whalealert_fetched + result.nansen_fetched
-            )
-            result.total_stored = (
-                result.coingecko_stored + result.binance_stored +
-                result.cryptonews_stored + result.cryptopanic_stored +
-                result.whalealert_stored + result.nansen_stored + result.exchange_flow_stored
-            )
-            
         except Exception as e:
-            result.total_errors += 1
-            result.errors.append(str(e))
+            # Critical source failures were counted as they were recorded
+            if not isinstance(e, _CriticalSourceError):
+                result.total_errors += 1
+                result.errors.append(str(e))
             self._logger.error(f"Ingestion cycle failed: {e}", exc_info=True)
             
             if self._config.fail_fast:
                 raise RuntimeError(f"Ingestion failed (fail_fast=True): {e}") from e
         
         finally:
+            # Calculate totals
+            result.total_fetched = sum(
+                getattr(result, f"{name}_fetched") for name in SOURCE_NAMES
+            )
+            result.total_stored = sum(
+                getattr(result, f"{name}_stored") for name in SOURCE_NAMES
+            ) + result.exchange_flow_stored
+            
             # Complete result
             result.completed_at = datetime.now(timezone.utc)
             result.duration_seconds = time.time() - start_time
+            self._metric_cycle_duration.observe(result.duration_seconds)
             
             self._last_result = result
             self._total_cycles += 1
             self._total_records += result.total_stored
             
+            slowest = max(result.source_timings.items(), key=lambda kv: kv[1], default=None)
             self._logger.info(
                 f"=== INGESTION CYCLE {result.cycle_id} COMPLETED ===\n"
                 f"  Duration: {result.duration_seconds:.2f}s\n"
+                f"  Slowest Source: "
+                f"{f'{slowest[0]} ({slowest[1]:.2f}s)' if slowest else 'n/a'}\n"
                 f"  Total Fetched: {result.total_fetched}\n"
                 f"  Total Stored: {result.total_stored}\n"
                 f"  Errors: {result.total_errors}"
@@ -660,6 +714,221 @@ class RealIngestionModule:
         
         return stored_records
     
+    # --------------------------------------------------------
+    # SOURCE FAN-OUT
+    # --------------------------------------------------------
+    
+    def _get_enabled_sources(self) -> List[_SourceSpec]:
+        """
+        Build the list of enabled sources in declaration order.
+        
+        Market sources (CoinGecko, Binance) are critical: a failure there
+        counts as a cycle error. News and on-chain sources are best-effort.
+        """
+        cfg = self._config
+        candidates = [
+            _SourceSpec(
+                "coingecko", "CoinGecko", cfg.coingecko_enabled,
+                self._fetch_coingecko,
+                lambda records: self._persist_records(records, "coingecko"),
+                market_data=True,
+            ),
+            _SourceSpec(
+                "binance", "Binance", cfg.binance_enabled,
+                self._fetch_binance,
+                self._persist_binance_records,
+                market_data=True,
+            ),
+            _SourceSpec(
+                "cryptonews", "CryptoNews", cfg.cryptonews_enabled,
+                self._fetch_cryptonews,
+                lambda records: self._persist_news_records(records, "cryptonews_api"),
+            ),
+            _SourceSpec(
+                "cryptopanic", "CryptoPanic", cfg.cryptopanic_enabled,
+                self._fetch_cryptopanic,
+                lambda records: self._persist_news_records(records, "cryptopanic"),
+            ),
+            _SourceSpec(
+                "whalealert", "WhaleAlert", cfg.whalealert_enabled,
+                self._fetch_whale_alert,
+                lambda records: self._persist_onchain_flow_records(records, "whale_alert"),
+            ),
+            _SourceSpec(
+                "etherscan", "Etherscan", cfg.etherscan_enabled,
+                self._fetch_etherscan_flows,
+                lambda records: self._persist_onchain_flow_records(records, "etherscan"),
+            ),
+            _SourceSpec(
+                "nansen", "Nansen", cfg.nansen_enabled,
+                self._fetch_nansen,
+                lambda records: self._persist_onchain_flow_records(records, "nansen"),
+            ),
+        ]
+        return [source for source in candidates if source.enabled]
+    
+    def _get_source_deadline(self, name: str) -> float:
+        """Get the deadline (seconds) for a single source's fetch + persist."""
+        return self._config.source_deadline_overrides.get(
+            name, self._config.source_deadline_seconds
+        )
+    
+    async def _collect_source(
+        self,
+        source: _SourceSpec,
+        result: IngestionCycleResult,
+        persisting: Optional[Set[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch and persist a single source, recording counts and timing.
+        
+        Within a traced cycle the fetch and the persist are separate spans.
+        
+        Args:
+            source: Source to collect
+            result: Cycle result to record into
+            persisting: If given, holds the source name while its
+                persist is in flight
+        
+        Returns:
+            The stored records
+        """
+        tracer = get_tracer()
+        started = time.perf_counter()
+        try:
+            with tracer.span("ingestion.fetch", source=source.name) as span:
+                records = await source.fetch()
+                span.set(records=len(records))
+            setattr(result, f"{source.name}_fetched", len(records))
+            self._metric_records.labels(source.name, "fetched").inc(len(records))
+            
+            if persisting is not None:
+                persisting.add(source.name)
+            with tracer.span("ingestion.persist", source=source.name) as span:
+                stored = await source.persist(records)
+                span.set(stored=stored)
+            if persisting is not None:
+                persisting.discard(source.name)
+            setattr(result, f"{source.name}_stored", stored)
+            self._metric_records.labels(source.name, "stored").inc(stored)
+            
+            self._logger.info(
+                f"[{source.label}] Fetched: {len(records)}, Stored: {stored}"
+            )
+            return records[:stored]
+        finally:
+            elapsed = time.perf_counter() - started
+            result.source_timings[source.name] = elapsed
+            self._metric_source_duration.labels(source.name).observe(elapsed)
+    
+    def _record_source_failure(
+        self,
+        source: _SourceSpec,
+        result: IngestionCycleResult,
+        error: BaseException,
+    ) -> None:
+        """Record a per-source failure in the cycle result."""
+        message = str(error) or type(error).__name__
+        self._metric_failures.labels(source.name).inc()
+        result.failed_sources.append(source.name)
+        result.errors.append(f"{source.label}: {message}")
+        if source.market_data:
+            result.total_errors += 1
+            self._logger.error(f"[{source.label}] Error: {message}")
+        else:
+            self._logger.warning(f"[{source.label}] Error: {message}")
+    
+    def _record_source_unconfirmed(
+        self,
+        source: _SourceSpec,
+        result: IngestionCycleResult,
+        deadline: float,
+    ) -> None:
+        """
+        Record a source whose deadline hit while its write was queued.
+        
+        Cancelling the await does not withdraw the job from the DB
+        writer thread, so the rows may still commit: the outcome is
+        unknown rather than failed.
+        """
+        message = f"deadline of {deadline:.1f}s exceeded during persist; write outcome unknown"
+        result.unconfirmed_sources.append(source.name)
+        result.errors.append(f"{source.label}: {message}")
+        self._logger.warning(f"[{source.label}] {message}")
+    
+    async def _collect_sources_sequential(
+        self,
+        sources: List[_SourceSpec],
+        result: IngestionCycleResult,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Collect sources one after another.
+        
+        A critical source failure aborts the cycle (propagates to the
+        caller); best-effort sources are isolated.
+        """
+        per_source: Dict[str, List[Dict[str, Any]]] = {}
+        for source in sources:
+            try:
+                per_source[source.name] = await self._collect_source(source, result)
+            except Exception as e:
+                if source.market_data:
+                    self._metric_failures.labels(source.name).inc()
+                    result.failed_sources.append(source.name)
+                    raise
+                self._record_source_failure(source, result, e)
+        return per_source
+    
+    async def _collect_sources_parallel(
+        self,
+        sources: List[_SourceSpec],
+        result: IngestionCycleResult,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Collect all sources concurrently under a bounded TaskGroup.
+        
+        Each source runs under its own deadline and is persisted as soon
+        as it arrives. Failures are isolated per source so one slow or
+        broken provider never cancels its siblings. A deadline that hits
+        mid-persist is reported as unconfirmed, not failed.
+        
+        Raises:
+            RuntimeError: If a critical source failed and fail_fast is enabled
+        """
+        per_source: Dict[str, List[Dict[str, Any]]] = {}
+        persisting: Set[str] = set()
+        semaphore = asyncio.Semaphore(max(1, self._config.max_concurrent_sources))
+        
+        async def run(source: _SourceSpec) -> None:
+            async with semaphore:
+                deadline = self._get_source_deadline(source.name)
+                try:
+                    per_source[source.name] = await asyncio.wait_for(
+                        self._collect_source(source, result, persisting), timeout=deadline
+                    )
+                except asyncio.TimeoutError:
+                    if source.name in persisting:
+                        self._record_source_unconfirmed(source, result, deadline)
+                    else:
+                        self._record_source_failure(
+                            source, result, TimeoutError(f"deadline of {deadline:.1f}s exceeded")
+                        )
+                except Exception as e:
+                    self._record_source_failure(source, result, e)
+        
+        async with asyncio.TaskGroup() as group:
+            for source in sources:
+                group.create_task(run(source), name=f"ingestion-{source.name}")
+        
+        critical_failures = [
+            source.label for source in sources
+            if source.market_data and source.name in result.failed_sources
+        ]
+        if critical_failures and self._config.fail_fast:
+            raise _CriticalSourceError(f"Critical source(s) failed: {', '.join(critical_failures)}")
+        
+        return per_source
+    
     # --------------------------------------------------------
     # COINGECKO FETCHING
     # --------------------------------------------------------
@@ -695,7 +964,7 @@ class RealIngestionModule:
             headers["x-cg-demo-api-key"] = api_key
         
         try:
-            async with httpx.AsyncClient(timeout=self._config.timeout_seconds) as client:
+            async with self._http.client("coingecko", timeout=self._config.timeout_seconds) as client:
                 response = await client.get(url, params=params, headers=headers)
                 response.raise_for_status()
                 
@@ -784,6 +1053,10 @@ class RealIngestionModule:
         """
         Fetch OHLCV klines from Binance API.
         
+        Symbols are fetched concurrently and only candles after each
+        symbol's persisted cursor are requested (see KlineFetcher).
+        Cursors advance in _persist_binance_records once stored.
+        
         Returns:
             List of market data records ready for persistence
             
@@ -792,72 +1065,14 @@ class RealIngestionModule:
         """
         import httpx
         
-        self._logger.info(f"Fetching from Binance: {self._config.tracked_symbols}")
-        
-        base_url = (
-            self._config.binance_base_url 
-            if self._config.binance_use_futures 
-            else self._config.binance_spot_url
+        self._logger.info(
+            f"Fetching from Binance: {len(self._config.tracked_symbols)} symbols "
+            f"({self._config.binance_interval})"
         )
         
-        endpoint = "/fapi/v1/klines" if self._config.binance_use_futures else "/api/v3/klines"
-        
-        records = []
-        now = datetime.now(timezone.utc)
-        
         try:
-            async with httpx.AsyncClient(timeout=self._config.timeout_seconds) as client:
-                for symbol in self._config.tracked_symbols:
-                    url = f"{base_url}{endpoint}"
-                    params = {
-                        "symbol": symbol.upper(),
-                        "interval": "1h",  # Fetch hourly klines
-                        "limit": 5,  # Last 5 candles
-                    }
-                    
-                    response = await client.get(url, params=params)
-                    response.raise_for_status()
-                    
-                    klines = response.json()
-                    
-                    if not isinstance(klines, list):
-                        raise RuntimeError(f"Unexpected Binance response for {symbol}")
-                    
-                    for kline in klines:
-                        # Binance kline format: [open_time, open, high, low, close, volume, close_time, ...]
-                        open_time_ms = kline[0]
-                        close_time_ms = kline[6]
-                        
-                        record = {
-                            "symbol": symbol.replace("USDT", ""),
-                            "pair": symbol.upper(),
-                            "exchange": "binance_futures" if self._config.binance_use_futures else "binance_spot",
-                            "open_price": float(kline[1]),
-                            "high_price": float(kline[2]),
-                            "low_price": float(kline[3]),
-                            "close_price": float(kline[4]),
-                            "volume": float(kline[5]),
-                            "quote_volume": float(kline[7]),
-                            "vwap": None,
-                            "trade_count": int(kline[8]) if len(kline) > 8 else None,
-                            "interval": "1h",
-                            "candle_open_time": datetime.utcfromtimestamp(open_time_ms / 1000).replace(tzinfo=timezone.utc),
-                            "candle_close_time": datetime.utcfromtimestamp(close_time_ms / 1000).replace(tzinfo=timezone.utc),
-                            "source_module": "RealIngestionModule.binance",
-                            "fetched_at": now,
-                        }
-                        records.append(record)
-                    
-                    # Log latest price
-                    if klines:
-                        latest = klines[-1]
-                        self._logger.debug(
-                            f"[Binance] {symbol}: O={latest[1]} H={latest[2]} "
-                            f"L={latest[3]} C={latest[4]} V={latest[5]}"
-                        )
-                
-                return records
-                
+            # Raises the first error only if every symbol failed
+            result = await self._kline_fetcher.fetch(self._config.tracked_symbols)
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 429:
                 self._logger.warning(
@@ -873,6 +1088,35 @@ class RealIngestionModule:
         except httpx.RequestError as e:
             self._logger.warning(f"Binance request error: {e}. Skipping...")
             return []
+        
+        if result.symbols_failed:
+            self._logger.warning(
+                f"[Binance] {result.symbols_failed} symbol(s) failed: "
+                f"{'; '.join(result.errors[:5])}"
+            )
+        
+        return result.records
+    
+    async def _persist_binance_records(self, records: List[Dict[str, Any]]) -> int:
+        """
+        Persist Binance klines and their per-symbol cursors.
+        
+        The cursors are saved in the same writer job (one transaction)
+        as the candles and adopted only once that job committed.
+        """
+        fetcher = self._kline_fetcher
+        advanced = fetcher.cursor_advances(records)
+        
+        def save_cursors(session: Session) -> None:
+            fetcher.save_cursors(session, advanced)
+        
+        stored = await self._persist_records(
+            records, "binance", also_write=save_cursors if advanced else None,
+        )
+        if advanced:
+            fetcher.commit_cursors(advanced)
+            self._logger.debug(f"[Binance] Advanced {len(advanced)} kline cursors")
+        return stored
     
     # --------------------------------------------------------
     # CRYPTONEWS API FETCHING
@@ -920,7 +1164,7 @@ class RealIngestionModule:
         )
         
         try:
-            async with httpx.AsyncClient(timeout=self._config.timeout_seconds) as client:
+            async with self._http.client("cryptonews", timeout=self._config.timeout_seconds) as client:
                 response = await client.get(url, params=params)
                 
                 # Handle HTTP errors with explicit reasons
@@ -1131,8 +1375,7 @@ class RealIngestionModule:
         pages_fetched = 0
         
         try:
-            timeout = aiohttp.ClientTimeout(total=self._config.timeout_seconds)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with self._http.session("cryptopanic", timeout=self._config.timeout_seconds) as session:
                 while page_url and pages_fetched < max_pages:
                     async with session.get(page_url, params=params if pages_fetched == 0 else None) as response:
                         # Handle HTTP errors with explicit reasons
@@ -1373,8 +1616,7 @@ class RealIngestionModule:
         }
         
         try:
-            timeout = aiohttp.ClientTimeout(total=self._config.timeout_seconds)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with self._http.session("whalealert", timeout=self._config.timeout_seconds) as session:
                 async with session.get(url, params=params) as response:
                     # Handle HTTP errors
                     if response.status == 401:
@@ -1580,8 +1822,7 @@ class RealIngestionModule:
         }
         
         try:
-            timeout = aiohttp.ClientTimeout(total=self._config.timeout_seconds)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with self._http.session("etherscan", timeout=self._config.timeout_seconds) as session:
                 for chain in self._config.etherscan_chains:
                     chain_id = CHAIN_IDS.get(chain.lower(), 1)
                     
@@ -1786,8 +2027,7 @@ class RealIngestionModule:
         now = datetime.now(timezone.utc)
         
         try:
-            timeout = aiohttp.ClientTimeout(total=self._config.timeout_seconds)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with self._http.session("nansen", timeout=self._config.timeout_seconds) as session:
                 async with session.post(url, json=request_body, headers=headers) as response:
                     # Handle HTTP errors
                     if response.status == 401:
@@ -1952,142 +2192,36 @@ class RealIngestionModule:
         """
         Aggregate raw onchain flow data by exchange and time window.
         
-        Reads from onchain_flow_raw table, groups by:
-        - Token (BTC, ETH, USDT, etc.)
-        - Exchange (binance, coinbase, kraken, etc.)
-        - Time window (1h, 4h, 24h)
+        Incremental and SQL-side (see ExchangeFlowAggregator):
+        - Only onchain_flow_raw rows newer than the watermark are read,
+          folded into 5-minute buckets with one GROUP BY statement
+        - Time windows (1h, 4h, 24h) are rolled up from the buckets
         
-        Computes:
-        - Total inflow/outflow amounts
-        - Net flow (inflow - outflow)
-        - Transaction counts
-        - Flow ratio (inflow/outflow)
+        Groups by token (BTC, ETH, USDT, etc.) and exchange (binance,
+        coinbase, kraken, etc.) and computes inflow/outflow amounts, net
+        flow, transaction counts, flow ratio and dominance.
         
         Returns:
             List of aggregate records ready for persistence
         """
-        now = datetime.now(timezone.utc)
-        aggregates = []
+        now = datetime.utcnow()
         
         try:
-            with get_db_session() as session:
-                for time_window in self._config.exchange_flow_time_windows:
-                    window_delta = self._parse_time_window(time_window)
-                    window_start = now - window_delta
-                    
-                    # Query for exchange inflows in this time window
-                    for token in self._config.exchange_flow_tokens:
-                        # Get all flows for this token in this window
-                        flows = session.query(OnchainFlowRaw).filter(
-                            OnchainFlowRaw.token == token,
-                            OnchainFlowRaw.event_time >= window_start,
-                            OnchainFlowRaw.event_time <= now,
-                            OnchainFlowRaw.flow_type.in_(["exchange_inflow", "exchange_outflow"]),
-                        ).all()
-                        
-                        if not flows:
-                            continue
-                        
-                        # Group by exchange
-                        exchange_flows = {}
-                        for flow in flows:
-                            # Determine exchange from entity
-                            if flow.flow_type == "exchange_inflow":
-                                exchange = flow.to_entity or "unknown"
-                            else:  # exchange_outflow
-                                exchange = flow.from_entity or "unknown"
-                            
-                            if not exchange or exchange == "unknown":
-                                continue
-                            
-                            # Normalize exchange name
-                            exchange = exchange.lower().strip()
-                            
-                            if exchange not in exchange_flows:
-                                exchange_flows[exchange] = {
-                                    "inflow_amount": 0.0,
-                                    "outflow_amount": 0.0,
-                                    "inflow_usd": 0.0,
-                                    "outflow_usd": 0.0,
-                                    "inflow_tx_count": 0,
-                                    "outflow_tx_count": 0,
-                                    "data_points": 0,
-                                }
-                            
-                            ef = exchange_flows[exchange]
-                            ef["data_points"] += 1
-                            
-                            if flow.flow_type == "exchange_inflow":
-                                ef["inflow_amount"] += flow.amount or 0
-                                ef["inflow_usd"] += flow.amount_usd or 0
-                                ef["inflow_tx_count"] += 1
-                            else:
-                                ef["outflow_amount"] += flow.amount or 0
-                                ef["outflow_usd"] += flow.amount_usd or 0
-                                ef["outflow_tx_count"] += 1
-                        
-                        # Calculate totals for dominance percentage
-                        total_flow_usd = sum(
-                            ef["inflow_usd"] + ef["outflow_usd"]
-                            for ef in exchange_flows.values()
-                        )
-                        
-                        # Create aggregate records for each exchange
-                        for exchange, ef in exchange_flows.items():
-                            total_tx = ef["inflow_tx_count"] + ef["outflow_tx_count"]
-                            
-                            # Skip if below minimum transaction count
-                            if total_tx < self._config.exchange_flow_min_tx_count:
-                                continue
-                            
-                            net_flow = ef["inflow_amount"] - ef["outflow_amount"]
-                            net_flow_usd = ef["inflow_usd"] - ef["outflow_usd"]
-                            
-                            # Calculate flow ratio (inflow/outflow)
-                            flow_ratio = None
-                            if ef["outflow_amount"] > 0:
-                                flow_ratio = ef["inflow_amount"] / ef["outflow_amount"]
-                            
-                            # Calculate dominance percentage
-                            dominance_pct = None
-                            if total_flow_usd > 0:
-                                exchange_flow_usd = ef["inflow_usd"] + ef["outflow_usd"]
-                                dominance_pct = (exchange_flow_usd / total_flow_usd) * 100
-                            
-                            aggregate = {
-                                "token": token,
-                                "exchange": exchange,
-                                "time_window": time_window,
-                                "inflow_amount": ef["inflow_amount"],
-                                "outflow_amount": ef["outflow_amount"],
-                                "net_flow": net_flow,
-                                "inflow_usd": ef["inflow_usd"] if ef["inflow_usd"] > 0 else None,
-                                "outflow_usd": ef["outflow_usd"] if ef["outflow_usd"] > 0 else None,
-                                "net_flow_usd": net_flow_usd if abs(net_flow_usd) > 0 else None,
-                                "inflow_tx_count": ef["inflow_tx_count"],
-                                "outflow_tx_count": ef["outflow_tx_count"],
-                                "total_tx_count": total_tx,
-                                "flow_ratio": flow_ratio,
-                                "dominance_pct": dominance_pct,
-                                "window_start": window_start,
-                                "window_end": now,
-                                "source_name": "whale_alert",
-                                "data_points_count": ef["data_points"],
-                                "aggregated_at": now,
-                            }
-                            aggregates.append(aggregate)
-                
-                self._logger.debug(
-                    f"[ExchangeFlow] Generated {len(aggregates)} aggregates "
-                    f"across {len(self._config.exchange_flow_time_windows)} time windows"
-                )
-                
+            aggregates = await self._writer.submit(
+                lambda session: self._flow_aggregator.aggregate(session, now),
+                label="exchange_flow_rollup",
+            )
         except Exception as e:
             self._logger.error(
                 f"[ExchangeFlow] Aggregation error: {type(e).__name__}: {e}",
                 exc_info=True
             )
+            return []
         
+        self._logger.debug(
+            f"[ExchangeFlow] Generated {len(aggregates)} aggregates "
+            f"across {len(self._config.exchange_flow_time_windows)} time windows"
+        )
         return aggregates
     
     # --------------------------------------------------------
@@ -2098,16 +2232,20 @@ class RealIngestionModule:
         self,
         records: List[Dict[str, Any]],
         source: str,
+        also_write: Optional[Callable[[Session], Any]] = None,
     ) -> int:
         """
         Persist market data records to database using upsert.
         
         Uses PostgreSQL ON CONFLICT DO UPDATE to handle duplicates gracefully.
         Updates existing records if they have the same (symbol, exchange, interval, candle_open_time).
+        The write runs on the async DB writer thread; large batches use COPY.
         
         Args:
             records: List of record dictionaries
             source: Source identifier for logging
+            also_write: Optional extra write run in the same job (and
+                        transaction) after the upsert
             
         Returns:
             Number of records stored/updated
@@ -2120,63 +2258,53 @@ class RealIngestionModule:
         
         correlation_id = uuid4().hex
         
+        # Prepare records for bulk upsert
+        values_list = []
+        for record in records:
+            values_list.append({
+                "correlation_id": correlation_id,
+                "symbol": record["symbol"],
+                "pair": record["pair"],
+                "exchange": record["exchange"],
+                "open_price": record["open_price"],
+                "high_price": record["high_price"],
+                "low_price": record["low_price"],
+                "close_price": record["close_price"],
+                "volume": record["volume"],
+                "quote_volume": record.get("quote_volume"),
+                "vwap": record.get("vwap"),
+                "trade_count": record.get("trade_count"),
+                "interval": record["interval"],
+                "candle_open_time": record["candle_open_time"],
+                "candle_close_time": record["candle_close_time"],
+                "source_module": record["source_module"],
+                "fetched_at": record["fetched_at"],
+            })
+        
+        def write(session: Session) -> int:
+            # PostgreSQL upsert: INSERT ... ON CONFLICT DO UPDATE
+            stored = bulk_upsert(
+                session,
+                MarketData,
+                values_list,
+                conflict_constraint="uq_market_data",
+                update_columns=MARKET_DATA_UPDATE_COLUMNS,
+                chunk_size=self._config.persist_batch_size,
+                copy_threshold=self._config.copy_threshold,
+            )
+            if also_write is not None:
+                also_write(session)
+            return stored
+        
         try:
-            with get_db_session() as session:
-                # Prepare records for bulk upsert
-                values_list = []
-                for record in records:
-                    values_list.append({
-                        "correlation_id": correlation_id,
-                        "symbol": record["symbol"],
-                        "pair": record["pair"],
-                        "exchange": record["exchange"],
-                        "open_price": record["open_price"],
-                        "high_price": record["high_price"],
-                        "low_price": record["low_price"],
-                        "close_price": record["close_price"],
-                        "volume": record["volume"],
-                        "quote_volume": record.get("quote_volume"),
-                        "vwap": record.get("vwap"),
-                        "trade_count": record.get("trade_count"),
-                        "interval": record["interval"],
-                        "candle_open_time": record["candle_open_time"],
-                        "candle_close_time": record["candle_close_time"],
-                        "source_module": record["source_module"],
-                        "fetched_at": record["fetched_at"],
-                    })
-                
-                # PostgreSQL upsert: INSERT ... ON CONFLICT DO UPDATE
-                stmt = pg_insert(MarketData).values(values_list)
-                stmt = stmt.on_conflict_do_update(
-                    constraint="uq_market_data",  # The unique constraint name
-                    set_={
-                        "correlation_id": stmt.excluded.correlation_id,
-                        "open_price": stmt.excluded.open_price,
-                        "high_price": stmt.excluded.high_price,
-                        "low_price": stmt.excluded.low_price,
-                        "close_price": stmt.excluded.close_price,
-                        "volume": stmt.excluded.volume,
-                        "quote_volume": stmt.excluded.quote_volume,
-                        "vwap": stmt.excluded.vwap,
-                        "trade_count": stmt.excluded.trade_count,
-                        "candle_close_time": stmt.excluded.candle_close_time,
-                        "source_module": stmt.excluded.source_module,
-                        "fetched_at": stmt.excluded.fetched_at,
-                    },
-                )
-                
-                session.execute(stmt)
-                session.commit()
-                
-                stored_count = len(values_list)
-                self._logger.info(
-                    f"[{source}] Persisted {stored_count}/{len(records)} records "
-                    f"(correlation_id={correlation_id[:8]}...)"
-                )
-                
+            stored_count = await self._writer.submit(write, rows=len(values_list), label=source)
         except Exception as e:
             raise RuntimeError(f"Failed to persist {source} records: {e}") from e
         
+        self._logger.info(
+            f"[{source}] Persisted {stored_count}/{len(records)} records "
+            f"(correlation_id={correlation_id[:8]}...)"
+        )
         return stored_count
     
     async def _persist_news_records(
@@ -2185,9 +2313,10 @@ class RealIngestionModule:
         source: str,
     ) -> int:
         """
-        Persist news records to raw_news table using upsert.
+        Persist news records to raw_news table.
         
-        Uses PostgreSQL ON CONFLICT DO NOTHING to handle duplicates gracefully.
+        Duplicates (same external_id + source_name) are skipped using one
+        set-based existence check instead of a query per record.
         
         Args:
             records: List of news record dictionaries
@@ -2200,53 +2329,59 @@ class RealIngestionModule:
             return 0
         
         correlation_id = uuid4().hex
-        stored_count = 0
+        now = datetime.utcnow()
+        
+        rows = []
+        for record in records:
+            rows.append({
+                "correlation_id": correlation_id,
+                "external_id": record.get("external_id", ""),
+                "title": record.get("title", ""),
+                "content": record.get("content"),
+                "summary": record.get("summary"),
+                "url": record.get("url"),
+                "source_name": record.get("source_name", source),
+                "source_module": record.get("source_module", "RealIngestionModule"),
+                "author": record.get("author"),
+                "categories": record.get("categories"),
+                "tokens": record.get("tokens"),
+                "published_at": record.get("published_at"),
+                "fetched_at": record.get("fetched_at") or now,
+                "created_at": now,
+                "processed": False,
+            })
+        
+        def write(session: Session) -> int:
+            keys = [(row["external_id"], row["source_name"]) for row in rows if row["external_id"]]
+            seen = existing_keys(session, (RawNews.external_id, RawNews.source_name), keys)
+            
+            new_rows = []
+            for row in rows:
+                if row["external_id"]:
+                    key = (row["external_id"], row["source_name"])
+                    if key in seen:
+                        continue  # Skip duplicate
+                    seen.add(key)
+                new_rows.append(row)
+            
+            return bulk_upsert(
+                session,
+                RawNews,
+                new_rows,
+                copy_threshold=self._config.copy_threshold,
+            )
         
         try:
-            with get_db_session() as session:
-                # Prepare records for bulk insert
-                for record in records:
-                    # Check if already exists by external_id
-                    external_id = record.get("external_id", "")
-                    if external_id:
-                        existing = session.query(RawNews).filter(
-                            RawNews.external_id == external_id,
-                            RawNews.source_name == record.get("source_name", source),
-                        ).first()
-                        if existing:
-                            continue  # Skip duplicate
-                    
-                    # Create new record
-                    news_record = RawNews(
-                        correlation_id=correlation_id,
-                        external_id=external_id,
-                        title=record.get("title", ""),
-                        content=record.get("content"),
-                        summary=record.get("summary"),
-                        url=record.get("url"),
-                        source_name=record.get("source_name", source),
-                        source_module=record.get("source_module", "RealIngestionModule"),
-                        author=record.get("author"),
-                        categories=record.get("categories"),
-                        tokens=record.get("tokens"),
-                        published_at=record.get("published_at"),
-                        fetched_at=record.get("fetched_at"),
-                    )
-                    session.add(news_record)
-                    stored_count += 1
-                
-                session.commit()
-                
-                self._logger.info(
-                    f"[{source}] Persisted {stored_count}/{len(records)} news records "
-                    f"(correlation_id={correlation_id[:8]}...)"
-                )
-                
+            stored_count = await self._writer.submit(write, rows=len(rows), label=source)
         except Exception as e:
             self._logger.error(f"Failed to persist {source} news: {e}")
             # Don't raise - we want ingestion to continue
             return 0
         
+        self._logger.info(
+            f"[{source}] Persisted {stored_count}/{len(records)} news records "
+            f"(correlation_id={correlation_id[:8]}...)"
+        )
         return stored_count
     
     async def _persist_onchain_flow_records(
@@ -2257,7 +2392,8 @@ class RealIngestionModule:
         """
         Persist onchain flow records to onchain_flow_raw table.
         
-        Handles duplicates by checking tx_hash + token + event_time.
+        Duplicates (same tx_hash + token) are skipped using one
+        set-based existence check instead of a query per record.
         
         Args:
             records: List of onchain flow record dictionaries
@@ -2270,55 +2406,62 @@ class RealIngestionModule:
             return 0
         
         correlation_id = uuid4().hex
-        stored_count = 0
+        now = datetime.utcnow()
+        
+        rows = []
+        for record in records:
+            rows.append({
+                "correlation_id": correlation_id,
+                "token": record.get("token", "UNKNOWN"),
+                "chain": record.get("chain", "unknown"),
+                "flow_type": record.get("flow_type", "transfer"),
+                "amount": record.get("amount", 0),
+                "amount_usd": record.get("amount_usd"),
+                "from_address": record.get("from_address"),
+                "to_address": record.get("to_address"),
+                "from_entity": record.get("from_entity"),
+                "to_entity": record.get("to_entity"),
+                "tx_hash": record.get("tx_hash"),
+                "block_number": record.get("block_number"),
+                "source_name": record.get("source_name", source),
+                "source_module": record.get("source_module", "RealIngestionModule"),
+                "event_time": record.get("event_time"),
+                "fetched_at": record.get("fetched_at") or now,
+                "created_at": now,
+                "processed": False,
+            })
+        
+        def write(session: Session) -> int:
+            keys = [(row["tx_hash"], row["token"]) for row in rows if row["tx_hash"]]
+            seen = existing_keys(session, (OnchainFlowRaw.tx_hash, OnchainFlowRaw.token), keys)
+            
+            new_rows = []
+            for row in rows:
+                if row["tx_hash"]:
+                    key = (row["tx_hash"], row["token"])
+                    if key in seen:
+                        continue  # Skip duplicate
+                    seen.add(key)
+                new_rows.append(row)
+            
+            return bulk_upsert(
+                session,
+                OnchainFlowRaw,
+                new_rows,
+                copy_threshold=self._config.copy_threshold,
+            )
         
         try:
-            with get_db_session() as session:
-                for record in records:
-                    # Skip if duplicate by tx_hash (if exists)
-                    tx_hash = record.get("tx_hash")
-                    if tx_hash:
-                        existing = session.query(OnchainFlowRaw).filter(
-                            OnchainFlowRaw.tx_hash == tx_hash,
-                            OnchainFlowRaw.token == record.get("token"),
-                        ).first()
-                        if existing:
-                            continue  # Skip duplicate
-                    
-                    # Create new record
-                    flow_record = OnchainFlowRaw(
-                        correlation_id=correlation_id,
-                        token=record.get("token", "UNKNOWN"),
-                        chain=record.get("chain", "unknown"),
-                        flow_type=record.get("flow_type", "transfer"),
-                        amount=record.get("amount", 0),
-                        amount_usd=record.get("amount_usd"),
-                        from_address=record.get("from_address"),
-                        to_address=record.get("to_address"),
-                        from_entity=record.get("from_entity"),
-                        to_entity=record.get("to_entity"),
-                        tx_hash=tx_hash,
-                        block_number=record.get("block_number"),
-                        source_name=record.get("source_name", source),
-                        source_module=record.get("source_module", "RealIngestionModule"),
-                        event_time=record.get("event_time"),
-                        fetched_at=record.get("fetched_at"),
-                    )
-                    session.add(flow_record)
-                    stored_count += 1
-                
-                session.commit()
-                
-                self._logger.info(
-                    f"[{source}] Persisted {stored_count}/{len(records)} onchain flow records "
-                    f"(correlation_id={correlation_id[:8]}...)"
-                )
-                
+            stored_count = await self._writer.submit(write, rows=len(rows), label=source)
         except Exception as e:
             self._logger.error(f"Failed to persist {source} onchain flows: {e}")
             # Don't raise - we want ingestion to continue
             return 0
         
+        self._logger.info(
+            f"[{source}] Persisted {stored_count}/{len(records)} onchain flow records "
+            f"(correlation_id={correlation_id[:8]}...)"
+        )
         return stored_count
     
     async def _persist_exchange_flow_aggregates(
@@ -2328,8 +2471,8 @@ class RealIngestionModule:
         """
         Persist exchange flow aggregates using upsert.
         
-        Uses PostgreSQL ON CONFLICT DO UPDATE to update existing aggregates
-        for the same (token, exchange, time_window, window_start).
+        Uses one multi-row PostgreSQL ON CONFLICT DO UPDATE to update existing
+        aggregates for the same (token, exchange, time_window, window_start).
         
         Args:
             records: List of aggregate dictionaries
@@ -2341,73 +2484,55 @@ class RealIngestionModule:
             return 0
         
         correlation_id = uuid4().hex
-        stored_count = 0
+        
+        rows = []
+        for record in records:
+            rows.append({
+                "correlation_id": correlation_id,
+                "token": record["token"],
+                "exchange": record["exchange"],
+                "time_window": record["time_window"],
+                "inflow_amount": record["inflow_amount"],
+                "outflow_amount": record["outflow_amount"],
+                "net_flow": record["net_flow"],
+                "inflow_usd": record.get("inflow_usd"),
+                "outflow_usd": record.get("outflow_usd"),
+                "net_flow_usd": record.get("net_flow_usd"),
+                "inflow_tx_count": record["inflow_tx_count"],
+                "outflow_tx_count": record["outflow_tx_count"],
+                "total_tx_count": record["total_tx_count"],
+                "flow_ratio": record.get("flow_ratio"),
+                "dominance_pct": record.get("dominance_pct"),
+                "window_start": record["window_start"],
+                "window_end": record["window_end"],
+                "source_name": record.get("source_name", "whale_alert"),
+                "source_module": "exchange_flow_aggregator",
+                "data_points_count": record.get("data_points_count", 0),
+                "aggregated_at": record.get("aggregated_at"),
+            })
+        
+        def write(session: Session) -> int:
+            # On conflict, update the aggregate values
+            return multirow_upsert(
+                session,
+                ExchangeFlowAggregate,
+                rows,
+                conflict_constraint="uq_exchange_flow_aggregate",
+                update_columns=EXCHANGE_FLOW_UPDATE_COLUMNS,
+                chunk_size=self._config.persist_batch_size,
+            )
         
         try:
-            with get_db_session() as session:
-                for record in records:
-                    # Build upsert statement
-                    stmt = pg_insert(ExchangeFlowAggregate).values(
-                        correlation_id=correlation_id,
-                        token=record["token"],
-                        exchange=record["exchange"],
-                        time_window=record["time_window"],
-                        inflow_amount=record["inflow_amount"],
-                        outflow_amount=record["outflow_amount"],
-                        net_flow=record["net_flow"],
-                        inflow_usd=record.get("inflow_usd"),
-                        outflow_usd=record.get("outflow_usd"),
-                        net_flow_usd=record.get("net_flow_usd"),
-                        inflow_tx_count=record["inflow_tx_count"],
-                        outflow_tx_count=record["outflow_tx_count"],
-                        total_tx_count=record["total_tx_count"],
-                        flow_ratio=record.get("flow_ratio"),
-                        dominance_pct=record.get("dominance_pct"),
-                        window_start=record["window_start"],
-                        window_end=record["window_end"],
-                        source_name=record.get("source_name", "whale_alert"),
-                        source_module="exchange_flow_aggregator",
-                        data_points_count=record.get("data_points_count", 0),
-                        aggregated_at=record.get("aggregated_at"),
-                    )
-                    
-                    # On conflict, update the aggregate values
-                    stmt = stmt.on_conflict_do_update(
-                        constraint="uq_exchange_flow_aggregate",
-                        set_={
-                            "correlation_id": stmt.excluded.correlation_id,
-                            "inflow_amount": stmt.excluded.inflow_amount,
-                            "outflow_amount": stmt.excluded.outflow_amount,
-                            "net_flow": stmt.excluded.net_flow,
-                            "inflow_usd": stmt.excluded.inflow_usd,
-                            "outflow_usd": stmt.excluded.outflow_usd,
-                            "net_flow_usd": stmt.excluded.net_flow_usd,
-                            "inflow_tx_count": stmt.excluded.inflow_tx_count,
-                            "outflow_tx_count": stmt.excluded.outflow_tx_count,
-                            "total_tx_count": stmt.excluded.total_tx_count,
-                            "flow_ratio": stmt.excluded.flow_ratio,
-                            "dominance_pct": stmt.excluded.dominance_pct,
-                            "window_end": stmt.excluded.window_end,
-                            "data_points_count": stmt.excluded.data_points_count,
-                            "aggregated_at": stmt.excluded.aggregated_at,
-                        },
-                    )
-                    
-                    session.execute(stmt)
-                    stored_count += 1
-                
-                session.commit()
-                
-                self._logger.info(
-                    f"[ExchangeFlow] Persisted {stored_count} aggregate records "
-                    f"(correlation_id={correlation_id[:8]}...)"
-                )
-                
+            stored_count = await self._writer.submit(write, rows=len(rows), label="exchange_flow")
         except Exception as e:
             self._logger.error(f"Failed to persist exchange flow aggregates: {e}")
             # Don't raise - we want ingestion to continue
             return 0
         
+        self._logger.info(
+            f"[ExchangeFlow] Persisted {stored_count} aggregate records "
+            f"(correlation_id={correlation_id[:8]}...)"
+        )
         return stored_count
 
 
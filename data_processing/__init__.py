@@ -12,6 +12,7 @@ Sub-packages:
 Main modules:
 - feature_engineering: Feature computation
 - contracts: Data contracts for processed market state
+- state_cache: In-memory latest market state snapshot
 - processing_module: Main processing pipeline module
 """
 
@@ -24,6 +25,9 @@ from .contracts import (
     ProcessedMarketStateBundle,
 )
 
+# Latest-state cache shared by readers in this process
+from .state_cache import MarketStateCache, get_market_state_cache
+
 # Main processing module
 from .processing_module import ProcessingPipelineModule
 
@@ -35,6 +39,9 @@ __all__ = [
     # Main contract
     "ProcessedMarketState",
     "ProcessedMarketStateBundle",
+    # Cache
+    "MarketStateCache",
+    "get_market_state_cache",
     # Module
     "ProcessingPipelineModule",
 ]
@@ -27,16 +27,36 @@ DEDUPLICATION STRATEGIES
 3. Cross-source: Same story from different sources
 4. Temporal: Same source, same story updated
 
+============================================================
+NEAR-DUPLICATE INDEX
+============================================================
+SimHashes are indexed by LSH bands (default 4 x 16 bits). A
+query probes every band value within probe_bits of its own; two
+hashes within Hamming distance d share a probed band value when
+d < bands * (probe_bits + 1). The default (1 bit) finds every match
+up to distance 7 and most at 8-9 (the 0.85 threshold); probe_bits
+None picks the radius with no recall loss at the threshold, at
+several times the query cost.
+
+Entries expire through a heap ordered by timestamp: adding an item
+evicts everything older than the time window behind the newest
+timestamp, so the index never needs a full scan.
+
 ============================================================
 """
 
 import hashlib
+import heapq
 import re
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set, Tuple
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import combinations
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 from uuid import UUID
 
+import numpy as np
+
 
 # ============================================================
 # CONFIGURATION
@@ -55,6 +75,10 @@ class DeduplicatorConfig:
     similarity_threshold: float = 0.85
     shingle_size: int = 3  # For SimHash
     
+    # LSH index settings
+    lsh_bands: int = 4  # 64 / lsh_bands bits per band
+    lsh_probe_bits: Optional[int] = 1  # None = no recall loss vs a full scan (slower)
+    
     # Time window
     time_window_hours: int = 168  # 7 days
     
@@ -82,6 +106,273 @@ class DeduplicationResult:
     checked_at: datetime = field(default_factory=datetime.utcnow)
 
 
+# ============================================================
+# SIMHASH HELPERS
+# ============================================================
+
+
+SIMHASH_BITS = 64
+
+_POPCOUNT8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def popcount64(values: np.ndarray) -> np.ndarray:
+    """Number of set bits of each uint64 value (same shape)."""
+    values = np.ascontiguousarray(values, dtype=np.uint64)
+    counts = _POPCOUNT8[values.view(np.uint8)].reshape(values.shape + (8,))
+    return counts.sum(axis=-1, dtype=np.int64)
+
+
+def max_hamming_distance(similarity_threshold: float) -> int:
+    """Largest Hamming distance whose similarity meets the threshold."""
+    return int((1 - similarity_threshold) * SIMHASH_BITS + 1e-9)
+
+
+@lru_cache(maxsize=None)
+def _probe_masks(band_bits: int, probe_bits: int) -> Tuple[int, ...]:
+    """XOR masks of every band value within probe_bits of a band."""
+    masks = []
+    for flipped in range(probe_bits + 1):
+        for positions in combinations(range(band_bits), flipped):
+            mask = 0
+            for position in positions:
+                mask |= 1 << position
+            masks.append(mask)
+    return tuple(masks)
+
+
+def _epoch(timestamp: datetime) -> float:
+    """Seconds since epoch; naive timestamps are UTC."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.timestamp()
+
+
+# ============================================================
+# SIMHASH INDEX
+# ============================================================
+
+
+class SimHashIndex:
+    """
+    Banded LSH index of 64-bit SimHashes with time-ordered eviction.
+    
+    Entries live in slot arrays (fingerprint, timestamp, insertion
+    order) so candidates are verified with one vectorized popcount.
+    Band tables map a band value to the set of slots holding it.
+    """
+    
+    def __init__(
+        self,
+        max_distance: int,
+        bands: int = 4,
+        probe_bits: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the index.
+        
+        Args:
+            max_distance: Largest Hamming distance that is a match
+            bands: Number of bands (must divide 64)
+            probe_bits: Band bits flipped when probing; None picks the
+                        smallest radius with no recall loss
+        """
+        if bands < 1 or SIMHASH_BITS % bands:
+            raise ValueError(f"bands must divide {SIMHASH_BITS}, got {bands}")
+        
+        self._max_distance = max_distance
+        self._bands = bands
+        self._band_bits = SIMHASH_BITS // bands
+        self._band_mask = (1 << self._band_bits) - 1
+        
+        exact_radius = max(0, -(-(max_distance + 1) // bands) - 1)
+        self._probe_bits = exact_radius if probe_bits is None else min(probe_bits, self._band_bits)
+        self._masks = _probe_masks(self._band_bits, self._probe_bits)
+        
+        self._tables: List[Dict[int, Set[int]]] = [{} for _ in range(bands)]
+        
+        capacity = 1024
+        self._fingerprints = np.zeros(capacity, dtype=np.uint64)
+        self._epochs = np.zeros(capacity, dtype=np.float64)
+        self._seqs = np.zeros(capacity, dtype=np.int64)
+        self._ids: List[Optional[UUID]] = [None] * capacity
+        self._free: List[int] = []
+        self._used = 0
+        self._size = 0
+        self._next_seq = 0
+        
+        # (timestamp, slot), oldest first
+        self._expiry: List[Tuple[float, int]] = []
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    @property
+    def probe_bits(self) -> int:
+        return self._probe_bits
+    
+    @property
+    def exact_recall(self) -> bool:
+        """True if probing finds every entry within max_distance."""
+        return self._bands * (self._probe_bits + 1) > self._max_distance
+    
+    # ---------------------------------------------------------
+    # WRITES
+    # ---------------------------------------------------------
+    
+    def add(self, item_id: UUID, fingerprint: int, epoch: float) -> None:
+        """Add an entry."""
+        if self._free:
+            slot = self._free.pop()
+        else:
+            if self._used == len(self._ids):
+                self._grow()
+            slot = self._used
+            self._used += 1
+        
+        self._fingerprints[slot] = fingerprint
+        self._epochs[slot] = epoch
+        self._seqs[slot] = self._next_seq
+        self._ids[slot] = item_id
+        self._next_seq += 1
+        self._size += 1
+        
+        for table, key in zip(self._tables, self._band_keys(fingerprint)):
+            bucket = table.get(key)
+            if bucket is None:
+                table[key] = {slot}
+            else:
+                bucket.add(slot)
+        
+        heapq.heappush(self._expiry, (epoch, slot))
+    
+    def evict_before(self, cutoff_epoch: float) -> int:
+        """
+        Remove entries older than the cutoff.
+        
+        Returns:
+            Number of entries removed
+        """
+        evicted = 0
+        while self._expiry and self._expiry[0][0] < cutoff_epoch:
+            _, slot = heapq.heappop(self._expiry)
+            fingerprint = int(self._fingerprints[slot])
+            for table, key in zip(self._tables, self._band_keys(fingerprint)):
+                bucket = table[key]
+                bucket.discard(slot)
+                if not bucket:
+                    del table[key]
+            self._ids[slot] = None
+            self._free.append(slot)
+            self._size -= 1
+            evicted += 1
+        return evicted
+    
+    # ---------------------------------------------------------
+    # QUERIES
+    # ---------------------------------------------------------
+    
+    def candidates(self, fingerprint: int) -> Set[int]:
+        """Slots sharing a probed band value with the fingerprint."""
+        found: Set[int] = set()
+        for table, key in zip(self._tables, self._band_keys(fingerprint)):
+            for mask in self._masks:
+                bucket = table.get(key ^ mask)
+                if bucket:
+                    found |= bucket
+        return found
+    
+    def best_match(
+        self,
+        fingerprint: int,
+        min_epoch: float = float("-inf"),
+    ) -> Optional[Tuple[UUID, int]]:
+        """
+        Closest entry within max_distance (earliest on ties).
+        
+        Args:
+            fingerprint: SimHash to look up
+            min_epoch: Ignore entries older than this
+            
+        Returns:
+            (item_id, distance) or None
+        """
+        return self.best_matches(
+            np.array([fingerprint], dtype=np.uint64), np.array([min_epoch])
+        )[0]
+    
+    def best_matches(
+        self,
+        fingerprints: np.ndarray,
+        min_epochs: np.ndarray,
+    ) -> List[Optional[Tuple[UUID, int]]]:
+        """
+        best_match for many fingerprints with one vectorized verification.
+        
+        Args:
+            fingerprints: uint64 SimHashes
+            min_epochs: Per-query oldest timestamp to consider
+        """
+        queries: List[int] = []
+        slots: List[int] = []
+        for query, fingerprint in enumerate(fingerprints.tolist()):
+            found = self.candidates(fingerprint)
+            queries.extend([query] * len(found))
+            slots.extend(found)
+        
+        matches: List[Optional[Tuple[UUID, int]]] = [None] * len(fingerprints)
+        if not slots:
+            return matches
+        
+        query_index = np.array(queries, dtype=np.int64)
+        slot_index = np.array(slots, dtype=np.int64)
+        distances = popcount64(self._fingerprints[slot_index] ^ fingerprints[query_index])
+        
+        ok = (distances <= self._max_distance) & (self._epochs[slot_index] >= min_epochs[query_index])
+        query_index, slot_index, distances = query_index[ok], slot_index[ok], distances[ok]
+        if not len(query_index):
+            return matches
+        
+        # Per query: smallest distance, then earliest insertion
+        order = np.lexsort((self._seqs[slot_index], distances, query_index))
+        firsts = order[np.unique(query_index[order], return_index=True)[1]]
+        for query, slot, distance in zip(
+            query_index[firsts].tolist(), slot_index[firsts].tolist(), distances[firsts].tolist()
+        ):
+            matches[query] = (self._ids[slot], distance)
+        return matches
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Index size and bucket statistics."""
+        bucket_sizes = [len(bucket) for table in self._tables for bucket in table.values()]
+        return {
+            "entries": self._size,
+            "buckets": len(bucket_sizes),
+            "max_bucket_size": max(bucket_sizes, default=0),
+            "bands": self._bands,
+            "probe_bits": self._probe_bits,
+            "probes_per_query": self._bands * len(self._masks),
+            "exact_recall": self.exact_recall,
+        }
+    
+    # ---------------------------------------------------------
+    # INTERNALS
+    # ---------------------------------------------------------
+    
+    def _band_keys(self, fingerprint: int) -> List[int]:
+        bits, mask = self._band_bits, self._band_mask
+        return [(fingerprint >> (band * bits)) & mask for band in range(self._bands)]
+    
+    def _grow(self) -> None:
+        capacity = len(self._ids) * 2
+        for name in ("_fingerprints", "_epochs", "_seqs"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+        self._ids.extend([None] * (capacity - len(self._ids)))
+
+
 # ============================================================
 # DEDUPLICATOR
 # ============================================================
@@ -115,10 +406,20 @@ class Deduplicator:
             config: Deduplication configuration
         """
         self._config = config
+        self._window_seconds = config.time_window_hours * 3600
+        self._max_distance = max_hamming_distance(config.similarity_threshold)
         
         # In-memory hash index (would be backed by DB in production)
         self._hash_index: Dict[str, Tuple[UUID, datetime]] = {}
-        self._simhash_index: Dict[int, List[Tuple[UUID, int, datetime]]] = {}
+        self._hash_expiry: List[Tuple[float, str]] = []
+        self._simhash_index = SimHashIndex(
+            self._max_distance,
+            bands=config.lsh_bands,
+            probe_bits=config.lsh_probe_bits,
+        )
+        
+        # Newest timestamp seen; the window trails it
+        self._watermark = float("-inf")
     
     @property
     def version(self) -> str:
@@ -149,24 +450,28 @@ class Deduplicator:
             DeduplicationResult with duplicate info
         """
         timestamp = timestamp or datetime.utcnow()
+        epoch = _epoch(timestamp)
         
         # Normalize content for comparison
         normalized = self._normalize_content(content)
+        content_hash = self._hash(normalized)
         
         # Check exact match first
         if self._config.exact_match_enabled:
-            exact_result = self._check_exact_match(item_id, normalized, timestamp)
+            exact_result = self._check_exact_match(item_id, content_hash, epoch)
             if exact_result.is_duplicate:
                 return exact_result
         
         # Check near-duplicate
+        simhash = None
         if self._config.near_duplicate_enabled:
-            near_result = self._check_near_duplicate(item_id, normalized, timestamp)
+            simhash = self._compute_simhash(normalized)
+            near_result = self._check_near_duplicate(item_id, simhash, epoch)
             if near_result.is_duplicate:
                 return near_result
         
         # Not a duplicate - add to index
-        self._add_to_index(item_id, normalized, timestamp)
+        self._add_to_index(item_id, content_hash, simhash, timestamp)
         
         return DeduplicationResult(
             item_id=item_id,
@@ -180,16 +485,58 @@ class Deduplicator:
         """
         Check a batch of items for duplicates.
         
+        Equivalent to check_duplicate in order, but SimHashes are
+        computed together and Hamming distances are verified with
+        vectorized popcounts: once against the index, and pairwise
+        within the batch (exhaustively, independent of probe_bits).
+        
         Args:
             items: List of (item_id, content, source, timestamp) tuples
             
         Returns:
             List of DeduplicationResult
         """
-        results = []
-        for item_id, content, source, timestamp in items:
-            result = self.check_duplicate(item_id, content, source, timestamp)
-            results.append(result)
+        if not items:
+            return []
+        
+        timestamps = [timestamp or datetime.utcnow() for _, _, _, timestamp in items]
+        epochs = np.array([_epoch(ts) for ts in timestamps], dtype=np.float64)
+        normalized = [self._normalize_content(content) for _, content, _, _ in items]
+        hashes = [self._hash(text) for text in normalized]
+        
+        near_enabled = self._config.near_duplicate_enabled
+        if near_enabled:
+            simhashes = self.compute_simhashes(normalized)
+            index_matches = self._simhash_index.best_matches(
+                simhashes, epochs - self._window_seconds
+            )
+            batch_pairs = self._batch_pairs(simhashes)
+        
+        results: List[DeduplicationResult] = []
+        accepted: Set[int] = set()
+        for i, (item_id, _, _, _) in enumerate(items):
+            if self._config.exact_match_enabled:
+                exact_result = self._check_exact_match(item_id, hashes[i], float(epochs[i]))
+                if exact_result.is_duplicate:
+                    results.append(exact_result)
+                    continue
+            
+            simhash = None
+            if near_enabled:
+                simhash = int(simhashes[i])
+                best = index_matches[i]
+                min_epoch = epochs[i] - self._window_seconds
+                for j, distance in batch_pairs.get(i, ()):
+                    if j in accepted and epochs[j] >= min_epoch and (best is None or distance < best[1]):
+                        best = (items[j][0], distance)
+                if best is not None:
+                    results.append(self._near_result(item_id, *best))
+                    continue
+            
+            self._add_to_index(item_id, hashes[i], simhash, timestamps[i])
+            accepted.add(i)
+            results.append(DeduplicationResult(item_id=item_id, is_duplicate=False))
+        
         return results
     
     def compute_hash(self, content: str) -> str:
@@ -202,38 +549,56 @@ class Deduplicator:
         Returns:
             Hash string
         """
-        normalized = self._normalize_content(content)
-        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        return self._hash(self._normalize_content(content))
     
-    def clear_expired(self) -> int:
+    def compute_simhashes(self, normalized_contents: Sequence[str]) -> np.ndarray:
         """
-        Clear expired entries from the index.
+        SimHashes of normalized contents.
+        
+        Each distinct shingle votes +1/-1 per bit with the low 64 bits
+        of its MD5; a bit is set if the votes are positive.
         
         Returns:
-            Number of entries cleared
+            uint64 array (0 for content shorter than one shingle)
         """
-        cutoff = datetime.utcnow() - timedelta(hours=self._config.time_window_hours)
-        cleared = 0
+        size = self._config.shingle_size
+        md5 = hashlib.md5
+        digests: List[bytes] = []
+        counts = np.zeros(len(normalized_contents), dtype=np.int64)
+        
+        for i, content in enumerate(normalized_contents):
+            words = content.split()
+            shingles = {" ".join(words[j:j + size]) for j in range(len(words) - size + 1)}
+            counts[i] = len(shingles)
+            digests.extend(md5(shingle.encode()).digest()[8:] for shingle in shingles)
+        
+        fingerprints = np.zeros(len(normalized_contents), dtype=np.uint64)
+        if not digests:
+            return fingerprints
+        
+        # Low 64 bits of each MD5 as big-endian integers -> bit matrix
+        values = np.frombuffer(b"".join(digests), dtype=">u8").astype("<u8")
+        bits = np.unpackbits(values.view(np.uint8).reshape(-1, 8), axis=1, bitorder="little")
+        
+        present = counts > 0
+        starts = np.concatenate(([0], np.cumsum(counts[present])[:-1]))
+        ones = np.add.reduceat(bits, starts, axis=0, dtype=np.int32)
+        set_bits = (2 * ones > counts[present, None]).astype(np.uint8)
+        fingerprints[present] = np.packbits(set_bits, axis=1, bitorder="little").view("<u8").ravel()
+        return fingerprints
+    
+    def clear_expired(self, now: Optional[datetime] = None) -> int:
+        """
+        Clear entries older than the time window.
         
-        # Clear exact hash index
-        expired_hashes = [
-            h for h, (_, ts) in self._hash_index.items()
-            if ts < cutoff
-        ]
-        for h in expired_hashes:
-            del self._hash_index[h]
-            cleared += 1
-        
-        # Clear simhash index
-        for bucket_key in list(self._simhash_index.keys()):
-            self._simhash_index[bucket_key] = [
-                (id_, sh, ts) for id_, sh, ts in self._simhash_index[bucket_key]
-                if ts >= cutoff
-            ]
-            if not self._simhash_index[bucket_key]:
-                del self._simhash_index[bucket_key]
+        Adding items already evicts behind the newest timestamp;
+        this also evicts relative to the wall clock.
         
-        return cleared
+        Returns:
+            Number of entries cleared
+        """
+        cutoff = _epoch(now or datetime.utcnow()) - self._window_seconds
+        return self._evict_before(cutoff)
     
     # =========================================================
     # EXACT MATCH
@@ -242,21 +607,22 @@ class Deduplicator:
     def _check_exact_match(
         self,
         item_id: UUID,
-        normalized_content: str,
-        timestamp: datetime,
+        content_hash: str,
+        epoch: float,
     ) -> DeduplicationResult:
-        """Check for exact hash match."""
-        content_hash = hashlib.sha256(normalized_content.encode("utf-8")).hexdigest()
-        
-        if content_hash in self._hash_index:
-            original_id, original_ts = self._hash_index[content_hash]
-            return DeduplicationResult(
-                item_id=item_id,
-                is_duplicate=True,
-                duplicate_type="exact",
-                original_id=original_id,
-                similarity_score=1.0,
-            )
+        """Check for exact hash match within the time window."""
+        entry = self._hash_index.get(content_hash)
+        
+        if entry is not None:
+            original_id, original_ts = entry
+            if _epoch(original_ts) >= epoch - self._window_seconds:
+                return DeduplicationResult(
+                    item_id=item_id,
+                    is_duplicate=True,
+                    duplicate_type="exact",
+                    original_id=original_id,
+                    similarity_score=1.0,
+                )
         
         return DeduplicationResult(
             item_id=item_id,
@@ -270,69 +636,53 @@ class Deduplicator:
     def _check_near_duplicate(
         self,
         item_id: UUID,
-        normalized_content: str,
-        timestamp: datetime,
+        content_simhash: int,
+        epoch: float,
     ) -> DeduplicationResult:
-        """Check for near-duplicate using SimHash."""
-        content_simhash = self._compute_simhash(normalized_content)
-        
-        # Get candidate buckets (LSH-style)
-        bucket_key = content_simhash >> 32  # Use high 32 bits as bucket
-        
-        if bucket_key in self._simhash_index:
-            for original_id, original_simhash, original_ts in self._simhash_index[bucket_key]:
-                similarity = self._hamming_similarity(content_simhash, original_simhash)
-                
-                if similarity >= self._config.similarity_threshold:
-                    return DeduplicationResult(
-                        item_id=item_id,
-                        is_duplicate=True,
-                        duplicate_type="near",
-                        original_id=original_id,
-                        similarity_score=similarity,
-                    )
+        """Check for near-duplicate using the SimHash LSH index."""
+        match = self._simhash_index.best_match(content_simhash, epoch - self._window_seconds)
+        
+        if match is not None:
+            return self._near_result(item_id, *match)
         
         return DeduplicationResult(
             item_id=item_id,
             is_duplicate=False,
         )
     
+    def _near_result(self, item_id: UUID, original_id: UUID, distance: int) -> DeduplicationResult:
+        return DeduplicationResult(
+            item_id=item_id,
+            is_duplicate=True,
+            duplicate_type="near",
+            original_id=original_id,
+            similarity_score=1 - (distance / SIMHASH_BITS),
+        )
+    
+    def _batch_pairs(self, simhashes: np.ndarray, block: int = 256) -> Dict[int, List[Tuple[int, int]]]:
+        """
+        Pairs (i, j < i) within max_distance, by i.
+        
+        Computed in row blocks to bound memory.
+        """
+        pairs: Dict[int, List[Tuple[int, int]]] = {}
+        for start in range(0, len(simhashes), block):
+            end = min(start + block, len(simhashes))
+            distances = popcount64(simhashes[start:end, None] ^ simhashes[None, :end])
+            rows = np.arange(start, end)[:, None]
+            cols = np.arange(end)[None, :]
+            hit_rows, hit_cols = np.nonzero((cols < rows) & (distances <= self._max_distance))
+            for r, c in zip(hit_rows.tolist(), hit_cols.tolist()):
+                pairs.setdefault(start + r, []).append((c, int(distances[r, c])))
+        return pairs
+    
     def _compute_simhash(self, content: str) -> int:
         """
         Compute SimHash of content.
         
         Uses shingle-based approach for text similarity.
         """
-        # Generate shingles
-        words = content.split()
-        shingles = set()
-        for i in range(len(words) - self._config.shingle_size + 1):
-            shingle = " ".join(words[i:i + self._config.shingle_size])
-            shingles.add(shingle)
-        
-        if not shingles:
-            return 0
-        
-        # Compute SimHash
-        v = [0] * 64  # 64-bit hash
-        
-        for shingle in shingles:
-            # Hash each shingle
-            h = int(hashlib.md5(shingle.encode()).hexdigest(), 16) % (2 ** 64)
-            
-            for i in range(64):
-                if h & (1 << i):
-                    v[i] += 1
-                else:
-                    v[i] -= 1
-        
-        # Generate final hash
-        fingerprint = 0
-        for i in range(64):
-            if v[i] > 0:
-                fingerprint |= (1 << i)
-        
-        return fingerprint
+        return int(self.compute_simhashes([content])[0])
     
     def _hamming_similarity(self, hash1: int, hash2: int) -> float:
         """
@@ -353,23 +703,46 @@ class Deduplicator:
     def _add_to_index(
         self,
         item_id: UUID,
-        normalized_content: str,
+        content_hash: str,
+        content_simhash: Optional[int],
         timestamp: datetime,
     ) -> None:
-        """Add item to deduplication indices."""
+        """Add item to deduplication indices and evict behind it."""
+        epoch = _epoch(timestamp)
+        
         # Add to exact hash index
-        content_hash = hashlib.sha256(normalized_content.encode("utf-8")).hexdigest()
-        self._hash_index[content_hash] = (item_id, timestamp)
+        self._index_hash(content_hash, item_id, timestamp, epoch)
         
         # Add to simhash index
         if self._config.near_duplicate_enabled:
-            content_simhash = self._compute_simhash(normalized_content)
-            bucket_key = content_simhash >> 32
-            
-            if bucket_key not in self._simhash_index:
-                self._simhash_index[bucket_key] = []
-            
-            self._simhash_index[bucket_key].append((item_id, content_simhash, timestamp))
+            if content_simhash is None:
+                raise ValueError("SimHash required when near-duplicate detection is enabled")
+            self._simhash_index.add(item_id, content_simhash, epoch)
+        
+        if epoch > self._watermark:
+            self._watermark = epoch
+            self._evict_before(epoch - self._window_seconds)
+    
+    def _index_hash(self, content_hash: str, item_id: UUID, timestamp: datetime, epoch: float) -> None:
+        self._hash_index[content_hash] = (item_id, timestamp)
+        heapq.heappush(self._hash_expiry, (epoch, content_hash))
+    
+    def _evict_before(self, cutoff_epoch: float) -> int:
+        """Remove exact and SimHash entries older than the cutoff."""
+        cleared = 0
+        while self._hash_expiry and self._hash_expiry[0][0] < cutoff_epoch:
+            epoch, content_hash = heapq.heappop(self._hash_expiry)
+            entry = self._hash_index.get(content_hash)
+            # Skip if the hash was indexed again later
+            if entry is not None and _epoch(entry[1]) == epoch:
+                del self._hash_index[content_hash]
+                cleared += 1
+        
+        self._simhash_index.evict_before(cutoff_epoch)
+        return cleared
+    
+    def _hash(self, normalized_content: str) -> str:
+        return hashlib.sha256(normalized_content.encode("utf-8")).hexdigest()
     
     def _normalize_content(self, content: str) -> str:
         """
@@ -408,18 +781,25 @@ class Deduplicator:
             # Check if content looks like a hash (64 hex chars)
             if len(content) == 64 and all(c in "0123456789abcdef" for c in content.lower()):
                 # It's already a hash
-                self._hash_index[content] = (record_id, timestamp)
+                self._index_hash(content, record_id, timestamp, _epoch(timestamp))
             else:
                 # It's content, compute hash
-                self._add_to_index(record_id, self._normalize_content(content), timestamp)
+                normalized = self._normalize_content(content)
+                simhash = (
+                    self._compute_simhash(normalized)
+                    if self._config.near_duplicate_enabled else None
+                )
+                self._add_to_index(record_id, self._hash(normalized), simhash, timestamp)
     
     def get_index_stats(self) -> Dict[str, Any]:
         """Get statistics about the deduplication index."""
+        simhash_stats = self._simhash_index.get_stats()
         return {
             "exact_hash_count": len(self._hash_index),
-            "simhash_bucket_count": len(self._simhash_index),
-            "simhash_entry_count": sum(
-                len(entries) for entries in self._simhash_index.values()
-            ),
+            "simhash_bucket_count": simhash_stats["buckets"],
+            "simhash_entry_count": simhash_stats["entries"],
+            "simhash_max_bucket_size": simhash_stats["max_bucket_size"],
+            "lsh_probe_bits": simhash_stats["probe_bits"],
+            "lsh_exact_recall": simhash_stats["exact_recall"],
             "version": self._config.version,
         }
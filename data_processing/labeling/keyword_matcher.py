@@ -0,0 +1,156 @@
+"""
+Data Processing - Keyword Matcher.
+
+============================================================
+PURPOSE
+============================================================
+Finds every whole-word keyword occurrence of many keyword groups
+(topics, risk categories) in ONE scan of the text.
+
+Results are exactly those of running, for every keyword,
+re.finditer(rf"\\b{re.escape(keyword)}\\b", text, re.IGNORECASE)
+over lower-cased text - the per-keyword regexes the topic
+classifier and risk keyword detector used before.
+
+============================================================
+HOW IT WORKS
+============================================================
+A whole-word keyword that starts and ends with a word character
+starts at a word start and its first word is a whole text word.
+Keywords are indexed by their first word, so the scan walks the
+words of the text and checks only keywords starting with that
+word: one dict lookup per word, independent of keyword count.
+
+- Lower-case characters that re.IGNORECASE folds onto ASCII
+  letters are mapped before lookup
+- Hits of one keyword never overlap (finditer semantics)
+- Keywords the word index cannot represent (non-ASCII, or not
+  starting and ending with a word character) use their regex
+
+============================================================
+"""
+
+import re
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Tuple
+
+
+_WORD = re.compile(r"\w+")
+
+# Lower-case characters re.IGNORECASE matches to ASCII letters
+_IGNORECASE_FOLD = str.maketrans({"ı": "i", "ſ": "s"})
+
+
+class KeywordHit(NamedTuple):
+    """One keyword occurrence."""
+    group: str
+    keyword: str  # As given in the group
+    index: int  # Position of the keyword in its group
+    start: int
+    end: int
+
+
+def _is_word_char(char: str) -> bool:
+    """Same as re's \\w for str patterns."""
+    return char.isalnum() or char == "_"
+
+
+class KeywordMatcher:
+    """
+    Single-pass multi-keyword matcher.
+
+    Usage:
+        matcher = KeywordMatcher({"security": ["hack", "rug pull"]})
+        hits = matcher.scan(text.lower())
+        counts = matcher.count(text.lower())
+    """
+
+    def __init__(self, groups: Mapping[str, Iterable[str]]) -> None:
+        """
+        Initialize the matcher.
+
+        Args:
+            groups: Group name -> keywords (order is kept in hit.index)
+        """
+        # Lower-cased keyword -> (group, keyword, index) entries
+        self._entries: Dict[str, List[Tuple[str, str, int]]] = {}
+        # First word -> lower-cased keywords starting with it
+        self._by_first_word: Dict[str, List[str]] = {}
+        self._fallback: List[Tuple[re.Pattern, Tuple[str, str, int]]] = []
+
+        for group, keywords in groups.items():
+            for index, keyword in enumerate(keywords):
+                entry = (group, keyword, index)
+                if not self._indexable(keyword):
+                    pattern = re.compile(rf"\b{re.escape(keyword)}\b", re.IGNORECASE)
+                    self._fallback.append((pattern, entry))
+                    continue
+
+                lowered = keyword.lower()
+                if lowered not in self._entries:
+                    self._entries[lowered] = []
+                    first_word = _WORD.match(lowered).group()
+                    self._by_first_word.setdefault(first_word, []).append(lowered)
+                self._entries[lowered].append(entry)
+
+    # =========================================================
+    # PUBLIC API
+    # =========================================================
+
+    def scan(self, text: str) -> List[KeywordHit]:
+        """
+        All keyword hits in lower-cased text.
+
+        Hits of the indexed keywords come in text order; fallback
+        keyword hits follow.
+        """
+        folded = text.translate(_IGNORECASE_FOLD)
+        length = len(folded)
+        hits: List[KeywordHit] = []
+        last_end: Dict[str, int] = {}
+
+        for word in _WORD.finditer(folded):
+            candidates = self._by_first_word.get(word.group())
+            if candidates is None:
+                continue
+
+            start = word.start()
+            for keyword in candidates:
+                end = start + len(keyword)
+                if end != word.end():
+                    # Multi-word keyword: rest of it must follow
+                    if not folded.startswith(keyword, start):
+                        continue
+                    if end < length and _is_word_char(folded[end]):
+                        continue
+                if last_end.get(keyword, -1) > start:
+                    continue
+                last_end[keyword] = end
+
+                for group, original, index in self._entries[keyword]:
+                    hits.append(KeywordHit(group, original, index, start, end))
+
+        for pattern, (group, original, index) in self._fallback:
+            for match in pattern.finditer(text):
+                hits.append(KeywordHit(group, original, index, match.start(), match.end()))
+
+        return hits
+
+    def count(self, text: str) -> Dict[str, int]:
+        """Number of hits per group in lower-cased text."""
+        counts: Dict[str, int] = {}
+        for hit in self.scan(text):
+            counts[hit.group] = counts.get(hit.group, 0) + 1
+        return counts
+
+    # =========================================================
+    # INTERNAL METHODS
+    # =========================================================
+
+    @staticmethod
+    def _indexable(keyword: str) -> bool:
+        return (
+            bool(keyword)
+            and keyword.isascii()
+            and _is_word_char(keyword[0])
+            and _is_word_char(keyword[-1])
+        )
@@ -29,15 +29,24 @@ RISK CATEGORIES (DESCRIPTIVE)
 - market_risk: crash, dump, manipulation
 - operational_risk: downtime, outage, failure
 
+============================================================
+MATCHING
+============================================================
+All categories are matched in one scan per text by a shared
+KeywordMatcher; detections are identical to one \bkeyword\b
+regex per keyword. detect_batch can fan out to a process pool.
+
 ============================================================
 """
 
-import re
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from typing import Dict, List, Optional, Set, Tuple
 
+from .keyword_matcher import KeywordMatcher
+
 
 # ============================================================
 # CONFIGURATION
@@ -261,8 +270,8 @@ class RiskKeywordDetector:
         """
         self._config = config or RiskKeywordConfig()
         
-        # Build detection patterns
-        self._patterns = self._build_patterns()
+        # Build the keyword matcher
+        self._matcher, self._severities = self._build_matcher()
     
     @property
     def version(self) -> str:
@@ -287,28 +296,23 @@ class RiskKeywordDetector:
         Returns:
             RiskDetectionResult with detections
         """
-        detections: List[RiskDetection] = []
         text_lower = text.lower()
         
+        # Group hits by category, in keyword then text order
+        hits_by_category: Dict[str, List[RiskDetection]] = {}
+        for hit in sorted(self._matcher.scan(text_lower), key=lambda h: (h.index, h.start)):
+            keyword = text_lower[hit.start:hit.end]
+            hits_by_category.setdefault(hit.group, []).append(RiskDetection(
+                keyword=keyword,
+                category=hit.group,
+                severity=self._severities[hit.group][hit.index],
+                context=self._extract_context(text, hit.start, len(keyword)),
+                position=hit.start,
+            ))
+        
+        detections: List[RiskDetection] = []
         for category in self._config.categories:
-            if category not in self._patterns:
-                continue
-            
-            for pattern, severity in self._patterns[category]:
-                for match in pattern.finditer(text_lower):
-                    keyword = match.group()
-                    position = match.start()
-                    
-                    # Extract context
-                    context = self._extract_context(text, position, len(keyword))
-                    
-                    detections.append(RiskDetection(
-                        keyword=keyword,
-                        category=category,
-                        severity=Decimal(str(severity)),
-                        context=context,
-                        position=position,
-                    ))
+            detections.extend(hits_by_category.get(category, []))
         
         # Get unique categories
         categories_detected = list(set(d.category for d in detections))
@@ -320,41 +324,49 @@ class RiskKeywordDetector:
             version=self._config.version,
         )
     
-    def detect_batch(self, texts: List[str]) -> List[RiskDetectionResult]:
+    def detect_batch(
+        self,
+        texts: List[str],
+        executor: Optional[Executor] = None,
+        chunk_size: int = 256,
+    ) -> List[RiskDetectionResult]:
         """
         Detect risk keywords in a batch of texts.
         
         Args:
             texts: List of texts to analyze
+            executor: Optional (process) pool; texts are sent in chunks
+            chunk_size: Texts per submitted chunk
             
         Returns:
             List of RiskDetectionResult
         """
-        return [self.detect(text) for text in texts]
+        if executor is None or len(texts) <= chunk_size:
+            return _detect_texts(self, texts)
+        
+        futures = [
+            executor.submit(_detect_texts, self, texts[i:i + chunk_size])
+            for i in range(0, len(texts), chunk_size)
+        ]
+        return [result for future in futures for result in future.result()]
     
     # =========================================================
     # INTERNAL METHODS
     # =========================================================
     
-    def _build_patterns(self) -> Dict[str, List[Tuple[re.Pattern, float]]]:
-        """Build regex patterns for each category."""
-        patterns: Dict[str, List[Tuple[re.Pattern, float]]] = {}
+    def _build_matcher(self) -> Tuple[KeywordMatcher, Dict[str, List[Decimal]]]:
+        """Build the keyword matcher and per-keyword severities."""
+        groups: Dict[str, List[str]] = {}
+        severities: Dict[str, List[Decimal]] = {}
         
         for category, keywords in RISK_KEYWORDS.items():
             if category not in self._config.categories:
                 continue
             
-            category_patterns = []
-            for keyword, severity in keywords.items():
-                # Escape special regex characters
-                escaped = re.escape(keyword)
-                # Create word boundary pattern
-                pattern = re.compile(rf"\b{escaped}\b", re.IGNORECASE)
-                category_patterns.append((pattern, severity))
-            
-            patterns[category] = category_patterns
+            groups[category] = list(keywords)
+            severities[category] = [Decimal(str(severity)) for severity in keywords.values()]
         
-        return patterns
+        return KeywordMatcher(groups), severities
     
     def _extract_context(
         self,
@@ -403,3 +415,8 @@ class RiskKeywordDetector:
             "operational_risk": "Technical and operational failures",
         }
         return descriptions.get(category, "Unknown category")
+
+
+def _detect_texts(detector: RiskKeywordDetector, texts: List[str]) -> List[RiskDetectionResult]:
+    """Module-level so chunks can be sent to a process pool."""
+    return [detector.detect(text) for text in texts]
@@ -33,14 +33,23 @@ TOPIC TAXONOMY
 - nft: NFT, digital collectibles
 - other: Uncategorized
 
+============================================================
+MATCHING
+============================================================
+Keyword counts for all topics come from one KeywordMatcher scan
+per text (same counts as one findall per keyword pattern).
+classify_batch can fan out to a process pool.
+
 ============================================================
 """
 
-import re
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional, Set, Tuple
 
+from .keyword_matcher import KeywordMatcher
+
 
 # ============================================================
 # CONFIGURATION
@@ -213,8 +222,8 @@ class TopicClassifier:
         """
         self._config = config or TopicClassifierConfig()
         
-        # Build keyword patterns
-        self._patterns = self._build_patterns()
+        # Build the keyword matcher
+        self._matcher = self._build_matcher()
     
     @property
     def version(self) -> str:
@@ -249,11 +258,12 @@ class TopicClassifier:
         
         # Calculate scores for each topic
         scores: Dict[str, float] = {}
+        match_counts = self._matcher.count(text)
         
         for topic in self._config.topics:
             if topic == "other":
                 continue
-            score = self._calculate_topic_score(text, topic)
+            score = self._score_from_count(match_counts.get(topic, 0))
             if score > 0:
                 scores[topic] = score
         
@@ -302,61 +312,47 @@ class TopicClassifier:
     def classify_batch(
         self,
         items: List[Tuple[str, Optional[str]]],
+        executor: Optional[Executor] = None,
+        chunk_size: int = 256,
     ) -> List[ClassificationResult]:
         """
         Classify a batch of items.
         
         Args:
             items: List of (title, content) tuples
+            executor: Optional (process) pool; items are sent in chunks
+            chunk_size: Items per submitted chunk
             
         Returns:
             List of ClassificationResult
         """
-        return [self.classify(title, content) for title, content in items]
+        if executor is None or len(items) <= chunk_size:
+            return _classify_items(self, items)
+        
+        futures = [
+            executor.submit(_classify_items, self, items[i:i + chunk_size])
+            for i in range(0, len(items), chunk_size)
+        ]
+        return [result for future in futures for result in future.result()]
     
     # =========================================================
     # INTERNAL METHODS
     # =========================================================
     
-    def _build_patterns(self) -> Dict[str, List[re.Pattern]]:
-        """Build regex patterns for each topic."""
-        patterns: Dict[str, List[re.Pattern]] = {}
-        
-        for topic, keywords in TOPIC_KEYWORDS.items():
-            if topic not in self._config.topics:
-                continue
-            
-            topic_patterns = []
-            for keyword in keywords:
-                # Escape special regex characters
-                escaped = re.escape(keyword)
-                # Create word boundary pattern
-                pattern = re.compile(rf"\b{escaped}\b", re.IGNORECASE)
-                topic_patterns.append(pattern)
-            
-            patterns[topic] = topic_patterns
-        
-        return patterns
+    def _build_matcher(self) -> KeywordMatcher:
+        """Build the keyword matcher over the configured topics."""
+        return KeywordMatcher({
+            topic: keywords
+            for topic, keywords in TOPIC_KEYWORDS.items()
+            if topic in self._config.topics
+        })
     
-    def _calculate_topic_score(self, text: str, topic: str) -> float:
+    def _score_from_count(self, match_count: int) -> float:
         """
         Calculate score for a topic based on keyword matches.
         
         Returns a score between 0 and 1.
         """
-        if topic not in self._patterns:
-            return 0.0
-        
-        patterns = self._patterns[topic]
-        if not patterns:
-            return 0.0
-        
-        # Count matches
-        match_count = 0
-        for pattern in patterns:
-            matches = pattern.findall(text)
-            match_count += len(matches)
-        
         # Score based on match count (with diminishing returns)
         # 1 match = 0.3, 2 = 0.5, 3 = 0.6, 4+ = 0.7+
         if match_count == 0:
@@ -393,3 +389,11 @@ class TopicClassifier:
             "other": "Uncategorized news",
         }
         return descriptions.get(topic, "Unknown topic")
+
+
+def _classify_items(
+    classifier: TopicClassifier,
+    items: List[Tuple[str, Optional[str]]],
+) -> List[ClassificationResult]:
+    """Module-level so chunks can be sent to a process pool."""
+    return [classifier.classify(title, content) for title, content in items]
@@ -20,17 +20,37 @@ DESIGN PRINCIPLES
 - No look-ahead or future data access
 - All I/O through repositories only
 
+============================================================
+CHUNKED MODE
+============================================================
+process_batch(chunk_size=N) streams pending records in chunks
+instead of one round trip per record:
+
+- Records are read with a server-side cursor (separate read
+  session) when the processor exposes pending_records_query()
+- process_record runs in an optional executor (thread or
+  process pool) for processors marked parallel_safe
+- Each chunk is written with one bulk persist and one
+  UPDATE ... WHERE id = ANY(:ids) stage transition, then ONE
+  commit; a failing chunk is retried record by record
+
 ============================================================
 """
 
 import logging
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, Future
 from datetime import datetime
-from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
+from typing import (
+    Any, Dict, Generic, Iterator, List, Optional, Sequence, Set, Tuple, TypeVar,
+)
 from uuid import UUID
 
+from sqlalchemy import any_, bindparam, cast, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
 
 from data_processing.pipeline.types import (
     DataDomain,
@@ -47,6 +67,28 @@ TInput = TypeVar("TInput")
 TOutput = TypeVar("TOutput")
 
 
+def _compute_records(processor: "BaseStageProcessor", records: Sequence[Any]) -> List[Tuple]:
+    """
+    Run the CPU-bound part of a stage for a chunk of records.
+    
+    Module-level so it can be submitted to a process pool; errors
+    are returned as strings because exceptions may not pickle.
+    """
+    computed: List[Tuple] = []
+    for record in records:
+        start_time = time.time()
+        try:
+            processor._validate_preconditions(record)
+            output = processor.process_record(record)
+            processor._validate_output(output)
+            computed.append((output, None, False, (time.time() - start_time) * 1000))
+        except ProcessingError as e:
+            computed.append((None, str(e), True, (time.time() - start_time) * 1000))
+        except Exception as e:
+            computed.append((None, str(e), False, (time.time() - start_time) * 1000))
+    return computed
+
+
 class BaseStageProcessor(ABC, Generic[TInput, TOutput]):
     """
     Abstract base class for processing stage processors.
@@ -73,6 +115,10 @@ class BaseStageProcessor(ABC, Generic[TInput, TOutput]):
     ============================================================
     """
     
+    # True if process_record keeps no state between records, so a chunk
+    # can be split across workers without changing results
+    parallel_safe: bool = False
+    
     def __init__(
         self,
         session: Session,
@@ -95,6 +141,17 @@ class BaseStageProcessor(ABC, Generic[TInput, TOutput]):
         # Metrics
         self._metrics = StageMetrics(stage=self.to_stage)
     
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without session/logger (for process pool workers)."""
+        state = self.__dict__.copy()
+        state["_session"] = None
+        state.pop("_logger", None)
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._logger = logging.getLogger(f"processor.{self.stage_name}")
+    
     @property
     @abstractmethod
     def from_stage(self) -> ProcessingStage:
@@ -195,6 +252,38 @@ class BaseStageProcessor(ABC, Generic[TInput, TOutput]):
         """
         pass
     
+    # =========================================================
+    # OPTIONAL HOOKS - CHUNKED MODE
+    # =========================================================
+    
+    def pending_records_query(self, limit: Optional[int] = None) -> Optional[Select]:
+        """
+        ORM select of pending records (scalars are the input records).
+        
+        When provided, chunked mode streams it with a server-side
+        cursor; otherwise load_pending_records is used.
+        """
+        return None
+    
+    def source_stage_columns(self) -> Optional[Tuple[Any, Any]]:
+        """
+        (id column, processing_stage column) of the source table.
+        
+        When provided, chunked mode moves a whole chunk to to_stage
+        with one UPDATE instead of update_source_stage per record.
+        """
+        return None
+    
+    def persist_results_bulk(self, items: List[Tuple[TOutput, UUID]]) -> Optional[List[UUID]]:
+        """
+        Persist a chunk of (result, source_id) pairs in bulk.
+        
+        Returns:
+            New record IDs in input order, or None if not supported
+            (persist_result is then called per record)
+        """
+        return None
+    
     # =========================================================
     # PROCESSING WORKFLOW
     # =========================================================
@@ -203,6 +292,8 @@ class BaseStageProcessor(ABC, Generic[TInput, TOutput]):
         self,
         limit: int = 100,
         continue_on_error: bool = True,
+        chunk_size: Optional[int] = None,
+        executor: Optional[Executor] = None,
     ) -> List[ProcessingResult]:
         """
         Process a batch of records through this stage.
@@ -210,6 +301,11 @@ class BaseStageProcessor(ABC, Generic[TInput, TOutput]):
         Args:
             limit: Maximum records to process
             continue_on_error: Whether to continue on individual errors
+                               (chunked mode stops after the failing chunk)
+            chunk_size: Records per chunk; None processes and commits
+                        record by record
+            executor: Pool for process_record in chunked mode
+                      (used only if parallel_safe)
             
         Returns:
             List of processing results
@@ -218,6 +314,19 @@ class BaseStageProcessor(ABC, Generic[TInput, TOutput]):
         results: List[ProcessingResult] = []
         
         try:
+            if chunk_size:
+                for records in self.iter_pending_chunks(limit, chunk_size):
+                    chunk_results = self.persist_chunk(
+                        records, self.submit_chunk(records, executor).result()
+                    )
+                    results.extend(chunk_results)
+                    
+                    failed = [r for r in chunk_results if r.status == ProcessingStatus.FAILED]
+                    if failed and not continue_on_error:
+                        self._logger.error(f"Stopping batch due to error: {failed[0].error_message}")
+                        break
+                return results
+            
             # Load pending records
             records = self.load_pending_records(limit)
             self._logger.info(f"Loaded {len(records)} records for processing")
@@ -327,6 +436,156 @@ class BaseStageProcessor(ABC, Generic[TInput, TOutput]):
                 error_message=str(e),
             )
     
+    # =========================================================
+    # CHUNKED WORKFLOW
+    # =========================================================
+    
+    def iter_pending_chunks(self, limit: Optional[int], chunk_size: int) -> Iterator[List[TInput]]:
+        """
+        Yield pending records in chunks of at most chunk_size.
+        
+        Streams pending_records_query() through a server-side cursor
+        on a separate read session, so commits of earlier chunks do not
+        close the cursor. Falls back to load_pending_records(limit).
+        """
+        stmt = self.pending_records_query(limit)
+        if stmt is None:
+            records = self.load_pending_records(limit)
+            self._logger.info(f"Loaded {len(records)} records for processing")
+            for i in range(0, len(records), chunk_size):
+                yield records[i:i + chunk_size]
+            return
+        
+        read_session = Session(bind=self._session.get_bind())
+        try:
+            result = read_session.execute(stmt.execution_options(yield_per=chunk_size))
+            for partition in result.scalars().partitions(chunk_size):
+                yield list(partition)
+        finally:
+            read_session.close()
+    
+    def submit_chunk(self, records: List[TInput], executor: Optional[Executor] = None) -> Future:
+        """
+        Start the CPU-bound part of a chunk.
+        
+        Returns:
+            Future of the per-record compute results (already resolved
+            when there is no executor or the processor is not parallel_safe)
+        """
+        if executor is None or not self.parallel_safe or not records:
+            future: Future = Future()
+            future.set_result(_compute_records(self, records))
+            return future
+        return executor.submit(_compute_records, self, records)
+    
+    def persist_chunk(
+        self,
+        records: List[TInput],
+        computed: List[Tuple],
+        record_ids: Optional[List[UUID]] = None,
+    ) -> List[ProcessingResult]:
+        """
+        Write a computed chunk with one bulk persist, one stage UPDATE
+        and one commit; retry record by record if the chunk fails.
+        
+        Args:
+            records: Input records
+            computed: Results of _compute_records for the same records
+            record_ids: IDs of the records, if already known
+            
+        Returns:
+            Processing results in input order
+        """
+        if record_ids is None:
+            record_ids = [self.get_record_id(record) for record in records]
+        succeeded = [
+            (output, record_id)
+            for record_id, (output, error, _, _) in zip(record_ids, computed)
+            if error is None
+        ]
+        
+        new_ids: Dict[UUID, UUID] = {}
+        persisted = False
+        if succeeded:
+            try:
+                with self._session.begin_nested():
+                    new_ids = self._persist_many(succeeded)
+                self._session.commit()
+                persisted = True
+            except Exception as e:
+                self._session.rollback()
+                self._logger.warning(
+                    f"Bulk persist of {len(succeeded)} records failed, retrying one by one: {e}"
+                )
+        
+        results: List[ProcessingResult] = []
+        for record_id, (output, error, is_processing_error, duration_ms) in zip(record_ids, computed):
+            if error is None and not persisted:
+                start_time = time.time()
+                try:
+                    new_ids[record_id] = self.persist_result(output, record_id)
+                    self.update_source_stage(record_id)
+                    self._session.commit()
+                except Exception as e:
+                    self._session.rollback()
+                    error = str(e)
+                duration_ms += (time.time() - start_time) * 1000
+            
+            self._metrics.records_processed += 1
+            if error is None:
+                self._metrics.records_succeeded += 1
+                results.append(ProcessingResult(
+                    record_id=record_id,
+                    domain=self._domain,
+                    status=ProcessingStatus.SUCCESS,
+                    from_stage=self.from_stage,
+                    to_stage=self.to_stage,
+                    duration_ms=duration_ms,
+                    metadata={"new_id": str(new_ids.get(record_id))},
+                ))
+            else:
+                self._metrics.records_failed += 1
+                self._metrics.errors.append(error)
+                if is_processing_error:
+                    self._logger.warning(f"Processing error for {record_id}: {error}")
+                else:
+                    self._logger.error(f"Unexpected error for {record_id}: {error}")
+                results.append(ProcessingResult(
+                    record_id=record_id,
+                    domain=self._domain,
+                    status=ProcessingStatus.FAILED,
+                    from_stage=self.from_stage,
+                    to_stage=self.to_stage,
+                    duration_ms=duration_ms,
+                    error_message=error,
+                ))
+        
+        return results
+    
+    def _persist_many(self, items: List[Tuple[TOutput, UUID]]) -> Dict[UUID, UUID]:
+        """Persist results and move sources to to_stage (no commit)."""
+        source_ids = [source_id for _, source_id in items]
+        
+        new_ids = self.persist_results_bulk(items)
+        if new_ids is None:
+            new_ids = [self.persist_result(output, source_id) for output, source_id in items]
+        
+        columns = self.source_stage_columns()
+        if columns is not None:
+            id_column, stage_column = columns
+            self._session.execute(
+                update(id_column.table)
+                .where(id_column == any_(cast(bindparam("ids"), ARRAY(id_column.type))))
+                .values({stage_column.name: self.to_stage.value})
+                .execution_options(synchronize_session=False),
+                {"ids": source_ids},
+            )
+        else:
+            for source_id in source_ids:
+                self.update_source_stage(source_id)
+        
+        return dict(zip(source_ids, new_ids))
+    
     def _validate_preconditions(self, record: TInput) -> None:
         """
         Validate preconditions before processing.
@@ -415,17 +674,35 @@ class CompositeProcessor:
         self,
         limit_per_stage: int = 100,
         continue_on_error: bool = True,
+        chunk_size: Optional[int] = None,
+        executor: Optional[Executor] = None,
     ) -> Dict[ProcessingStage, List[ProcessingResult]]:
         """
         Process records through all stages.
         
+        With chunk_size, the stages are pipelined: every round each
+        stage takes its next chunk, the chunks are computed together
+        (in the executor, if given) and then persisted in stage order.
+        Cleaning of chunk N+1 thus overlaps labeling of chunk N.
+        
         Args:
             limit_per_stage: Maximum records per stage
             continue_on_error: Whether to continue on errors
+            chunk_size: Records per stage per round; None runs the
+                        stages one after another, record by record
+            executor: Pool for the compute step of parallel_safe stages
             
         Returns:
             Results grouped by stage
         """
+        if chunk_size:
+            all_results = self._process_pipelined(
+                limit_per_stage, continue_on_error, chunk_size, executor
+            )
+            for processor in self._processors:
+                self._log_stage_complete(processor, all_results[processor.to_stage])
+            return all_results
+        
         all_results: Dict[ProcessingStage, List[ProcessingResult]] = {}
         
         for processor in self._processors:
@@ -438,14 +715,86 @@ class CompositeProcessor:
             
             all_results[processor.to_stage] = results
             
-            self._logger.info(
-                f"Stage {processor.stage_name} complete: "
-                f"{len([r for r in results if r.status == ProcessingStatus.SUCCESS])} succeeded, "
-                f"{len([r for r in results if r.status == ProcessingStatus.FAILED])} failed"
-            )
+            self._log_stage_complete(processor, results)
         
         return all_results
     
+    def _process_pipelined(
+        self,
+        limit_per_stage: int,
+        continue_on_error: bool,
+        chunk_size: int,
+        executor: Optional[Executor],
+    ) -> Dict[ProcessingStage, List[ProcessingResult]]:
+        """Run all stages as a wavefront of chunks (see process_all_stages)."""
+        all_results: Dict[ProcessingStage, List[ProcessingResult]] = {
+            p.to_stage: [] for p in self._processors
+        }
+        # Failed records stay at their stage; never reload them this run
+        failed_ids: List[Set[UUID]] = [set() for _ in self._processors]
+        done = [False] * len(self._processors)
+        rounds = 0
+        
+        while not all(done):
+            rounds += 1
+            
+            # 1. Load: each stage sees what upstream committed last round
+            chunks: List[Tuple[BaseStageProcessor, List[Any], List[UUID]]] = []
+            for i, processor in enumerate(self._processors):
+                if done[i]:
+                    continue
+                remaining = limit_per_stage - len(all_results[processor.to_stage])
+                records = [
+                    record
+                    for record in processor.load_pending_records(remaining + len(failed_ids[i]))
+                    if processor.get_record_id(record) not in failed_ids[i]
+                ][:remaining]
+                
+                if not records:
+                    # Finished once nothing upstream can produce more input
+                    if all(done[:i]):
+                        done[i] = True
+                    continue
+                chunk = records[:chunk_size]
+                chunks.append((processor, chunk, [processor.get_record_id(r) for r in chunk]))
+            
+            # 2. Compute every stage's chunk together, wait for all of them
+            #    (commits below expire ORM records still being read)
+            futures = [processor.submit_chunk(chunk, executor) for processor, chunk, _ in chunks]
+            computed = [future.result() for future in futures]
+            
+            # 3. Persist in stage order, one commit per stage chunk
+            stop = False
+            for (processor, chunk, record_ids), chunk_computed in zip(chunks, computed):
+                index = self._processors.index(processor)
+                results = processor.persist_chunk(chunk, chunk_computed, record_ids)
+                all_results[processor.to_stage].extend(results)
+                
+                failed = {r.record_id for r in results if r.status == ProcessingStatus.FAILED}
+                failed_ids[index] |= failed
+                if failed and not continue_on_error:
+                    stop = True
+                if len(all_results[processor.to_stage]) >= limit_per_stage:
+                    done[index] = True
+            
+            if stop:
+                self._logger.error("Stopping pipelined run due to errors")
+                break
+        
+        self._logger.info(f"Pipelined run finished after {rounds} rounds")
+        return all_results
+    
+    def _log_stage_complete(
+        self,
+        processor: BaseStageProcessor,
+        results: List[ProcessingResult],
+    ) -> None:
+        self._logger.info(
+            f"Stage {processor.stage_name} complete: "
+            f"{len([r for r in results if r.status == ProcessingStatus.SUCCESS])} succeeded, "
+            f"{len([r for r in results if r.status == ProcessingStatus.FAILED])} failed"
+        )
+    
     def get_all_metrics(self) -> Dict[ProcessingStage, StageMetrics]:
         """Get metrics from all stages."""
         return {p.to_stage: p.get_metrics() for p in self._processors}
@@ -23,10 +23,11 @@ TO: CLEANED
 import logging
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
-from uuid import UUID
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, insert
+from sqlalchemy.sql import Select
 from sqlalchemy.orm import Session
 
 from data_processing.pipeline.base import BaseStageProcessor
@@ -96,6 +97,11 @@ class NewsCleaningProcessor(BaseStageProcessor[RawNewsData, CleanedNewsItem]):
             version=version,
         ))
     
+    @property
+    def parallel_safe(self) -> bool:
+        # The deduplicator remembers earlier records
+        return not self._config.enable_deduplication
+    
     @property
     def from_stage(self) -> ProcessingStage:
         return ProcessingStage.RAW
@@ -106,14 +112,19 @@ class NewsCleaningProcessor(BaseStageProcessor[RawNewsData, CleanedNewsItem]):
     
     def load_pending_records(self, limit: int = 100) -> List[RawNewsData]:
         """Load raw news records pending cleaning."""
+        result = self._session.execute(self.pending_records_query(limit))
+        return list(result.scalars().all())
+    
+    def pending_records_query(self, limit: Optional[int] = None) -> Select:
         stmt = (
             select(RawNewsData)
             .where(RawNewsData.processing_stage == "raw")
             .order_by(RawNewsData.collected_at)
-            .limit(limit)
         )
-        result = self._session.execute(stmt)
-        return list(result.scalars().all())
+        return stmt.limit(limit) if limit is not None else stmt
+    
+    def source_stage_columns(self) -> Tuple[Any, Any]:
+        return RawNewsData.raw_news_id, RawNewsData.processing_stage
     
     def get_record_id(self, record: RawNewsData) -> UUID:
         return record.raw_news_id
@@ -221,26 +232,7 @@ class NewsCleaningProcessor(BaseStageProcessor[RawNewsData, CleanedNewsItem]):
     def persist_result(self, result: CleanedNewsItem, source_id: UUID) -> UUID:
         """Persist cleaned news data."""
         # Create ProcessedNewsData entity
-        entity = ProcessedNewsData(
-            raw_news_id=result.raw_news_id,
-            source=result.source,
-            original_id=str(source_id),
-            title=result.title,
-            content=result.content,
-            summary=result.summary,
-            url=result.url,
-            author=result.author,
-            published_at=result.published_at or datetime.utcnow(),
-            collected_at=result.collected_at,
-            processed_at=result.cleaned_at,
-            content_hash=result.content_hash,
-            is_duplicate=result.is_duplicate,
-            duplicate_of_id=result.duplicate_of_id,
-            word_count=result.word_count,
-            version=result.version,
-            processing_stage="cleaned",
-            confidence_score=Decimal("1.0"),
-        )
+        entity = ProcessedNewsData(**self._processed_news_values(result, source_id))
         
         self._session.add(entity)
         self._session.flush()
@@ -248,19 +240,67 @@ class NewsCleaningProcessor(BaseStageProcessor[RawNewsData, CleanedNewsItem]):
         # Also create CleanedTextData entry
         if result.content:
             cleaned_text = CleanedTextData(
-                processed_news_id=entity.processed_news_id,
-                original_text=result.original_payload.get("content", ""),
-                cleaned_text=result.content,
-                extracted_urls=result.extracted_urls,
-                cleaning_operations=result.cleaning_operations,
-                characters_removed=result.characters_removed,
-                version=result.version,
-                processing_stage="cleaned",
+                **self._cleaned_text_values(result, entity.processed_news_id)
             )
             self._session.add(cleaned_text)
         
         return entity.processed_news_id
     
+    def persist_results_bulk(self, items: List[Tuple[CleanedNewsItem, UUID]]) -> List[UUID]:
+        """Persist a chunk with one multi-row INSERT per table."""
+        # IDs are generated here so text rows can reference them
+        # without reading them back
+        new_ids = [uuid4() for _ in items]
+        news_rows = [
+            {"processed_news_id": new_id, **self._processed_news_values(result, source_id)}
+            for new_id, (result, source_id) in zip(new_ids, items)
+        ]
+        text_rows = [
+            self._cleaned_text_values(result, new_id)
+            for new_id, (result, _) in zip(new_ids, items)
+            if result.content
+        ]
+        
+        self._session.execute(insert(ProcessedNewsData), news_rows)
+        if text_rows:
+            self._session.execute(insert(CleanedTextData), text_rows)
+        
+        return new_ids
+    
+    def _processed_news_values(self, result: CleanedNewsItem, source_id: UUID) -> Dict[str, Any]:
+        return {
+            "raw_news_id": result.raw_news_id,
+            "source": result.source,
+            "original_id": str(source_id),
+            "title": result.title,
+            "content": result.content,
+            "summary": result.summary,
+            "url": result.url,
+            "author": result.author,
+            "published_at": result.published_at or datetime.utcnow(),
+            "collected_at": result.collected_at,
+            "processed_at": result.cleaned_at,
+            "content_hash": result.content_hash,
+            "is_duplicate": result.is_duplicate,
+            "duplicate_of_id": result.duplicate_of_id,
+            "word_count": result.word_count,
+            "version": result.version,
+            "processing_stage": "cleaned",
+            "confidence_score": Decimal("1.0"),
+        }
+    
+    def _cleaned_text_values(self, result: CleanedNewsItem, processed_news_id: UUID) -> Dict[str, Any]:
+        return {
+            "processed_news_id": processed_news_id,
+            "original_text": result.original_payload.get("content", ""),
+            "cleaned_text": result.content,
+            "extracted_urls": result.extracted_urls,
+            "cleaning_operations": result.cleaning_operations,
+            "characters_removed": result.characters_removed,
+            "version": result.version,
+            "processing_stage": "cleaned",
+        }
+    
     def update_source_stage(self, source_id: UUID) -> None:
         """Update raw news processing stage to cleaned."""
         stmt = (
@@ -331,6 +371,11 @@ class MarketCleaningProcessor(BaseStageProcessor[RawMarketData, CleanedMarketIte
             version=version,
         ))
     
+    @property
+    def parallel_safe(self) -> bool:
+        # The deduplicator remembers earlier records
+        return not self._config.enable_deduplication
+    
     @property
     def from_stage(self) -> ProcessingStage:
         return ProcessingStage.RAW
@@ -341,14 +386,19 @@ class MarketCleaningProcessor(BaseStageProcessor[RawMarketData, CleanedMarketIte
     
     def load_pending_records(self, limit: int = 100) -> List[RawMarketData]:
         """Load raw market data records pending cleaning."""
+        result = self._session.execute(self.pending_records_query(limit))
+        return list(result.scalars().all())
+    
+    def pending_records_query(self, limit: Optional[int] = None) -> Select:
         stmt = (
             select(RawMarketData)
             .where(RawMarketData.processing_stage == "raw")
             .order_by(RawMarketData.collected_at)
-            .limit(limit)
         )
-        result = self._session.execute(stmt)
-        return list(result.scalars().all())
+        return stmt.limit(limit) if limit is not None else stmt
+    
+    def source_stage_columns(self) -> Tuple[Any, Any]:
+        return RawMarketData.raw_market_id, RawMarketData.processing_stage
     
     def get_record_id(self, record: RawMarketData) -> UUID:
         return record.raw_market_id
@@ -428,6 +478,10 @@ class MarketCleaningProcessor(BaseStageProcessor[RawMarketData, CleanedMarketIte
         # For now, just return the source_id as we're updating in place
         return source_id
     
+    def persist_results_bulk(self, items: List[Tuple[CleanedMarketItem, UUID]]) -> List[UUID]:
+        # Updated in place; the stage UPDATE is all there is to write
+        return [source_id for _, source_id in items]
+    
     def update_source_stage(self, source_id: UUID) -> None:
         """Update raw market data processing stage to cleaned."""
         stmt = (
@@ -524,6 +578,11 @@ class OnChainCleaningProcessor(BaseStageProcessor[RawOnChainData, CleanedOnChain
             version=version,
         ))
     
+    @property
+    def parallel_safe(self) -> bool:
+        # The deduplicator remembers earlier records
+        return not self._config.enable_deduplication
+    
     @property
     def from_stage(self) -> ProcessingStage:
         return ProcessingStage.RAW
@@ -534,14 +593,19 @@ class OnChainCleaningProcessor(BaseStageProcessor[RawOnChainData, CleanedOnChain
     
     def load_pending_records(self, limit: int = 100) -> List[RawOnChainData]:
         """Load raw on-chain data records pending cleaning."""
+        result = self._session.execute(self.pending_records_query(limit))
+        return list(result.scalars().all())
+    
+    def pending_records_query(self, limit: Optional[int] = None) -> Select:
         stmt = (
             select(RawOnChainData)
             .where(RawOnChainData.processing_stage == "raw")
             .order_by(RawOnChainData.collected_at)
-            .limit(limit)
         )
-        result = self._session.execute(stmt)
-        return list(result.scalars().all())
+        return stmt.limit(limit) if limit is not None else stmt
+    
+    def source_stage_columns(self) -> Tuple[Any, Any]:
+        return RawOnChainData.raw_onchain_id, RawOnChainData.processing_stage
     
     def get_record_id(self, record: RawOnChainData) -> UUID:
         return record.raw_onchain_id
@@ -627,6 +691,10 @@ class OnChainCleaningProcessor(BaseStageProcessor[RawOnChainData, CleanedOnChain
         # For on-chain data, we update stage in place
         return source_id
     
+    def persist_results_bulk(self, items: List[Tuple[CleanedOnChainItem, UUID]]) -> List[UUID]:
+        # Updated in place; the stage UPDATE is all there is to write
+        return [source_id for _, source_id in items]
+    
     def update_source_stage(self, source_id: UUID) -> None:
         """Update raw on-chain data processing stage to cleaned."""
         stmt = (
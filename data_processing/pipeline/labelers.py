@@ -33,10 +33,11 @@ NO price prediction indicators.
 import logging
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, insert
+from sqlalchemy.sql import Select
 from sqlalchemy.orm import Session
 
 from data_processing.pipeline.base import BaseStageProcessor
@@ -112,6 +113,8 @@ class NewsLabelingProcessor(BaseStageProcessor[ProcessedNewsData, LabeledNewsIte
             version=version,
         ))
     
+    parallel_safe = True
+    
     @property
     def from_stage(self) -> ProcessingStage:
         return ProcessingStage.NORMALIZED
@@ -122,14 +125,19 @@ class NewsLabelingProcessor(BaseStageProcessor[ProcessedNewsData, LabeledNewsIte
     
     def load_pending_records(self, limit: int = 100) -> List[ProcessedNewsData]:
         """Load normalized news records pending labeling."""
+        result = self._session.execute(self.pending_records_query(limit))
+        return list(result.scalars().all())
+    
+    def pending_records_query(self, limit: Optional[int] = None) -> Select:
         stmt = (
             select(ProcessedNewsData)
             .where(ProcessedNewsData.processing_stage == "normalized")
             .order_by(ProcessedNewsData.processed_at)
-            .limit(limit)
         )
-        result = self._session.execute(stmt)
-        return list(result.scalars().all())
+        return stmt.limit(limit) if limit is not None else stmt
+    
+    def source_stage_columns(self) -> Tuple[Any, Any]:
+        return ProcessedNewsData.processed_news_id, ProcessedNewsData.processing_stage
     
     def get_record_id(self, record: ProcessedNewsData) -> UUID:
         return record.processed_news_id
@@ -183,38 +191,65 @@ class NewsLabelingProcessor(BaseStageProcessor[ProcessedNewsData, LabeledNewsIte
             record.processing_stage = "labeled"
         
         # Store topic classifications
-        for topic in result.primary_topics:
-            confidence = result.topic_confidences.get(topic, 0.5)
-            is_primary = (topic == result.news_category)
-            
-            classification = TopicClassification(
-                processed_news_id=source_id,
-                topic=topic,
-                confidence_score=Decimal(str(confidence)),
-                is_primary_topic=is_primary,
-                classification_method="rule_based",
-                version=self._version,
-                processing_stage="labeled",
-            )
-            self._session.add(classification)
+        for values in self._classification_values(result, source_id):
+            self._session.add(TopicClassification(**values))
         
         # Store risk keyword detections
-        for keyword, keywords_list in result.keyword_categories.items():
-            for kw in keywords_list:
-                detection = RiskKeywordDetection(
-                    processed_news_id=source_id,
-                    keyword=kw,
-                    category=keyword,
-                    severity=Decimal("0.5"),  # Default severity
-                    confidence_score=Decimal("1.0"),
-                    detection_method="pattern",
-                    version=self._version,
-                    processing_stage="labeled",
-                )
-                self._session.add(detection)
+        for values in self._detection_values(result, source_id):
+            self._session.add(RiskKeywordDetection(**values))
         
         return source_id
     
+    def persist_results_bulk(self, items: List[Tuple[LabeledNewsItem, UUID]]) -> List[UUID]:
+        """Persist a chunk with one multi-row INSERT per label table."""
+        classifications = [
+            values
+            for result, source_id in items
+            for values in self._classification_values(result, source_id)
+        ]
+        detections = [
+            values
+            for result, source_id in items
+            for values in self._detection_values(result, source_id)
+        ]
+        
+        if classifications:
+            self._session.execute(insert(TopicClassification), classifications)
+        if detections:
+            self._session.execute(insert(RiskKeywordDetection), detections)
+        
+        return [source_id for _, source_id in items]
+    
+    def _classification_values(self, result: LabeledNewsItem, source_id: UUID) -> List[Dict[str, Any]]:
+        return [
+            {
+                "processed_news_id": source_id,
+                "topic": topic,
+                "confidence_score": Decimal(str(result.topic_confidences.get(topic, 0.5))),
+                "is_primary_topic": topic == result.news_category,
+                "classification_method": "rule_based",
+                "version": self._version,
+                "processing_stage": "labeled",
+            }
+            for topic in result.primary_topics
+        ]
+    
+    def _detection_values(self, result: LabeledNewsItem, source_id: UUID) -> List[Dict[str, Any]]:
+        return [
+            {
+                "processed_news_id": source_id,
+                "keyword": kw,
+                "category": category,
+                "severity": Decimal("0.5"),  # Default severity
+                "confidence_score": Decimal("1.0"),
+                "detection_method": "pattern",
+                "version": self._version,
+                "processing_stage": "labeled",
+            }
+            for category, keywords_list in result.keyword_categories.items()
+            for kw in keywords_list
+        ]
+    
     def update_source_stage(self, source_id: UUID) -> None:
         """Update is done in persist_result."""
         pass
@@ -341,6 +376,8 @@ class MarketLabelingProcessor(BaseStageProcessor[dict, LabeledMarketItem]):
         
         self._config = config or LabelingConfig()
     
+    parallel_safe = True
+    
     @property
     def from_stage(self) -> ProcessingStage:
         return ProcessingStage.NORMALIZED
@@ -416,6 +453,15 @@ class MarketLabelingProcessor(BaseStageProcessor[dict, LabeledMarketItem]):
         
         return source_id
     
+    def persist_results_bulk(self, items: List[Tuple[LabeledMarketItem, UUID]]) -> List[UUID]:
+        # Only the stage changes; see source_stage_columns
+        return [source_id for _, source_id in items]
+    
+    def source_stage_columns(self) -> Tuple[Any, Any]:
+        from storage.models.raw_data import RawMarketData
+        
+        return RawMarketData.raw_market_id, RawMarketData.processing_stage
+    
     def update_source_stage(self, source_id: UUID) -> None:
         """Update is done in persist_result."""
         pass
@@ -504,6 +550,8 @@ class OnChainLabelingProcessor(BaseStageProcessor[dict, LabeledOnChainItem]):
         
         self._config = config or LabelingConfig()
     
+    parallel_safe = True
+    
     @property
     def from_stage(self) -> ProcessingStage:
         return ProcessingStage.NORMALIZED
@@ -574,6 +622,15 @@ class OnChainLabelingProcessor(BaseStageProcessor[dict, LabeledOnChainItem]):
         
         return source_id
     
+    def persist_results_bulk(self, items: List[Tuple[LabeledOnChainItem, UUID]]) -> List[UUID]:
+        # Only the stage changes; see source_stage_columns
+        return [source_id for _, source_id in items]
+    
+    def source_stage_columns(self) -> Tuple[Any, Any]:
+        from storage.models.raw_data import RawOnChainData
+        
+        return RawOnChainData.raw_onchain_id, RawOnChainData.processing_stage
+    
     def update_source_stage(self, source_id: UUID) -> None:
         """Update is done in persist_result."""
         pass
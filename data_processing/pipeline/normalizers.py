@@ -28,7 +28,8 @@ from decimal import Decimal, ROUND_HALF_UP
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.sql import Select
 from sqlalchemy.orm import Session
 
 from data_processing.pipeline.base import BaseStageProcessor
@@ -328,6 +329,8 @@ class NewsNormalizationProcessor(BaseStageProcessor[ProcessedNewsData, Normalize
         )
         self._timestamp_normalizer = TimestampNormalizer()
     
+    parallel_safe = True
+    
     @property
     def from_stage(self) -> ProcessingStage:
         return ProcessingStage.CLEANED
@@ -338,14 +341,16 @@ class NewsNormalizationProcessor(BaseStageProcessor[ProcessedNewsData, Normalize
     
     def load_pending_records(self, limit: int = 100) -> List[ProcessedNewsData]:
         """Load cleaned news records pending normalization."""
+        result = self._session.execute(self.pending_records_query(limit))
+        return list(result.scalars().all())
+    
+    def pending_records_query(self, limit: Optional[int] = None) -> Select:
         stmt = (
             select(ProcessedNewsData)
             .where(ProcessedNewsData.processing_stage == "cleaned")
             .order_by(ProcessedNewsData.processed_at)
-            .limit(limit)
         )
-        result = self._session.execute(stmt)
-        return list(result.scalars().all())
+        return stmt.limit(limit) if limit is not None else stmt
     
     def get_record_id(self, record: ProcessedNewsData) -> UUID:
         return record.processed_news_id
@@ -407,6 +412,22 @@ class NewsNormalizationProcessor(BaseStageProcessor[ProcessedNewsData, Normalize
         
         return source_id
     
+    def persist_results_bulk(self, items: List[Tuple[NormalizedNewsItem, UUID]]) -> List[UUID]:
+        """Update a chunk with one executemany UPDATE by primary key."""
+        self._session.execute(
+            update(ProcessedNewsData),
+            [
+                {
+                    "processed_news_id": source_id,
+                    "assets_mentioned": result.assets_mentioned,
+                    "language_detected": result.language_detected,
+                    "processing_stage": "normalized",
+                }
+                for result, source_id in items
+            ],
+        )
+        return [source_id for _, source_id in items]
+    
     def update_source_stage(self, source_id: UUID) -> None:
         """Update is done in persist_result."""
         pass
@@ -502,6 +523,8 @@ class MarketNormalizationProcessor(BaseStageProcessor[dict, NormalizedMarketItem
             percentage_decimals=self._config.percentage_decimal_places,
         )
     
+    parallel_safe = True
+    
     @property
     def from_stage(self) -> ProcessingStage:
         return ProcessingStage.CLEANED
@@ -615,6 +638,15 @@ class MarketNormalizationProcessor(BaseStageProcessor[dict, NormalizedMarketItem
         
         return source_id
     
+    def persist_results_bulk(self, items: List[Tuple[NormalizedMarketItem, UUID]]) -> List[UUID]:
+        # Only the stage changes; see source_stage_columns
+        return [source_id for _, source_id in items]
+    
+    def source_stage_columns(self) -> Tuple[Any, Any]:
+        from storage.models.raw_data import RawMarketData
+        
+        return RawMarketData.raw_market_id, RawMarketData.processing_stage
+    
     def update_source_stage(self, source_id: UUID) -> None:
         """Update is done in persist_result."""
         pass
@@ -672,6 +704,8 @@ class OnChainNormalizationProcessor(BaseStageProcessor[dict, NormalizedOnChainIt
         self._timestamp_normalizer = TimestampNormalizer()
         self._numeric_normalizer = NumericNormalizer()
     
+    parallel_safe = True
+    
     @property
     def from_stage(self) -> ProcessingStage:
         return ProcessingStage.CLEANED
@@ -793,6 +827,15 @@ class OnChainNormalizationProcessor(BaseStageProcessor[dict, NormalizedOnChainIt
         
         return source_id
     
+    def persist_results_bulk(self, items: List[Tuple[NormalizedOnChainItem, UUID]]) -> List[UUID]:
+        # Only the stage changes; see source_stage_columns
+        return [source_id for _, source_id in items]
+    
+    def source_stage_columns(self) -> Tuple[Any, Any]:
+        from storage.models.raw_data import RawOnChainData
+        
+        return RawOnChainData.raw_onchain_id, RawOnChainData.processing_stage
+    
     def update_source_stage(self, source_id: UUID) -> None:
         """Update is done in persist_result."""
         pass
@@ -27,12 +27,15 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from sqlalchemy import and_, func
-from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
+from database.bulk import multirow_upsert
 from database.engine import get_session
 from database.models import MarketData, ProcessedMarketData, ProcessedMarketStateRecord
 
+from .columnar_features import CandleFrame, compute_window_features
+from .rolling_window import IncrementalFeatureEngine
+from .state_cache import MarketStateCache, get_market_state_cache
 from .contracts import (
     ProcessedMarketState,
     ProcessedMarketStateBundle,
@@ -45,6 +48,39 @@ from .contracts import (
 logger = logging.getLogger("data_processing.module")
 
 
+# Columns refreshed when an upsert hits an existing row
+PROCESSED_DATA_UPDATE_COLUMNS = (
+    "open_price", "high_price", "low_price", "close_price", "vwap",
+    "total_volume", "total_quote_volume", "avg_volume", "price_return",
+    "price_return_pct", "volatility", "high_low_range", "volume_change",
+    "volume_change_pct", "candle_count", "trade_count", "data_quality_score",
+    "has_gaps", "calculated_at",
+)
+MARKET_STATE_UPDATE_COLUMNS = (
+    "state_id", "trend_state", "volatility_level", "liquidity_score",
+    "liquidity_grade", "current_price", "price_change_pct", "volatility_raw",
+    "volatility_percentile", "volume_ratio", "trend_strength",
+    "trend_direction_numeric", "is_tradeable", "risk_score_hint",
+)
+# Conflict key of processed_market_states (uq_processed_market_state)
+MARKET_STATE_KEY_COLUMNS = ("symbol", "timeframe", "exchange", "calculated_at")
+
+# Numeric fields compared when verifying incremental results
+_VERIFIED_FIELDS = (
+    "open_price", "high_price", "low_price", "close_price", "vwap",
+    "total_volume", "total_quote_volume", "avg_volume", "price_return",
+    "volatility", "high_low_range", "volume_change", "candle_count", "trade_count",
+)
+
+
+def _dedupe_rows(rows: List[Dict[str, Any]], key_columns: Tuple[str, ...]) -> List[Dict[str, Any]]:
+    """Keep the last row per unique key (one statement cannot upsert a row twice)."""
+    unique: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+    for row in rows:
+        unique[tuple(row[col] for col in key_columns)] = row
+    return list(unique.values())
+
+
 class ProcessingPipelineModule:
     """
     Real data processing module for orchestrator.
@@ -70,6 +106,12 @@ class ProcessingPipelineModule:
     def __init__(
         self,
         session_factory=None,
+        vectorized: bool = True,
+        incremental: bool = False,
+        full_recompute_every: int = 60,
+        late_data_grace: timedelta = timedelta(minutes=5),
+        verify_tolerance: float = 1e-6,
+        state_cache: Optional[MarketStateCache] = None,
         **kwargs,
     ) -> None:
         """
@@ -77,9 +119,36 @@ class ProcessingPipelineModule:
         
         Args:
             session_factory: Optional factory for database sessions
+            vectorized: Compute features with the columnar NumPy engine
+                        (False = per-candle reference implementation)
+            incremental: Keep rolling windows in memory and read only rows
+                         fetched since the last cycle
+            full_recompute_every: Cycles between full 48h recomputes in
+                                  incremental mode (verifies and resets drift)
+            late_data_grace: Overlap for the fetched_at watermark, covering
+                             rows committed after their fetch time
+            verify_tolerance: Max relative difference tolerated between
+                              incremental and full results
+            state_cache: Latest-state cache published after each commit
+                         (default: the process-wide cache)
             **kwargs: Additional arguments (for orchestrator compatibility)
         """
         self._session_factory = session_factory or get_session
+        self._vectorized = vectorized
+        self._incremental = incremental
+        self._full_recompute_every = full_recompute_every
+        self._late_data_grace = late_data_grace
+        self._verify_tolerance = verify_tolerance
+        self._rolling: Optional[IncrementalFeatureEngine] = None
+        self._state_cache = state_cache or get_market_state_cache()
+        self._cycles_since_full = 0
+        self._rolling_stats: Dict[str, Any] = {
+            "rows_read_last_cycle": 0,
+            "full_recomputes": 0,
+            "verifications": 0,
+            "verify_mismatches": 0,
+            "max_relative_error": 0.0,
+        }
         self._running = False
         self._processed_count = 0
         self._last_run_time: Optional[float] = None
@@ -110,6 +179,13 @@ class ProcessingPipelineModule:
             "is_placeholder": False,
             "processed_count": self._processed_count,
             "last_run_time": self._last_run_time,
+            "mode": "incremental" if self._incremental else ("vectorized" if self._vectorized else "reference"),
+            "incremental": {
+                **self._rolling_stats,
+                "groups": self._rolling.group_count if self._rolling else 0,
+                "group_rebuilds": self._rolling.rebuild_count if self._rolling else 0,
+            } if self._incremental else None,
+            "state_cache": self._state_cache.get_stats(),
         }
     
     def can_trade(self) -> bool:
@@ -166,9 +242,21 @@ class ProcessingPipelineModule:
             session = self._session_factory()
             
             # 1. Fetch recent market data
-            raw_data = self._fetch_recent_market_data(session, window_start, window_end)
+            if self._incremental:
+                # Only rows fetched since the last cycle; features come from rolling state
+                all_processed_records, rows_read = self._compute_interval_features_incremental(
+                    session, intervals, now
+                )
+                has_data = self._rolling.group_count > 0
+            else:
+                if self._vectorized:
+                    raw_data = self._fetch_recent_market_columns(session, window_start, window_end)
+                else:
+                    raw_data = self._fetch_recent_market_data(session, window_start, window_end)
+                rows_read = len(raw_data)
+                has_data = bool(raw_data)
             
-            if not raw_data:
+            if not has_data:
                 logger.warning("No market data found in the specified time window")
                 result = {
                     "success": True,
@@ -183,53 +271,17 @@ class ProcessingPipelineModule:
                 }
                 return result
             
-            logger.info(f"Fetched {len(raw_data)} raw market data records")
+            logger.info(f"Fetched {rows_read} raw market data records")
             
-            # 2. Group data by symbol and exchange
-            grouped_data = self._group_market_data(raw_data)
-            
-            # 3. Process each interval
-            all_processed_records: List[Dict[str, Any]] = []
-            
-            for interval_name, interval_delta in intervals:
-                # Calculate window for this interval
-                interval_end = now
-                interval_start = interval_end - interval_delta
-                
-                # Also need previous period for volume change
-                prev_start = interval_start - interval_delta
-                prev_end = interval_start
-                
-                for (symbol, exchange), candles in grouped_data.items():
-                    # Filter candles for current interval
-                    current_candles = [
-                        c for c in candles
-                        if self._normalize_to_utc(interval_start) <= self._normalize_to_utc(c.candle_open_time) < self._normalize_to_utc(interval_end)
-                    ]
-                    
-                    if not current_candles:
-                        continue
-                    
-                    # Get previous period candles for volume change
-                    prev_candles = [
-                        c for c in candles
-                        if self._normalize_to_utc(prev_start) <= self._normalize_to_utc(c.candle_open_time) < self._normalize_to_utc(prev_end)
-                    ]
-                    
-                    # Compute features
-                    processed_record = self._compute_features(
-                        symbol=symbol,
-                        exchange=exchange,
-                        interval=interval_name,
-                        candles=current_candles,
-                        prev_candles=prev_candles,
-                        window_start=interval_start,
-                        window_end=interval_end,
-                    )
-                    
-                    if processed_record:
-                        all_processed_records.append(processed_record)
-                        processed_symbols.add(symbol)
+            # 2-3. Group by symbol/exchange and compute features per interval
+            # (incremental mode already computed them from rolling state)
+            if not self._incremental:
+                compute_features = (
+                    self._compute_interval_features_columnar if self._vectorized
+                    else self._compute_interval_features
+                )
+                all_processed_records = compute_features(raw_data, intervals, now)
+            processed_symbols.update(record["symbol"] for record in all_processed_records)
             
             # 4. Persist processed records
             if all_processed_records:
@@ -237,18 +289,22 @@ class ProcessingPipelineModule:
                 total_records_processed = stored_count
                 logger.info(f"Persisted {stored_count} processed market data records")
             
-            # 5. Compute and persist market states
-            market_states: List[ProcessedMarketState] = []
-            for record in all_processed_records:
-                state = self.compute_market_state(record)
-                market_states.append(state)
-                self.persist_market_state(session, state)
+            # 5. Compute and persist market states (one multi-row upsert)
+            market_states: List[ProcessedMarketState] = [
+                self.compute_market_state(record) for record in all_processed_records
+            ]
+            persisted_states = self.persist_market_states(session, market_states)
             
             if market_states:
-                logger.info(f"Computed and persisted {len(market_states)} market states")
+                logger.info(
+                    f"Computed {len(market_states)} and persisted {len(persisted_states)} market states"
+                )
             
             session.commit()
             
+            # Readers switch to this cycle's states only once they are committed
+            self._state_cache.publish(persisted_states)
+            
         except Exception as e:
             logger.error(f"Processing cycle failed: {e}", exc_info=True)
             if session:
@@ -334,6 +390,77 @@ class ProcessingPipelineModule:
         
         return query.all()
     
+    def _fetch_recent_market_columns(
+        self,
+        session: Session,
+        start_time: datetime,
+        end_time: datetime,
+    ) -> List[Any]:
+        """
+        Fetch only the columns feature computation needs (no ORM objects).
+        
+        Same filter and ordering as _fetch_recent_market_data.
+        
+        Returns:
+            List of rows with MarketData attribute names
+        """
+        return session.query(
+            MarketData.symbol,
+            MarketData.exchange,
+            MarketData.candle_open_time,
+            MarketData.open_price,
+            MarketData.high_price,
+            MarketData.low_price,
+            MarketData.close_price,
+            MarketData.volume,
+            MarketData.quote_volume,
+            MarketData.trade_count,
+            MarketData.candle_close_time,
+            MarketData.interval,
+        ).filter(
+            and_(
+                MarketData.candle_open_time >= start_time,
+                MarketData.candle_open_time < end_time,
+            )
+        ).order_by(MarketData.symbol, MarketData.candle_open_time).all()
+    
+    def _fetch_market_rows_since(
+        self,
+        session: Session,
+        start_time: datetime,
+        fetched_after: datetime,
+    ) -> List[Any]:
+        """
+        Fetch rows inserted or updated since a fetched_at watermark.
+        
+        Args:
+            session: Database session
+            start_time: Oldest candle open time still inside any window
+            fetched_after: Watermark (exclusive)
+            
+        Returns:
+            List of rows with MarketData attribute names
+        """
+        return session.query(
+            MarketData.symbol,
+            MarketData.exchange,
+            MarketData.candle_open_time,
+            MarketData.open_price,
+            MarketData.high_price,
+            MarketData.low_price,
+            MarketData.close_price,
+            MarketData.volume,
+            MarketData.quote_volume,
+            MarketData.trade_count,
+            MarketData.candle_close_time,
+            MarketData.interval,
+        ).filter(
+            and_(
+                MarketData.fetched_at > self._normalize_to_utc(fetched_after),
+                MarketData.candle_open_time >= start_time,
+            )
+        ).order_by(MarketData.symbol, MarketData.candle_open_time).all()
+    
     def _group_market_data(
         self,
         records: List[MarketData],
@@ -359,6 +486,208 @@ class ProcessingPipelineModule:
         
         return grouped
     
+    def _compute_interval_features(
+        self,
+        raw_data: List[MarketData],
+        intervals: List[Tuple[str, timedelta]],
+        now: datetime,
+    ) -> List[Dict[str, Any]]:
+        """
+        Compute features per (symbol, exchange) and interval, candle by candle.
+        
+        Reference implementation for the columnar engine.
+        
+        Args:
+            raw_data: MarketData records in the lookback window
+            intervals: (name, length) pairs to aggregate
+            now: End of every interval window
+            
+        Returns:
+            List of processed record dicts
+        """
+        grouped_data = self._group_market_data(raw_data)
+        
+        all_processed_records: List[Dict[str, Any]] = []
+        
+        for interval_name, interval_delta in intervals:
+            # Calculate window for this interval
+            interval_end = now
+            interval_start = interval_end - interval_delta
+            
+            # Also need previous period for volume change
+            prev_start = interval_start - interval_delta
+            prev_end = interval_start
+            
+            for (symbol, exchange), candles in grouped_data.items():
+                # Filter candles for current interval
+                current_candles = [
+                    c for c in candles
+                    if self._normalize_to_utc(interval_start) <= self._normalize_to_utc(c.candle_open_time) < self._normalize_to_utc(interval_end)
+                ]
+                
+                if not current_candles:
+                    continue
+                
+                # Get previous period candles for volume change
+                prev_candles = [
+                    c for c in candles
+                    if self._normalize_to_utc(prev_start) <= self._normalize_to_utc(c.candle_open_time) < self._normalize_to_utc(prev_end)
+                ]
+                
+                # Compute features
+                processed_record = self._compute_features(
+                    symbol=symbol,
+                    exchange=exchange,
+                    interval=interval_name,
+                    candles=current_candles,
+                    prev_candles=prev_candles,
+                    window_start=interval_start,
+                    window_end=interval_end,
+                )
+                
+                if processed_record:
+                    all_processed_records.append(processed_record)
+        
+        return all_processed_records
+    
+    def _compute_interval_features_columnar(
+        self,
+        raw_data: List[Any],
+        intervals: List[Tuple[str, timedelta]],
+        now: datetime,
+    ) -> List[Dict[str, Any]]:
+        """
+        Compute the same records as _compute_interval_features, vectorized.
+        
+        Args:
+            raw_data: MarketData rows (ORM objects or column tuples)
+            intervals: (name, length) pairs to aggregate
+            now: End of every interval window
+            
+        Returns:
+            List of processed record dicts
+        """
+        frame = CandleFrame.from_rows(raw_data)
+        all_processed_records: List[Dict[str, Any]] = []
+        
+        for interval_name, interval_delta in intervals:
+            interval_start = now - interval_delta
+            all_processed_records.extend(compute_window_features(
+                frame,
+                interval=interval_name,
+                window_start=interval_start,
+                window_end=now,
+                prev_start=interval_start - interval_delta,
+                prev_end=interval_start,
+            ))
+        
+        return all_processed_records
+    
+    def _compute_interval_features_incremental(
+        self,
+        session: Session,
+        intervals: List[Tuple[str, timedelta]],
+        now: datetime,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Compute interval features from rolling state, reading only new rows.
+        
+        Every `full_recompute_every` cycles (and on cold start) the state
+        is rebuilt from the full lookback; if incremental state existed,
+        its results are verified against the full recompute first.
+        The fetched_at watermark (folded_until) lives with the rolling
+        state in memory and is not persisted: after a restart the state
+        is rebuilt anyway.
+        
+        Args:
+            session: Database session
+            intervals: (name, length) pairs to aggregate
+            now: End of every interval window
+            
+        Returns:
+            (processed record dicts, raw rows read)
+        """
+        if self._rolling is None:
+            self._rolling = IncrementalFeatureEngine(intervals)
+        rolling = self._rolling
+        history_start = now - rolling.history
+        
+        full = rolling.folded_until is None or (
+            self._full_recompute_every > 0
+            and self._cycles_since_full >= self._full_recompute_every
+        )
+        
+        rows_read = 0
+        incremental_records: Optional[List[Dict[str, Any]]] = None
+        if rolling.folded_until is not None:
+            new_rows = self._fetch_market_rows_since(
+                session, history_start, rolling.folded_until - self._late_data_grace
+            )
+            rows_read += rolling.ingest(new_rows, now)
+            incremental_records = rolling.compute(now)
+            self._cycles_since_full += 1
+        
+        if full:
+            rows = self._fetch_recent_market_columns(session, history_start, now)
+            rows_read += len(rows)
+            rolling.load(rows, now)
+            records = rolling.compute(now)
+            if incremental_records is not None:
+                self._verify_incremental(incremental_records, records)
+            self._cycles_since_full = 0
+            self._rolling_stats["full_recomputes"] += 1
+        else:
+            records = incremental_records
+        
+        self._rolling_stats["rows_read_last_cycle"] = rows_read
+        return records, rows_read
+    
+    def _verify_incremental(
+        self,
+        incremental: List[Dict[str, Any]],
+        full: List[Dict[str, Any]],
+    ) -> bool:
+        """
+        Compare incremental results against a full recompute.
+        
+        Returns:
+            True if every record matches within verify_tolerance
+        """
+        def key(record: Dict[str, Any]) -> Tuple[str, str, str]:
+            return (record["symbol"], record["exchange"], record["interval"])
+        
+        by_key = {key(record): record for record in incremental}
+        mismatches = 0
+        worst = 0.0
+        
+        for expected in full:
+            actual = by_key.pop(key(expected), None)
+            if actual is None:
+                mismatches += 1
+                continue
+            for name in _VERIFIED_FIELDS:
+                a, b = actual.get(name), expected.get(name)
+                if a is None or b is None:
+                    if a is not b:
+                        mismatches += 1
+                    continue
+                error = abs(a - b) / max(abs(b), 1e-12)
+                worst = max(worst, error)
+                if error > self._verify_tolerance:
+                    mismatches += 1
+        mismatches += len(by_key)
+        
+        stats = self._rolling_stats
+        stats["verifications"] += 1
+        stats["max_relative_error"] = worst
+        if mismatches:
+            stats["verify_mismatches"] += 1
+            logger.warning(
+                f"Incremental features diverged from full recompute: "
+                f"{mismatches} mismatches (max relative error {worst:.3g}); state rebuilt"
+            )
+        return mismatches == 0
+    
     def _compute_features(
         self,
         symbol: str,
@@ -505,6 +834,10 @@ class ProcessingPipelineModule:
         """
         Persist processed market data records using upsert.
         
+        Writes all records with one multi-row upsert; if that fails,
+        falls back to per-record upserts so one bad record cannot
+        drop the others.
+        
         Args:
             session: Database session
             records: List of processed record dicts
@@ -515,40 +848,32 @@ class ProcessingPipelineModule:
         if not records:
             return 0
         
+        rows = _dedupe_rows(records, ("symbol", "exchange", "interval", "window_start"))
+        
+        try:
+            with session.begin_nested():
+                return multirow_upsert(
+                    session,
+                    ProcessedMarketData,
+                    rows,
+                    conflict_constraint="uq_processed_market_data",
+                    update_columns=PROCESSED_DATA_UPDATE_COLUMNS,
+                )
+        except Exception as e:
+            logger.warning(f"Bulk persist of processed records failed, retrying per record: {e}")
+        
         persisted_count = 0
         
-        for record in records:
+        for record in rows:
             try:
-                # Use PostgreSQL INSERT ... ON CONFLICT for upsert
-                stmt = pg_insert(ProcessedMarketData).values(**record)
-                
-                # On conflict, update the values
-                stmt = stmt.on_conflict_do_update(
-                    constraint="uq_processed_market_data",
-                    set_={
-                        "open_price": stmt.excluded.open_price,
-                        "high_price": stmt.excluded.high_price,
-                        "low_price": stmt.excluded.low_price,
-                        "close_price": stmt.excluded.close_price,
-                        "vwap": stmt.excluded.vwap,
-                        "total_volume": stmt.excluded.total_volume,
-                        "total_quote_volume": stmt.excluded.total_quote_volume,
-                        "avg_volume": stmt.excluded.avg_volume,
-                        "price_return": stmt.excluded.price_return,
-                        "price_return_pct": stmt.excluded.price_return_pct,
-                        "volatility": stmt.excluded.volatility,
-                        "high_low_range": stmt.excluded.high_low_range,
-                        "volume_change": stmt.excluded.volume_change,
-                        "volume_change_pct": stmt.excluded.volume_change_pct,
-                        "candle_count": stmt.excluded.candle_count,
-                        "trade_count": stmt.excluded.trade_count,
-                        "data_quality_score": stmt.excluded.data_quality_score,
-                        "has_gaps": stmt.excluded.has_gaps,
-                        "calculated_at": stmt.excluded.calculated_at,
-                    },
-                )
-                
-                session.execute(stmt)
+                with session.begin_nested():
+                    multirow_upsert(
+                        session,
+                        ProcessedMarketData,
+                        [record],
+                        conflict_constraint="uq_processed_market_data",
+                        update_columns=PROCESSED_DATA_UPDATE_COLUMNS,
+                    )
                 persisted_count += 1
                 
             except Exception as e:
@@ -731,6 +1056,36 @@ class ProcessingPipelineModule:
         
         return max(0.0, min(1.0, final_score))
     
+    def _market_state_row(self, state: ProcessedMarketState) -> Dict[str, Any]:
+        """Column values for a processed_market_states row."""
+        return {
+            "state_id": str(state.state_id),
+            "symbol": state.symbol,
+            "timeframe": state.timeframe,
+            "exchange": state.exchange,
+            "trend_state": state.trend_state.value,
+            "volatility_level": state.volatility_level.value,
+            "liquidity_score": state.liquidity_score,
+            "liquidity_grade": state.liquidity_grade.value,
+            "current_price": state.current_price,
+            "price_change_pct": state.price_change_pct,
+            "volatility_raw": state.volatility_raw,
+            "volatility_percentile": state.volatility_percentile,
+            "volume_ratio": state.volume_ratio,
+            "spread_pct": state.spread_pct,
+            "trend_strength": state.trend_strength,
+            "trend_direction_numeric": state.trend_direction_numeric,
+            "trend_duration_periods": state.trend_duration_periods,
+            "data_quality_score": state.data_quality_score,
+            "is_tradeable": state.is_tradeable,
+            "risk_score_hint": state.risk_score_hint,
+            "window_start": state.window_start,
+            "window_end": state.window_end,
+            "source_module": state.source_module,
+            "version": state.version,
+            "calculated_at": state.calculated_at,
+        }
+    
     def persist_market_state(
         self,
         session: Session,
@@ -749,57 +1104,13 @@ class ProcessingPipelineModule:
             True if persisted successfully
         """
         try:
-            record_data = {
-                "state_id": str(state.state_id),
-                "symbol": state.symbol,
-                "timeframe": state.timeframe,
-                "exchange": state.exchange,
-                "trend_state": state.trend_state.value,
-                "volatility_level": state.volatility_level.value,
-                "liquidity_score": state.liquidity_score,
-                "liquidity_grade": state.liquidity_grade.value,
-                "current_price": state.current_price,
-                "price_change_pct": state.price_change_pct,
-                "volatility_raw": state.volatility_raw,
-                "volatility_percentile": state.volatility_percentile,
-                "volume_ratio": state.volume_ratio,
-                "spread_pct": state.spread_pct,
-                "trend_strength": state.trend_strength,
-                "trend_direction_numeric": state.trend_direction_numeric,
-                "trend_duration_periods": state.trend_duration_periods,
-                "data_quality_score": state.data_quality_score,
-                "is_tradeable": state.is_tradeable,
-                "risk_score_hint": state.risk_score_hint,
-                "window_start": state.window_start,
-                "window_end": state.window_end,
-                "source_module": state.source_module,
-                "version": state.version,
-                "calculated_at": state.calculated_at,
-            }
-            
-            stmt = pg_insert(ProcessedMarketStateRecord).values(**record_data)
-            
-            stmt = stmt.on_conflict_do_update(
-                constraint="uq_processed_market_state",
-                set_={
-                    "state_id": stmt.excluded.state_id,
-                    "trend_state": stmt.excluded.trend_state,
-                    "volatility_level": stmt.excluded.volatility_level,
-                    "liquidity_score": stmt.excluded.liquidity_score,
-                    "liquidity_grade": stmt.excluded.liquidity_grade,
-                    "current_price": stmt.excluded.current_price,
-                    "price_change_pct": stmt.excluded.price_change_pct,
-                    "volatility_raw": stmt.excluded.volatility_raw,
-                    "volatility_percentile": stmt.excluded.volatility_percentile,
-                    "volume_ratio": stmt.excluded.volume_ratio,
-                    "trend_strength": stmt.excluded.trend_strength,
-                    "trend_direction_numeric": stmt.excluded.trend_direction_numeric,
-                    "is_tradeable": stmt.excluded.is_tradeable,
-                    "risk_score_hint": stmt.excluded.risk_score_hint,
-                },
+            multirow_upsert(
+                session,
+                ProcessedMarketStateRecord,
+                [self._market_state_row(state)],
+                conflict_constraint="uq_processed_market_state",
+                update_columns=MARKET_STATE_UPDATE_COLUMNS,
             )
-            
-            session.execute(stmt)
             return True
             
         except Exception as e:
@@ -808,6 +1119,68 @@ class ProcessingPipelineModule:
             )
             return False
     
+    def persist_market_states(
+        self,
+        session: Session,
+        states: List[ProcessedMarketState],
+    ) -> List[ProcessedMarketState]:
+        """
+        Persist many ProcessedMarketStates with one multi-row upsert.
+        
+        Falls back to one upsert per state if the batch fails; states
+        whose own upsert fails too are left out of the result.
+        
+        Args:
+            session: Database session
+            states: States computed this cycle
+            
+        Returns:
+            The persisted states, one per (symbol, timeframe, exchange,
+            calculated_at), for publishing to the latest-state cache
+        """
+        if not states:
+            return []
+        
+        # One statement cannot upsert a row twice: the last state per key wins
+        unique: Dict[Tuple[Any, ...], Tuple[ProcessedMarketState, Dict[str, Any]]] = {}
+        for state in states:
+            row = self._market_state_row(state)
+            unique[tuple(row[col] for col in MARKET_STATE_KEY_COLUMNS)] = (state, row)
+        rows = [row for _, row in unique.values()]
+        
+        try:
+            with session.begin_nested():
+                multirow_upsert(
+                    session,
+                    ProcessedMarketStateRecord,
+                    rows,
+                    conflict_constraint="uq_processed_market_state",
+                    update_columns=MARKET_STATE_UPDATE_COLUMNS,
+                )
+            return [state for state, _ in unique.values()]
+        except Exception as e:
+            logger.warning(f"Bulk persist of market states failed, retrying per state: {e}")
+        
+        persisted: List[ProcessedMarketState] = []
+        for state, row in unique.values():
+            try:
+                with session.begin_nested():
+                    multirow_upsert(
+                        session,
+                        ProcessedMarketStateRecord,
+                        [row],
+                        conflict_constraint="uq_processed_market_state",
+                        update_columns=MARKET_STATE_UPDATE_COLUMNS,
+                    )
+                persisted.append(state)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to persist market state for "
+                    f"{row['symbol']}/{row['timeframe']}/{row['exchange']}: {e}"
+                )
+        
+        return persisted
+    
     def get_latest_market_state(
         self,
         session: Session,
@@ -819,7 +1192,8 @@ class ProcessingPipelineModule:
         Retrieve the latest persisted market state.
         
         This is the canonical method for downstream modules to
-        read market state deterministically.
+        read market state deterministically. Served from the
+        latest-state cache when possible.
         
         Args:
             session: Database session
@@ -830,6 +1204,24 @@ class ProcessingPipelineModule:
         Returns:
             ProcessedMarketState if found, None otherwise
         """
+        version = self._state_cache.version
+        state = self._state_cache.get(symbol, timeframe, exchange)
+        if state is not None:
+            return state
+        
+        state = self._load_market_state(session, symbol, timeframe, exchange)
+        if state is not None:
+            self._state_cache.publish([state], if_version=version)
+        return state
+    
+    def _load_market_state(
+        self,
+        session: Session,
+        symbol: str,
+        timeframe: str,
+        exchange: str = "binance",
+    ) -> Optional[ProcessedMarketState]:
+        """Read the latest persisted market state from the database."""
         try:
             record = session.query(ProcessedMarketStateRecord).filter(
                 and_(
@@ -883,7 +1275,9 @@ class ProcessingPipelineModule:
         """
         Retrieve latest states for multiple symbols as a bundle.
         
-        Convenience method for portfolio-level operations.
+        Convenience method for portfolio-level operations. Served from
+        the latest-state cache when it has every requested symbol;
+        otherwise read from the database (and cached).
         
         Args:
             session: Database session
@@ -894,10 +1288,15 @@ class ProcessingPipelineModule:
         Returns:
             ProcessedMarketStateBundle with all available states
         """
+        version = self._state_cache.version
+        cached = self._state_cache.get_bundle(symbols, timeframe, exchange)
+        if cached is not None:
+            return cached
+        
         bundle = ProcessedMarketStateBundle()
         
         for symbol in symbols:
-            state = self.get_latest_market_state(
+            state = self._load_market_state(
                 session=session,
                 symbol=symbol,
                 timeframe=timeframe,
@@ -906,4 +1305,7 @@ class ProcessingPipelineModule:
             if state:
                 bundle.add(state)
         
+        if bundle.states:
+            self._state_cache.publish(bundle.states.values(), if_version=version)
+        
         return bundle
@@ -0,0 +1,484 @@
+"""
+Data Processing - Incremental Rolling Windows.
+
+============================================================
+PURPOSE
+============================================================
+Stateful alternative to recomputing 1h/24h features from the
+full 48h lookback every cycle.
+
+Per (symbol, exchange, interval) a RollingWindow keeps:
+- Running sums: volume, quote volume, typical price * volume
+  (VWAP numerator), trade count
+- Welford mean/M2 of close-to-close returns (add AND remove)
+- Monotonic deques for window high/low
+- The previous period's volume (for volume change)
+
+Appending a candle or evicting one is O(1) amortized, so a
+cycle costs O(new candles), not O(window size).
+
+============================================================
+CANDLE LIFECYCLE
+============================================================
+- CLOSED candles (close time <= now) are folded into windows
+- FORMING candles are kept aside and merged at compute time,
+  since they are re-upserted until they close
+- Anything that breaks append-only order (late candle, changed
+  closed candle) rebuilds that group from its in-memory
+  history, which is exact but O(window) for that group only
+
+Running sums drift by float rounding as candles are evicted;
+callers periodically rebuild from a full read to reset drift
+and verify the incremental results.
+
+============================================================
+"""
+
+import bisect
+import math
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from .columnar_features import build_feature_record, to_epoch_us
+
+
+class Candle(NamedTuple):
+    """Minimal candle used by the rolling windows (times in epoch µs)."""
+
+    open_time: int
+    close_time: int
+    interval: str
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    quote_volume: float
+    trade_count: int
+
+    @property
+    def key(self) -> Tuple[int, str]:
+        return (self.open_time, self.interval)
+
+    @classmethod
+    def from_row(cls, row: Any) -> "Candle":
+        """Build from a MarketData row (ORM object or column tuple)."""
+        return cls(
+            open_time=to_epoch_us(row.candle_open_time),
+            close_time=to_epoch_us(row.candle_close_time),
+            interval=row.interval,
+            open=row.open_price,
+            high=row.high_price,
+            low=row.low_price,
+            close=row.close_price,
+            volume=row.volume,
+            quote_volume=row.quote_volume or 0,
+            trade_count=row.trade_count or 0,
+        )
+
+
+# ============================================================
+# WELFORD
+# ============================================================
+
+class _Welford:
+    """Running mean / M2 with O(1) add and remove."""
+
+    __slots__ = ("n", "mean", "m2")
+
+    def __init__(self, n: int = 0, mean: float = 0.0, m2: float = 0.0) -> None:
+        self.n = n
+        self.mean = mean
+        self.m2 = m2
+
+    def copy(self) -> "_Welford":
+        return _Welford(self.n, self.mean, self.m2)
+
+    def add(self, x: float) -> None:
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+    def remove(self, x: float) -> None:
+        if self.n <= 1:
+            self.n, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        self.n -= 1
+        delta = x - self.mean
+        self.mean -= delta / self.n
+        self.m2 = max(0.0, self.m2 - delta * (x - self.mean))
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation."""
+        return math.sqrt(self.m2 / self.n) if self.n else 0.0
+
+
+def _return(prev: Candle, curr: Candle) -> Optional[float]:
+    """Close-to-close return, None when the previous close is not positive."""
+    if prev.close and prev.close > 0:
+        return (curr.close - prev.close) / prev.close
+    return None
+
+
+# ============================================================
+# ROLLING WINDOW
+# ============================================================
+
+class RollingWindow:
+    """
+    Sliding window of closed candles, ordered by open time.
+
+    Candles must be appended in open-time order and evicted by
+    advance(); current covers [start, now), previous covers
+    [start - length, start).
+    """
+
+    def __init__(self, length: timedelta) -> None:
+        self.length_us = int(length.total_seconds() * 1_000_000)
+        self.current: Deque[Candle] = deque()
+        self.previous: Deque[Candle] = deque()
+
+        self.volume = 0.0
+        self.quote_volume = 0.0
+        self.vwap_numerator = 0.0
+        self.trade_count = 0
+        self.returns = _Welford()
+        self.prev_volume = 0.0
+
+        # (sequence number, value), monotonic for O(1) max/min
+        self._highs: Deque[Tuple[int, float]] = deque()
+        self._lows: Deque[Tuple[int, float]] = deque()
+        self._head_seq = 0
+        self._next_seq = 0
+
+    def append(self, candle: Candle) -> None:
+        """Add the newest closed candle."""
+        if self.current:
+            ret = _return(self.current[-1], candle)
+            if ret is not None:
+                self.returns.add(ret)
+
+        self.current.append(candle)
+        seq = self._next_seq
+        self._next_seq += 1
+
+        self.volume += candle.volume
+        self.quote_volume += candle.quote_volume
+        self.vwap_numerator += ((candle.high + candle.low + candle.close) / 3) * candle.volume
+        self.trade_count += candle.trade_count
+
+        while self._highs and self._highs[-1][1] <= candle.high:
+            self._highs.pop()
+        self._highs.append((seq, candle.high))
+        while self._lows and self._lows[-1][1] >= candle.low:
+            self._lows.pop()
+        self._lows.append((seq, candle.low))
+
+    def seed(self, candles: Iterable[Candle], start_us: int) -> None:
+        """
+        Fill an empty window from sorted history without evictions.
+
+        Candles before start_us go straight to the previous period, so
+        the running sums start out as exact sequential sums.
+        """
+        prev_start = start_us - self.length_us
+        for candle in candles:
+            if candle.open_time < prev_start:
+                continue
+            if candle.open_time < start_us:
+                self.previous.append(candle)
+                self.prev_volume += candle.volume
+            else:
+                self.append(candle)
+
+    def advance(self, start_us: int) -> None:
+        """Evict candles opened before start_us into the previous period."""
+        while self.current and self.current[0].open_time < start_us:
+            candle = self.current.popleft()
+            seq = self._head_seq
+            self._head_seq += 1
+
+            self.volume -= candle.volume
+            self.quote_volume -= candle.quote_volume
+            self.vwap_numerator -= ((candle.high + candle.low + candle.close) / 3) * candle.volume
+            self.trade_count -= candle.trade_count
+
+            if self.current:
+                ret = _return(candle, self.current[0])
+                if ret is not None:
+                    self.returns.remove(ret)
+            else:
+                self.returns = _Welford()
+
+            if self._highs and self._highs[0][0] == seq:
+                self._highs.popleft()
+            if self._lows and self._lows[0][0] == seq:
+                self._lows.popleft()
+
+            self.previous.append(candle)
+            self.prev_volume += candle.volume
+
+        if not self.current:
+            # Empty window: reset sums so rounding residue cannot leak
+            self.volume = self.quote_volume = self.vwap_numerator = 0.0
+            self.trade_count = 0
+
+        prev_start = start_us - self.length_us
+        while self.previous and self.previous[0].open_time < prev_start:
+            self.prev_volume -= self.previous.popleft().volume
+        if not self.previous:
+            self.prev_volume = 0.0
+
+    def aggregates(self, tail: Sequence[Candle] = ()) -> Optional[Dict[str, Any]]:
+        """
+        Window aggregates, optionally extended by forming candles.
+
+        Args:
+            tail: Forming candles inside the window, in open-time order,
+                  none older than the last closed candle
+
+        Returns:
+            Aggregates for build_feature_record, or None if the window is empty
+        """
+        count = len(self.current) + len(tail)
+        if count == 0:
+            return None
+
+        volume = self.volume
+        quote_volume = self.quote_volume
+        vwap_numerator = self.vwap_numerator
+        trade_count = self.trade_count
+        high = self._highs[0][1] if self._highs else -math.inf
+        low = self._lows[0][1] if self._lows else math.inf
+        returns = self.returns
+
+        if tail:
+            returns = returns.copy()
+            prev = self.current[-1] if self.current else None
+            for candle in tail:
+                volume += candle.volume
+                quote_volume += candle.quote_volume
+                vwap_numerator += ((candle.high + candle.low + candle.close) / 3) * candle.volume
+                trade_count += candle.trade_count
+                high = max(high, candle.high)
+                low = min(low, candle.low)
+                if prev is not None:
+                    ret = _return(prev, candle)
+                    if ret is not None:
+                        returns.add(ret)
+                prev = candle
+
+        first = self.current[0] if self.current else tail[0]
+        last = tail[-1] if tail else self.current[-1]
+        return {
+            "count": count,
+            "open_price": first.open,
+            "close_price": last.close,
+            "high_price": high,
+            "low_price": low,
+            "total_volume": volume,
+            "total_quote_volume": quote_volume,
+            "vwap_numerator": vwap_numerator,
+            "trade_count": trade_count,
+            "volatility": returns.std,
+            "return_count": returns.n,
+            "prev_count": len(self.previous),
+            "prev_volume": self.prev_volume,
+        }
+
+
+# ============================================================
+# PER-GROUP STATE
+# ============================================================
+
+class _GroupState:
+    """Closed-candle history, forming candles and windows for one (symbol, exchange)."""
+
+    def __init__(self, intervals: Sequence[Tuple[str, timedelta]], history: timedelta) -> None:
+        self._intervals = list(intervals)
+        self._history_us = int(history.total_seconds() * 1_000_000)
+        self.candles: List[Candle] = []  # Closed, sorted by open time
+        self.by_key: Dict[Tuple[int, str], Candle] = {}
+        self.forming: Dict[Tuple[int, str], Candle] = {}
+        self.windows = self._new_windows()
+        self.rebuilds = 0
+
+    def _new_windows(self) -> Dict[str, RollingWindow]:
+        return {name: RollingWindow(delta) for name, delta in self._intervals}
+
+    def ingest(self, new: Iterable[Candle], now_us: int) -> None:
+        """Fold closed candles in, keep forming ones aside, slide windows to now."""
+        # Forming candles that closed since the last cycle are folded too
+        pending: Dict[Tuple[int, str], Candle] = dict(self.forming)
+        for candle in new:
+            pending[candle.key] = candle
+        self.forming = {}
+
+        fresh = not self.candles
+        dirty = False
+        for candle in sorted(pending.values(), key=lambda c: c.open_time):
+            if candle.close_time > now_us:
+                self.forming[candle.key] = candle
+                continue
+
+            existing = self.by_key.get(candle.key)
+            if existing is not None:
+                if existing != candle:
+                    # Closed candle changed after folding
+                    index = self._index_of(existing)
+                    self.candles[index] = candle
+                    self.by_key[candle.key] = candle
+                    dirty = True
+                continue
+
+            self.by_key[candle.key] = candle
+            if self.candles and candle.open_time < self.candles[-1].open_time:
+                # Late candle: keep history sorted (ties keep arrival order)
+                index = bisect.bisect_right([c.open_time for c in self.candles], candle.open_time)
+                self.candles.insert(index, candle)
+                dirty = True
+            else:
+                self.candles.append(candle)
+                if not (dirty or fresh):
+                    for window in self.windows.values():
+                        window.append(candle)
+
+        # Drop history no window can reach anymore
+        cutoff = now_us - self._history_us
+        drop = 0
+        while drop < len(self.candles) and self.candles[drop].open_time < cutoff:
+            del self.by_key[self.candles[drop].key]
+            drop += 1
+        if drop:
+            del self.candles[:drop]
+
+        if dirty or fresh:
+            self.rebuilds += int(dirty)
+            self.windows = self._new_windows()
+            for window in self.windows.values():
+                window.seed(self.candles, now_us - window.length_us)
+        else:
+            for window in self.windows.values():
+                window.advance(now_us - window.length_us)
+
+    def _index_of(self, candle: Candle) -> int:
+        for index in range(len(self.candles) - 1, -1, -1):
+            if self.candles[index].key == candle.key:
+                return index
+        raise KeyError(candle.key)
+
+    def aggregates(self, interval: str, start_us: int, end_us: int) -> Optional[Dict[str, Any]]:
+        """Aggregates for one interval, including forming candles in the window."""
+        window = self.windows[interval]
+        tail = sorted(
+            (c for c in self.forming.values() if start_us <= c.open_time < end_us),
+            key=lambda c: c.open_time,
+        )
+        if tail and window.current and tail[0].open_time < window.current[-1].open_time:
+            # Forming candle interleaves with closed ones: evaluate in order
+            merged = RollingWindow(timedelta(microseconds=window.length_us))
+            for candle in sorted(list(window.current) + tail, key=lambda c: c.open_time):
+                merged.append(candle)
+            merged.previous, merged.prev_volume = window.previous, window.prev_volume
+            return merged.aggregates()
+        return window.aggregates(tail)
+
+
+# ============================================================
+# ENGINE
+# ============================================================
+
+class IncrementalFeatureEngine:
+    """
+    Rolling 1h/24h features for every (symbol, exchange), updated incrementally.
+
+    Usage:
+        engine = IncrementalFeatureEngine(intervals)
+        engine.load(rows_48h, now)      # cold start / full recompute
+        engine.ingest(new_rows, now)    # each cycle: only new/updated rows
+        records = engine.compute(now)
+    """
+
+    def __init__(self, intervals: Sequence[Tuple[str, timedelta]]) -> None:
+        self._intervals = list(intervals)
+        longest = max((delta for _, delta in self._intervals), default=timedelta(hours=24))
+        self._history = 2 * longest  # Current + previous period
+        self._groups: Dict[Tuple[str, str], _GroupState] = {}
+        self.folded_until: Optional[datetime] = None
+
+    @property
+    def history(self) -> timedelta:
+        """Lookback needed for a full load."""
+        return self._history
+
+    @property
+    def group_count(self) -> int:
+        return len(self._groups)
+
+    @property
+    def rebuild_count(self) -> int:
+        return sum(group.rebuilds for group in self._groups.values())
+
+    def reset(self) -> None:
+        self._groups = {}
+        self.folded_until = None
+
+    def load(self, rows: Iterable[Any], now: datetime) -> None:
+        """Rebuild all state from a full lookback read."""
+        self.reset()
+        self.ingest(rows, now)
+
+    def ingest(self, rows: Iterable[Any], now: datetime) -> int:
+        """
+        Fold new or updated MarketData rows and slide every window to now.
+
+        Rows already folded with identical values are ignored, so
+        overlapping reads are safe.
+
+        Returns:
+            Number of rows read
+        """
+        now_us = to_epoch_us(now)
+        by_group: Dict[Tuple[str, str], List[Candle]] = {}
+        count = 0
+        for row in rows:
+            by_group.setdefault((row.symbol, row.exchange), []).append(Candle.from_row(row))
+            count += 1
+
+        for key in by_group:
+            if key not in self._groups:
+                self._groups[key] = _GroupState(self._intervals, self._history)
+
+        for key, group in list(self._groups.items()):
+            group.ingest(by_group.get(key, ()), now_us)
+            if not group.candles and not group.forming:
+                del self._groups[key]  # Symbol no longer produces data
+
+        self.folded_until = now
+        return count
+
+    def compute(self, now: datetime) -> List[Dict[str, Any]]:
+        """Processed records for every group with candles in each interval."""
+        now_us = to_epoch_us(now)
+        records: List[Dict[str, Any]] = []
+        for interval, delta in self._intervals:
+            window_start = now - delta
+            start_us = to_epoch_us(window_start)
+            for (symbol, exchange), group in self._groups.items():
+                agg = group.aggregates(interval, start_us, now_us)
+                if agg is None:
+                    continue
+                records.append(build_feature_record(
+                    symbol, exchange, interval, window_start, now, **agg
+                ))
+        return records
+
+
+__all__ = [
+    "Candle",
+    "RollingWindow",
+    "IncrementalFeatureEngine",
+]
@@ -0,0 +1,287 @@
+"""
+Data Processing - Latest Market State Cache.
+
+============================================================
+PURPOSE
+============================================================
+Process-wide, versioned snapshot of the latest ProcessedMarketState
+per (symbol, timeframe, exchange).
+
+The strategy stage, dashboard routers and risk modules read the
+same latest states many times per cycle. Serving them from memory
+keeps those reads off PostgreSQL.
+
+============================================================
+CONSISTENCY
+============================================================
+- A snapshot is immutable; publishing builds a new one and swaps
+  it in under a lock, so readers never see a half-updated cycle
+- The processing module publishes only AFTER its transaction
+  commits; a rolled back cycle leaves the previous snapshot
+- Every publish bumps the version; fills from database reads are
+  conditional on the version they started from, so they cannot
+  overwrite a newer cycle
+- An optional TTL expires the whole snapshot (covers states
+  written by other processes)
+
+Hit/miss counters are exposed through metric_values(), which the
+monitoring metrics collector polls as a registered source.
+
+============================================================
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .contracts import ProcessedMarketState, ProcessedMarketStateBundle
+
+
+StateKey = Tuple[str, str, str]  # (symbol, timeframe, exchange)
+
+# Metric names reported to monitoring
+METRIC_HITS = "market_state_cache_hits_total"
+METRIC_MISSES = "market_state_cache_misses_total"
+METRIC_VERSION = "market_state_cache_version"
+METRIC_SIZE = "market_state_cache_states"
+
+
+def state_key(symbol: str, timeframe: str, exchange: str) -> StateKey:
+    """Cache key for a state (symbols are upper-case, like the table)."""
+    return (symbol.upper(), timeframe, exchange)
+
+
+# ============================================================
+# SNAPSHOT
+# ============================================================
+
+@dataclass(frozen=True)
+class MarketStateSnapshot:
+    """Immutable set of latest states at one version."""
+
+    version: int
+    states: Mapping[StateKey, ProcessedMarketState]
+    published_at: datetime
+    published_monotonic: float = field(compare=False)
+
+    def get(self, symbol: str, timeframe: str, exchange: str) -> Optional[ProcessedMarketState]:
+        return self.states.get(state_key(symbol, timeframe, exchange))
+
+
+@dataclass
+class StateCacheStats:
+    """Cache effectiveness counters."""
+
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    publishes: int = 0
+    stale_fills: int = 0  # Database fills dropped because a newer version existed
+
+
+# ============================================================
+# CACHE
+# ============================================================
+
+class MarketStateCache:
+    """
+    Versioned latest-state cache.
+
+    Usage:
+        cache = get_market_state_cache()
+        cache.publish(states)                      # after commit
+        bundle = cache.get_bundle(["BTC"], "1h")   # None on miss
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._snapshot: Optional[MarketStateSnapshot] = None
+        self._version = 0
+        self._stats = StateCacheStats()
+
+    @property
+    def ttl_seconds(self) -> Optional[float]:
+        return self._ttl_seconds
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    # --------------------------------------------------------
+    # WRITES
+    # --------------------------------------------------------
+
+    def publish(
+        self,
+        states: Iterable[ProcessedMarketState],
+        if_version: Optional[int] = None,
+    ) -> bool:
+        """
+        Merge states into a new snapshot and swap it in atomically.
+
+        A state replaces the cached one for its key unless the cached
+        one is newer (calculated_at).
+
+        Args:
+            states: States that are committed to the database
+            if_version: Only publish if the cache is still at this version
+
+        Returns:
+            True if a new snapshot was published
+        """
+        states = list(states)
+        with self._lock:
+            if if_version is not None and if_version != self._version:
+                self._stats.stale_fills += 1
+                return False
+
+            current = self._live_snapshot(time.monotonic())
+            merged: Dict[StateKey, ProcessedMarketState] = dict(current.states) if current else {}
+            for state in states:
+                key = state_key(state.symbol, state.timeframe, state.exchange)
+                cached = merged.get(key)
+                if cached is None or cached.calculated_at <= state.calculated_at:
+                    merged[key] = state
+
+            self._version += 1
+            self._snapshot = MarketStateSnapshot(
+                version=self._version,
+                states=MappingProxyType(merged),
+                published_at=datetime.now(timezone.utc),
+                published_monotonic=time.monotonic(),
+            )
+            self._stats.publishes += 1
+        return True
+
+    def invalidate(self) -> None:
+        """Drop the snapshot; the next reads go to the database."""
+        with self._lock:
+            self._version += 1
+            self._snapshot = None
+
+    # --------------------------------------------------------
+    # READS
+    # --------------------------------------------------------
+
+    def snapshot(self) -> Optional[MarketStateSnapshot]:
+        """Current snapshot, or None if empty or expired."""
+        with self._lock:
+            return self._live_snapshot(time.monotonic())
+
+    def get(
+        self,
+        symbol: str,
+        timeframe: str,
+        exchange: str = "binance",
+    ) -> Optional[ProcessedMarketState]:
+        """Cached latest state, or None on miss."""
+        snapshot = self.snapshot()
+        state = snapshot.get(symbol, timeframe, exchange) if snapshot else None
+        self._record(state is not None)
+        return state
+
+    def get_bundle(
+        self,
+        symbols: List[str],
+        timeframe: str = "1h",
+        exchange: str = "binance",
+    ) -> Optional[ProcessedMarketStateBundle]:
+        """
+        Bundle of cached states, or None unless EVERY symbol is cached.
+
+        The bundle is a fresh object over the frozen states, so callers
+        may modify it without affecting the cache.
+        """
+        snapshot = self.snapshot()
+        if snapshot is None:
+            self._record(False)
+            return None
+
+        states = [snapshot.get(symbol, timeframe, exchange) for symbol in symbols]
+        if any(state is None for state in states):
+            self._record(False)
+            return None
+
+        bundle = ProcessedMarketStateBundle(timestamp=snapshot.published_at)
+        for state in states:
+            bundle.add(state)
+        self._record(True)
+        return bundle
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters and snapshot info for health reporting."""
+        with self._lock:
+            snapshot = self._snapshot
+            stats = self._stats
+            lookups = stats.hits + stats.misses
+            return {
+                "version": self._version,
+                "states": len(snapshot.states) if snapshot else 0,
+                "published_at": snapshot.published_at.isoformat() if snapshot else None,
+                "ttl_seconds": self._ttl_seconds,
+                "hits": stats.hits,
+                "misses": stats.misses,
+                "hit_rate": stats.hits / lookups if lookups else None,
+                "expired": stats.expired,
+                "publishes": stats.publishes,
+                "stale_fills": stats.stale_fills,
+            }
+
+    def metric_values(self) -> Dict[str, float]:
+        """Counters and gauges for the monitoring metrics collector."""
+        with self._lock:
+            snapshot = self._snapshot
+            return {
+                METRIC_HITS: self._stats.hits,
+                METRIC_MISSES: self._stats.misses,
+                METRIC_VERSION: self._version,
+                METRIC_SIZE: len(snapshot.states) if snapshot else 0,
+            }
+
+    # --------------------------------------------------------
+    # INTERNALS
+    # --------------------------------------------------------
+
+    def _live_snapshot(self, now_monotonic: float) -> Optional[MarketStateSnapshot]:
+        """Snapshot unless expired (caller holds the lock)."""
+        snapshot = self._snapshot
+        if snapshot is None or self._ttl_seconds is None:
+            return snapshot
+        if now_monotonic - snapshot.published_monotonic > self._ttl_seconds:
+            self._snapshot = None
+            self._stats.expired += 1
+            return None
+        return snapshot
+
+    def _record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self._stats.hits += 1
+            else:
+                self._stats.misses += 1
+
+
+_cache: Optional[MarketStateCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_market_state_cache() -> MarketStateCache:
+    """Get the process-wide latest market state cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = MarketStateCache()
+        return _cache
+
+
+__all__ = [
+    "MarketStateSnapshot",
+    "StateCacheStats",
+    "MarketStateCache",
+    "get_market_state_cache",
+    "state_key",
+]
@@ -75,6 +75,7 @@ from .models import (
     EntryDecision,
     PositionSizing,
     ExecutionRecord,
+    ExecutionQualityBucket,
     
     # Monitoring
     SystemMonitoring,
@@ -85,6 +86,9 @@ from .models import (
     
     # Strategy signals
     StrategySignalRecord,
+    
+    # Incremental cursors
+    PipelineWatermark,
 )
 
 # Individual persistence functions
@@ -107,6 +111,9 @@ from .persistence import (
     persist_strategy_signals_batch,
     get_signals_by_tier,
     get_latest_signals,
+    # Watermarks
+    load_watermarks,
+    save_watermarks,
 )
 
 # Pipeline-level persistence
@@ -121,6 +128,21 @@ from .pipeline_persistence import (
     get_persistence_statistics,
 )
 
+# Bulk writes
+from .bulk import (
+    bulk_upsert,
+    copy_upsert,
+    existing_keys,
+    multirow_upsert,
+)
+
+# Non-blocking writer thread
+from .async_writer import (
+    AsyncBatchWriter,
+    AsyncWriterConfig,
+    get_async_writer,
+)
+
 
 # =============================================================
 # PACKAGE VERSION
@@ -169,10 +191,12 @@ __all__ = [
     "EntryDecision",
     "PositionSizing",
     "ExecutionRecord",
+    "ExecutionQualityBucket",
     "SystemMonitoring",
     "ProcessedMarketData",
     "ProcessedMarketStateRecord",
     "StrategySignalRecord",
+    "PipelineWatermark",
     
     # Individual persistence
     "persist_raw_news",
@@ -192,6 +216,8 @@ __all__ = [
     "persist_strategy_signals_batch",
     "get_signals_by_tier",
     "get_latest_signals",
+    "load_watermarks",
+    "save_watermarks",
     
     # Pipeline persistence
     "PipelineCycleData",
@@ -202,4 +228,15 @@ __all__ = [
     "persist_health_check",
     "persist_error_event",
     "get_persistence_statistics",
+    
+    # Bulk writes
+    "bulk_upsert",
+    "copy_upsert",
+    "existing_keys",
+    "multirow_upsert",
+    
+    # Async writer
+    "AsyncBatchWriter",
+    "AsyncWriterConfig",
+    "get_async_writer",
 ]
@@ -0,0 +1,348 @@
+"""
+Database Persistence Layer - Async Batch Writer.
+
+============================================================
+NON-BLOCKING PERSISTENCE FOR ASYNC CALLERS
+============================================================
+
+The database engine is synchronous (psycopg2). Running a session
+inside an `async def` blocks the event loop for the whole round
+trip. AsyncBatchWriter moves those writes to one dedicated writer
+thread fed by a bounded queue:
+
+- submit() returns an awaitable; the event loop never blocks
+- Queued jobs from multiple sources are drained together and
+  committed in ONE transaction (each job in its own SAVEPOINT,
+  so one bad job cannot poison the others)
+- A full queue applies backpressure to producers
+- Write backlog (queued jobs/rows) is exposed as a metric
+- Each job runs in its submitter's context, so its statements
+  join the caller's trace as db.query spans
+
+============================================================
+"""
+
+import asyncio
+import contextvars
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, TypeVar
+
+from sqlalchemy.orm import Session
+
+from .engine import get_session
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+# =============================================================
+# CONFIGURATION & STATS
+# =============================================================
+
+@dataclass
+class AsyncWriterConfig:
+    """Configuration for the async batch writer."""
+
+    max_queue_jobs: int = 256  # Producers wait when the queue is full
+    max_jobs_per_batch: int = 32  # Jobs committed together
+    batch_linger_ms: float = 5.0  # Wait briefly for more jobs to batch
+    thread_name: str = "db-writer"
+
+
+@dataclass
+class WriterStats:
+    """Write backlog and throughput metrics."""
+
+    queued_jobs: int = 0
+    queued_rows: int = 0
+    max_queued_rows: int = 0
+    jobs_completed: int = 0
+    jobs_failed: int = 0
+    rows_written: int = 0
+    batches_committed: int = 0
+    batches_failed: int = 0
+    last_batch_jobs: int = 0
+    last_batch_ms: float = 0.0
+    total_batch_ms: float = 0.0
+
+    def to_dict(self) -> dict:
+        avg_ms = self.total_batch_ms / self.batches_committed if self.batches_committed else 0.0
+        return {
+            "queued_jobs": self.queued_jobs,
+            "queued_rows": self.queued_rows,
+            "max_queued_rows": self.max_queued_rows,
+            "jobs_completed": self.jobs_completed,
+            "jobs_failed": self.jobs_failed,
+            "rows_written": self.rows_written,
+            "batches_committed": self.batches_committed,
+            "batches_failed": self.batches_failed,
+            "last_batch_jobs": self.last_batch_jobs,
+            "last_batch_ms": round(self.last_batch_ms, 2),
+            "avg_batch_ms": round(avg_ms, 2),
+        }
+
+
+@dataclass
+class _WriteJob:
+    fn: Callable[[Session], Any]
+    rows: int
+    label: str
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future
+    context: contextvars.Context
+    result: Any = None
+    error: Optional[Exception] = None
+
+
+_STOP = object()
+
+
+# =============================================================
+# WRITER
+# =============================================================
+
+class AsyncBatchWriter:
+    """
+    Dedicated writer thread with a bounded job queue.
+
+    Usage:
+        writer = get_async_writer()
+
+        def write(session: Session) -> int:
+            bulk_upsert(session, MarketData, rows, ...)
+            return len(rows)
+
+        stored = await writer.submit(write, rows=len(rows), label="binance")
+
+    Jobs must NOT commit; the writer commits each batch.
+    """
+
+    def __init__(
+        self,
+        config: Optional[AsyncWriterConfig] = None,
+        session_factory: Callable[[], Session] = get_session,
+    ) -> None:
+        self._config = config or AsyncWriterConfig()
+        self._session_factory = session_factory
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=self._config.max_queue_jobs)
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._stats = WriterStats()
+        self._stats_lock = threading.Lock()
+
+    # ---------------------------------------------------------
+    # LIFECYCLE
+    # ---------------------------------------------------------
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the writer thread (idempotent)."""
+        with self._thread_lock:
+            if self.is_running:
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                name=self._config.thread_name,
+                daemon=True,
+            )
+            self._thread.start()
+            logger.info(f"Async DB writer started ({self._config.thread_name})")
+
+    async def stop(self, timeout: float = 30.0) -> None:
+        """Drain the queue and stop the writer thread."""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        await asyncio.to_thread(self._queue.put, _STOP)
+        await asyncio.to_thread(thread.join, timeout)
+        if thread.is_alive():
+            logger.warning("Async DB writer did not stop within timeout")
+        else:
+            logger.info("Async DB writer stopped")
+        self._thread = None
+
+    # ---------------------------------------------------------
+    # SUBMISSION
+    # ---------------------------------------------------------
+
+    async def submit(
+        self,
+        fn: Callable[[Session], T],
+        rows: int = 0,
+        label: str = "write",
+    ) -> T:
+        """
+        Queue a write job and await its result.
+
+        Args:
+            fn: Callable receiving a Session; must not commit
+            rows: Row count (for backlog metrics)
+            label: Name for logs
+
+        Returns:
+            The value returned by fn, after the batch committed
+
+        Raises:
+            Whatever fn raised, or the commit error
+        """
+        self.start()
+        loop = asyncio.get_running_loop()
+        job = _WriteJob(
+            fn=fn, rows=rows, label=label, loop=loop, future=loop.create_future(),
+            context=contextvars.copy_context(),
+        )
+
+        with self._stats_lock:
+            self._stats.queued_jobs += 1
+            self._stats.queued_rows += rows
+            self._stats.max_queued_rows = max(self._stats.max_queued_rows, self._stats.queued_rows)
+
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            logger.debug(f"DB write queue full, waiting ({label})")
+            await asyncio.to_thread(self._queue.put, job)
+
+        return await job.future
+
+    async def flush(self) -> None:
+        """Wait until every job queued so far has been committed."""
+        await self.submit(lambda session: None, label="flush")
+
+    # ---------------------------------------------------------
+    # WORKER THREAD
+    # ---------------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+
+            batch: List[_WriteJob] = [first]
+            stop_after = False
+            deadline = time.monotonic() + self._config.batch_linger_ms / 1000
+            while len(batch) < self._config.max_jobs_per_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    job = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if job is _STOP:
+                    stop_after = True
+                    break
+                batch.append(job)
+
+            self._execute_batch(batch)
+            if stop_after:
+                return
+
+    def _execute_batch(self, batch: List[_WriteJob]) -> None:
+        started = time.perf_counter()
+        session = self._session_factory()
+        commit_error: Optional[Exception] = None
+
+        try:
+            for job in batch:
+                savepoint = session.begin_nested()
+                try:
+                    job.result = job.context.run(job.fn, session)
+                    savepoint.commit()
+                except Exception as e:  # Delivered to the awaiting caller
+                    savepoint.rollback()
+                    job.error = e
+                    logger.error(f"DB write job '{job.label}' failed: {e}")
+            session.commit()
+        except Exception as e:
+            commit_error = e
+            logger.error(f"DB write batch commit failed ({len(batch)} jobs): {e}")
+            try:
+                session.rollback()
+            except Exception:
+                pass
+        finally:
+            session.close()
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._stats_lock:
+            s = self._stats
+            s.queued_jobs -= len(batch)
+            s.queued_rows -= sum(job.rows for job in batch)
+            s.last_batch_jobs = len(batch)
+            s.last_batch_ms = elapsed_ms
+            if commit_error is None:
+                s.batches_committed += 1
+                s.total_batch_ms += elapsed_ms
+            else:
+                s.batches_failed += 1
+            for job in batch:
+                if commit_error is None and job.error is None:
+                    s.jobs_completed += 1
+                    s.rows_written += job.rows
+                else:
+                    s.jobs_failed += 1
+
+        for job in batch:
+            error = commit_error or job.error
+            try:
+                job.loop.call_soon_threadsafe(_resolve, job.future, job.result, error)
+            except RuntimeError:
+                pass  # Caller's event loop already closed
+
+    # ---------------------------------------------------------
+    # METRICS
+    # ---------------------------------------------------------
+
+    @property
+    def backlog_rows(self) -> int:
+        """Rows queued but not yet committed."""
+        return self._stats.queued_rows
+
+    def get_stats(self) -> dict:
+        """Get writer metrics (backlog, throughput, failures)."""
+        with self._stats_lock:
+            stats = self._stats.to_dict()
+        stats["running"] = self.is_running
+        return stats
+
+
+def _resolve(future: asyncio.Future, result: Any, error: Optional[BaseException]) -> None:
+    if future.done():
+        return  # Caller was cancelled
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+# =============================================================
+# GLOBAL ACCESS
+# =============================================================
+
+_writer: Optional[AsyncBatchWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_async_writer() -> AsyncBatchWriter:
+    """Get the process-wide async batch writer."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = AsyncBatchWriter()
+        return _writer
+
+
+__all__ = [
+    "AsyncWriterConfig",
+    "WriterStats",
+    "AsyncBatchWriter",
+    "get_async_writer",
+]
@@ -0,0 +1,315 @@
+"""
+Database Persistence Layer - Bulk Writes.
+
+============================================================
+BULK INSERT / UPSERT HELPERS
+============================================================
+
+Set-based writes for hot ingestion and processing paths:
+- Multi-row INSERT ... ON CONFLICT, chunked under the
+  PostgreSQL bind-parameter limit
+- COPY FROM STDIN into a temp table + INSERT ... SELECT
+  for large batches (psycopg2 only, transparent fallback)
+
+Callers own the transaction; nothing here commits.
+
+============================================================
+"""
+
+import csv
+import io
+import json
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from uuid import uuid4
+
+from sqlalchemy import Table, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from .engine import DatabasePersistenceError
+
+logger = logging.getLogger(__name__)
+
+
+# PostgreSQL allows at most 65535 bind parameters per statement
+MAX_BIND_PARAMS = 65535
+
+# Batches at least this large go through COPY when available
+DEFAULT_COPY_THRESHOLD = 5000
+
+_COPY_NULL = "\\N"
+
+
+# =============================================================
+# HELPERS
+# =============================================================
+
+def _table_of(model_or_table: Any) -> Table:
+    """Resolve an ORM model or Core table to its Table."""
+    return getattr(model_or_table, "__table__", model_or_table)
+
+
+def _chunk_size(column_count: int, requested: Optional[int]) -> int:
+    """Rows per statement that fit under the bind-parameter limit."""
+    limit = max(1, MAX_BIND_PARAMS // max(1, column_count))
+    return min(limit, requested) if requested else limit
+
+
+def _copy_value(value: Any) -> Any:
+    """Format a Python value for CSV COPY."""
+    if value is None:
+        return _COPY_NULL
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    return value
+
+
+def _python_defaults(table: Table, columns: Sequence[str]) -> Dict[str, Any]:
+    """
+    Scalar and callable Python-side defaults for columns not in `columns`.
+
+    COPY bypasses the ORM, so defaults such as `created_at = utc_now`
+    must be materialized into the rows before loading.
+    """
+    defaults = {}
+    for column in table.columns:
+        default = column.default
+        if column.name in columns or default is None:
+            continue
+        if default.is_scalar or default.is_callable:
+            defaults[column.name] = default
+    return defaults
+
+
+def supports_copy(session: Session) -> bool:
+    """Check whether the session's DBAPI driver supports COPY (psycopg2)."""
+    try:
+        dbapi_conn = session.connection().connection.dbapi_connection
+        cursor = dbapi_conn.cursor()
+        try:
+            return hasattr(cursor, "copy_expert")
+        finally:
+            cursor.close()
+    except Exception:
+        return False
+
+
+def _conflict_clause(
+    conflict_constraint: Optional[str],
+    update_columns: Optional[Sequence[str]],
+) -> str:
+    if conflict_constraint is None:
+        return ""
+    if not update_columns:
+        return f" ON CONFLICT ON CONSTRAINT {conflict_constraint} DO NOTHING"
+    assignments = ", ".join(f'"{col}" = EXCLUDED."{col}"' for col in update_columns)
+    return f" ON CONFLICT ON CONSTRAINT {conflict_constraint} DO UPDATE SET {assignments}"
+
+
+# =============================================================
+# MULTI-ROW INSERT
+# =============================================================
+
+def multirow_upsert(
+    session: Session,
+    model_or_table: Any,
+    rows: List[Dict[str, Any]],
+    conflict_constraint: Optional[str] = None,
+    update_columns: Optional[Sequence[str]] = None,
+    chunk_size: Optional[int] = None,
+) -> int:
+    """
+    Multi-row INSERT with optional ON CONFLICT handling.
+
+    Args:
+        session: Database session (caller commits)
+        model_or_table: ORM model class or Core Table
+        rows: Row dictionaries (same keys in every row)
+        conflict_constraint: Unique constraint name for ON CONFLICT
+        update_columns: Columns to update on conflict (None = DO NOTHING)
+        chunk_size: Max rows per statement
+
+    Returns:
+        Number of rows sent
+    """
+    if not rows:
+        return 0
+
+    table = _table_of(model_or_table)
+    size = _chunk_size(len(rows[0]), chunk_size)
+
+    for offset in range(0, len(rows), size):
+        stmt = pg_insert(table).values(rows[offset:offset + size])
+        if conflict_constraint is not None:
+            if update_columns:
+                stmt = stmt.on_conflict_do_update(
+                    constraint=conflict_constraint,
+                    set_={col: stmt.excluded[col] for col in update_columns},
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(constraint=conflict_constraint)
+        session.execute(stmt)
+
+    return len(rows)
+
+
+# =============================================================
+# COPY
+# =============================================================
+
+def copy_upsert(
+    session: Session,
+    model_or_table: Any,
+    rows: List[Dict[str, Any]],
+    columns: Optional[Sequence[str]] = None,
+    conflict_constraint: Optional[str] = None,
+    update_columns: Optional[Sequence[str]] = None,
+) -> int:
+    """
+    Bulk load rows with COPY into a temp table, then INSERT ... SELECT.
+
+    Scalar and callable Python-side column defaults missing from the
+    rows are evaluated per row and loaded with them, as the ORM would.
+
+    Raises:
+        NotImplementedError: If the driver does not support COPY
+        DatabasePersistenceError: On database failure
+    """
+    if not rows:
+        return 0
+
+    table = _table_of(model_or_table)
+    columns = list(columns or rows[0].keys())
+    defaults = _python_defaults(table, columns)
+    columns.extend(defaults)
+    column_list = ", ".join(f'"{col}"' for col in columns)
+    temp_name = f"_copy_{table.name}_{uuid4().hex[:8]}"
+
+    dbapi_conn = session.connection().connection.dbapi_connection
+    cursor = dbapi_conn.cursor()
+    if not hasattr(cursor, "copy_expert"):
+        cursor.close()
+        raise NotImplementedError("DBAPI driver does not support COPY")
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        if defaults:
+            row = dict(row)
+            for name, default in defaults.items():
+                row[name] = default.arg(None) if default.is_callable else default.arg
+        writer.writerow([_copy_value(row.get(col)) for col in columns])
+    buffer.seek(0)
+
+    try:
+        session.execute(text(
+            f'CREATE TEMP TABLE "{temp_name}" (LIKE "{table.name}" INCLUDING DEFAULTS) '
+            f"ON COMMIT DROP"
+        ))
+        cursor.copy_expert(
+            f'COPY "{temp_name}" ({column_list}) FROM STDIN '
+            f"WITH (FORMAT csv, NULL '{_COPY_NULL}')",
+            buffer,
+        )
+        session.execute(text(
+            f'INSERT INTO "{table.name}" ({column_list}) '
+            f'SELECT {column_list} FROM "{temp_name}"'
+            + _conflict_clause(conflict_constraint, update_columns)
+        ))
+        session.execute(text(f'DROP TABLE IF EXISTS "{temp_name}"'))
+    except Exception as e:
+        raise DatabasePersistenceError(f"COPY into {table.name} failed: {e}") from e
+    finally:
+        cursor.close()
+
+    logger.debug(f"COPY {table.name}: rows={len(rows)}")
+    return len(rows)
+
+
+# =============================================================
+# DISPATCH
+# =============================================================
+
+def bulk_upsert(
+    session: Session,
+    model_or_table: Any,
+    rows: List[Dict[str, Any]],
+    conflict_constraint: Optional[str] = None,
+    update_columns: Optional[Sequence[str]] = None,
+    chunk_size: Optional[int] = None,
+    copy_threshold: int = DEFAULT_COPY_THRESHOLD,
+) -> int:
+    """
+    Write rows with the cheapest available strategy.
+
+    Uses COPY for batches of at least `copy_threshold` rows when the
+    driver supports it, otherwise chunked multi-row INSERT.
+
+    Returns:
+        Number of rows sent
+    """
+    if not rows:
+        return 0
+
+    if copy_threshold and len(rows) >= copy_threshold and supports_copy(session):
+        return copy_upsert(
+            session,
+            model_or_table,
+            rows,
+            conflict_constraint=conflict_constraint,
+            update_columns=update_columns,
+        )
+
+    return multirow_upsert(
+        session,
+        model_or_table,
+        rows,
+        conflict_constraint=conflict_constraint,
+        update_columns=update_columns,
+        chunk_size=chunk_size,
+    )
+
+
+def existing_keys(
+    session: Session,
+    columns: Sequence[Any],
+    keys: Iterable[tuple],
+    chunk_size: int = 1000,
+) -> set:
+    """
+    Return which composite keys already exist, in few round trips.
+
+    Args:
+        session: Database session
+        columns: ORM columns forming the key, e.g. (RawNews.external_id, RawNews.source_name)
+        keys: Candidate key tuples
+
+    Returns:
+        Set of key tuples that exist in the table
+    """
+    from sqlalchemy import select, tuple_
+
+    keys = list(dict.fromkeys(keys))
+    found: set = set()
+    for offset in range(0, len(keys), chunk_size):
+        chunk = keys[offset:offset + chunk_size]
+        stmt = select(*columns).where(tuple_(*columns).in_(chunk))
+        found.update(tuple(row) for row in session.execute(stmt))
+    return found
+
+
+__all__ = [
+    "MAX_BIND_PARAMS",
+    "DEFAULT_COPY_THRESHOLD",
+    "supports_copy",
+    "multirow_upsert",
+    "copy_upsert",
+    "bulk_upsert",
+    "existing_keys",
+]
@@ -30,6 +30,8 @@ from sqlalchemy.pool import QueuePool
 
 from dotenv import load_dotenv
 
+from monitoring.tracing import get_tracer, instrument_engine
+
 # Load environment variables
 load_dotenv()
 
@@ -115,6 +117,9 @@ def create_database_engine(
     def on_checkout(dbapi_conn, connection_record, connection_proxy):
         logger.debug("Database connection checked out from pool")
     
+    # Statements run inside a traced cycle become db.query spans
+    instrument_engine(_engine)
+    
     return _engine
 
 
@@ -173,19 +178,20 @@ def get_db_session() -> Generator[Session, None, None]:
         - Re-raises the exception
         - Logs the error
     """
-    session = get_session()
-    try:
-        yield session
-    except SQLAlchemyError as e:
-        logger.error(f"Database error, rolling back: {e}")
-        session.rollback()
-        raise
-    except Exception as e:
-        logger.error(f"Unexpected error, rolling back: {e}")
-        session.rollback()
-        raise
-    finally:
-        session.close()
+    with get_tracer().span("db.session"):
+        session = get_session()
+        try:
+            yield session
+        except SQLAlchemyError as e:
+            logger.error(f"Database error, rolling back: {e}")
+            session.rollback()
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error, rolling back: {e}")
+            session.rollback()
+            raise
+        finally:
+            session.close()
 
 
 @contextmanager
@@ -202,21 +208,22 @@ def transaction_scope() -> Generator[Session, None, None]:
             persist_cleaned_news(session, cleaned_items)
             # Commits automatically at end
     """
-    session = get_session()
-    try:
-        yield session
-        session.commit()
-        logger.debug("Database transaction committed successfully")
-    except SQLAlchemyError as e:
-        logger.error(f"Database transaction failed, rolling back: {e}")
-        session.rollback()
-        raise DatabasePersistenceError(f"Transaction failed: {e}") from e
-    except Exception as e:
-        logger.error(f"Transaction failed with unexpected error: {e}")
-        session.rollback()
-        raise DatabasePersistenceError(f"Transaction failed: {e}") from e
-    finally:
-        session.close()
+    with get_tracer().span("db.transaction"):
+        session = get_session()
+        try:
+            yield session
+            session.commit()
+            logger.debug("Database transaction committed successfully")
+        except SQLAlchemyError as e:
+            logger.error(f"Database transaction failed, rolling back: {e}")
+            session.rollback()
+            raise DatabasePersistenceError(f"Transaction failed: {e}") from e
+        except Exception as e:
+            logger.error(f"Transaction failed with unexpected error: {e}")
+            session.rollback()
+            raise DatabasePersistenceError(f"Transaction failed: {e}") from e
+        finally:
+            session.close()
 
 
 # =============================================================
@@ -0,0 +1,238 @@
+"""
+Database - Execution Quality Aggregates.
+
+============================================================
+RESPONSIBILITY
+============================================================
+Execution quality metrics (slippage, latency, fills) computed
+in the database instead of over loaded ExecutionRecord rows.
+
+- execution_quality_stats(): ONE aggregate query over
+  execution_records (avg/max, percentile_cont p99, count FILTER)
+- record_execution_quality(): folds one written execution
+  record into its hourly execution_quality_buckets row
+  (additive upsert), called by persist_execution_record
+- rollup_execution_quality(): ONE aggregate over the buckets
+  of a window
+
+============================================================
+UNITS
+============================================================
+- Slippage in basis points as the committee reports it
+  (slippage_percent * 100)
+- Latency in milliseconds
+- The rollup p99 is the upper bound of the histogram bin
+  holding the p99 rank (capped at the max latency seen), so
+  thresholds on bin bounds are judged exactly
+
+============================================================
+"""
+
+import logging
+from datetime import datetime
+from typing import List, NamedTuple, Optional, Sequence
+
+from sqlalchemy import Integer, cast, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from .models import ExecutionQualityBucket, ExecutionRecord
+
+
+logger = logging.getLogger(__name__)
+
+
+P99 = 0.99
+REJECTED_STATUSES = ("rejected", "failed", "cancelled")
+
+# Latency histogram bin upper bounds (ms); one more bin above the last
+LATENCY_BOUNDS_MS = (100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+LATENCY_BIN_COLUMNS = [f"latency_le_{bound}" for bound in LATENCY_BOUNDS_MS] + [
+    f"latency_gt_{LATENCY_BOUNDS_MS[-1]}"
+]
+
+
+class ExecutionStats(NamedTuple):
+    """Execution quality over a window."""
+    orders: int = 0
+    avg_slippage_bps: float = 0.0
+    max_slippage_bps: float = 0.0
+    avg_latency_ms: float = 0.0
+    p99_latency_ms: float = 0.0
+    filled: int = 0
+    partial: int = 0
+    rejected: int = 0
+
+
+def _float(value) -> float:
+    return float(value) if value is not None else 0.0
+
+
+# ============================================================
+# RAW RECORDS
+# ============================================================
+
+def execution_quality_stats(session: Session, since: datetime) -> ExecutionStats:
+    """Execution quality of records created since `since`, in one query."""
+    r = ExecutionRecord
+    recent = r.created_at >= since
+
+    if session.get_bind().dialect.name == "postgresql":
+        p99 = func.percentile_cont(P99).within_group(r.latency_ms)
+    else:
+        # No percentile_cont: nearest-rank p99 as a scalar subquery
+        rank = select(cast(func.count(r.latency_ms) * P99, Integer)).where(recent).scalar_subquery()
+        p99 = (
+            select(r.latency_ms)
+            .where(recent, r.latency_ms.isnot(None))
+            .order_by(r.latency_ms)
+            .limit(1)
+            .offset(rank)
+            .scalar_subquery()
+        )
+
+    row = session.execute(
+        select(
+            func.count(r.id),
+            func.avg(r.slippage_percent),
+            func.max(r.slippage_percent),
+            func.avg(r.latency_ms),
+            p99,
+            func.count(r.id).filter(r.status == "filled"),
+            func.count(r.id).filter(r.status == "partial"),
+            func.count(r.id).filter(r.status.in_(REJECTED_STATUSES)),
+        ).where(recent)
+    ).one()
+
+    return ExecutionStats(
+        orders=row[0] or 0,
+        avg_slippage_bps=_float(row[1]) * 100,
+        max_slippage_bps=_float(row[2]) * 100,
+        avg_latency_ms=_float(row[3]),
+        p99_latency_ms=_float(row[4]),
+        filled=row[5] or 0,
+        partial=row[6] or 0,
+        rejected=row[7] or 0,
+    )
+
+
+# ============================================================
+# HOURLY ROLLUP
+# ============================================================
+
+def bucket_start(timestamp: datetime) -> datetime:
+    """Hour a record is rolled up into."""
+    return timestamp.replace(minute=0, second=0, microsecond=0)
+
+
+def latency_bin(latency_ms: int) -> str:
+    """Histogram column counting a latency."""
+    for bound, column in zip(LATENCY_BOUNDS_MS, LATENCY_BIN_COLUMNS):
+        if latency_ms <= bound:
+            return column
+    return LATENCY_BIN_COLUMNS[-1]
+
+
+def record_execution_quality(session: Session, record: ExecutionRecord) -> None:
+    """Add one (flushed) execution record to its hourly bucket."""
+    slippage = record.slippage_percent
+    latency = record.latency_ms
+    now = datetime.utcnow()
+
+    values = {
+        "bucket_start": bucket_start(record.created_at or now),
+        "order_count": 1,
+        "filled_count": int(record.status == "filled"),
+        "partial_count": int(record.status == "partial"),
+        "rejected_count": int(record.status in REJECTED_STATUSES),
+        "slippage_count": int(slippage is not None),
+        "slippage_sum": slippage or 0.0,
+        "slippage_max": slippage,
+        "latency_count": int(latency is not None),
+        "latency_sum": latency or 0,
+        "latency_max": latency,
+        **{column: 0 for column in LATENCY_BIN_COLUMNS},
+        "updated_at": now,
+    }
+    if latency is not None:
+        values[latency_bin(latency)] = 1
+
+    bucket = ExecutionQualityBucket.__table__
+    stmt = pg_insert(bucket).values(**values)
+    additive = [
+        "order_count", "filled_count", "partial_count", "rejected_count",
+        "slippage_count", "slippage_sum", "latency_count", "latency_sum",
+        *LATENCY_BIN_COLUMNS,
+    ]
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["bucket_start"],
+        set_={
+            **{col: bucket.c[col] + stmt.excluded[col] for col in additive},
+            # GREATEST ignores NULLs
+            "slippage_max": func.greatest(bucket.c.slippage_max, stmt.excluded.slippage_max),
+            "latency_max": func.greatest(bucket.c.latency_max, stmt.excluded.latency_max),
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    session.execute(stmt)
+
+
+def histogram_p99(bin_counts: Sequence[int], latency_max: Optional[float]) -> float:
+    """Nearest-rank p99 from histogram bin counts (bin upper bound)."""
+    total = sum(bin_counts)
+    if not total:
+        return 0.0
+    rank = int(total * P99)
+    seen = 0
+    for bound, count in zip(LATENCY_BOUNDS_MS, bin_counts):
+        seen += count
+        if seen > rank:
+            return float(min(bound, latency_max)) if latency_max is not None else float(bound)
+    return _float(latency_max)
+
+
+def rollup_execution_quality(session: Session, since: datetime) -> ExecutionStats:
+    """Execution quality from the buckets since `since` (aligned down to the hour)."""
+    b = ExecutionQualityBucket
+    bins: List = [func.sum(getattr(b, column)) for column in LATENCY_BIN_COLUMNS]
+
+    row = session.execute(
+        select(
+            func.sum(b.order_count),
+            func.sum(b.filled_count),
+            func.sum(b.partial_count),
+            func.sum(b.rejected_count),
+            func.sum(b.slippage_count),
+            func.sum(b.slippage_sum),
+            func.max(b.slippage_max),
+            func.sum(b.latency_count),
+            func.sum(b.latency_sum),
+            func.max(b.latency_max),
+            *bins,
+        ).where(b.bucket_start >= bucket_start(since))
+    ).one()
+
+    (orders, filled, partial, rejected, slippage_count, slippage_sum, slippage_max,
+     latency_count, latency_sum, latency_max) = row[:10]
+    bin_counts = [count or 0 for count in row[10:]]
+
+    return ExecutionStats(
+        orders=orders or 0,
+        avg_slippage_bps=_float(slippage_sum) / slippage_count * 100 if slippage_count else 0.0,
+        max_slippage_bps=_float(slippage_max) * 100,
+        avg_latency_ms=_float(latency_sum) / latency_count if latency_count else 0.0,
+        p99_latency_ms=histogram_p99(bin_counts, latency_max),
+        filled=filled or 0,
+        partial=partial or 0,
+        rejected=rejected or 0,
+    )
+
+
+__all__ = [
+    "ExecutionStats",
+    "LATENCY_BOUNDS_MS",
+    "execution_quality_stats",
+    "record_execution_quality",
+    "rollup_execution_quality",
+    "histogram_p99",
+]
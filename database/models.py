@@ -22,7 +22,7 @@ import uuid
 from sqlalchemy import (
     Column, Integer, BigInteger, String, Text, Float, Boolean,
     DateTime, JSON, ForeignKey, Index, Enum as SQLEnum,
-    UniqueConstraint,
+    UniqueConstraint, func,
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
@@ -89,6 +89,7 @@ class RawNews(Base):
     __table_args__ = (
         Index("idx_raw_news_source_date", "source_name", "created_at"),
         Index("idx_raw_news_unprocessed", "processed", "created_at"),
+        Index("idx_raw_news_replay", func.coalesce(published_at, fetched_at), "id"),  # Replay order
     )
 
 
@@ -237,6 +238,8 @@ class MarketData(Base):
     __table_args__ = (
         UniqueConstraint("symbol", "exchange", "interval", "candle_open_time", name="uq_market_data"),
         Index("idx_market_data_symbol_time", "symbol", "interval", "candle_open_time"),
+        Index("idx_market_data_fetched", "fetched_at"),  # Incremental processing reads
+        Index("idx_market_data_replay", "interval", "candle_open_time", "id"),  # Replay order
     )
 
 
@@ -291,6 +294,7 @@ class OnchainFlowRaw(Base):
     __table_args__ = (
         Index("idx_onchain_token_time", "token", "event_time"),
         Index("idx_onchain_flow_type", "flow_type", "event_time"),
+        Index("idx_onchain_replay", "event_time", "id"),  # Replay order
     )
 
 
@@ -364,6 +368,49 @@ class ExchangeFlowAggregate(Base):
     )
 
 
+# =============================================================
+# 5c. EXCHANGE FLOW BUCKETS TABLE
+# =============================================================
+
+class ExchangeFlowBucket(Base):
+    """
+    Fixed-width exchange flow buckets (rollup source).
+    
+    Source: Incremental aggregation of onchain_flow_raw data
+    Update Frequency: Per ingestion cycle (new raw rows only)
+    Retention: Longest aggregation window
+    
+    Each raw flow is added to exactly one bucket, once; the
+    1h/4h/24h aggregates are rolled up from these buckets so
+    aggregation cost does not grow with the raw table.
+    """
+    __tablename__ = "exchange_flow_buckets"
+    
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    
+    # Dimensions
+    token = Column(String(20), nullable=False)
+    exchange = Column(String(100), nullable=False)
+    bucket_start = Column(DateTime, nullable=False, index=True)
+    
+    # Running sums
+    inflow_amount = Column(Float, nullable=False, default=0)
+    outflow_amount = Column(Float, nullable=False, default=0)
+    inflow_usd = Column(Float, nullable=False, default=0)
+    outflow_usd = Column(Float, nullable=False, default=0)
+    inflow_tx_count = Column(Integer, nullable=False, default=0)
+    outflow_tx_count = Column(Integer, nullable=False, default=0)
+    
+    updated_at = Column(DateTime, nullable=False, default=utc_now, onupdate=utc_now)
+    
+    __table_args__ = (
+        UniqueConstraint(
+            "token", "exchange", "bucket_start",
+            name="uq_exchange_flow_bucket"
+        ),
+    )
+
+
 # =============================================================
 # 6. FLOW SCORES TABLE
 # =============================================================
@@ -712,6 +759,55 @@ class ExecutionRecord(Base):
     )
 
 
+class ExecutionQualityBucket(Base):
+    """
+    Hourly execution quality rollup.
+
+    Source: Incremental update per written execution_records row
+    Update Frequency: Per execution record
+    Retention: Indefinite (one row per hour)
+
+    Each execution record is added to its hour's bucket once, so
+    execution quality over a window is one aggregate over at most
+    a day of bucket rows instead of the raw records. Latencies are
+    counted in fixed histogram bins (upper bounds in the column
+    names, in ms) for percentile estimates.
+    """
+    __tablename__ = "execution_quality_buckets"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+
+    # Dimension
+    bucket_start = Column(DateTime, nullable=False, unique=True)
+
+    # Running counts
+    order_count = Column(Integer, nullable=False, default=0)
+    filled_count = Column(Integer, nullable=False, default=0)
+    partial_count = Column(Integer, nullable=False, default=0)
+    rejected_count = Column(Integer, nullable=False, default=0)
+
+    # Slippage (slippage_percent)
+    slippage_count = Column(Integer, nullable=False, default=0)
+    slippage_sum = Column(Float, nullable=False, default=0)
+    slippage_max = Column(Float, nullable=True)
+
+    # Latency
+    latency_count = Column(Integer, nullable=False, default=0)
+    latency_sum = Column(Float, nullable=False, default=0)
+    latency_max = Column(Integer, nullable=True)
+    latency_le_100 = Column(Integer, nullable=False, default=0)
+    latency_le_250 = Column(Integer, nullable=False, default=0)
+    latency_le_500 = Column(Integer, nullable=False, default=0)
+    latency_le_1000 = Column(Integer, nullable=False, default=0)
+    latency_le_2500 = Column(Integer, nullable=False, default=0)
+    latency_le_5000 = Column(Integer, nullable=False, default=0)
+    latency_le_10000 = Column(Integer, nullable=False, default=0)
+    latency_le_30000 = Column(Integer, nullable=False, default=0)
+    latency_gt_30000 = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime, nullable=False, default=utc_now, onupdate=utc_now)
+
+
 # =============================================================
 # 12. SYSTEM MONITORING TABLE
 # =============================================================
@@ -995,6 +1091,42 @@ class StrategySignalRecord(Base):
     )
 
 
+# =============================================================
+# 15. PIPELINE WATERMARKS TABLE
+# =============================================================
+
+class PipelineWatermark(Base):
+    """
+    Incremental-processing cursors (high-water marks).
+    
+    Source: data_ingestion, data_processing
+    Update Frequency: Per cycle, after the covered data is committed
+    Retention: Indefinite (one row per component/stream)
+    
+    Each row records how far a component has consumed a stream,
+    e.g. component="binance_klines", stream_key="BTCUSDT:1h" holds
+    the open time of the last closed candle that was persisted.
+    """
+    __tablename__ = "pipeline_watermarks"
+    
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    
+    # ---- Identification ----
+    component = Column(String(50), nullable=False)  # binance_klines, exchange_flow, processing
+    stream_key = Column(String(100), nullable=False)  # BTCUSDT:1h, ETH:binance:1h
+    
+    # ---- Position ----
+    watermark_time = Column(DateTime, nullable=True)  # Last consumed event/candle time
+    watermark_id = Column(BigInteger, nullable=True)  # Last consumed row id (if id-ordered)
+    
+    # ---- Timestamps ----
+    updated_at = Column(DateTime, nullable=False, default=utc_now, onupdate=utc_now)
+    
+    __table_args__ = (
+        UniqueConstraint("component", "stream_key", name="uq_pipeline_watermark"),
+    )
+
+
 # =============================================================
 # EXPORT ALL MODELS
 # =============================================================
@@ -1005,14 +1137,17 @@ __all__ = [
     "SentimentScore",
     "MarketData",
     "OnchainFlowRaw",
+    "ExchangeFlowBucket",
     "FlowScore",
     "MarketState",
     "RiskState",
     "EntryDecision",
     "PositionSizing",
     "ExecutionRecord",
+    "ExecutionQualityBucket",
     "SystemMonitoring",
     "ProcessedMarketData",
     "ProcessedMarketStateRecord",
     "StrategySignalRecord",
+    "PipelineWatermark",
 ]
@@ -19,6 +19,7 @@ from datetime import datetime
 from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from .models import (
     RawNews,
@@ -34,8 +35,10 @@ from .models import (
     ExecutionRecord,
     SystemMonitoring,
     StrategySignalRecord,
+    PipelineWatermark,
 )
 from .engine import DatabasePersistenceError, PersistenceValidationError
+from .execution_quality import record_execution_quality
 
 if TYPE_CHECKING:
     from strategy_engine.types import StrategySignal
@@ -699,6 +702,9 @@ def persist_execution_record(
         session.add(record)
         session.flush()
         
+        # Keep the hourly execution quality rollup current
+        record_execution_quality(session, record)
+        
         _log_persistence(
             "execution_records", 1,
             f"token={execution.get('token')} status={execution.get('status')}"
@@ -992,6 +998,94 @@ def get_latest_signals(
     return query.order_by(StrategySignalRecord.generated_at.desc()).limit(limit).all()
 
 
+# =============================================================
+# PIPELINE WATERMARKS
+# =============================================================
+
+def load_watermarks(
+    session: Session,
+    component: str,
+) -> Dict[str, PipelineWatermark]:
+    """
+    Load all watermarks for a component.
+    
+    Args:
+        session: Database session
+        component: Component name (e.g. "binance_klines")
+        
+    Returns:
+        Dict mapping stream_key to its PipelineWatermark row
+    """
+    rows = session.query(PipelineWatermark).filter(
+        PipelineWatermark.component == component,
+    ).all()
+    return {row.stream_key: row for row in rows}
+
+
+def save_watermarks(
+    session: Session,
+    component: str,
+    watermarks: Dict[str, Dict[str, Any]],
+) -> int:
+    """
+    Upsert watermarks for a component in one statement.
+    
+    Watermarks only move forward: an existing watermark_time is never
+    replaced by an older one.
+    
+    Args:
+        session: Database session
+        component: Component name
+        watermarks: Dict mapping stream_key to
+            {"watermark_time": datetime, "watermark_id": Optional[int]}
+        
+    Returns:
+        Number of watermarks written
+        
+    Raises:
+        DatabasePersistenceError on failure
+    """
+    if not watermarks:
+        return 0
+    
+    now = datetime.utcnow()
+    values = [
+        {
+            "component": component,
+            "stream_key": stream_key,
+            "watermark_time": mark.get("watermark_time"),
+            "watermark_id": mark.get("watermark_id"),
+            "updated_at": now,
+        }
+        for stream_key, mark in watermarks.items()
+    ]
+    
+    try:
+        stmt = pg_insert(PipelineWatermark).values(values)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_pipeline_watermark",
+            set_={
+                "watermark_time": stmt.excluded.watermark_time,
+                "watermark_id": stmt.excluded.watermark_id,
+                "updated_at": stmt.excluded.updated_at,
+            },
+            where=(
+                PipelineWatermark.watermark_time.is_(None)
+                | stmt.excluded.watermark_time.is_(None)
+                | (stmt.excluded.watermark_time >= PipelineWatermark.watermark_time)
+            ),
+        )
+        session.execute(stmt)
+        session.flush()
+        
+        _log_persistence("pipeline_watermarks", len(values), f"component={component}")
+        return len(values)
+        
+    except SQLAlchemyError as e:
+        logger.error(f"Failed to persist pipeline_watermarks: {e}")
+        raise DatabasePersistenceError(f"pipeline_watermarks persistence failed: {e}") from e
+
+
 # =============================================================
 # EXPORTS
 # =============================================================
@@ -1015,4 +1109,7 @@ __all__ = [
     "persist_strategy_signals_batch",
     "get_signals_by_tier",
     "get_latest_signals",
+    # Watermarks
+    "load_watermarks",
+    "save_watermarks",
 ]
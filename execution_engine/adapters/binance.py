@@ -50,6 +50,7 @@ from .base import (
     CancelOrderRequest,
     CancelOrderResponse,
 )
+from monitoring.tracing import current_span, traced
 
 
 logger = logging.getLogger(__name__)
@@ -550,6 +551,7 @@ class BinanceAdapter(ExchangeAdapter):
     # INTERNAL
     # --------------------------------------------------------
     
+    @traced("exchange.request")
     async def _request(
         self,
         method: str,
@@ -558,6 +560,7 @@ class BinanceAdapter(ExchangeAdapter):
         signed: bool = False,
     ) -> Any:
         """Make API request."""
+        current_span().set(exchange="binance", method=method, endpoint=path)
         if not self._session:
             raise ExchangeError("Not connected")
         
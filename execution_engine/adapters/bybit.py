@@ -59,6 +59,7 @@ from .errors import (
 )
 from .metrics import AdapterMetrics, get_global_aggregator
 from .logging_utils import AdapterLogger
+from monitoring.tracing import current_span, traced
 
 
 logger = logging.getLogger(__name__)
@@ -259,6 +260,7 @@ class BybitAdapter(ExchangeAdapter):
     # REQUEST HANDLING
     # --------------------------------------------------------
     
+    @traced("exchange.request")
     async def _request(
         self,
         method: str,
@@ -278,6 +280,7 @@ class BybitAdapter(ExchangeAdapter):
         Returns:
             Response data
         """
+        current_span().set(exchange="bybit", method=method, endpoint=endpoint)
         if not self._session:
             raise ExchangeException(
                 create_network_error("bybit", "Not connected")
@@ -13,17 +13,28 @@ METRICS TRACKED:
 - Order rejection rates
 - Connection health
 
+Everything recorded here is also reported to the process-wide
+monitoring metrics registry (exchange_* metrics), which the
+dashboard API exposes at /metrics.
+
 ============================================================
 """
 
 import logging
-import time
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import defaultdict, deque
 from enum import Enum
 
+from monitoring.metrics import (
+    CounterChild,
+    HistogramChild,
+    RollingCounter,
+    get_metrics_collector,
+    log_buckets,
+)
+
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +58,10 @@ class MetricType(Enum):
     TIMEOUT = "timeout"
 
 
+# 0.1ms .. 60s
+LATENCY_BUCKETS_MS = log_buckets(0.1, 60_000)
+
+
 @dataclass
 class LatencyStats:
     """Latency statistics."""
@@ -56,49 +71,67 @@ class LatencyStats:
     min_ms: float = float("inf")
     max_ms: float = 0.0
     
+    # Fixed-bucket distribution for percentiles
+    _histogram: HistogramChild = field(
+        default_factory=lambda: HistogramChild(LATENCY_BUCKETS_MS), repr=False
+    )
+    
     @property
     def avg_ms(self) -> float:
         """Average latency in ms."""
         return self.total_ms / self.count if self.count > 0 else 0.0
     
+    @property
+    def p50_ms(self) -> float:
+        """Median latency in ms."""
+        return self._histogram.quantile(0.5)
+    
+    @property
+    def p99_ms(self) -> float:
+        """99th percentile latency in ms."""
+        return self._histogram.quantile(0.99)
+    
+    @property
+    def p999_ms(self) -> float:
+        """99.9th percentile latency in ms."""
+        return self._histogram.quantile(0.999)
+    
     def record(self, latency_ms: float) -> None:
         """Record a latency measurement."""
         self.count += 1
         self.total_ms += latency_ms
         self.min_ms = min(self.min_ms, latency_ms)
         self.max_ms = max(self.max_ms, latency_ms)
+        self._histogram.observe(latency_ms)
 
 
 @dataclass
 class CounterStats:
     """Counter statistics."""
     
-    total: int = 0
-    last_hour: int = 0
-    last_minute: int = 0
+    # Per-second ring buffer over the last hour
+    _window: RollingCounter = field(
+        default_factory=lambda: RollingCounter(window_seconds=3600), repr=False
+    )
     
-    # Timestamps for rolling windows
-    _minute_counts: List[tuple] = field(default_factory=list)
-    _hour_counts: List[tuple] = field(default_factory=list)
+    @property
+    def total(self) -> int:
+        """Count since creation."""
+        return int(self._window.total)
+    
+    @property
+    def last_minute(self) -> int:
+        """Count over the last 60 seconds."""
+        return int(self._window.sum(60))
+    
+    @property
+    def last_hour(self) -> int:
+        """Count over the last hour."""
+        return int(self._window.sum(3600))
     
     def increment(self) -> None:
-        """Increment counter."""
-        now = time.time()
-        self.total += 1
-        self._minute_counts.append((now, 1))
-        self._hour_counts.append((now, 1))
-        self._cleanup(now)
-    
-    def _cleanup(self, now: float) -> None:
-        """Clean up old entries."""
-        minute_ago = now - 60
-        hour_ago = now - 3600
-        
-        self._minute_counts = [(t, c) for t, c in self._minute_counts if t > minute_ago]
-        self._hour_counts = [(t, c) for t, c in self._hour_counts if t > hour_ago]
-        
-        self.last_minute = sum(c for _, c in self._minute_counts)
-        self.last_hour = sum(c for _, c in self._hour_counts)
+        """Increment counter (O(1))."""
+        self._window.add()
 
 
 # ============================================================
@@ -134,8 +167,37 @@ class AdapterMetrics:
         self._error_codes: Dict[str, int] = defaultdict(int)
         
         # Last N requests for debugging
-        self._recent_requests: List[Dict[str, Any]] = []
         self._max_recent = 100
+        self._recent_requests: deque = deque(maxlen=self._max_recent)
+        
+        # Process-wide registry (children bound per endpoint / event)
+        registry = get_metrics_collector()
+        self._registry_requests = registry.counter(
+            "exchange_requests_total", "Exchange API requests",
+            labels=("exchange", "endpoint", "outcome"),
+        )
+        self._registry_latency = registry.histogram(
+            "exchange_request_latency_ms", "Exchange API request latency (ms)",
+            labels=("exchange", "endpoint"), buckets=LATENCY_BUCKETS_MS,
+        )
+        self._registry_errors = registry.counter(
+            "exchange_errors_total", "Exchange errors by code",
+            labels=("exchange", "code"), max_series=500,
+        )
+        orders = registry.counter(
+            "exchange_orders_total", "Exchange order events",
+            labels=("exchange", "event"),
+        )
+        self._registry_orders = {
+            event: orders.labels(exchange_id, event.value)
+            for event in (
+                MetricType.ORDER_SUBMITTED,
+                MetricType.ORDER_REJECTED,
+                MetricType.ORDER_FILLED,
+                MetricType.ORDER_CANCELED,
+            )
+        }
+        self._endpoint_children: Dict[str, Tuple[CounterChild, CounterChild, HistogramChild]] = {}
     
     # --------------------------------------------------------
     # RECORDING
@@ -163,14 +225,19 @@ class AdapterMetrics:
         self._latency[endpoint].record(latency_ms)
         self._latency["_all"].record(latency_ms)
         
+        succeeded, failed, latency = self._children_for(endpoint)
+        latency.observe(latency_ms)
+        
         # Success/failure counter
         if success:
             self._counters[MetricType.REQUEST_SUCCESS].increment()
+            succeeded.inc()
         else:
             self._counters[MetricType.REQUEST_FAILURE].increment()
+            failed.inc()
             
             if error_code:
-                self._error_codes[error_code] += 1
+                self._record_error_code(error_code)
                 
                 # Specific error types
                 if "RATE" in error_code.upper():
@@ -189,27 +256,46 @@ class AdapterMetrics:
             "status_code": status_code,
             "error_code": error_code,
         })
-        
-        if len(self._recent_requests) > self._max_recent:
-            self._recent_requests.pop(0)
+    
+    def _children_for(self, endpoint: str) -> Tuple[CounterChild, CounterChild, HistogramChild]:
+        """Registry series of an endpoint (bound on first request)."""
+        children = self._endpoint_children.get(endpoint)
+        if children is None:
+            children = (
+                self._registry_requests.labels(self._exchange_id, endpoint, "success"),
+                self._registry_requests.labels(self._exchange_id, endpoint, "failure"),
+                self._registry_latency.labels(self._exchange_id, endpoint),
+            )
+            self._endpoint_children[endpoint] = children
+        return children
+    
+    def _record_error_code(self, error_code: str) -> None:
+        """Count an error code locally and in the registry."""
+        self._error_codes[error_code] += 1
+        self._registry_errors.labels(self._exchange_id, error_code).inc()
+    
+    def _record_order_event(self, event: MetricType) -> None:
+        """Count an order event locally and in the registry."""
+        self._counters[event].increment()
+        self._registry_orders[event].inc()
     
     def record_order_submitted(self) -> None:
         """Record order submission."""
-        self._counters[MetricType.ORDER_SUBMITTED].increment()
+        self._record_order_event(MetricType.ORDER_SUBMITTED)
     
     def record_order_rejected(self, error_code: str = None) -> None:
         """Record order rejection."""
-        self._counters[MetricType.ORDER_REJECTED].increment()
+        self._record_order_event(MetricType.ORDER_REJECTED)
         if error_code:
-            self._error_codes[error_code] += 1
+            self._record_error_code(error_code)
     
     def record_order_filled(self) -> None:
         """Record order fill."""
-        self._counters[MetricType.ORDER_FILLED].increment()
+        self._record_order_event(MetricType.ORDER_FILLED)
     
     def record_order_canceled(self) -> None:
         """Record order cancellation."""
-        self._counters[MetricType.ORDER_CANCELED].increment()
+        self._record_order_event(MetricType.ORDER_CANCELED)
     
     # --------------------------------------------------------
     # REPORTING
@@ -248,6 +334,9 @@ class AdapterMetrics:
                 "avg_ms": all_latency.avg_ms,
                 "min_ms": all_latency.min_ms if all_latency.min_ms != float("inf") else 0,
                 "max_ms": all_latency.max_ms,
+                "p50_ms": all_latency.p50_ms,
+                "p99_ms": all_latency.p99_ms,
+                "p999_ms": all_latency.p999_ms,
             },
             "orders": {
                 "submitted": self._counters[MetricType.ORDER_SUBMITTED].total,
@@ -273,12 +362,13 @@ class AdapterMetrics:
                     "avg_ms": stats.avg_ms,
                     "min_ms": stats.min_ms if stats.min_ms != float("inf") else 0,
                     "max_ms": stats.max_ms,
+                    "p99_ms": stats.p99_ms,
                 }
         return result
     
     def get_recent_requests(self, limit: int = 20) -> List[Dict[str, Any]]:
         """Get recent requests."""
-        return self._recent_requests[-limit:]
+        return list(self._recent_requests)[-limit:]
     
     def get_error_distribution(self) -> Dict[str, int]:
         """Get error code distribution."""
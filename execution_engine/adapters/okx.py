@@ -60,6 +60,7 @@ from .errors import (
 )
 from .metrics import AdapterMetrics, get_global_aggregator
 from .logging_utils import AdapterLogger
+from monitoring.tracing import current_span, traced
 
 
 logger = logging.getLogger(__name__)
@@ -267,6 +268,7 @@ class OKXAdapter(ExchangeAdapter):
     # REQUEST HANDLING
     # --------------------------------------------------------
     
+    @traced("exchange.request")
     async def _request(
         self,
         method: str,
@@ -286,6 +288,7 @@ class OKXAdapter(ExchangeAdapter):
         Returns:
             Response data
         """
+        current_span().set(exchange="okx", method=method, endpoint=endpoint)
         if not self._session:
             raise ExchangeException(
                 create_network_error("okx", "Not connected")
@@ -109,6 +109,8 @@ from .notifications import (
     TelegramNotifier,
     create_telegram_handler,
     telegram_alert_handler,
+    NotificationQueueConfig,
+    NotificationQueue,
 )
 
 from .dashboard_service import (
@@ -122,6 +124,32 @@ from .api import (
     setup_dashboard_routes,
 )
 
+from .metrics import (
+    MetricType,
+    MetricDefinition,
+    MetricValue,
+    Counter,
+    Gauge,
+    Histogram,
+    HistogramSnapshot,
+    RollingCounter,
+    MetricsCollector,
+    PROMETHEUS_CONTENT_TYPE,
+    log_buckets,
+    get_metrics_collector,
+)
+
+from .tracing import (
+    Span,
+    Trace,
+    Tracer,
+    RingBufferExporter,
+    current_span,
+    traced,
+    instrument_engine,
+    get_tracer,
+)
+
 
 __all__ = [
     # --------------------------------------------------------
@@ -211,6 +239,8 @@ __all__ = [
     "TelegramNotifier",
     "create_telegram_handler",
     "telegram_alert_handler",
+    "NotificationQueueConfig",
+    "NotificationQueue",
     
     # --------------------------------------------------------
     # Service
@@ -224,4 +254,32 @@ __all__ = [
     "DashboardAPI",
     "create_dashboard_router",
     "setup_dashboard_routes",
+    
+    # --------------------------------------------------------
+    # Metrics
+    # --------------------------------------------------------
+    "MetricType",
+    "MetricDefinition",
+    "MetricValue",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "HistogramSnapshot",
+    "RollingCounter",
+    "MetricsCollector",
+    "PROMETHEUS_CONTENT_TYPE",
+    "log_buckets",
+    "get_metrics_collector",
+    
+    # --------------------------------------------------------
+    # Tracing
+    # --------------------------------------------------------
+    "Span",
+    "Trace",
+    "Tracer",
+    "RingBufferExporter",
+    "current_span",
+    "traced",
+    "instrument_engine",
+    "get_tracer",
 ]
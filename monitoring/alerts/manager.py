@@ -17,8 +17,11 @@ PRINCIPLES:
 
 import asyncio
 import logging
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, deque
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List, Callable, Awaitable
+from itertools import islice
+from typing import Dict, Any, Optional, List, Callable, Awaitable, Deque
 
 from ..models import Alert, AlertTier
 from .rules import AlertRule, get_default_rules
@@ -36,25 +39,83 @@ class AlertHistory:
     Maintains alert history.
     
     READ-ONLY: Only stores alert records.
+    
+    Alerts are kept in a deque ordered by trigger time, with
+    secondary indexes by tier, category and rule and live views of
+    the active and unacknowledged alerts. The indexes are updated
+    on add, acknowledge, resolve and trim, so the views the
+    dashboard polls cost O(result) rather than a scan of the full
+    history, and time-range queries bisect the log.
+    
+    Lifecycle changes must go through acknowledge() and resolve()
+    to keep the views current.
     """
     
     def __init__(self, max_history: int = 10000):
         """Initialize alert history."""
-        self._alerts: List[Alert] = []
+        self._alerts: Deque[Alert] = deque()
         self._max_history = max_history
         self._alerts_by_id: Dict[str, Alert] = {}
+        
+        # Secondary indexes (dicts keep insertion order)
+        self._by_tier: Dict[AlertTier, Dict[str, Alert]] = defaultdict(dict)
+        self._by_category: Dict[str, Dict[str, Alert]] = defaultdict(dict)
+        self._by_rule: Dict[str, Dict[str, Alert]] = defaultdict(dict)
+        
+        # Live views
+        self._active: Dict[str, Alert] = {}
+        self._unacknowledged: Dict[str, Alert] = {}
+    
+    def __len__(self) -> int:
+        return len(self._alerts)
     
     def add(self, alert: Alert) -> None:
         """Add alert to history."""
-        self._alerts.append(alert)
-        self._alerts_by_id[alert.alert_id] = alert
+        if alert.alert_id in self._alerts_by_id:
+            self._remove(self._alerts_by_id[alert.alert_id])
+        
+        # Alerts almost always arrive in time order
+        if not self._alerts or alert.triggered_at >= self._alerts[-1].triggered_at:
+            self._alerts.append(alert)
+        else:
+            index = bisect_right(self._alerts, alert.triggered_at, key=_triggered_at)
+            self._alerts.insert(index, alert)
+        self._index(alert)
         
         # Trim history if needed
-        if len(self._alerts) > self._max_history:
-            removed = self._alerts[:-self._max_history]
-            self._alerts = self._alerts[-self._max_history:]
-            for alert in removed:
-                self._alerts_by_id.pop(alert.alert_id, None)
+        while len(self._alerts) > self._max_history:
+            self._unindex(self._alerts.popleft())
+    
+    def _index(self, alert: Alert) -> None:
+        alert_id = alert.alert_id
+        self._alerts_by_id[alert_id] = alert
+        self._by_tier[alert.tier][alert_id] = alert
+        self._by_category[alert.category][alert_id] = alert
+        self._by_rule[alert.triggered_by_rule][alert_id] = alert
+        if not alert.resolved:
+            self._active[alert_id] = alert
+        if not alert.acknowledged:
+            self._unacknowledged[alert_id] = alert
+    
+    def _unindex(self, alert: Alert) -> None:
+        alert_id = alert.alert_id
+        self._alerts_by_id.pop(alert_id, None)
+        for index, key in (
+            (self._by_tier, alert.tier),
+            (self._by_category, alert.category),
+            (self._by_rule, alert.triggered_by_rule),
+        ):
+            bucket = index.get(key)
+            if bucket is not None:
+                bucket.pop(alert_id, None)
+                if not bucket:
+                    del index[key]
+        self._active.pop(alert_id, None)
+        self._unacknowledged.pop(alert_id, None)
+    
+    def _remove(self, alert: Alert) -> None:
+        self._alerts.remove(alert)
+        self._unindex(alert)
     
     def get(self, alert_id: str) -> Optional[Alert]:
         """Get alert by ID."""
@@ -62,27 +123,43 @@ class AlertHistory:
     
     def get_recent(self, limit: int = 100) -> List[Alert]:
         """Get recent alerts."""
-        return self._alerts[-limit:][::-1]  # Newest first
+        return list(islice(reversed(self._alerts), limit))  # Newest first
     
     def get_unacknowledged(self) -> List[Alert]:
         """Get unacknowledged alerts."""
-        return [a for a in self._alerts if not a.acknowledged]
+        return list(self._unacknowledged.values())
     
     def get_active(self) -> List[Alert]:
         """Get active (unresolved) alerts."""
-        return [a for a in self._alerts if not a.resolved]
+        return list(self._active.values())
     
     def get_by_tier(self, tier: AlertTier) -> List[Alert]:
         """Get alerts by tier."""
-        return [a for a in self._alerts if a.tier == tier]
+        return list(self._by_tier.get(tier, {}).values())
     
     def get_by_category(self, category: str) -> List[Alert]:
         """Get alerts by category."""
-        return [a for a in self._alerts if a.category == category]
-    
-    def get_since(self, since: datetime) -> List[Alert]:
-        """Get alerts since a timestamp."""
-        return [a for a in self._alerts if a.triggered_at >= since]
+        return list(self._by_category.get(category, {}).values())
+    
+    def get_by_rule(self, rule_id: str) -> List[Alert]:
+        """Get alerts triggered by a rule."""
+        return list(self._by_rule.get(rule_id, {}).values())
+    
+    def count_since(self, since: datetime) -> int:
+        """Count alerts triggered at or after a timestamp."""
+        return len(self._alerts) - bisect_left(self._alerts, since, key=_triggered_at)
+    
+    def get_since(self, since: datetime, until: Optional[datetime] = None) -> List[Alert]:
+        """Get alerts since a timestamp (and before until, if given)."""
+        start = bisect_left(self._alerts, since, key=_triggered_at)
+        end = len(self._alerts)
+        if until is not None:
+            end = bisect_left(self._alerts, until, key=_triggered_at)
+        
+        # Recent ranges sit at the right end of the deque
+        alerts = list(islice(reversed(self._alerts), len(self._alerts) - end, len(self._alerts) - start))
+        alerts.reverse()
+        return alerts
     
     def acknowledge(
         self,
@@ -97,6 +174,19 @@ class AlertHistory:
         alert.acknowledged = True
         alert.acknowledged_at = datetime.utcnow()
         alert.acknowledged_by = acknowledged_by
+        self._unacknowledged.pop(alert_id, None)
+        return True
+    
+    def resolve(self, alert_id: str) -> bool:
+        """Resolve an alert (a rule may already have marked it resolved)."""
+        alert = self._alerts_by_id.get(alert_id)
+        if alert is None:
+            return False
+        
+        if not alert.resolved:
+            alert.resolved = True
+            alert.resolved_at = datetime.utcnow()
+        self._active.pop(alert_id, None)
         return True
     
     def stats(self) -> Dict[str, Any]:
@@ -105,22 +195,23 @@ class AlertHistory:
         last_hour = now - timedelta(hours=1)
         last_day = now - timedelta(days=1)
         
-        alerts_1h = [a for a in self._alerts if a.triggered_at >= last_hour]
-        alerts_24h = [a for a in self._alerts if a.triggered_at >= last_day]
-        
         return {
             "total_alerts": len(self._alerts),
-            "active_alerts": len(self.get_active()),
-            "unacknowledged": len(self.get_unacknowledged()),
-            "alerts_last_hour": len(alerts_1h),
-            "alerts_last_24h": len(alerts_24h),
+            "active_alerts": len(self._active),
+            "unacknowledged": len(self._unacknowledged),
+            "alerts_last_hour": self.count_since(last_hour),
+            "alerts_last_24h": self.count_since(last_day),
             "by_tier": {
-                tier.value: len(self.get_by_tier(tier))
+                tier.value: len(self._by_tier.get(tier, {}))
                 for tier in AlertTier
             },
         }
 
 
+def _triggered_at(alert: Alert) -> datetime:
+    return alert.triggered_at
+
+
 # ============================================================
 # ALERT MANAGER
 # ============================================================
@@ -231,7 +322,10 @@ class AlertManager:
                     continue
                 
                 try:
+                    previous = rule.active_alert
                     alert = rule.evaluate(context)
+                    if previous is not None and previous.resolved:
+                        self._history.resolve(previous.alert_id)
                     if alert:
                         triggered.append(alert)
                         self._history.add(alert)
@@ -249,13 +343,27 @@ class AlertManager:
             return triggered
     
     async def _dispatch_notifications(self, alerts: List[Alert]) -> None:
-        """Dispatch alerts to notification handlers."""
-        for alert in alerts:
-            for handler in self._handlers:
-                try:
-                    await handler(alert)
-                except Exception as e:
-                    logger.error(f"Notification handler error: {e}")
+        """
+        Dispatch alerts to notification handlers.
+        
+        All handler calls run concurrently, so one slow handler does
+        not hold up the others. Handlers that send over the network
+        should queue (see NotificationQueue) rather than await delivery.
+        """
+        calls = [
+            self._notify(handler, alert)
+            for alert in alerts
+            for handler in self._handlers
+        ]
+        if calls:
+            await asyncio.gather(*calls)
+    
+    @staticmethod
+    async def _notify(handler: NotificationHandler, alert: Alert) -> None:
+        try:
+            await handler(alert)
+        except Exception as e:
+            logger.error(f"Notification handler error: {e}")
     
     def acknowledge(
         self,
@@ -94,6 +94,11 @@ class AlertRule(ABC):
         """Whether this rule has an active (unresolved) alert."""
         return self._active_alert is not None
     
+    @property
+    def active_alert(self) -> Optional[Alert]:
+        """The rule's active (unresolved) alert, if any."""
+        return self._active_alert
+    
     @abstractmethod
     def evaluate(self, context: Dict[str, Any]) -> Optional[Alert]:
         """
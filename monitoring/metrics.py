@@ -24,58 +24,738 @@ METRIC TYPES
 ============================================================
 - Counter: Cumulative values (trades, errors)
 - Gauge: Current values (positions, balance)
-- Histogram: Distributions (latency, slippage)
-- Summary: Percentiles
+- Histogram: Distributions (latency, slippage), fixed
+  log-spaced buckets with p50/p99/p999 estimates
+- RollingCounter: Per-second ring buffer for "last minute /
+  last hour" counts with O(1) increments
+
+============================================================
+HOT PATH
+============================================================
+Bind labels once and keep the child:
+
+    requests = metrics.counter(
+        "exchange_requests_total", "Exchange API requests",
+        labels=("exchange", "outcome"),
+    )
+    ok = requests.labels("binance", "success")
+    ok.inc()
+
+An update on a child is one uncontended lock plus an add; a
+histogram observation adds a bisect over its bucket bounds.
+Each metric holds at most max_series label sets; further
+label sets share one overflow series instead of growing
+without bound.
 
 ============================================================
 """
 
-# TODO: Import typing, dataclasses
-
-# TODO: Define MetricType enum
-#   - COUNTER
-#   - GAUGE
-#   - HISTOGRAM
-#   - SUMMARY
-
-# TODO: Define MetricDefinition dataclass
-#   - name: str
-#   - type: MetricType
-#   - description: str
-#   - labels: list[str]
-
-# TODO: Define MetricValue dataclass
-#   - name: str
-#   - value: float
-#   - labels: dict[str, str]
-#   - timestamp: datetime
-
-# TODO: Implement MetricsCollector class
-#   - __init__(config)
-#   - register_metric(definition) -> None
-#   - increment(name, labels, value) -> None
-#   - set_gauge(name, labels, value) -> None
-#   - observe(name, labels, value) -> None
-#   - get_metric(name) -> MetricValue
-
-# TODO: Implement Prometheus exporter
-#   - Export metrics in Prometheus format
-#   - HTTP endpoint for scraping
-#   - Metric families
-
-# TODO: Define standard metrics
-#   - data_ingestion_total
-#   - data_processing_duration
-#   - scoring_duration
-#   - decisions_total
-#   - executions_total
-#   - execution_slippage
-#   - portfolio_value
-#   - drawdown_percent
-
-# TODO: Implement metric aggregation
-#   - Time-based aggregation
-#   - Label-based aggregation
-
-# TODO: DECISION POINT - Metric retention policy
-# TODO: DECISION POINT - Custom metric requirements
+import logging
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# TYPES
+# ============================================================
+
+class MetricType(str, Enum):
+    """Kind of metric."""
+    COUNTER = "counter"
+    GAUGE = "gauge"
+    HISTOGRAM = "histogram"
+    SUMMARY = "summary"
+
+
+@dataclass(frozen=True)
+class MetricDefinition:
+    """Registered metric."""
+    name: str
+    type: MetricType
+    description: str = ""
+    labels: Tuple[str, ...] = ()
+    buckets: Tuple[float, ...] = ()
+
+
+@dataclass(frozen=True)
+class MetricValue:
+    """Point-in-time value of one labelled series."""
+    name: str
+    value: float
+    labels: Dict[str, str] = field(default_factory=dict)
+    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+# Pull source: returns {metric_name: value} when metrics are read
+MetricSource = Callable[[], Dict[str, float]]
+
+# Label sets per metric before new ones go to the overflow series
+DEFAULT_MAX_SERIES = 1000
+OVERFLOW_LABEL_VALUE = "__overflow__"
+
+# Quantiles reported for histograms by collect()
+REPORTED_QUANTILES = (0.5, 0.99, 0.999)
+
+
+def _label_key(labels: Optional[Dict[str, str]]) -> LabelKey:
+    return tuple(sorted((labels or {}).items()))
+
+
+def log_buckets(low: float, high: float, per_decade: int = 10) -> Tuple[float, ...]:
+    """
+    Log-spaced histogram bucket upper bounds from low to high.
+
+    With 10 buckets per decade adjacent bounds are ~26% apart;
+    quantiles interpolate within a bucket.
+    """
+    if low <= 0 or high <= low:
+        raise ValueError("Buckets need 0 < low < high")
+    steps = math.ceil(round(math.log10(high / low) * per_decade, 9))
+    bounds = []
+    for i in range(steps + 1):
+        bound = low * 10 ** (i / per_decade)
+        digits = 2 - math.floor(math.log10(bound))
+        bounds.append(round(bound, digits))
+    return tuple(bounds)
+
+
+# 1ms .. ~28h when observing seconds, 1µs .. 100s when observing milliseconds
+DEFAULT_BUCKETS = log_buckets(0.001, 100_000)
+
+
+# ============================================================
+# SERIES
+# ============================================================
+
+class CounterChild:
+    """One labelled counter series."""
+
+    __slots__ = ("_lock", "_value")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Add to the counter."""
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+
+class GaugeChild:
+    """One labelled gauge series."""
+
+    __slots__ = ("_lock", "_value")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._value = 0.0
+
+    def set(self, value: float) -> None:
+        """Set the gauge."""
+        self._value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Raise the gauge."""
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Lower the gauge."""
+        with self._lock:
+            self._value -= amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    """Consistent copy of one histogram series."""
+    bounds: Tuple[float, ...]
+    counts: Tuple[int, ...]
+    count: int
+    sum: float
+    min: float
+    max: float
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the q-quantile (0 if empty).
+
+        Finds the bucket holding the nearest rank and interpolates
+        linearly inside it; the result is clamped to the observed
+        min/max, so q=0 and q=1 are exact.
+        """
+        if not self.count:
+            return 0.0
+        if q <= 0:
+            return self.min
+        rank = math.ceil(q * self.count)
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank:
+                lower = self.bounds[i - 1] if i > 0 else self.min
+                upper = self.bounds[i] if i < len(self.bounds) else self.max
+                lower, upper = max(lower, self.min), min(upper, self.max)
+                estimate = lower + (upper - lower) * (rank - seen) / bucket_count
+                return min(max(estimate, self.min), self.max)
+            seen += bucket_count
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+
+class HistogramChild:
+    """One labelled histogram series (fixed buckets)."""
+
+    __slots__ = ("_lock", "_bounds", "_counts", "_count", "_sum", "_min", "_max")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self._lock = threading.Lock()
+        self._bounds = bounds
+        # One extra bucket above the last bound (+Inf)
+        self._counts = [0] * (len(bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        index = bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+            if value < self._min:
+                self._min = value
+            if value > self._max:
+                self._max = value
+
+    def snapshot(self) -> HistogramSnapshot:
+        with self._lock:
+            return HistogramSnapshot(
+                bounds=self._bounds,
+                counts=tuple(self._counts),
+                count=self._count,
+                sum=self._sum,
+                min=self._min if self._count else 0.0,
+                max=self._max if self._count else 0.0,
+            )
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-quantile of the observations."""
+        return self.snapshot().quantile(q)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+
+# ============================================================
+# METRIC FAMILIES
+# ============================================================
+
+class MetricFamily(ABC):
+    """
+    A metric and its labelled series.
+
+    labels() returns the series for a label set, creating it on
+    first use; callers on hot paths keep the returned child.
+    """
+
+    def __init__(self, definition: MetricDefinition, max_series: int = DEFAULT_MAX_SERIES):
+        self.definition = definition
+        self._max_series = max_series
+        self._lock = threading.Lock()
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._overflowed = False
+
+    @property
+    def name(self) -> str:
+        return self.definition.name
+
+    @abstractmethod
+    def _new_child(self):
+        """Create the series object for a new label set."""
+
+    def labels(self, *values: str, **labels: str):
+        """Series for a label set (positional in definition order, or by name)."""
+        names = self.definition.labels
+        if labels:
+            if values or set(labels) != set(names):
+                raise ValueError(f"Metric {self.name} has labels {names}")
+            values = tuple(str(labels[name]) for name in names)
+        else:
+            if len(values) != len(names):
+                raise ValueError(f"Metric {self.name} has labels {names}")
+            values = tuple(str(value) for value in values)
+
+        child = self._children.get(values)
+        if child is not None:
+            return child
+        with self._lock:
+            child = self._children.get(values)
+            if child is None:
+                if len(self._children) >= self._max_series:
+                    if not self._overflowed:
+                        self._overflowed = True
+                        logger.warning(
+                            f"Metric {self.name} reached {self._max_series} series; "
+                            f"further label sets are counted as {OVERFLOW_LABEL_VALUE}"
+                        )
+                    values = (OVERFLOW_LABEL_VALUE,) * len(names)
+                    child = self._children.get(values)
+                if child is None:
+                    child = self._new_child()
+                    self._children[values] = child
+            return child
+
+    def get(self, labels: Optional[Dict[str, str]] = None):
+        """Existing series for a label set, or None (never creates one)."""
+        labels = labels or {}
+        if set(labels) != set(self.definition.labels):
+            return None
+        return self._children.get(tuple(str(labels[name]) for name in self.definition.labels))
+
+    def series(self) -> List[Tuple[Dict[str, str], object]]:
+        """(labels, child) of every series."""
+        with self._lock:
+            items = list(self._children.items())
+        return [(dict(zip(self.definition.labels, values)), child) for values, child in items]
+
+
+class Counter(MetricFamily):
+    """Monotonic counter."""
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Add to the unlabelled series."""
+        self.labels().inc(amount)
+
+
+class Gauge(MetricFamily):
+    """Value that goes up and down."""
+
+    def _new_child(self) -> GaugeChild:
+        return GaugeChild()
+
+    def set(self, value: float) -> None:
+        """Set the unlabelled series."""
+        self.labels().set(value)
+
+
+class Histogram(MetricFamily):
+    """Fixed-bucket distribution."""
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.definition.buckets)
+
+    def observe(self, value: float) -> None:
+        """Record into the unlabelled series."""
+        self.labels().observe(value)
+
+
+_FAMILY_TYPES = {
+    MetricType.COUNTER: Counter,
+    MetricType.GAUGE: Gauge,
+    MetricType.HISTOGRAM: Histogram,
+}
+
+
+# ============================================================
+# ROLLING WINDOW
+# ============================================================
+
+class RollingCounter:
+    """
+    Count over a trailing window, in per-second buckets.
+
+    A ring of window_seconds slots, each stamped with the second
+    it counts; add() reuses a stale slot in place, so recording
+    is O(1) and memory is fixed. Reading sums the slots that fall
+    inside the requested window.
+    """
+
+    __slots__ = ("_lock", "_clock", "_size", "_stamps", "_slots", "total")
+
+    def __init__(
+        self,
+        window_seconds: int = 3600,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._lock = threading.Lock()
+        self._clock = clock
+        self._size = window_seconds
+        self._stamps = [-1] * window_seconds
+        self._slots = [0.0] * window_seconds
+        self.total = 0.0
+
+    def add(self, amount: float = 1.0) -> None:
+        """Count `amount` in the current second."""
+        second = int(self._clock())
+        index = second % self._size
+        with self._lock:
+            if self._stamps[index] != second:
+                self._stamps[index] = second
+                self._slots[index] = 0.0
+            self._slots[index] += amount
+            self.total += amount
+
+    def sum(self, seconds: Optional[int] = None) -> float:
+        """Count over the last `seconds` (the whole window if None)."""
+        seconds = min(seconds or self._size, self._size)
+        now = int(self._clock())
+        oldest = now - seconds
+        with self._lock:
+            return sum(
+                value
+                for stamp, value in zip(self._stamps, self._slots)
+                if oldest < stamp <= now
+            )
+
+
+# ============================================================
+# COLLECTOR
+# ============================================================
+
+class MetricsCollector:
+    """
+    Thread-safe in-process metric registry.
+
+    Metrics are registered once (counter(), gauge(), histogram()
+    return the existing family on repeat calls) and updated through
+    label-bound children.
+
+    Components that already keep their own counters register a
+    source instead; it is only called when metrics are read.
+
+    Usage:
+        metrics = get_metrics_collector()
+        metrics.increment("decisions_total", {"action": "buy"})
+        metrics.histogram("order_latency_ms", labels=("exchange",)).labels("okx").observe(12.5)
+        metrics.register_source("market_state_cache", cache.metric_values)
+        metrics.get_metric("market_state_cache_hits_total").value
+        metrics.render_prometheus()
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._families: Dict[str, MetricFamily] = {}
+        self._sources: Dict[str, MetricSource] = {}
+
+    # --------------------------------------------------------
+    # REGISTRATION
+    # --------------------------------------------------------
+
+    def register_metric(
+        self,
+        definition: MetricDefinition,
+        max_series: int = DEFAULT_MAX_SERIES,
+    ) -> MetricFamily:
+        """Register a metric (idempotent for identical definitions)."""
+        if definition.type not in _FAMILY_TYPES:
+            raise ValueError(f"Unsupported metric type {definition.type.value}")
+        if definition.type == MetricType.HISTOGRAM and not definition.buckets:
+            raise ValueError(f"Histogram {definition.name} needs buckets")
+        with self._lock:
+            existing = self._families.get(definition.name)
+            if existing is not None:
+                if existing.definition.type != definition.type:
+                    raise ValueError(
+                        f"Metric {definition.name} already registered as "
+                        f"{existing.definition.type.value}"
+                    )
+                if existing.definition.labels != definition.labels:
+                    raise ValueError(
+                        f"Metric {definition.name} already registered with labels "
+                        f"{existing.definition.labels}"
+                    )
+                return existing
+            family = _FAMILY_TYPES[definition.type](definition, max_series)
+            self._families[definition.name] = family
+            return family
+
+    def counter(
+        self,
+        name: str,
+        description: str = "",
+        labels: Sequence[str] = (),
+        max_series: int = DEFAULT_MAX_SERIES,
+    ) -> Counter:
+        """Get or register a counter."""
+        return self.register_metric(
+            MetricDefinition(name, MetricType.COUNTER, description, tuple(labels)),
+            max_series,
+        )
+
+    def gauge(
+        self,
+        name: str,
+        description: str = "",
+        labels: Sequence[str] = (),
+        max_series: int = DEFAULT_MAX_SERIES,
+    ) -> Gauge:
+        """Get or register a gauge."""
+        return self.register_metric(
+            MetricDefinition(name, MetricType.GAUGE, description, tuple(labels)),
+            max_series,
+        )
+
+    def histogram(
+        self,
+        name: str,
+        description: str = "",
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        max_series: int = DEFAULT_MAX_SERIES,
+    ) -> Histogram:
+        """Get or register a histogram."""
+        return self.register_metric(
+            MetricDefinition(
+                name, MetricType.HISTOGRAM, description, tuple(labels),
+                tuple(sorted(buckets)),
+            ),
+            max_series,
+        )
+
+    def register_source(self, name: str, source: MetricSource) -> None:
+        """Register (or replace) a pull source of unlabelled metrics."""
+        with self._lock:
+            self._sources[name] = source
+
+    def unregister_source(self, name: str) -> None:
+        """Remove a pull source."""
+        with self._lock:
+            self._sources.pop(name, None)
+
+    # --------------------------------------------------------
+    # UPDATES BY NAME
+    # --------------------------------------------------------
+
+    def increment(
+        self,
+        name: str,
+        labels: Optional[Dict[str, str]] = None,
+        value: float = 1.0,
+    ) -> None:
+        """Add to a counter (registered on first use)."""
+        key = _label_key(labels)
+        self.counter(name, labels=[k for k, _ in key]).labels(**dict(key)).inc(value)
+
+    def set_gauge(
+        self,
+        name: str,
+        labels: Optional[Dict[str, str]] = None,
+        value: float = 0.0,
+    ) -> None:
+        """Set a gauge (registered on first use)."""
+        key = _label_key(labels)
+        self.gauge(name, labels=[k for k, _ in key]).labels(**dict(key)).set(value)
+
+    def observe(
+        self,
+        name: str,
+        value: float,
+        labels: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Record into a histogram (registered with default buckets on first use)."""
+        key = _label_key(labels)
+        self.histogram(name, labels=[k for k, _ in key]).labels(**dict(key)).observe(value)
+
+    # --------------------------------------------------------
+    # READING
+    # --------------------------------------------------------
+
+    def get_metric(
+        self,
+        name: str,
+        labels: Optional[Dict[str, str]] = None,
+    ) -> Optional[MetricValue]:
+        """Current value of one counter/gauge series, or None if never recorded."""
+        with self._lock:
+            family = self._families.get(name)
+        value = None
+        if family is not None and not isinstance(family, Histogram):
+            child = family.get(labels)
+            value = child.value if child is not None else None
+        if value is None and not labels:
+            value = self._poll_sources().get(name)
+        if value is None:
+            return None
+        return MetricValue(name=name, value=value, labels=dict(labels or {}))
+
+    def get_histogram(
+        self,
+        name: str,
+        labels: Optional[Dict[str, str]] = None,
+    ) -> Optional[HistogramSnapshot]:
+        """Snapshot of one histogram series, or None if never recorded."""
+        with self._lock:
+            family = self._families.get(name)
+        if not isinstance(family, Histogram):
+            return None
+        child = family.get(labels)
+        return child.snapshot() if child is not None else None
+
+    def collect(self) -> List[MetricValue]:
+        """
+        Snapshot of every series.
+
+        Histograms appear as <name>_count, <name>_sum and <name>
+        with a "quantile" label per reported quantile.
+        """
+        now = datetime.now(timezone.utc)
+        values: List[MetricValue] = []
+        for family in self._family_list():
+            for labels, child in family.series():
+                if isinstance(child, HistogramChild):
+                    snap = child.snapshot()
+                    values.append(MetricValue(f"{family.name}_count", snap.count, labels, now))
+                    values.append(MetricValue(f"{family.name}_sum", snap.sum, labels, now))
+                    for q in REPORTED_QUANTILES:
+                        values.append(MetricValue(
+                            family.name, snap.quantile(q), {**labels, "quantile": str(q)}, now,
+                        ))
+                else:
+                    values.append(MetricValue(family.name, child.value, labels, now))
+        values.extend(
+            MetricValue(name=name, value=value, timestamp=now)
+            for name, value in self._poll_sources().items()
+        )
+        return values
+
+    def definitions(self) -> List[MetricDefinition]:
+        """All registered metric definitions."""
+        return [family.definition for family in self._family_list()]
+
+    def render_prometheus(self) -> str:
+        """Every metric in the Prometheus text exposition format (0.0.4)."""
+        lines: List[str] = []
+        for family in sorted(self._family_list(), key=lambda f: f.name):
+            definition = family.definition
+            if definition.description:
+                lines.append(f"# HELP {family.name} {_escape_help(definition.description)}")
+            lines.append(f"# TYPE {family.name} {definition.type.value}")
+            for labels, child in family.series():
+                if isinstance(child, HistogramChild):
+                    lines.extend(_histogram_lines(family.name, labels, child.snapshot()))
+                else:
+                    lines.append(f"{family.name}{_format_labels(labels)} {_format_value(child.value)}")
+        for name, value in sorted(self._poll_sources().items()):
+            lines.append(f"# TYPE {name} untyped")
+            lines.append(f"{name} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _family_list(self) -> List[MetricFamily]:
+        with self._lock:
+            return list(self._families.values())
+
+    def _poll_sources(self) -> Dict[str, float]:
+        """Current values of every pull source (outside the lock)."""
+        with self._lock:
+            sources = list(self._sources.values())
+        values: Dict[str, float] = {}
+        for source in sources:
+            values.update(source())
+        return values
+
+
+# ============================================================
+# PROMETHEUS TEXT FORMAT
+# ============================================================
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels.items())
+    return "{" + pairs + "}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _histogram_lines(name: str, labels: Dict[str, str], snap: HistogramSnapshot) -> Iterable[str]:
+    cumulative = 0
+    for bound, count in zip(snap.bounds, snap.counts):
+        cumulative += count
+        yield f"{name}_bucket{_format_labels({**labels, 'le': _format_value(bound)})} {cumulative}"
+    yield f"{name}_bucket{_format_labels({**labels, 'le': '+Inf'})} {snap.count}"
+    yield f"{name}_sum{_format_labels(labels)} {_format_value(snap.sum)}"
+    yield f"{name}_count{_format_labels(labels)} {snap.count}"
+
+
+_collector: Optional[MetricsCollector] = None
+_collector_lock = threading.Lock()
+
+
+def get_metrics_collector() -> MetricsCollector:
+    """Get the process-wide metrics collector."""
+    global _collector
+    with _collector_lock:
+        if _collector is None:
+            _collector = MetricsCollector()
+        return _collector
+
+
+__all__ = [
+    "MetricType",
+    "MetricDefinition",
+    "MetricValue",
+    "MetricFamily",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "CounterChild",
+    "GaugeChild",
+    "HistogramChild",
+    "HistogramSnapshot",
+    "RollingCounter",
+    "MetricsCollector",
+    "DEFAULT_BUCKETS",
+    "DEFAULT_MAX_SERIES",
+    "OVERFLOW_LABEL_VALUE",
+    "PROMETHEUS_CONTENT_TYPE",
+    "log_buckets",
+    "get_metrics_collector",
+]
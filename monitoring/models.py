@@ -311,7 +311,6 @@ class Alert:
     """An alert record."""
     
     alert_id: str
-    timestamp: datetime
     
     # Classification
     tier: AlertTier
@@ -322,16 +321,18 @@ class Alert:
     message: str
     
     # Source
-    source_module: str
-    source_component: Optional[str]
+    triggered_at: datetime
+    triggered_by_rule: str
     
     # Context
-    context: Dict[str, Any] = field(default_factory=dict)
+    data: Dict[str, Any] = field(default_factory=dict)
     
     # Status
     acknowledged: bool = False
     acknowledged_by: Optional[str] = None
     acknowledged_at: Optional[datetime] = None
+    resolved: bool = False
+    resolved_at: Optional[datetime] = None
     
     # Notifications
     sent_to_dashboard: bool = False
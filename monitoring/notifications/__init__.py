@@ -11,6 +11,10 @@ from .telegram import (
     create_telegram_handler,
     telegram_alert_handler,
 )
+from .queue import (
+    NotificationQueueConfig,
+    NotificationQueue,
+)
 
 
 __all__ = [
@@ -19,4 +23,6 @@ __all__ = [
     "TelegramNotifier",
     "create_telegram_handler",
     "telegram_alert_handler",
+    "NotificationQueueConfig",
+    "NotificationQueue",
 ]
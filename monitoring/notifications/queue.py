@@ -0,0 +1,242 @@
+"""
+Outbound Notification Queue.
+
+============================================================
+PURPOSE
+============================================================
+Decouple alert evaluation from Telegram delivery.
+
+- AlertManager hands alerts to the queue and returns at once
+- Bursts of alerts within a short window are coalesced into
+  one digest message
+- CRITICAL alerts take a priority lane that bypasses digesting
+- A single worker sends, so the rate limiter delays messages
+  instead of dropping them
+
+============================================================
+LANES
+============================================================
+- Priority: CRITICAL alerts, sent one by one ahead of
+  anything else. If more than max_critical_backlog pile up
+  (a critical storm) they go out together as one digest.
+- Digest: everything else. The first alert of a burst opens
+  a window of digest_window_seconds; everything arriving
+  before it closes (up to max_digest_size) is sent as one
+  message. A lone alert is sent in its normal format.
+
+============================================================
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, List, Optional
+
+from ..models import Alert, AlertTier
+from .telegram import TelegramNotifier
+
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# CONFIGURATION
+# ============================================================
+
+@dataclass
+class NotificationQueueConfig:
+    """Configuration for the outbound notification queue."""
+    digest_window_seconds: float = 5.0   # Coalescing window for a burst
+    max_digest_size: int = 50            # Flush a digest early at this size
+    max_critical_backlog: int = 5        # Above this, criticals are digested too
+    stop_timeout_seconds: float = 30.0   # Drain budget on stop (sends wait out rate limits)
+
+
+# ============================================================
+# NOTIFICATION QUEUE
+# ============================================================
+
+class NotificationQueue:
+    """
+    Asynchronous outbound queue in front of a TelegramNotifier.
+
+    Usable directly as an AlertManager notification handler:
+
+        queue = NotificationQueue(notifier)
+        queue.start()
+        manager.add_handler(queue)
+        ...
+        await queue.stop()
+    """
+
+    def __init__(
+        self,
+        notifier: TelegramNotifier,
+        config: Optional[NotificationQueueConfig] = None,
+    ):
+        """
+        Initialize the queue.
+
+        Args:
+            notifier: Notifier that formats and sends the messages
+            config: Queue configuration
+        """
+        self._notifier = notifier
+        self._config = config or NotificationQueueConfig()
+
+        self._critical: Deque[Alert] = deque()
+        self._digest: List[Alert] = []
+        self._digest_deadline: Optional[float] = None
+
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._flushing = False
+        self._task: Optional[asyncio.Task] = None
+
+        # Statistics
+        self.alerts_queued = 0
+        self.messages_sent = 0
+        self.messages_failed = 0
+        self.digests_sent = 0
+
+    # --------------------------------------------------------
+    # PRODUCER SIDE
+    # --------------------------------------------------------
+
+    async def __call__(self, alert: Alert) -> bool:
+        """AlertManager handler: enqueue without waiting for delivery."""
+        return self.submit(alert)
+
+    def submit(self, alert: Alert) -> bool:
+        """
+        Enqueue an alert.
+
+        Returns False if the notifier would not send it (disabled or
+        below its minimum tier).
+        """
+        if not self._notifier.should_send(alert):
+            return False
+
+        if alert.tier == AlertTier.CRITICAL:
+            self._critical.append(alert)
+        else:
+            if not self._digest:
+                self._digest_deadline = time.monotonic() + self._config.digest_window_seconds
+            self._digest.append(alert)
+
+        self.alerts_queued += 1
+        self._idle.clear()
+        self._wakeup.set()
+        return True
+
+    @property
+    def pending(self) -> int:
+        """Alerts waiting to be sent."""
+        return len(self._critical) + len(self._digest)
+
+    # --------------------------------------------------------
+    # LIFECYCLE
+    # --------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the sender task on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(
+                self._run(), name="telegram-notification-queue"
+            )
+
+    async def drain(self) -> None:
+        """Send everything queued now, without waiting out digest windows."""
+        self.start()
+        self._flushing = True
+        self._wakeup.set()
+        try:
+            await self._idle.wait()
+        finally:
+            self._flushing = False
+
+    async def stop(self) -> None:
+        """
+        Drain the queue and stop the sender task.
+
+        The sender waits out rate limits, so draining is bounded by
+        stop_timeout_seconds; whatever is still queued then is dropped.
+        """
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(self.drain(), self._config.stop_timeout_seconds)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Notification queue stopped with {self.pending} alert(s) unsent (rate limited)"
+            )
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    # --------------------------------------------------------
+    # SENDER
+    # --------------------------------------------------------
+
+    def _next_batch(self) -> Optional[List[Alert]]:
+        """The next alerts to send as one message, or None to wait."""
+        if self._critical:
+            if len(self._critical) > self._config.max_critical_backlog:
+                batch = list(self._critical)
+                self._critical.clear()
+                return batch
+            return [self._critical.popleft()]
+
+        if self._digest and (
+            self._flushing
+            or len(self._digest) >= self._config.max_digest_size
+            or time.monotonic() >= self._digest_deadline
+        ):
+            batch = self._digest[:self._config.max_digest_size]
+            del self._digest[:self._config.max_digest_size]
+            # The remainder of an oversized burst goes out immediately
+            self._digest_deadline = time.monotonic()
+            return batch
+
+        return None
+
+    async def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                if not self._digest:
+                    self._idle.set()
+                    timeout = None
+                else:
+                    timeout = max(0.0, self._digest_deadline - time.monotonic())
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            await self._send(batch)
+
+    async def _send(self, batch: List[Alert]) -> None:
+        try:
+            if len(batch) == 1:
+                sent = await self._notifier.send_alert(batch[0], wait_for_slot=True)
+            else:
+                sent = await self._notifier.send_digest(batch, wait_for_slot=True)
+                if sent:
+                    self.digests_sent += 1
+        except Exception as e:
+            logger.error(f"Notification queue send error: {e}")
+            sent = False
+
+        if sent:
+            self.messages_sent += 1
+        else:
+            self.messages_failed += 1
@@ -19,9 +19,9 @@ import asyncio
 import logging
 import html
 import os
-from datetime import datetime, timedelta
+import time
 from decimal import Decimal
-from typing import Dict, Any, Optional, List, TYPE_CHECKING
+from typing import Callable, Dict, Any, Optional, List, TYPE_CHECKING
 
 import aiohttp
 
@@ -34,6 +34,10 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+# Alert tiers from least to most severe
+TIER_ORDER = {AlertTier.INFO: 0, AlertTier.WARNING: 1, AlertTier.CRITICAL: 2}
+
+
 # ============================================================
 # TELEGRAM MESSAGE FORMATTER
 # ============================================================
@@ -130,7 +134,7 @@ class TelegramFormatter:
         return lines
     
     @classmethod
-    def format_summary(cls, alerts: List[Alert]) -> str:
+    def format_summary(cls, alerts: List[Alert], total_label: str = "Total Active") -> str:
         """Format alert summary."""
         if not alerts:
             return "✅ No active alerts"
@@ -146,7 +150,7 @@ class TelegramFormatter:
             f"⚠️ Warning: {warning}",
             f"ℹ️ Info: {info}",
             "",
-            f"Total Active: {len(alerts)}",
+            f"{total_label}: {len(alerts)}",
         ]
         
         # List critical alerts
@@ -159,6 +163,28 @@ class TelegramFormatter:
         
         return "\n".join(lines)
     
+    @classmethod
+    def format_digest(cls, alerts: List[Alert], max_items: int = 10) -> str:
+        """
+        Format a burst of alerts as one message.
+        
+        The summary lists the critical alerts; the rest are listed
+        below it, newest last, up to max_items.
+        """
+        lines = [cls.format_summary(alerts, total_label="Alerts in digest")]
+        
+        others = [a for a in alerts if a.tier != AlertTier.CRITICAL]
+        if others:
+            lines.append("")
+            lines.append("<b>Other Alerts:</b>")
+            for alert in others[:max_items]:
+                icon = cls.TIER_ICONS.get(alert.tier, "📌")
+                lines.append(f"{icon} {html.escape(alert.title)}")
+            if len(others) > max_items:
+                lines.append(f"<i>... and {len(others) - max_items} more</i>")
+        
+        return "\n".join(lines)
+    
     @classmethod
     def format_system_status(
         cls,
@@ -345,64 +371,102 @@ class TelegramFormatter:
 # RATE LIMITER
 # ============================================================
 
+class _TokenBucket:
+    """Tokens refill continuously at rate per second, up to capacity."""
+    
+    def __init__(self, capacity: float, rate: float, now: float):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self._updated = now
+    
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def delay(self) -> float:
+        """Seconds until one token is available (after refill)."""
+        if self.tokens >= 1:
+            return 0.0
+        if self.rate <= 0:
+            return float("inf")
+        return (1 - self.tokens) / self.rate
+
+
 class TelegramRateLimiter:
     """
     Rate limiter for Telegram messages.
     
     Prevents excessive message sending.
+    
+    Two token buckets: one refilling max_per_minute tokens a
+    minute (burst of max_per_minute), one refilling max_per_hour
+    tokens an hour. A send takes a token from both. acquire() is
+    a non-blocking try; wait() delays until a token is free
+    instead of dropping the message.
     """
     
     def __init__(
         self,
         max_per_minute: int = 20,
         max_per_hour: int = 100,
+        clock: Callable[[], float] = time.monotonic,
     ):
         """Initialize rate limiter."""
         self._max_per_minute = max_per_minute
         self._max_per_hour = max_per_hour
-        self._minute_window: List[datetime] = []
-        self._hour_window: List[datetime] = []
-        self._lock = asyncio.Lock()
+        self._clock = clock
+        now = clock()
+        self._minute = _TokenBucket(max_per_minute, max_per_minute / 60.0, now)
+        self._hour = _TokenBucket(max_per_hour, max_per_hour / 3600.0, now)
+        self._waiters = asyncio.Lock()
+    
+    def _delay(self) -> float:
+        now = self._clock()
+        self._minute.refill(now)
+        self._hour.refill(now)
+        return max(self._minute.delay(), self._hour.delay())
+    
+    def _take(self) -> None:
+        self._minute.tokens -= 1
+        self._hour.tokens -= 1
     
     async def acquire(self) -> bool:
         """Try to acquire a send slot."""
-        async with self._lock:
-            now = datetime.utcnow()
-            
-            # Clean old entries
-            minute_ago = now - timedelta(minutes=1)
-            hour_ago = now - timedelta(hours=1)
-            
-            self._minute_window = [t for t in self._minute_window if t > minute_ago]
-            self._hour_window = [t for t in self._hour_window if t > hour_ago]
-            
-            # Check limits
-            if len(self._minute_window) >= self._max_per_minute:
-                return False
-            if len(self._hour_window) >= self._max_per_hour:
-                return False
-            
-            # Record this send
-            self._minute_window.append(now)
-            self._hour_window.append(now)
-            
-            return True
+        if self._delay() > 0:
+            return False
+        self._take()
+        return True
+    
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Acquire a send slot, sleeping until one is free.
+        
+        Waiters are served in arrival order. Returns False only if
+        no slot frees up within timeout seconds.
+        """
+        deadline = None if timeout is None else self._clock() + timeout
+        async with self._waiters:
+            while True:
+                delay = self._delay()
+                if delay == 0:
+                    self._take()
+                    return True
+                if deadline is not None and self._clock() + delay > deadline:
+                    return False
+                await asyncio.sleep(delay)
     
     @property
     def remaining_minute(self) -> int:
         """Remaining sends in current minute."""
-        now = datetime.utcnow()
-        minute_ago = now - timedelta(minutes=1)
-        count = sum(1 for t in self._minute_window if t > minute_ago)
-        return max(0, self._max_per_minute - count)
+        self._delay()
+        return int(min(self._minute.tokens, self._hour.tokens))
     
     @property
     def remaining_hour(self) -> int:
         """Remaining sends in current hour."""
-        now = datetime.utcnow()
-        hour_ago = now - timedelta(hours=1)
-        count = sum(1 for t in self._hour_window if t > hour_ago)
-        return max(0, self._max_per_hour - count)
+        self._delay()
+        return int(self._hour.tokens)
 
 
 # ============================================================
@@ -485,25 +549,45 @@ class TelegramNotifier:
         """Disable notifications."""
         self._enabled = False
     
-    async def send_alert(self, alert: Alert) -> bool:
+    @property
+    def enabled(self) -> bool:
+        """Whether notifications are sent."""
+        return self._enabled
+    
+    def should_send(self, alert: Alert) -> bool:
+        """Whether an alert passes the enabled and tier checks."""
+        if not self._enabled:
+            return False
+        return TIER_ORDER.get(alert.tier, 0) >= TIER_ORDER.get(self._min_tier, 0)
+    
+    async def send_alert(self, alert: Alert, wait_for_slot: bool = False) -> bool:
         """
         Send an alert notification.
         
+        Args:
+            alert: Alert to send
+            wait_for_slot: Wait for the rate limiter instead of
+                           failing fast (NotificationQueue sender only)
+        
         Returns True if sent successfully.
         """
-        if not self._enabled:
-            return False
-        
-        # Check tier
-        tier_order = {AlertTier.INFO: 0, AlertTier.WARNING: 1, AlertTier.CRITICAL: 2}
-        if tier_order.get(alert.tier, 0) < tier_order.get(self._min_tier, 0):
+        if not self.should_send(alert):
             return False
         
         # Format message
         message = self._formatter.format_alert(alert)
         
         # Send to all chats
-        return await self._send_to_all(message)
+        return await self._send_to_all(message, wait_for_slot)
+    
+    async def send_digest(self, alerts: List[Alert], wait_for_slot: bool = False) -> bool:
+        """Send a burst of alerts as one digest message."""
+        alerts = [a for a in alerts if self.should_send(a)]
+        if not alerts:
+            return False
+        if len(alerts) == 1:
+            return await self._send_to_all(self._formatter.format_alert(alerts[0]), wait_for_slot)
+        return await self._send_to_all(self._formatter.format_digest(alerts), wait_for_slot)
     
     async def send_summary(self, alerts: List[Alert]) -> bool:
         """Send alert summary."""
@@ -632,18 +716,26 @@ class TelegramNotifier:
             send_summary=send_summary,
         )
     
-    async def _send_to_all(self, message: str) -> bool:
-        """Send message to all configured chats."""
-        if not await self._rate_limiter.acquire():
+    async def _send_to_all(self, message: str, wait_for_slot: bool = False) -> bool:
+        """
+        Send message to all configured chats concurrently.
+        
+        Direct sends fail fast when rate limited; only the
+        NotificationQueue sender waits for a slot, however long it
+        takes, so queued messages are delayed rather than dropped.
+        """
+        if wait_for_slot:
+            acquired = await self._rate_limiter.wait()
+        else:
+            acquired = await self._rate_limiter.acquire()
+        if not acquired:
             logger.warning("Telegram rate limit reached, message not sent")
             return False
         
-        success = True
-        for chat_id in self._chat_ids:
-            if not await self._send_message(chat_id, message):
-                success = False
-        
-        return success
+        results = await asyncio.gather(
+            *(self._send_message(chat_id, message) for chat_id in self._chat_ids)
+        )
+        return all(results)
     
     async def _send_message(
         self,
@@ -711,5 +803,8 @@ async def telegram_alert_handler(
     Usage:
         notifier = create_telegram_handler(...)
         manager.add_handler(lambda a: telegram_alert_handler(notifier, a))
+    
+    The handler awaits the send; to keep alert storms off the
+    evaluation path, register a NotificationQueue instead.
     """
     return await notifier.send_alert(alert)
@@ -0,0 +1,554 @@
+"""
+Monitoring - Tracing.
+
+============================================================
+RESPONSIBILITY
+============================================================
+Lightweight in-process tracing of one execution cycle.
+
+- Nested spans timed on the monotonic clock
+- Per-trace sampling decided once, at the root span
+- Finished traces kept in a bounded ring buffer
+- Flame-style breakdown (total and self time per call path)
+- Chrome trace JSON export (chrome://tracing, Perfetto)
+
+============================================================
+DESIGN PRINCIPLES
+============================================================
+- Spans cost nothing outside a sampled trace: a single
+  context variable lookup returns a shared no-op span
+- No background threads, no network, no dependencies
+- Spans follow the context: asyncio tasks and
+  asyncio.to_thread inherit the current span, plain
+  ThreadPoolExecutor workers do not
+
+============================================================
+USAGE
+============================================================
+    tracer = get_tracer()
+    with tracer.trace("cycle", trace_id=cycle_id):
+        with tracer.span("stage.data_ingestion"):
+            ...
+
+    @traced("exchange.request")
+    async def _request(self, method, endpoint, ...):
+        current_span().set(endpoint=endpoint)
+
+    trace = tracer.exporter.get(cycle_id)
+    trace.breakdown()
+    trace.to_chrome_trace()
+
+A span opened with tracer.span() joins whatever trace is
+current, so instrumented libraries only ever need the
+process-wide tracer.
+
+============================================================
+"""
+
+import asyncio
+import functools
+import os
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, List, Optional, TypeVar
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+# ============================================================
+# CONSTANTS
+# ============================================================
+
+DEFAULT_TRACE_CAPACITY = 100
+DEFAULT_MAX_SPANS = 10_000
+
+# Longest SQL statement kept on a db.query span
+MAX_STATEMENT_LENGTH = 200
+
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("monitoring_current_span", default=None)
+
+
+def _lane() -> str:
+    """Name of the asyncio task, or thread, the caller runs on."""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    if task is not None:
+        return task.get_name()
+    return threading.current_thread().name
+
+
+# ============================================================
+# SPANS
+# ============================================================
+
+class Span:
+    """
+    One timed operation within a trace.
+
+    Used as a context manager: entering starts the clock and makes
+    the span current, exiting stops it and attaches it to its trace.
+    """
+
+    __slots__ = (
+        "name", "trace", "span_id", "parent_id", "attributes",
+        "start_ns", "end_ns", "error", "lane", "_token",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace: "Trace",
+        parent_id: Optional[int],
+        attributes: Dict[str, Any],
+    ):
+        self.name = name
+        self.trace = trace
+        self.span_id = trace._next_span_id()
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.start_ns = 0
+        self.end_ns = 0
+        self.error: Optional[str] = None
+        self.lane = ""
+        self._token = None
+
+    @property
+    def duration_ns(self) -> int:
+        return max(0, self.end_ns - self.start_ns)
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration_ns / 1e6
+
+    def set(self, **attributes: Any) -> None:
+        """Attach attributes to the span."""
+        self.attributes.update(attributes)
+
+    def __enter__(self) -> "Span":
+        self.lane = _lane()
+        self._token = _current_span.set(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            self.error = exc_type.__name__
+        _current_span.reset(self._token)
+        self._token = None
+        self.trace._add(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_ms": (self.start_ns - self.trace.start_ns) / 1e6,
+            "duration_ms": self.duration_ms,
+            "lane": self.lane,
+            "error": self.error,
+            "attributes": dict(self.attributes),
+        }
+
+
+class RootSpan(Span):
+    """The first span of a trace; exporting the trace on exit."""
+
+    __slots__ = ("tracer",)
+
+    def __init__(self, name: str, trace: "Trace", attributes: Dict[str, Any], tracer: "Tracer"):
+        super().__init__(name, trace, None, attributes)
+        self.tracer = tracer
+
+    def __enter__(self) -> "Span":
+        super().__enter__()
+        self.trace.start_ns = self.start_ns
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        super().__exit__(exc_type, exc, tb)
+        self.trace.end_ns = self.end_ns
+        self.tracer.exporter.export(self.trace)
+
+
+class _NoopSpan:
+    """Stand-in span outside a sampled trace."""
+
+    __slots__ = ()
+
+    name = ""
+    attributes: Dict[str, Any] = {}
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+# ============================================================
+# TRACES
+# ============================================================
+
+class Trace:
+    """All spans recorded under one root span."""
+
+    def __init__(self, trace_id: str, name: str, max_spans: int = DEFAULT_MAX_SPANS):
+        self.trace_id = trace_id
+        self.name = name
+        self.started_at = datetime.now(timezone.utc)
+        self.start_ns = 0
+        self.end_ns = 0
+        self.spans: List[Span] = []
+        self.dropped_spans = 0
+        self._max_spans = max_spans
+        self._span_ids = 0
+        self._lock = threading.Lock()
+
+    def _next_span_id(self) -> int:
+        with self._lock:
+            self._span_ids += 1
+            return self._span_ids
+
+    def _add(self, span: Span) -> None:
+        with self._lock:
+            if len(self.spans) < self._max_spans or span.parent_id is None:
+                self.spans.append(span)
+            else:
+                self.dropped_spans += 1
+
+    @property
+    def duration_ms(self) -> float:
+        return max(0, self.end_ns - self.start_ns) / 1e6
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "name": self.name,
+            "started_at": self.started_at.isoformat(),
+            "duration_ms": self.duration_ms,
+            "span_count": len(self.spans),
+            "dropped_spans": self.dropped_spans,
+        }
+
+    def _paths(self) -> Dict[int, str]:
+        """Semicolon-joined call path of every span, keyed by span id."""
+        by_id = {span.span_id: span for span in self.spans}
+        paths: Dict[int, str] = {}
+
+        def path_of(span: Span) -> str:
+            if span.span_id not in paths:
+                parent = by_id.get(span.parent_id)
+                prefix = path_of(parent) + ";" if parent is not None else ""
+                paths[span.span_id] = prefix + span.name
+            return paths[span.span_id]
+
+        for span in self.spans:
+            path_of(span)
+        return paths
+
+    def _self_times_ns(self) -> Dict[int, int]:
+        """
+        Time each span spent outside its children.
+
+        Concurrent children can overlap their parent's whole duration
+        more than once over, so self time is clamped at zero.
+        """
+        child_ns: Dict[int, int] = {}
+        for span in self.spans:
+            if span.parent_id is not None:
+                child_ns[span.parent_id] = child_ns.get(span.parent_id, 0) + span.duration_ns
+        return {
+            span.span_id: max(0, span.duration_ns - child_ns.get(span.span_id, 0))
+            for span in self.spans
+        }
+
+    def breakdown(self) -> List[Dict[str, Any]]:
+        """
+        Flame-style breakdown: one row per distinct call path.
+
+        Rows are in call order (first start, then depth) with the
+        number of spans on the path and their total and self time.
+        """
+        paths = self._paths()
+        self_ns = self._self_times_ns()
+        rows: Dict[str, Dict[str, Any]] = {}
+        for span in self.spans:
+            path = paths[span.span_id]
+            row = rows.get(path)
+            if row is None:
+                row = rows[path] = {
+                    "path": path,
+                    "name": span.name,
+                    "depth": path.count(";"),
+                    "count": 0,
+                    "errors": 0,
+                    "total_ms": 0.0,
+                    "self_ms": 0.0,
+                    "_first_ns": span.start_ns,
+                }
+            row["count"] += 1
+            row["errors"] += span.error is not None
+            row["total_ms"] += span.duration_ns / 1e6
+            row["self_ms"] += self_ns[span.span_id] / 1e6
+            row["_first_ns"] = min(row["_first_ns"], span.start_ns)
+
+        ordered = sorted(rows.values(), key=lambda r: (r["_first_ns"], r["depth"]))
+        for row in ordered:
+            del row["_first_ns"]
+        return ordered
+
+    def folded(self) -> str:
+        """Folded stacks ("a;b;c <self microseconds>") for flamegraph tools."""
+        paths = self._paths()
+        totals: Dict[str, int] = {}
+        for span_id, ns in self._self_times_ns().items():
+            totals[paths[span_id]] = totals.get(paths[span_id], 0) + ns
+        return "\n".join(f"{path} {ns // 1000}" for path, ns in totals.items())
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Export in the Chrome trace event format.
+
+        Every span is a complete ("X") event with microsecond
+        timestamps relative to the trace start; each asyncio task or
+        thread gets its own named track.
+        """
+        pid = os.getpid()
+        tids: Dict[str, int] = {}
+        events: List[Dict[str, Any]] = []
+        for span in sorted(self.spans, key=lambda s: s.start_ns):
+            tid = tids.setdefault(span.lane, len(tids) + 1)
+            args = {key: str(value) for key, value in span.attributes.items()}
+            if span.error:
+                args["error"] = span.error
+            events.append({
+                "name": span.name,
+                "cat": span.name.split(".", 1)[0],
+                "ph": "X",
+                "ts": (span.start_ns - self.start_ns) / 1000,
+                "dur": span.duration_ns / 1000,
+                "pid": pid,
+                "tid": tid,
+                "args": args,
+            })
+
+        metadata = [
+            {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": self.name}},
+        ] + [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": lane}}
+            for lane, tid in tids.items()
+        ]
+        return {
+            "traceEvents": metadata + events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "trace_id": self.trace_id,
+                "started_at": self.started_at.isoformat(),
+            },
+        }
+
+
+# ============================================================
+# EXPORTER
+# ============================================================
+
+class RingBufferExporter:
+    """Keeps the most recent finished traces in memory."""
+
+    def __init__(self, capacity: int = DEFAULT_TRACE_CAPACITY):
+        self._traces: Deque[Trace] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def export(self, trace: Trace) -> None:
+        with self._lock:
+            self._traces.append(trace)
+
+    def get(self, trace_id: str) -> Optional[Trace]:
+        with self._lock:
+            for trace in reversed(self._traces):
+                if trace.trace_id == trace_id:
+                    return trace
+        return None
+
+    def recent(self, limit: Optional[int] = None) -> List[Trace]:
+        """Finished traces, newest first."""
+        with self._lock:
+            traces = list(reversed(self._traces))
+        return traces[:limit] if limit is not None else traces
+
+    def clear(self) -> None:
+        with self._lock:
+            self._traces.clear()
+
+    def __len__(self) -> int:
+        return len(self._traces)
+
+
+# ============================================================
+# TRACER
+# ============================================================
+
+class Tracer:
+    """
+    Starts traces and spans.
+
+    sample_rate is the fraction of root spans recorded; spans in
+    an unsampled trace are no-ops.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        exporter: Optional[RingBufferExporter] = None,
+        max_spans_per_trace: int = DEFAULT_MAX_SPANS,
+    ):
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.sample_rate = sample_rate
+        self.exporter = exporter if exporter is not None else RingBufferExporter()
+        self._max_spans = max_spans_per_trace
+        self._random = random.Random()
+
+    def trace(self, name: str, trace_id: Optional[str] = None, **attributes: Any):
+        """
+        Open a root span.
+
+        Inside a trace this is an ordinary child span, so a traced
+        component can run standalone or as part of a larger cycle.
+        """
+        parent = _current_span.get()
+        if parent is not None:
+            return Span(name, parent.trace, parent.span_id, attributes)
+        if self.sample_rate < 1.0 and self._random.random() >= self.sample_rate:
+            return NOOP_SPAN
+        trace = Trace(trace_id or uuid.uuid4().hex, name, self._max_spans)
+        return RootSpan(name, trace, attributes, self)
+
+    def span(self, name: str, **attributes: Any):
+        """Open a child of the current span (a no-op outside a trace)."""
+        parent = _current_span.get()
+        if parent is None:
+            return NOOP_SPAN
+        return Span(name, parent.trace, parent.span_id, attributes)
+
+    def record(self, name: str, start_ns: int, end_ns: int, **attributes: Any) -> None:
+        """Attach an already finished span, timed by the caller."""
+        parent = _current_span.get()
+        if parent is None:
+            return
+        span = Span(name, parent.trace, parent.span_id, attributes)
+        span.lane = _lane()
+        span.start_ns = start_ns
+        span.end_ns = end_ns
+        parent.trace._add(span)
+
+
+def current_span():
+    """The innermost open span, or a no-op span outside a trace."""
+    return _current_span.get() or NOOP_SPAN
+
+
+def traced(name: Optional[str] = None) -> Callable[[F], F]:
+    """Decorate a function or coroutine function to run in a span."""
+
+    def decorator(fn: F) -> F:
+        span_name = name or fn.__qualname__
+
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with get_tracer().span(span_name):
+                    return await fn(*args, **kwargs)
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with get_tracer().span(span_name):
+                return fn(*args, **kwargs)
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+# ============================================================
+# SQLALCHEMY
+# ============================================================
+
+def instrument_engine(engine: Any) -> None:
+    """
+    Record every statement run on a SQLAlchemy engine as a db.query span.
+
+    Outside a trace the cost is two event callbacks and a clock read.
+    """
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def on_before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("trace_query_start_ns", []).append(time.perf_counter_ns())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def on_after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("trace_query_start_ns")
+        if not starts:
+            return
+        start_ns = starts.pop()
+        if _current_span.get() is None:
+            return
+        get_tracer().record(
+            "db.query", start_ns, time.perf_counter_ns(),
+            statement=statement[:MAX_STATEMENT_LENGTH],
+            executemany=executemany,
+        )
+
+    @event.listens_for(engine, "handle_error")
+    def on_error(context):
+        starts = context.connection.info.get("trace_query_start_ns") if context.connection else None
+        if starts:
+            starts.pop()
+
+
+# ============================================================
+# PROCESS-WIDE TRACER
+# ============================================================
+
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer."""
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                _tracer = Tracer()
+    return _tracer
+
+
+__all__ = [
+    "Span",
+    "Trace",
+    "Tracer",
+    "RingBufferExporter",
+    "NOOP_SPAN",
+    "current_span",
+    "traced",
+    "instrument_engine",
+    "get_tracer",
+]
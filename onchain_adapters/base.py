@@ -18,6 +18,7 @@ from typing import Any, Optional
 
 import aiohttp
 
+from core.http_pool import get_http_registry
 from onchain_adapters.exceptions import (
     CacheError,
     FetchError,
@@ -469,9 +470,17 @@ class BaseOnchainAdapter(ABC):
     
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create HTTP session."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self._timeout),
+        registry = get_http_registry()
+        stale = self._session is not None and (
+            self._session.closed
+            or (self._owns_session and not registry.session_is_live(self._session))
+        )
+        if self._session is None or stale:
+            if stale and self._owns_session:
+                await registry.close_session(self._session)
+            # Holds a pool reference until close()
+            self._session = await registry.open_session(
+                timeout=self._timeout,
                 headers=self._get_default_headers(),
             )
             self._owns_session = True
@@ -637,8 +646,9 @@ class BaseOnchainAdapter(ABC):
     
     async def close(self) -> None:
         """Close resources."""
-        if self._owns_session and self._session and not self._session.closed:
-            await self._session.close()
+        if self._owns_session and self._session is not None:
+            session, self._session = self._session, None
+            await get_http_registry().close_session(session)
     
     async def __aenter__(self) -> "BaseOnchainAdapter":
         """Async context manager entry."""
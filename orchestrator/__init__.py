@@ -132,6 +132,7 @@ from orchestrator.models import (
     # Enums
     RuntimeMode,
     ExecutionStage,
+    STAGE_DEPENDENCIES,
     ModuleStatus,
     
     # Results
@@ -176,6 +177,7 @@ from orchestrator.pipeline import (
     # Execution
     StageExecutor,
     ExecutionPipeline,
+    build_stage_graph,
     
     # Builder
     PipelineBuilder,
@@ -230,6 +232,7 @@ __all__ = [
     # Models - Enums
     "RuntimeMode",
     "ExecutionStage",
+    "STAGE_DEPENDENCIES",
     "ModuleStatus",
     
     # Models - Results
@@ -264,6 +267,7 @@ __all__ = [
     # Pipeline - Execution
     "StageExecutor",
     "ExecutionPipeline",
+    "build_stage_graph",
     
     # Pipeline - Builder
     "PipelineBuilder",
@@ -492,6 +492,8 @@ class Orchestrator:
                 .with_handlers(self._stage_handlers) \
                 .with_safety_checker(self.get_safety_context) \
                 .with_stage_timeout(300.0) \
+                .with_module_registry(self._registry) \
+                .with_max_concurrent_stages(self._config.max_concurrent_tasks) \
                 .build()
             
             # Transition to running
@@ -171,6 +171,11 @@ class ExecutionStage(Enum):
         """Get stage description."""
         return self._description
     
+    @property
+    def dependencies(self) -> Set["ExecutionStage"]:
+        """Stages whose output this stage needs (see STAGE_DEPENDENCIES)."""
+        return STAGE_DEPENDENCIES.get(self, set())
+    
     @classmethod
     def get_ordered_stages(cls) -> List["ExecutionStage"]:
         """Get all stages in execution order."""
@@ -220,6 +225,44 @@ class ExecutionStage(Enum):
         return init_stages
 
 
+# Data dependencies between stages. Stages with no path between them
+# may run concurrently. A dependency that does not run in the current
+# cycle (other mode, no handler) is replaced by its own dependencies.
+STAGE_DEPENDENCIES: Dict[ExecutionStage, Set[ExecutionStage]] = {
+    ExecutionStage.LOAD_CONFIG: set(),
+    ExecutionStage.INIT_LOGGING: {ExecutionStage.LOAD_CONFIG},
+    ExecutionStage.INIT_DATABASE: {ExecutionStage.LOAD_CONFIG},
+    ExecutionStage.INIT_HEALTH: {ExecutionStage.INIT_LOGGING, ExecutionStage.INIT_DATABASE},
+    
+    ExecutionStage.INIT_COLLECTORS: {ExecutionStage.INIT_HEALTH},
+    ExecutionStage.RUN_INGESTION: {ExecutionStage.INIT_COLLECTORS},
+    
+    ExecutionStage.RUN_PROCESSING: {ExecutionStage.RUN_INGESTION},
+    ExecutionStage.RUN_MARKET_CLASSIFICATION: {ExecutionStage.RUN_PROCESSING},
+    
+    ExecutionStage.RUN_RISK_SCORING: {ExecutionStage.RUN_PROCESSING},
+    ExecutionStage.RUN_RISK_BUDGET: {ExecutionStage.RUN_RISK_SCORING},
+    ExecutionStage.RUN_COMMITTEE_REVIEW: {
+        ExecutionStage.RUN_MARKET_CLASSIFICATION,
+        ExecutionStage.RUN_RISK_BUDGET,
+    },
+    
+    # Committee decisions (halts) gate every trading stage
+    ExecutionStage.RUN_STRATEGY: {ExecutionStage.RUN_COMMITTEE_REVIEW},
+    ExecutionStage.RUN_TRADE_GUARD: {ExecutionStage.RUN_STRATEGY},
+    ExecutionStage.RUN_RISK_CONTROLLER: {ExecutionStage.RUN_COMMITTEE_REVIEW},
+    ExecutionStage.RUN_EXECUTION: {
+        ExecutionStage.RUN_TRADE_GUARD,
+        ExecutionStage.RUN_RISK_CONTROLLER,
+    },
+    
+    ExecutionStage.SEND_NOTIFICATIONS: {ExecutionStage.RUN_EXECUTION},
+    ExecutionStage.PERSIST_RESULTS: {ExecutionStage.RUN_EXECUTION},
+    # Monitoring only reads health state; it does not wait for the data stages
+    ExecutionStage.UPDATE_MONITORING: {ExecutionStage.INIT_HEALTH},
+}
+
+
 # ============================================================
 # MODULE STATUS
 # ============================================================
@@ -309,6 +352,7 @@ class CycleResult:
     stage_results: List[StageResult] = field(default_factory=list)
     failed_stage: Optional[ExecutionStage] = None
     error: Optional[str] = None
+    critical_path: List[ExecutionStage] = field(default_factory=list)
     
     @property
     def duration_seconds(self) -> float:
@@ -317,6 +361,12 @@ class CycleResult:
             return (self.completed_at - self.started_at).total_seconds()
         return 0.0
     
+    @property
+    def critical_path_seconds(self) -> float:
+        """Summed duration of the stages on the critical path."""
+        durations = {r.stage: r.duration_seconds for r in self.stage_results}
+        return sum(durations.get(stage, 0.0) for stage in self.critical_path)
+    
     @property
     def stages_completed(self) -> int:
         """Get number of completed stages."""
@@ -341,6 +391,8 @@ class CycleResult:
             "stages_completed": self.stages_completed,
             "failed_stage": self.failed_stage.stage_id if self.failed_stage else None,
             "error": self.error,
+            "critical_path": [s.stage_id for s in self.critical_path],
+            "critical_path_seconds": self.critical_path_seconds,
             "stage_results": [r.to_dict() for r in self.stage_results],
         }
 
@@ -428,7 +480,7 @@ class OrchestratorConfig:
     """Main loop tick interval (default 1 hour)."""
     
     max_concurrent_tasks: int = 10
-    """Maximum concurrent async tasks."""
+    """Maximum concurrent async tasks (also caps concurrently running stages)."""
     
     # Shutdown settings
     shutdown_timeout_seconds: int = 30
@@ -567,6 +619,7 @@ __all__ = [
     # Enums
     "RuntimeMode",
     "ExecutionStage",
+    "STAGE_DEPENDENCIES",
     "ModuleStatus",
     
     # Results
@@ -11,6 +11,26 @@ Manages stage execution with strict ordering and failure handling.
 - Track execution timing
 - Classify errors (recoverable vs non-recoverable)
 
+============================================================
+STAGE DAG
+============================================================
+Stages run as a dependency graph, not a fixed sequence:
+
+- Each stage declares the stages whose output it needs
+  (models.STAGE_DEPENDENCIES); module dependencies from the
+  registry's DependencyGraph add ordering between stages whose
+  modules depend on each other
+- A stage starts as soon as its dependencies have finished, so
+  independent I/O stages overlap
+- Per-stage timeouts and trading safety gates are unchanged
+- On the first failure no new stage starts; stages already
+  running finish (bounded by their timeout)
+- The chain of stages that determined the cycle wall time is
+  reported as CycleResult.critical_path
+
+With max_concurrent_stages=1 the pipeline runs strictly in
+stage order, exactly as before.
+
 ============================================================
 """
 
@@ -18,7 +38,7 @@ import asyncio
 import logging
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
 from dataclasses import dataclass, field
 
 from .models import (
@@ -28,6 +48,7 @@ from .models import (
     CycleResult,
     SafetyContext,
 )
+from .registry import DependencyGraph, ModuleRegistry
 from core.exceptions import (
     TradingException,
     PipelineError,
@@ -36,6 +57,8 @@ from core.exceptions import (
     ErrorClassification,
 )
 from core.clock import ClockFactory
+from monitoring.metrics import MetricsCollector, get_metrics_collector, log_buckets
+from monitoring.tracing import Tracer, get_tracer
 
 
 # ============================================================
@@ -44,6 +67,85 @@ from core.clock import ClockFactory
 
 StageHandler = Callable[[], Awaitable[Dict[str, Any]]]
 
+# Stages that require a passing safety check before they start
+TRADING_STAGES = (
+    ExecutionStage.RUN_STRATEGY,
+    ExecutionStage.RUN_EXECUTION,
+)
+
+# 1ms .. 10min
+PIPELINE_DURATION_BUCKETS = log_buckets(0.001, 600)
+
+
+# ============================================================
+# STAGE GRAPH
+# ============================================================
+
+def build_stage_graph(
+    stages: List[ExecutionStage],
+    registry: Optional[ModuleRegistry] = None,
+) -> Dict[ExecutionStage, Set[ExecutionStage]]:
+    """
+    Resolve the dependencies among the stages that will run.
+    
+    Declared stage dependencies are combined with module ordering
+    from the registry: a stage depends on an earlier stage if one
+    of its modules is, or depends on, a module active there.
+    Dependencies outside `stages` are replaced transitively by
+    their own dependencies.
+    
+    Args:
+        stages: Stages that run this cycle
+        registry: Module registry (optional)
+        
+    Returns:
+        Mapping of stage -> stages in `stages` it must wait for
+        
+    Raises:
+        ValueError: If the dependencies contain a cycle
+    """
+    scheduled = set(stages)
+    
+    modules: Dict[ExecutionStage, Set[str]] = {}
+    if registry is not None:
+        modules = {
+            stage: set(registry.get_modules_for_stage(stage))
+            for stage in ExecutionStage
+        }
+    
+    def direct(stage: ExecutionStage) -> Set[ExecutionStage]:
+        deps = set(stage.dependencies)
+        stage_modules = modules.get(stage, set())
+        if stage_modules:
+            needed = set(stage_modules)
+            for name in stage_modules:
+                needed |= registry.get_dependencies(name)
+            deps |= {
+                other for other in ExecutionStage
+                if other.order < stage.order and modules[other] & needed
+            }
+        return deps
+    
+    resolved: Dict[ExecutionStage, Set[ExecutionStage]] = {}
+    
+    def resolve(stage: ExecutionStage) -> Set[ExecutionStage]:
+        if stage not in resolved:
+            deps: Set[ExecutionStage] = set()
+            for dep in direct(stage):
+                deps |= {dep} if dep in scheduled else resolve(dep)
+            resolved[stage] = deps
+        return resolved[stage]
+    
+    graph = {stage: resolve(stage) for stage in stages}
+    
+    # Cycle check (raises ValueError)
+    check = DependencyGraph()
+    for stage, deps in graph.items():
+        check.add_node(stage.stage_id, [d.stage_id for d in deps])
+    check.get_startup_order()
+    
+    return graph
+
 
 # ============================================================
 # STAGE EXECUTOR
@@ -203,13 +305,14 @@ class StageExecutor:
 
 class ExecutionPipeline:
     """
-    Orchestrates stage execution in strict order.
+    Orchestrates stage execution as a dependency graph.
     
     Features:
-    - Strict ordering enforcement
+    - Dependency ordering enforcement
+    - Concurrent execution of independent stages
     - Failure short-circuit
     - Safety checks before trading stages
-    - Cycle result tracking
+    - Cycle result tracking with critical path
     """
     
     def __init__(
@@ -218,6 +321,10 @@ class ExecutionPipeline:
         handlers: Dict[ExecutionStage, StageHandler],
         safety_checker: Optional[Callable[[], SafetyContext]] = None,
         stage_timeout_seconds: float = 300.0,
+        registry: Optional[ModuleRegistry] = None,
+        max_concurrent_stages: Optional[int] = None,
+        metrics: Optional[MetricsCollector] = None,
+        tracer: Optional[Tracer] = None,
     ):
         """
         Initialize pipeline.
@@ -227,21 +334,56 @@ class ExecutionPipeline:
             handlers: Stage handlers
             safety_checker: Function to check safety context
             stage_timeout_seconds: Default timeout per stage
+            registry: Module registry whose dependencies order stages
+            max_concurrent_stages: Cap on stages running at once
+                                   (None = no cap, 1 = strictly sequential)
+            metrics: Metrics registry (defaults to the process-wide one)
+            tracer: Tracer recording one trace per cycle (defaults to
+                    the process-wide one)
         """
         self.mode = mode
         self._handlers = handlers
         self._safety_checker = safety_checker
         self._stage_timeout = stage_timeout_seconds
+        self._max_concurrent = max_concurrent_stages
+        self._tracer = tracer or get_tracer()
         self._logger = logging.getLogger(__name__)
         
         # Get stages for this mode
         self._stages = ExecutionStage.get_stages_for_mode(mode)
+        
+        # Only stages with a handler take part in the graph
+        runnable = [stage for stage in self._stages if stage in handlers]
+        self._graph = build_stage_graph(runnable, registry)
+        
+        # Metrics
+        metrics = metrics or get_metrics_collector()
+        self._metric_stage_duration = metrics.histogram(
+            "pipeline_stage_duration_seconds", "Stage execution time",
+            labels=("stage",), buckets=PIPELINE_DURATION_BUCKETS,
+        )
+        self._metric_stage_runs = metrics.counter(
+            "pipeline_stage_runs_total", "Stage executions by outcome",
+            labels=("stage", "outcome"),
+        )
+        self._metric_cycle_duration = metrics.histogram(
+            "pipeline_cycle_duration_seconds", "Cycle wall time",
+            buckets=PIPELINE_DURATION_BUCKETS,
+        )
+        self._metric_cycles = metrics.counter(
+            "pipeline_cycles_total", "Cycles by outcome", labels=("outcome",),
+        )
     
     @property
     def stages(self) -> List[ExecutionStage]:
         """Get stages to execute."""
         return self._stages
     
+    @property
+    def stage_graph(self) -> Dict[ExecutionStage, Set[ExecutionStage]]:
+        """Get stage -> dependencies for the stages that run."""
+        return self._graph
+    
     def _generate_cycle_id(self) -> str:
         """Generate a unique cycle ID."""
         return f"cycle_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
@@ -250,11 +392,20 @@ class ExecutionPipeline:
         """
         Execute a complete cycle.
         
+        The cycle is traced under its cycle ID, with one span per stage.
+        
         Returns:
             CycleResult with all stage results
         """
-        clock = ClockFactory.get_clock()
         cycle_id = self._generate_cycle_id()
+        with self._tracer.trace("pipeline.cycle", trace_id=cycle_id, mode=self.mode.value) as span:
+            result = await self._execute_cycle(cycle_id)
+            span.set(success=result.success, stages_completed=result.stages_completed)
+            return result
+    
+    async def _execute_cycle(self, cycle_id: str) -> CycleResult:
+        """Run the stage graph of one cycle."""
+        clock = ClockFactory.get_clock()
         
         result = CycleResult(
             cycle_id=cycle_id,
@@ -268,54 +419,124 @@ class ExecutionPipeline:
         )
         
         for stage in self._stages:
-            # Check if we have a handler
-            handler = self._handlers.get(stage)
-            if not handler:
+            if stage not in self._graph:
                 self._logger.debug(f"No handler for stage: {stage.stage_id}")
-                continue
-            
-            # Safety check before trading stages
-            if stage in (
-                ExecutionStage.RUN_STRATEGY,
-                ExecutionStage.RUN_EXECUTION,
-            ):
-                if not await self._check_safety_for_trading(stage):
-                    self._logger.warning(
-                        f"Safety check failed for {stage.stage_id}, skipping"
-                    )
-                    continue
-            
-            # Execute stage
-            executor = StageExecutor(
-                stage=stage,
-                handler=handler,
-                timeout_seconds=self._stage_timeout,
-            )
-            
-            stage_result = await executor.execute()
-            result.add_stage_result(stage_result)
+        
+        pending = sorted(self._graph, key=lambda s: s.order)
+        finished: Set[ExecutionStage] = set()
+        running: Dict[asyncio.Task, ExecutionStage] = {}
+        limit = self._max_concurrent or len(pending) or 1
+        aborted = False
+        
+        try:
+            while pending or running:
+                # Start every stage whose dependencies are done
+                if not aborted:
+                    for stage in list(pending):
+                        if len(running) >= limit:
+                            break
+                        if self._graph[stage] <= finished:
+                            pending.remove(stage)
+                            running[asyncio.create_task(self._run_stage(stage))] = stage
+                
+                if not running:
+                    break
+                
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=lambda t: running[t].order):
+                    stage = running.pop(task)
+                    stage_result = task.result()
+                    finished.add(stage)
+                    if stage_result is None:
+                        continue  # Skipped by safety gate
+                    
+                    result.add_stage_result(stage_result)
+                    
+                    # Short-circuit on failure
+                    if not stage_result.success and not aborted:
+                        aborted = True
+                        self._logger.error(
+                            f"=== CYCLE ABORTED: {cycle_id} | "
+                            f"failed_stage={stage.stage_id} ==="
+                        )
             
-            # Short-circuit on failure
-            if not stage_result.success:
-                self._logger.error(
-                    f"=== CYCLE ABORTED: {cycle_id} | "
-                    f"failed_stage={stage.stage_id} ==="
-                )
-                result.completed_at = clock.now()
-                result.success = False
-                return result
+        finally:
+            # A cancelled cycle (stop / emergency stop) must not leave
+            # stages such as RUN_EXECUTION running in the background
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
         
+        result.stage_results.sort(key=lambda r: r.stage.order)
+        result.critical_path = self._critical_path(result.stage_results)
         result.completed_at = clock.now()
+        self._metric_cycle_duration.observe(result.duration_seconds)
+        
+        if aborted:
+            result.success = False
+            self._metric_cycles.labels("aborted").inc()
+            return result
+        
         result.success = True
+        self._metric_cycles.labels("success").inc()
         
         self._logger.info(
             f"=== CYCLE COMPLETE: {cycle_id} | "
             f"duration={result.duration_seconds:.2f}s | "
-            f"stages_completed={result.stages_completed} ==="
+            f"stages_completed={result.stages_completed} | "
+            f"critical_path={'>'.join(s.stage_id for s in result.critical_path)} ==="
         )
         
         return result
     
+    async def _run_stage(self, stage: ExecutionStage) -> Optional[StageResult]:
+        """Run one stage; None if a safety gate skipped it."""
+        # Safety check before trading stages
+        if stage in TRADING_STAGES:
+            if not await self._check_safety_for_trading(stage):
+                self._logger.warning(
+                    f"Safety check failed for {stage.stage_id}, skipping"
+                )
+                return None
+        
+        executor = StageExecutor(
+            stage=stage,
+            handler=self._handlers[stage],
+            timeout_seconds=self._stage_timeout,
+        )
+        with self._tracer.span(f"stage.{stage.stage_id}") as span:
+            stage_result = await executor.execute()
+            span.set(success=stage_result.success)
+        
+        self._metric_stage_duration.labels(stage.stage_id).observe(stage_result.duration_seconds)
+        self._metric_stage_runs.labels(
+            stage.stage_id, "success" if stage_result.success else "failure"
+        ).inc()
+        return stage_result
+    
+    def _critical_path(self, results: List[StageResult]) -> List[ExecutionStage]:
+        """
+        Chain of stages that determined the cycle wall time.
+        
+        Starting from the stage that finished last, repeatedly step to
+        the dependency that finished last (the one it waited for).
+        """
+        by_stage = {r.stage: r for r in results}
+        if not by_stage:
+            return []
+        
+        current = max(results, key=lambda r: (r.completed_at, r.stage.order)).stage
+        path = [current]
+        while True:
+            deps = [by_stage[d] for d in self._graph.get(current, ()) if d in by_stage]
+            if not deps:
+                break
+            current = max(deps, key=lambda r: (r.completed_at, r.stage.order)).stage
+            path.append(current)
+        
+        return list(reversed(path))
+    
     async def _check_safety_for_trading(self, stage: ExecutionStage) -> bool:
         """
         Check if it's safe to proceed with trading stages.
@@ -397,6 +618,8 @@ class PipelineBuilder:
         self._handlers: Dict[ExecutionStage, StageHandler] = {}
         self._safety_checker: Optional[Callable[[], SafetyContext]] = None
         self._stage_timeout = 300.0
+        self._registry: Optional[ModuleRegistry] = None
+        self._max_concurrent: Optional[int] = None
     
     def with_handler(
         self,
@@ -428,6 +651,16 @@ class PipelineBuilder:
         self._stage_timeout = timeout_seconds
         return self
     
+    def with_module_registry(self, registry: ModuleRegistry) -> "PipelineBuilder":
+        """Order stages by module dependencies as well."""
+        self._registry = registry
+        return self
+    
+    def with_max_concurrent_stages(self, limit: Optional[int]) -> "PipelineBuilder":
+        """Cap concurrently running stages (1 = strictly sequential)."""
+        self._max_concurrent = limit
+        return self
+    
     def build(self) -> ExecutionPipeline:
         """Build the pipeline."""
         return ExecutionPipeline(
@@ -435,6 +668,8 @@ class PipelineBuilder:
             handlers=self._handlers,
             safety_checker=self._safety_checker,
             stage_timeout_seconds=self._stage_timeout,
+            registry=self._registry,
+            max_concurrent_stages=self._max_concurrent,
         )
 
 
@@ -518,6 +753,8 @@ class CycleHistory:
 
 __all__ = [
     "StageHandler",
+    "TRADING_STAGES",
+    "build_stage_graph",
     "StageExecutor",
     "ExecutionPipeline",
     "PipelineBuilder",
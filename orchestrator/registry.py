@@ -132,6 +132,10 @@ class DependencyGraph:
         """Get modules in shutdown order (reverse of startup)."""
         return list(reversed(self.get_startup_order()))
     
+    def get_dependencies(self, name: str) -> Set[str]:
+        """Get modules the given module depends on."""
+        return set(self._edges.get(name, set()))
+    
     def get_dependents(self, name: str) -> Set[str]:
         """Get modules that depend on the given module."""
         dependents = set()
@@ -277,6 +281,10 @@ class ModuleRegistry:
         """Get modules in shutdown order."""
         return list(reversed(self.get_startup_order()))
     
+    def get_dependencies(self, name: str) -> Set[str]:
+        """Get registered modules the given module depends on."""
+        return {m for m in self._graph.get_dependencies(name) if m in self._definitions}
+    
     def get_modules_for_stage(self, stage: ExecutionStage) -> List[str]:
         """Get modules active in a given stage."""
         return [
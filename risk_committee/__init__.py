@@ -47,6 +47,8 @@ from .types import (
     CommitteeReport,
 )
 
+from .snapshot import CommitteeSnapshot, CommitteeSnapshotLoader
+
 from .reviewers import (
     BaseReviewer,
     DataIntegrityReviewer,
@@ -75,6 +77,10 @@ __all__ = [
     "CapitalSafetyReport",
     "CommitteeReport",
     
+    # Snapshot
+    "CommitteeSnapshot",
+    "CommitteeSnapshotLoader",
+    
     # Reviewers
     "BaseReviewer",
     "DataIntegrityReviewer",
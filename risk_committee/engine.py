@@ -17,11 +17,19 @@ AUTHORITY:
 - HOLD → freeze new trades, allow monitoring
 - BLOCK → trigger System Risk Controller global halt
 
+============================================================
+CONCURRENCY
+============================================================
+The data every reviewer reads is loaded once per session into
+an immutable CommitteeSnapshot; the four reviewers then run
+concurrently on the executor against that snapshot.
+
 ============================================================
 """
 
 import logging
 import time
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 
@@ -36,6 +44,7 @@ from .types import (
     ExecutionQualityReport,
     CapitalSafetyReport,
 )
+from .snapshot import CommitteeSnapshotLoader
 from .reviewers import (
     DataIntegrityReviewer,
     MarketRiskReviewer,
@@ -69,6 +78,7 @@ class RiskCommitteeEngine:
         self,
         session: Optional[Session] = None,
         config: Optional[Dict[str, Any]] = None,
+        executor: Optional[Executor] = None,
     ):
         """
         Initialize Risk Committee Engine.
@@ -76,10 +86,14 @@ class RiskCommitteeEngine:
         Args:
             session: SQLAlchemy session (optional, will create if None)
             config: Configuration dictionary
+            executor: Executor the reviewers run on (optional, a
+                four-thread pool is created if None)
         """
         self._session = session
         self._owns_session = session is None
         self._config = config or {}
+        self._executor = executor
+        self._owns_executor = executor is None
         
         # Extract configuration
         self._max_data_age = self._config.get("max_data_age_seconds", 7200.0)
@@ -87,6 +101,8 @@ class RiskCommitteeEngine:
         self._high_volatility_threshold = self._config.get("high_volatility_threshold", 80.0)
         self._max_slippage_bps = self._config.get("max_slippage_bps", 50.0)
         self._max_drawdown_pct = self._config.get("max_drawdown_pct", 10.0)
+        # "records" (aggregate over execution_records) or "rollup" (hourly buckets)
+        self._execution_metrics_source = self._config.get("execution_metrics_source", "records")
         
         self._initialized = False
         logger.info("RiskCommitteeEngine initialized")
@@ -103,6 +119,21 @@ class RiskCommitteeEngine:
         if self._owns_session and self._session:
             self._session.close()
             self._session = None
+
+    def _get_executor(self) -> Executor:
+        """Get reviewer executor."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=4, thread_name_prefix="risk-committee"
+            )
+            self._owns_executor = True
+        return self._executor
+
+    def _close_executor(self):
+        """Shut the executor down if we own it."""
+        if self._owns_executor and self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
     
     # ============================================================
     # MODULE PROTOCOL
@@ -116,6 +147,7 @@ class RiskCommitteeEngine:
     async def stop(self) -> None:
         """Stop the committee engine."""
         self._close_session()
+        self._close_executor()
         self._initialized = False
         logger.info("RiskCommitteeEngine stopped")
     
@@ -138,7 +170,8 @@ class RiskCommitteeEngine:
         """
         Convene the risk committee and produce a decision.
         
-        All four reviewers are consulted:
+        All four reviewers are consulted concurrently, against
+        one snapshot of the data they read:
         1. Data Integrity Reviewer
         2. Market Risk Reviewer
         3. Execution Quality Reviewer
@@ -166,34 +199,45 @@ class RiskCommitteeEngine:
         )
         
         try:
-            # 1. Data Integrity Review
-            data_reviewer = DataIntegrityReviewer(
-                session=session,
-                max_data_age_seconds=self._max_data_age,
-                expected_sources=self._expected_sources,
-            )
-            report.data_integrity = data_reviewer.review(correlation_id)
-            
-            # 2. Market Risk Review
-            market_reviewer = MarketRiskReviewer(
-                session=session,
-                high_volatility_threshold=self._high_volatility_threshold,
-            )
-            report.market_risk = market_reviewer.review(correlation_id)
-            
-            # 3. Execution Quality Review
-            execution_reviewer = ExecutionQualityReviewer(
-                session=session,
-                max_slippage_bps=self._max_slippage_bps,
-            )
-            report.execution_quality = execution_reviewer.review(correlation_id)
-            
-            # 4. Capital Preservation Review
-            capital_reviewer = CapitalPreservationReviewer(
-                session=session,
-                max_drawdown_pct=self._max_drawdown_pct,
-            )
-            report.capital_safety = capital_reviewer.review(correlation_id)
+            # Shared read snapshot (the only queries of the review)
+            snapshot = CommitteeSnapshotLoader(
+                session,
+                self._expected_sources,
+                execution_source=self._execution_metrics_source,
+            ).load()
+
+            reviewers = [
+                DataIntegrityReviewer(
+                    session=session,
+                    max_data_age_seconds=self._max_data_age,
+                    expected_sources=self._expected_sources,
+                ),
+                MarketRiskReviewer(
+                    session=session,
+                    high_volatility_threshold=self._high_volatility_threshold,
+                ),
+                ExecutionQualityReviewer(
+                    session=session,
+                    max_slippage_bps=self._max_slippage_bps,
+                ),
+                CapitalPreservationReviewer(
+                    session=session,
+                    max_drawdown_pct=self._max_drawdown_pct,
+                ),
+            ]
+
+            # 1-4. Reviews, concurrently
+            executor = self._get_executor()
+            futures = [
+                executor.submit(reviewer.review, correlation_id, snapshot)
+                for reviewer in reviewers
+            ]
+            (
+                report.data_integrity,
+                report.market_risk,
+                report.execution_quality,
+                report.capital_safety,
+            ) = [future.result() for future in futures]
             
             # 5. Committee Decision
             self._make_committee_decision(report)
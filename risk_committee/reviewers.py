@@ -11,20 +11,28 @@ COMMITTEE COMPOSITION
 
 Each reviewer operates INDEPENDENTLY and produces an EXPLICIT verdict.
 
+Reviewers read a CommitteeSnapshot (see snapshot.py) and never
+query the session while reviewing. Given no snapshot, a reviewer
+loads the parts it needs itself.
+
 ============================================================
 """
 
 import logging
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, FrozenSet, Tuple
 
-from sqlalchemy import func, desc
 from sqlalchemy.orm import Session
 
-from database.models import (
-    MarketData, RiskState, ExecutionRecord,
-    SystemMonitoring, MarketState, PositionSizing,
+from .snapshot import (
+    CommitteeSnapshot,
+    CommitteeSnapshotLoader,
+    MARKET_DATA,
+    MARKET_STATE,
+    RISK_STATE,
+    EXECUTIONS,
+    POSITION_SIZING,
+    MONITORING,
 )
 from .types import (
     ReviewerType,
@@ -57,6 +65,9 @@ class BaseReviewer(ABC):
     - Provides detailed reasoning
     """
     
+    # Snapshot parts the reviewer reads
+    snapshot_parts: FrozenSet[str] = frozenset()
+
     def __init__(self, session: Session):
         """
         Initialize reviewer with database session.
@@ -74,17 +85,34 @@ class BaseReviewer(ABC):
         pass
     
     @abstractmethod
-    def review(self, correlation_id: str) -> Any:
+    def review(
+        self,
+        correlation_id: str,
+        snapshot: Optional[CommitteeSnapshot] = None,
+    ) -> Any:
         """
         Perform review and return report.
         
         Args:
             correlation_id: Current cycle correlation ID
+            snapshot: Committee data snapshot (loaded if None)
             
         Returns:
             Specific report type for this reviewer
         """
         pass
+
+    def _snapshot_loader(self) -> CommitteeSnapshotLoader:
+        return CommitteeSnapshotLoader(self._session)
+
+    def _resolve_snapshot(self, snapshot: Optional[CommitteeSnapshot]) -> CommitteeSnapshot:
+        """Given snapshot, or the parts this reviewer reads loaded now."""
+        if snapshot is not None:
+            missing = self.snapshot_parts - snapshot.parts
+            if missing:
+                raise ValueError(f"Snapshot lacks parts: {sorted(missing)}")
+            return snapshot
+        return self._snapshot_loader().load(self.snapshot_parts)
     
     def _create_verdict(
         self,
@@ -118,6 +146,8 @@ class DataIntegrityReviewer(BaseReviewer):
     - Any missing ingestion cycles?
     """
     
+    snapshot_parts = frozenset({MARKET_DATA})
+
     def __init__(
         self,
         session: Session,
@@ -140,33 +170,40 @@ class DataIntegrityReviewer(BaseReviewer):
     def reviewer_type(self) -> ReviewerType:
         return ReviewerType.DATA_INTEGRITY
     
-    def review(self, correlation_id: str) -> DataIntegrityReport:
+    def _snapshot_loader(self) -> CommitteeSnapshotLoader:
+        return CommitteeSnapshotLoader(self._session, self._expected_sources)
+
+    def review(
+        self,
+        correlation_id: str,
+        snapshot: Optional[CommitteeSnapshot] = None,
+    ) -> DataIntegrityReport:
         """Perform data integrity review."""
         self._logger.info(f"Starting data integrity review | correlation_id={correlation_id}")
         
-        now = datetime.utcnow()
+        snapshot = self._resolve_snapshot(snapshot)
         details = []
         evidence = {}
         metrics = {}
         
         # 1. Check price data freshness
-        prices_realtime, oldest_age, source_freshness = self._check_price_freshness(now)
+        prices_realtime, oldest_age, source_freshness = self._check_price_freshness(snapshot)
         evidence["source_freshness"] = source_freshness
         metrics["oldest_data_age_seconds"] = oldest_age
         
         # 2. Check for mock/placeholder data
-        mock_detected = self._check_for_mocks()
+        mock_detected = snapshot.mock_rows > 0
         evidence["mock_check"] = {"detected": mock_detected}
         
         # 3. Check data freshness overall
         data_freshness_ok = oldest_age <= self._max_data_age
         
         # 4. Check for missing ingestion cycles
-        missing_cycles = self._count_missing_cycles(now)
+        missing_cycles = self._count_missing_cycles(snapshot)
         metrics["missing_cycles"] = float(missing_cycles)
         
         # 5. Get source statuses
-        source_statuses = self._get_source_statuses()
+        source_statuses = self._get_source_statuses(source_freshness)
         evidence["source_statuses"] = source_statuses
         
         # Determine status
@@ -222,22 +259,18 @@ class DataIntegrityReviewer(BaseReviewer):
         )
     
     def _check_price_freshness(
-        self, now: datetime
+        self, snapshot: CommitteeSnapshot
     ) -> Tuple[bool, float, Dict[str, float]]:
         """Check price data freshness by source."""
         source_freshness = {}
         oldest_age = 0.0
         
-        # Get latest data per exchange
+        # Latest data per exchange
         for source in self._expected_sources:
-            latest = (
-                self._session.query(func.max(MarketData.created_at))
-                .filter(MarketData.exchange.ilike(f"%{source}%"))
-                .scalar()
-            )
+            latest = snapshot.latest_for_source(source)
             
             if latest:
-                age = (now - latest).total_seconds()
+                age = (snapshot.taken_at - latest).total_seconds()
                 source_freshness[source] = age
                 oldest_age = max(oldest_age, age)
             else:
@@ -247,58 +280,24 @@ class DataIntegrityReviewer(BaseReviewer):
         prices_realtime = oldest_age <= self._max_data_age
         return prices_realtime, oldest_age, source_freshness
     
-    def _check_for_mocks(self) -> bool:
-        """Check for mock/placeholder data in system."""
-        # Check for mock markers in recent data
-        recent_cutoff = datetime.utcnow() - timedelta(hours=24)
-        
-        # Look for "mock", "test", "placeholder" in source_module
-        mock_count = (
-            self._session.query(func.count(MarketData.id))
-            .filter(MarketData.created_at >= recent_cutoff)
-            .filter(
-                MarketData.source_module.ilike("%mock%") |
-                MarketData.source_module.ilike("%test%") |
-                MarketData.source_module.ilike("%placeholder%") |
-                MarketData.source_module.ilike("%fake%")
-            )
-            .scalar()
-        )
-        
-        return mock_count > 0
-    
-    def _count_missing_cycles(self, now: datetime) -> int:
+    def _count_missing_cycles(self, snapshot: CommitteeSnapshot) -> int:
         """Count missing ingestion cycles in last 24 hours."""
         # Expected: 1 cycle per hour
         expected_cycles = 24
         
-        # Count actual cycles
-        actual_cycles = (
-            self._session.query(
-                func.count(func.distinct(MarketData.correlation_id))
-            )
-            .filter(MarketData.created_at >= now - timedelta(hours=24))
-            .scalar()
-        )
-        
-        missing = max(0, expected_cycles - (actual_cycles or 0))
+        missing = max(0, expected_cycles - snapshot.ingestion_cycles)
         return missing
     
-    def _get_source_statuses(self) -> Dict[str, str]:
+    def _get_source_statuses(self, source_freshness: Dict[str, float]) -> Dict[str, str]:
         """Get status for each data source."""
         statuses = {}
-        now = datetime.utcnow()
         
         for source in self._expected_sources:
-            latest = (
-                self._session.query(func.max(MarketData.created_at))
-                .filter(MarketData.exchange.ilike(f"%{source}%"))
-                .scalar()
-            )
+            age = source_freshness[source]
             
-            if not latest:
+            if age == float("inf"):
                 statuses[source] = "MISSING"
-            elif (now - latest).total_seconds() > self._max_data_age:
+            elif age > self._max_data_age:
                 statuses[source] = "STALE"
             else:
                 statuses[source] = "OK"
@@ -318,6 +317,8 @@ class MarketRiskReviewer(BaseReviewer):
     - Abnormal flow/sentiment
     - Market state consistency
     """
+
+    snapshot_parts = frozenset({MARKET_DATA, MARKET_STATE, RISK_STATE})
     
     def __init__(
         self,
@@ -341,30 +342,35 @@ class MarketRiskReviewer(BaseReviewer):
     def reviewer_type(self) -> ReviewerType:
         return ReviewerType.MARKET_RISK
     
-    def review(self, correlation_id: str) -> MarketRiskReport:
+    def review(
+        self,
+        correlation_id: str,
+        snapshot: Optional[CommitteeSnapshot] = None,
+    ) -> MarketRiskReport:
         """Perform market risk review."""
         self._logger.info(f"Starting market risk review | correlation_id={correlation_id}")
         
+        snapshot = self._resolve_snapshot(snapshot)
         details = []
         evidence = {}
         metrics = {}
         
         # 1. Assess volatility regime
-        volatility_regime, vol_percentile = self._assess_volatility()
+        volatility_regime, vol_percentile = self._assess_volatility(snapshot)
         metrics["volatility_percentile"] = vol_percentile
         evidence["volatility"] = {"regime": volatility_regime, "percentile": vol_percentile}
         
         # 2. Assess liquidity conditions
-        liquidity_condition = self._assess_liquidity()
+        liquidity_condition = self._assess_liquidity(snapshot)
         evidence["liquidity"] = {"condition": liquidity_condition}
         
         # 3. Assess flow/sentiment risk
-        flow_risk = self._assess_flow_risk()
-        sentiment_risk = self._assess_sentiment_risk()
+        flow_risk = self._assess_flow_risk(snapshot)
+        sentiment_risk = self._assess_sentiment_risk(snapshot)
         evidence["flow_sentiment"] = {"flow": flow_risk, "sentiment": sentiment_risk}
         
         # 4. Check market state consistency
-        consistency_score, cycles_analyzed = self._check_state_consistency()
+        consistency_score, cycles_analyzed = self._check_state_consistency(snapshot)
         metrics["state_consistency_score"] = consistency_score
         metrics["cycles_analyzed"] = float(cycles_analyzed)
         
@@ -430,15 +436,9 @@ class MarketRiskReviewer(BaseReviewer):
             cycles_analyzed=cycles_analyzed,
         )
     
-    def _assess_volatility(self) -> Tuple[str, float]:
+    def _assess_volatility(self, snapshot: CommitteeSnapshot) -> Tuple[str, float]:
         """Assess current volatility regime."""
-        # Get recent market states
-        recent = (
-            self._session.query(MarketState)
-            .order_by(desc(MarketState.created_at))
-            .limit(10)
-            .all()
-        )
+        recent = snapshot.market_states
         
         if not recent:
             return "UNKNOWN", 50.0
@@ -447,7 +447,7 @@ class MarketRiskReviewer(BaseReviewer):
         latest = recent[0]
         
         # Try to get volatility from regime or components
-        regime = getattr(latest, "volatility_regime", None)
+        regime = latest.volatility_regime
         if regime:
             regime_map = {
                 "low": ("LOW", 20.0),
@@ -458,7 +458,7 @@ class MarketRiskReviewer(BaseReviewer):
             return regime_map.get(str(regime).lower(), ("NORMAL", 50.0))
         
         # Default based on risk scores
-        risk_score = getattr(latest, "risk_score", 50.0)
+        risk_score = latest.risk_score
         if risk_score is None:
             risk_score = 50.0
         
@@ -471,21 +471,16 @@ class MarketRiskReviewer(BaseReviewer):
         else:
             return "LOW", 20.0
     
-    def _assess_liquidity(self) -> str:
+    def _assess_liquidity(self, snapshot: CommitteeSnapshot) -> str:
         """Assess current liquidity conditions."""
-        # Get recent market data for volume analysis
-        recent = (
-            self._session.query(MarketData)
-            .order_by(desc(MarketData.created_at))
-            .limit(100)
-            .all()
-        )
+        # Recent market data volumes
+        recent = snapshot.recent_volumes
         
         if not recent:
             return "UNKNOWN"
         
         # Calculate average volume
-        volumes = [m.volume for m in recent if m.volume]
+        volumes = [volume for volume in recent if volume]
         if not volumes:
             return "UNKNOWN"
         
@@ -502,20 +497,16 @@ class MarketRiskReviewer(BaseReviewer):
         else:
             return "GOOD"
     
-    def _assess_flow_risk(self) -> str:
+    def _assess_flow_risk(self, snapshot: CommitteeSnapshot) -> str:
         """Assess flow risk from recent data."""
-        # Get latest risk state
-        latest = (
-            self._session.query(RiskState)
-            .order_by(desc(RiskState.created_at))
-            .first()
-        )
+        # Latest risk state
+        latest = snapshot.risk_state
         
         if not latest:
             return "NEUTRAL"
         
         # Check flow score
-        flow_score = getattr(latest, "flow_score", None)
+        flow_score = latest.flow_score
         if flow_score is None:
             return "NEUTRAL"
         
@@ -526,18 +517,14 @@ class MarketRiskReviewer(BaseReviewer):
         else:
             return "NEUTRAL"
     
-    def _assess_sentiment_risk(self) -> str:
+    def _assess_sentiment_risk(self, snapshot: CommitteeSnapshot) -> str:
         """Assess sentiment risk from recent data."""
-        latest = (
-            self._session.query(RiskState)
-            .order_by(desc(RiskState.created_at))
-            .first()
-        )
+        latest = snapshot.risk_state
         
         if not latest:
             return "NEUTRAL"
         
-        sentiment_score = getattr(latest, "sentiment_score", None)
+        sentiment_score = latest.sentiment_score
         if sentiment_score is None:
             return "NEUTRAL"
         
@@ -548,15 +535,10 @@ class MarketRiskReviewer(BaseReviewer):
         else:
             return "NEUTRAL"
     
-    def _check_state_consistency(self) -> Tuple[float, int]:
+    def _check_state_consistency(self, snapshot: CommitteeSnapshot) -> Tuple[float, int]:
         """Check market state consistency over recent cycles."""
-        # Get recent market states
-        recent = (
-            self._session.query(MarketState)
-            .order_by(desc(MarketState.created_at))
-            .limit(24)  # Last 24 hours worth
-            .all()
-        )
+        # Last 24 market states
+        recent = snapshot.market_states
         
         if len(recent) < 2:
             return 100.0, len(recent)
@@ -564,8 +546,8 @@ class MarketRiskReviewer(BaseReviewer):
         # Calculate consistency based on regime stability
         regime_changes = 0
         for i in range(1, len(recent)):
-            curr = getattr(recent[i-1], "volatility_regime", "unknown")
-            prev = getattr(recent[i], "volatility_regime", "unknown")
+            curr = recent[i-1].volatility_regime
+            prev = recent[i].volatility_regime
             if curr != prev:
                 regime_changes += 1
         
@@ -588,6 +570,8 @@ class ExecutionQualityReviewer(BaseReviewer):
     - Fill consistency
     - Execution anomalies
     """
+
+    snapshot_parts = frozenset({EXECUTIONS})
     
     def __init__(
         self,
@@ -614,7 +598,11 @@ class ExecutionQualityReviewer(BaseReviewer):
     def reviewer_type(self) -> ReviewerType:
         return ReviewerType.EXECUTION_QUALITY
     
-    def review(self, correlation_id: str) -> ExecutionQualityReport:
+    def review(
+        self,
+        correlation_id: str,
+        snapshot: Optional[CommitteeSnapshot] = None,
+    ) -> ExecutionQualityReport:
         """Perform execution quality review."""
         self._logger.info(f"Starting execution quality review | correlation_id={correlation_id}")
         
@@ -623,16 +611,10 @@ class ExecutionQualityReviewer(BaseReviewer):
         metrics = {}
         anomalies = []
         
-        # Get recent executions
-        lookback = datetime.utcnow() - timedelta(hours=24)
-        executions = (
-            self._session.query(ExecutionRecord)
-            .filter(ExecutionRecord.created_at >= lookback)
-            .order_by(desc(ExecutionRecord.created_at))
-            .all()
-        )
+        # Execution quality of the last 24 hours (aggregated in SQL)
+        stats = self._resolve_snapshot(snapshot).execution_stats
         
-        orders_analyzed = len(executions)
+        orders_analyzed = stats.orders
         metrics["orders_analyzed"] = float(orders_analyzed)
         
         if orders_analyzed == 0:
@@ -651,13 +633,8 @@ class ExecutionQualityReviewer(BaseReviewer):
             )
         
         # 1. Analyze slippage
-        slippage_values = [
-            e.slippage_percent * 100 for e in executions 
-            if e.slippage_percent is not None
-        ]
-        
-        avg_slippage = sum(slippage_values) / len(slippage_values) if slippage_values else 0
-        max_slippage = max(slippage_values) if slippage_values else 0
+        avg_slippage = stats.avg_slippage_bps
+        max_slippage = stats.max_slippage_bps
         metrics["avg_slippage_bps"] = avg_slippage
         metrics["max_slippage_bps"] = max_slippage
         
@@ -665,11 +642,8 @@ class ExecutionQualityReviewer(BaseReviewer):
             anomalies.append(f"Extreme slippage: {max_slippage:.1f} bps")
         
         # 2. Analyze latency
-        latency_values = [e.latency_ms for e in executions if e.latency_ms is not None]
-        
-        avg_latency = sum(latency_values) / len(latency_values) if latency_values else 0
-        sorted_latencies = sorted(latency_values)
-        p99_latency = sorted_latencies[int(len(sorted_latencies) * 0.99)] if latency_values else 0
+        avg_latency = stats.avg_latency_ms
+        p99_latency = stats.p99_latency_ms
         
         metrics["avg_latency_ms"] = avg_latency
         metrics["p99_latency_ms"] = p99_latency
@@ -680,9 +654,9 @@ class ExecutionQualityReviewer(BaseReviewer):
             anomalies.append(f"High latency: p99={p99_latency:.0f}ms")
         
         # 3. Analyze fill rate
-        filled = sum(1 for e in executions if e.status == "filled")
-        partial = sum(1 for e in executions if e.status == "partial")
-        rejected = sum(1 for e in executions if e.status in ("rejected", "failed", "cancelled"))
+        filled = stats.filled
+        partial = stats.partial
+        rejected = stats.rejected
         
         fill_rate = (filled / orders_analyzed * 100) if orders_analyzed > 0 else 100
         metrics["fill_rate"] = fill_rate
@@ -756,6 +730,8 @@ class CapitalPreservationReviewer(BaseReviewer):
     - Position sizing consistency
     """
     
+    snapshot_parts = frozenset({RISK_STATE, POSITION_SIZING, MONITORING})
+
     def __init__(
         self,
         session: Session,
@@ -781,17 +757,22 @@ class CapitalPreservationReviewer(BaseReviewer):
     def reviewer_type(self) -> ReviewerType:
         return ReviewerType.CAPITAL_PRESERVATION
     
-    def review(self, correlation_id: str) -> CapitalSafetyReport:
+    def review(
+        self,
+        correlation_id: str,
+        snapshot: Optional[CommitteeSnapshot] = None,
+    ) -> CapitalSafetyReport:
         """Perform capital safety review."""
         self._logger.info(f"Starting capital safety review | correlation_id={correlation_id}")
         
+        snapshot = self._resolve_snapshot(snapshot)
         details = []
         evidence = {}
         metrics = {}
         rule_violations = []
         
         # 1. Check drawdown status
-        current_drawdown, drawdown_breached = self._check_drawdown()
+        current_drawdown, drawdown_breached = self._check_drawdown(snapshot)
         metrics["current_drawdown_pct"] = current_drawdown
         evidence["drawdown"] = {
             "current": current_drawdown,
@@ -800,7 +781,7 @@ class CapitalPreservationReviewer(BaseReviewer):
         }
         
         # 2. Check risk budget
-        risk_used, risk_remaining, budget_respected = self._check_risk_budget()
+        risk_used, risk_remaining, budget_respected = self._check_risk_budget(snapshot)
         metrics["risk_budget_used_pct"] = risk_used
         metrics["risk_budget_remaining_pct"] = risk_remaining
         evidence["risk_budget"] = {
@@ -810,14 +791,14 @@ class CapitalPreservationReviewer(BaseReviewer):
         }
         
         # 3. Check for override attempts
-        override_attempts = self._count_override_attempts()
+        override_attempts = snapshot.override_attempts
         metrics["override_attempts"] = float(override_attempts)
         
         if override_attempts > 0:
             rule_violations.append(f"{override_attempts} rule override attempts detected")
         
         # 4. Check position sizing consistency
-        position_consistent, max_position, current_exposure = self._check_position_sizing()
+        position_consistent, max_position, current_exposure = self._check_position_sizing(snapshot)
         metrics["max_position_size_pct"] = max_position
         metrics["current_exposure_pct"] = current_exposure
         evidence["position_sizing"] = {
@@ -886,20 +867,16 @@ class CapitalPreservationReviewer(BaseReviewer):
             current_exposure_pct=current_exposure,
         )
     
-    def _check_drawdown(self) -> Tuple[float, bool]:
+    def _check_drawdown(self, snapshot: CommitteeSnapshot) -> Tuple[float, bool]:
         """Check current drawdown status."""
-        # Get latest risk state
-        latest = (
-            self._session.query(RiskState)
-            .order_by(desc(RiskState.created_at))
-            .first()
-        )
+        # Latest risk state
+        latest = snapshot.risk_state
         
         if not latest:
             return 0.0, False
         
         # Try to get drawdown from risk state
-        current_drawdown = getattr(latest, "current_drawdown", 0.0)
+        current_drawdown = latest.current_drawdown
         if current_drawdown is None:
             current_drawdown = 0.0
         
@@ -910,21 +887,16 @@ class CapitalPreservationReviewer(BaseReviewer):
         breached = current_drawdown > self._max_drawdown
         return current_drawdown, breached
     
-    def _check_risk_budget(self) -> Tuple[float, float, bool]:
+    def _check_risk_budget(self, snapshot: CommitteeSnapshot) -> Tuple[float, float, bool]:
         """Check risk budget usage."""
-        # Get latest position sizing data
-        latest = (
-            self._session.query(PositionSizing)
-            .order_by(desc(PositionSizing.created_at))
-            .first()
-        )
-        
-        if not latest:
+        # Latest position sizing data
+        if not snapshot.position_sizings:
             return 0.0, 100.0, True
+        latest = snapshot.position_sizings[0]
         
         # Calculate budget usage from current exposure
-        exposure = getattr(latest, "current_exposure", 0.0)
-        portfolio = getattr(latest, "portfolio_value", 1.0)
+        exposure = latest.current_exposure
+        portfolio = latest.portfolio_value
         
         if portfolio and portfolio > 0:
             risk_used = (exposure / portfolio) * 100
@@ -936,32 +908,10 @@ class CapitalPreservationReviewer(BaseReviewer):
         
         return risk_used, risk_remaining, budget_respected
     
-    def _count_override_attempts(self) -> int:
-        """Count rule override attempts in system monitoring."""
-        lookback = datetime.utcnow() - timedelta(hours=24)
-        
-        count = (
-            self._session.query(func.count(SystemMonitoring.id))
-            .filter(SystemMonitoring.event_time >= lookback)
-            .filter(
-                SystemMonitoring.message.ilike("%override%") |
-                SystemMonitoring.message.ilike("%bypass%") |
-                SystemMonitoring.message.ilike("%violation%")
-            )
-            .scalar()
-        )
-        
-        return count or 0
-    
-    def _check_position_sizing(self) -> Tuple[bool, float, float]:
+    def _check_position_sizing(self, snapshot: CommitteeSnapshot) -> Tuple[bool, float, float]:
         """Check position sizing consistency."""
-        # Get recent position sizings
-        recent = (
-            self._session.query(PositionSizing)
-            .order_by(desc(PositionSizing.created_at))
-            .limit(10)
-            .all()
-        )
+        # Last 10 position sizings
+        recent = snapshot.position_sizings
         
         if not recent:
             return True, 0.0, 0.0
@@ -976,8 +926,8 @@ class CapitalPreservationReviewer(BaseReviewer):
         
         # Check current exposure
         latest = recent[0]
-        current_exposure = getattr(latest, "current_exposure", 0.0) or 0.0
-        portfolio = getattr(latest, "portfolio_value", 1.0) or 1.0
+        current_exposure = latest.current_exposure or 0.0
+        portfolio = latest.portfolio_value or 1.0
         
         exposure_pct = (current_exposure / portfolio * 100) if portfolio > 0 else 0.0
         
@@ -0,0 +1,280 @@
+"""
+Risk Committee - Shared Data Snapshot.
+
+============================================================
+PURPOSE
+============================================================
+Loads everything the four reviewers read in a few aggregate
+queries, once per committee session, into an immutable
+snapshot. Reviewers then only compute over the snapshot, so
+they can run concurrently without sharing the session.
+
+============================================================
+QUERIES
+============================================================
+1. market_data: per-source freshness, mock rows and ingestion
+   cycles (one aggregate) + the latest volumes
+2. market_state: latest regimes
+3. risk_state: latest row
+4. execution_records: 24h quality aggregate (one row, from
+   execution_records or the hourly execution_quality_buckets)
+5. position_sizing: latest rows
+6. system_monitoring: override attempts in the last 24h
+
+Reviewers used on their own load only the parts they need.
+
+============================================================
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import FrozenSet, Iterable, NamedTuple, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, case, desc, func, literal, or_, select
+from sqlalchemy.orm import Session
+
+from database.execution_quality import (
+    ExecutionStats,
+    execution_quality_stats,
+    rollup_execution_quality,
+)
+from database.models import (
+    MarketData, RiskState,
+    SystemMonitoring, MarketState, PositionSizing,
+)
+
+
+logger = logging.getLogger("risk_committee.snapshot")
+
+
+LOOKBACK = timedelta(hours=24)
+VOLUME_ROWS = 100
+MARKET_STATE_ROWS = 24
+POSITION_SIZING_ROWS = 10
+
+MOCK_MARKERS = ("mock", "test", "placeholder", "fake")
+OVERRIDE_MARKERS = ("override", "bypass", "violation")
+
+# Snapshot parts, one query each
+MARKET_DATA = "market_data"
+MARKET_STATE = "market_state"
+RISK_STATE = "risk_state"
+EXECUTIONS = "executions"
+POSITION_SIZING = "position_sizing"
+MONITORING = "monitoring"
+
+ALL_PARTS: FrozenSet[str] = frozenset({
+    MARKET_DATA, MARKET_STATE, RISK_STATE, EXECUTIONS, POSITION_SIZING, MONITORING,
+})
+
+# Where execution quality is aggregated from
+EXECUTION_SOURCES = ("records", "rollup")
+
+
+# ============================================================
+# ROWS
+# ============================================================
+
+class MarketStateRow(NamedTuple):
+    volatility_regime: Optional[str]
+    risk_score: Optional[float]
+
+
+class RiskStateRow(NamedTuple):
+    flow_score: Optional[float]
+    sentiment_score: Optional[float]
+    current_drawdown: Optional[float]
+
+
+class PositionSizingRow(NamedTuple):
+    size_percent_of_portfolio: Optional[float]
+    current_exposure: Optional[float]
+    portfolio_value: Optional[float]
+
+
+# ============================================================
+# SNAPSHOT
+# ============================================================
+
+@dataclass(frozen=True)
+class CommitteeSnapshot:
+    """
+    Immutable view of the data one committee session reviews.
+
+    Sequences are tuples ordered newest first.
+    """
+    taken_at: datetime
+    parts: FrozenSet[str] = frozenset()
+
+    # market_data
+    source_latest: Tuple[Tuple[str, Optional[datetime]], ...] = ()
+    mock_rows: int = 0
+    ingestion_cycles: int = 0
+    recent_volumes: Tuple[Optional[float], ...] = ()
+
+    # market_state
+    market_states: Tuple[MarketStateRow, ...] = ()
+
+    # risk_state
+    risk_state: Optional[RiskStateRow] = None
+
+    # execution_records
+    execution_stats: ExecutionStats = ExecutionStats()
+
+    # position_sizing
+    position_sizings: Tuple[PositionSizingRow, ...] = ()
+
+    # system_monitoring
+    override_attempts: int = 0
+
+    def latest_for_source(self, source: str) -> Optional[datetime]:
+        """Latest market data time of a source (None if absent)."""
+        for name, latest in self.source_latest:
+            if name == source:
+                return latest
+        return None
+
+
+# ============================================================
+# LOADER
+# ============================================================
+
+def _column(model, name: str):
+    """Model column, or NULL for attributes the model does not define."""
+    attribute = getattr(model, name, None)
+    return attribute if attribute is not None else literal(None)
+
+
+def _any_like(column, markers: Sequence[str]):
+    return or_(*[column.ilike(f"%{marker}%") for marker in markers])
+
+
+class CommitteeSnapshotLoader:
+    """
+    Loads a CommitteeSnapshot on one session.
+
+    Usage:
+        snapshot = CommitteeSnapshotLoader(session, ["binance"]).load()
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        expected_sources: Optional[Sequence[str]] = None,
+        now: Optional[datetime] = None,
+        execution_source: str = "records",
+    ):
+        if execution_source not in EXECUTION_SOURCES:
+            raise ValueError(f"Unknown execution source: {execution_source}")
+        self._session = session
+        self._expected_sources = list(expected_sources or ["coingecko", "binance"])
+        self._now = now
+        self._execution_source = execution_source
+
+    def load(self, parts: Optional[Iterable[str]] = None) -> CommitteeSnapshot:
+        """Load the given parts (all by default)."""
+        wanted = ALL_PARTS if parts is None else frozenset(parts)
+        unknown = wanted - ALL_PARTS
+        if unknown:
+            raise ValueError(f"Unknown snapshot parts: {sorted(unknown)}")
+
+        now = self._now or datetime.utcnow()
+        since = now - LOOKBACK
+        values = {"taken_at": now, "parts": wanted}
+
+        if MARKET_DATA in wanted:
+            values.update(self._load_market_data(since))
+        if MARKET_STATE in wanted:
+            values["market_states"] = self._load_market_states()
+        if RISK_STATE in wanted:
+            values["risk_state"] = self._load_risk_state()
+        if EXECUTIONS in wanted:
+            values["execution_stats"] = self._load_execution_stats(since)
+        if POSITION_SIZING in wanted:
+            values["position_sizings"] = self._load_position_sizings()
+        if MONITORING in wanted:
+            values["override_attempts"] = self._count_override_attempts(since)
+
+        return CommitteeSnapshot(**values)
+
+    def _load_market_data(self, since: datetime) -> dict:
+        recent = MarketData.created_at >= since
+        latest_columns = [
+            func.max(case((MarketData.exchange.ilike(f"%{source}%"), MarketData.created_at)))
+            for source in self._expected_sources
+        ]
+        row = self._session.execute(
+            select(
+                *latest_columns,
+                func.count(case((and_(recent, _any_like(MarketData.source_module, MOCK_MARKERS)), MarketData.id))),
+                func.count(func.distinct(case((recent, MarketData.correlation_id)))),
+            )
+        ).one()
+        volumes = self._session.execute(
+            select(MarketData.volume).order_by(desc(MarketData.created_at)).limit(VOLUME_ROWS)
+        ).scalars().all()
+
+        source_count = len(self._expected_sources)
+        return {
+            "source_latest": tuple(zip(self._expected_sources, row[:source_count])),
+            "mock_rows": row[source_count] or 0,
+            "ingestion_cycles": row[source_count + 1] or 0,
+            "recent_volumes": tuple(volumes),
+        }
+
+    def _load_market_states(self) -> Tuple[MarketStateRow, ...]:
+        rows = self._session.execute(
+            select(_column(MarketState, "volatility_regime"), _column(MarketState, "risk_score"))
+            .select_from(MarketState)
+            .order_by(desc(MarketState.created_at))
+            .limit(MARKET_STATE_ROWS)
+        ).all()
+        return tuple(MarketStateRow(*row) for row in rows)
+
+    def _load_risk_state(self) -> Optional[RiskStateRow]:
+        row = self._session.execute(
+            select(
+                _column(RiskState, "flow_score"),
+                _column(RiskState, "sentiment_score"),
+                _column(RiskState, "current_drawdown"),
+            )
+            .select_from(RiskState)
+            .order_by(desc(RiskState.created_at))
+            .limit(1)
+        ).first()
+        return RiskStateRow(*row) if row is not None else None
+
+    def _load_execution_stats(self, since: datetime) -> ExecutionStats:
+        if self._execution_source == "rollup":
+            return rollup_execution_quality(self._session, since)
+        return execution_quality_stats(self._session, since)
+
+    def _load_position_sizings(self) -> Tuple[PositionSizingRow, ...]:
+        rows = self._session.execute(
+            select(
+                PositionSizing.size_percent_of_portfolio,
+                PositionSizing.current_exposure,
+                PositionSizing.portfolio_value,
+            )
+            .order_by(desc(PositionSizing.created_at))
+            .limit(POSITION_SIZING_ROWS)
+        ).all()
+        return tuple(PositionSizingRow(*row) for row in rows)
+
+    def _count_override_attempts(self, since: datetime) -> int:
+        count = self._session.execute(
+            select(func.count(SystemMonitoring.id))
+            .where(SystemMonitoring.event_time >= since)
+            .where(_any_like(SystemMonitoring.message, OVERRIDE_MARKERS))
+        ).scalar()
+        return count or 0
+
+
+__all__ = [
+    "CommitteeSnapshot",
+    "CommitteeSnapshotLoader",
+    "MarketStateRow",
+    "RiskStateRow",
+    "PositionSizingRow",
+]
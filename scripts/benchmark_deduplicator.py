@@ -0,0 +1,175 @@
+"""
+Benchmark for near-duplicate detection.
+
+Measures, on a synthetic stream spread over a time window:
+1. Recall at the configured similarity threshold (planted
+   near-duplicates at every distance up to the threshold),
+   for the banded LSH index and for the old high-32-bit buckets
+2. Index throughput (query + insert + eviction per article)
+3. End-to-end Deduplicator.check_batch throughput on text
+
+Usage:
+    python scripts/benchmark_deduplicator.py
+    python scripts/benchmark_deduplicator.py --articles 100000 --exact-recall
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from uuid import uuid4
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data_processing.cleaning.deduplicator import (
+    Deduplicator,
+    DeduplicatorConfig,
+    SimHashIndex,
+    max_hamming_distance,
+)
+
+
+def print_header(text: str) -> None:
+    print(f"\n{'='*60}")
+    print(f"  {text}")
+    print("="*60)
+
+
+def make_stream(articles: int, window_hours: int, max_distance: int, dup_rate: float, seed: int):
+    """Fingerprints, timestamps and planted (position, original, distance) duplicates."""
+    rng = np.random.default_rng(seed)
+    fingerprints = rng.integers(0, 2 ** 64, size=articles, dtype=np.uint64)
+    epochs = np.sort(rng.uniform(0, window_hours * 3600, size=articles))
+
+    planted = []
+    lag = 2000  # Originals are indexed before their duplicates arrive
+    for position in np.flatnonzero(rng.random(articles) < dup_rate).tolist():
+        if position < lag:
+            continue
+        original = int(rng.integers(0, position - lag + 1))
+        distance = int(rng.integers(1, max_distance + 1))
+        flips = rng.choice(64, size=distance, replace=False)
+        mask = 0
+        for bit in flips.tolist():
+            mask |= 1 << bit
+        fingerprints[position] = int(fingerprints[original]) ^ mask
+        planted.append((position, original, distance))
+    return fingerprints, epochs, planted
+
+
+def bench_index(args) -> None:
+    max_distance = max_hamming_distance(args.threshold)
+    window_seconds = args.window_hours * 3600
+    fingerprints, epochs, planted = make_stream(
+        args.articles, args.window_hours, max_distance, args.dup_rate, args.seed
+    )
+    ids = list(range(args.articles))
+
+    index = SimHashIndex(max_distance, bands=args.bands, probe_bits=args.probe_bits)
+    print_header(f"LSH index: {args.articles:,} articles, {args.window_hours}h window")
+    print(f"  max distance {max_distance}, {index.get_stats()['probes_per_query']} probes/query, "
+          f"exact recall: {index.exact_recall}")
+
+    matched = {}
+    legacy_buckets = {}
+    legacy_found = set()
+    start = time.perf_counter()
+    for batch_start in range(0, args.articles, args.batch_size):
+        batch = slice(batch_start, batch_start + args.batch_size)
+        batch_fps = fingerprints[batch]
+        batch_epochs = epochs[batch]
+        matches = index.best_matches(batch_fps, batch_epochs - window_seconds)
+        for offset, match in enumerate(matches):
+            position = batch_start + offset
+            if match is not None:
+                matched[position] = match
+                continue
+            index.add(ids[position], int(batch_fps[offset]), float(batch_epochs[offset]))
+        index.evict_before(float(batch_epochs[-1]) - window_seconds)
+    elapsed = time.perf_counter() - start
+
+    # Old scheme: candidates share the high 32 bits
+    for position in range(args.articles):
+        legacy_buckets.setdefault(int(fingerprints[position]) >> 32, []).append(position)
+    for position, original, _ in planted:
+        if original in legacy_buckets.get(int(fingerprints[position]) >> 32, ()):
+            legacy_found.add(position)
+
+    # Only plants whose original was indexed (not itself a duplicate)
+    reachable = [(p, o, d) for p, o, d in planted if o not in matched]
+    found = sum(1 for position, _, _ in reachable if position in matched)
+    legacy = sum(1 for position, _, _ in reachable if position in legacy_found)
+    print(f"  planted duplicates: {len(reachable):,}")
+    print(f"  recall (LSH):       {found / max(len(reachable), 1):.4f}")
+    print(f"  recall (high-32):   {legacy / max(len(reachable), 1):.4f}")
+    for distance in range(1, max_distance + 1):
+        at = [p for p, _, d in reachable if d == distance]
+        hits = sum(1 for p in at if p in matched)
+        print(f"    distance {distance}: {hits / max(len(at), 1):.4f} ({len(at):,})")
+    print(f"  throughput:         {args.articles / elapsed:,.0f} articles/s ({elapsed:.1f}s)")
+    print(f"  final stats:        {index.get_stats()}")
+
+
+def bench_text(args) -> None:
+    rng = random.Random(args.seed)
+    vocab = [f"token{i}" for i in range(5000)]
+    base = datetime(2026, 1, 1)
+    items = []
+    for i in range(args.text_articles):
+        if items and rng.random() < args.dup_rate:
+            words = items[rng.randrange(len(items))][1].split()
+            words[rng.randrange(len(words))] = rng.choice(vocab)
+        else:
+            words = [rng.choice(vocab) for _ in range(rng.randint(80, 200))]
+        timestamp = base + timedelta(seconds=i * args.window_hours * 3600 / args.text_articles)
+        items.append((uuid4(), " ".join(words), "bench", timestamp))
+
+    print_header(f"Deduplicator end to end: {args.text_articles:,} articles")
+    for label, batch_size in (("check_duplicate", 1), ("check_batch", args.batch_size)):
+        dedup = Deduplicator(DeduplicatorConfig(
+            similarity_threshold=args.threshold,
+            lsh_bands=args.bands,
+            lsh_probe_bits=args.probe_bits,
+        ))
+        start = time.perf_counter()
+        duplicates = 0
+        if batch_size == 1:
+            for item in items:
+                duplicates += dedup.check_duplicate(*item).is_duplicate
+        else:
+            for batch_start in range(0, len(items), batch_size):
+                results = dedup.check_batch(items[batch_start:batch_start + batch_size])
+                duplicates += sum(r.is_duplicate for r in results)
+        elapsed = time.perf_counter() - start
+        print(f"  {label:16s} {len(items) / elapsed:,.0f} articles/s, {duplicates:,} duplicates")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark near-duplicate detection")
+    parser.add_argument("--articles", type=int, default=1_000_000)
+    parser.add_argument("--text-articles", type=int, default=20_000)
+    parser.add_argument("--window-hours", type=int, default=168)
+    parser.add_argument("--threshold", type=float, default=0.85)
+    parser.add_argument("--bands", type=int, default=4)
+    parser.add_argument("--probe-bits", type=int, default=DeduplicatorConfig.lsh_probe_bits)
+    parser.add_argument("--exact-recall", action="store_true",
+                        help="Probe radius with no recall loss at the threshold")
+    parser.add_argument("--dup-rate", type=float, default=0.05)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    if args.exact_recall:
+        args.probe_bits = None
+
+    bench_index(args)
+    if args.text_articles:
+        bench_text(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,8 @@ from typing import Any, Optional
 
 import aiohttp
 
+from core.http_pool import get_http_registry
+
 from ..base import BaseSentimentSource
 from ..exceptions import FetchError, ParseError, RateLimitError
 from ..models import (
@@ -141,9 +143,12 @@ class CryptoPanicSource(BaseSentimentSource):
     
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
-        if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=self.timeout)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+        registry = get_http_registry()
+        if self._session is None or not registry.session_is_live(self._session):
+            if self._session is not None:
+                await registry.close_session(self._session)
+            # Holds a pool reference until close()
+            self._session = await registry.open_session(timeout=self.timeout)
         return self._session
     
     async def _fetch_raw(
@@ -387,5 +392,6 @@ class CryptoPanicSource(BaseSentimentSource):
     
     async def close(self) -> None:
         """Close the aiohttp session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        if self._session is not None:
+            session, self._session = self._session, None
+            await get_http_registry().close_session(session)
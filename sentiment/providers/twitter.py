@@ -24,6 +24,8 @@ from urllib.parse import quote
 
 import aiohttp
 
+from core.http_pool import get_http_registry
+
 from ..base import BaseSentimentSource
 from ..exceptions import FetchError, ParseError, RateLimitError
 from ..models import (
@@ -120,17 +122,17 @@ class TwitterScraperSource(BaseSentimentSource):
     
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
-        if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=self.timeout)
+        registry = get_http_registry()
+        if self._session is None or not registry.session_is_live(self._session):
+            if self._session is not None:
+                await registry.close_session(self._session)
             headers = {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9",
                 "Accept-Language": "en-US,en;q=0.5",
             }
-            self._session = aiohttp.ClientSession(
-                timeout=timeout,
-                headers=headers,
-            )
+            # Holds a pool reference until close()
+            self._session = await registry.open_session(timeout=self.timeout, headers=headers)
         return self._session
     
     async def _fetch_raw(
@@ -468,5 +470,6 @@ class TwitterScraperSource(BaseSentimentSource):
     
     async def close(self) -> None:
         """Close the aiohttp session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        if self._session is not None:
+            session, self._session = self._session, None
+            await get_http_registry().close_session(session)
@@ -0,0 +1,742 @@
+"""
+Storage - Columnar Market Data Cache.
+
+============================================================
+PURPOSE
+============================================================
+On-disk columnar mirror of market_data, processed_market_data
+and onchain_flow_raw for replay and research, so historical
+reads do not go through Postgres and ORM objects.
+
+- ColumnarCacheSync copies new rows from the database
+- ColumnarCache answers time-range queries with NumPy arrays
+  that are memory-mapped views of the files (no copy when the
+  range falls in one partition)
+
+============================================================
+LAYOUT
+============================================================
+<root>/<table>/<symbol>/<YYYY-MM-DD>/
+    CURRENT             -> name of the live version
+    v000001/<column>.npy
+    v000001/meta.json   -> rows, column kinds, vocabularies,
+                           last (time, id) key
+
+Partitions hold one symbol (token for on-chain flows) and one
+UTC day of the table's time column, sorted by (time, id).
+An append writes a new version and then swaps CURRENT with an
+atomic rename, so readers never see a half-written partition
+and arrays mapped from the previous version stay valid. The
+last RETAINED_VERSIONS versions are kept on disk, so a reader
+that has just read CURRENT can still open its version.
+
+============================================================
+ENCODING
+============================================================
+- Float: float64, NaN = NULL
+- Integer: int64, INT64_MIN = NULL
+- Boolean: int8, -1 = NULL
+- DateTime: int64 epoch microseconds (UTC), INT64_MIN = NULL
+- String: int32 codes into a per-partition vocabulary; read()
+  returns object arrays (None = NULL)
+- Other column types (JSON, UUID, ...) are not mirrored
+
+============================================================
+INCREMENTAL SYNC
+============================================================
+Rows are synced in (updated-at column, id) order after a
+per-table watermark, streamed from a server-side cursor
+chunk_size rows at a time. Candles are upserted in place while
+they form (and backfilled out of time order), so the watermark
+follows when a row was written, not its candle time:
+- Only closed rows (close column <= now) are mirrored
+- A row re-written after it was synced is picked up again
+- A row that closed since the last sync is picked up even if
+  it was last written while still forming
+
+Appends upsert by id: a re-synced row replaces the cached one
+and unchanged rows are skipped, so re-running a chunk after a
+crash does not duplicate rows.
+
+============================================================
+"""
+
+import json
+import logging
+import os
+import shutil
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import quote, unquote
+
+import numpy as np
+from sqlalchemy import Boolean, DateTime, Float, Integer, String, select, tuple_
+
+from core.exceptions import InvalidConfigError
+
+try:
+    import pyarrow as pa
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+
+NULL_INT = np.iinfo(np.int64).min
+_EPOCH = datetime(1970, 1, 1)
+_DAY_US = 86_400 * 1_000_000
+
+CURRENT_FILE = "CURRENT"
+META_FILE = "meta.json"
+WATERMARK_FILE = "_watermark.json"
+
+# Versions kept per partition (the live one included)
+RETAINED_VERSIONS = 2
+
+
+def to_epoch_us(dt: datetime) -> int:
+    """Datetime to epoch microseconds (naive = UTC)."""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    delta = dt - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def from_epoch_us(value: int) -> datetime:
+    """Epoch microseconds to a naive UTC datetime."""
+    return _EPOCH + timedelta(microseconds=value)
+
+
+# ============================================================
+# TABLES
+# ============================================================
+
+@dataclass(frozen=True)
+class CacheTableSpec:
+    """How a table is partitioned in the cache."""
+    table: str
+    time_column: str  # Sort and day-partition column
+    partition_column: str  # Symbol-like column
+    updated_column: str  # Set on every insert and upsert; drives the sync
+    closed_column: Optional[str] = None  # Row is final once this is <= now
+    id_column: str = "id"
+
+
+CACHE_TABLES: Dict[str, CacheTableSpec] = {
+    "market_data": CacheTableSpec(
+        "market_data", "candle_open_time", "symbol", "fetched_at", "candle_close_time",
+    ),
+    "processed_market_data": CacheTableSpec(
+        "processed_market_data", "window_start", "symbol", "calculated_at", "window_end",
+    ),
+    "onchain_flow_raw": CacheTableSpec("onchain_flow_raw", "event_time", "token", "fetched_at"),
+}
+
+
+@dataclass(frozen=True)
+class SyncWatermark:
+    """Sync position of a table (epoch microseconds)."""
+    updated_us: int  # Last synced (updated-at, id) key
+    id: int
+    cutoff_us: Optional[int] = None  # Close-time cutoff of the last completed sync
+
+
+def column_kinds(table: Any) -> Dict[str, str]:
+    """Cache kind of every mirrored column of a SQLAlchemy table."""
+    kinds = {}
+    for column in table.columns:
+        column_type = column.type
+        if isinstance(column_type, Boolean):
+            kinds[column.name] = "bool"
+        elif isinstance(column_type, Integer):
+            kinds[column.name] = "int"
+        elif isinstance(column_type, Float):
+            kinds[column.name] = "float"
+        elif isinstance(column_type, DateTime):
+            kinds[column.name] = "datetime"
+        elif isinstance(column_type, String):
+            kinds[column.name] = "str"
+    return kinds
+
+
+def _encode(kind: str, values: List[Any]) -> Tuple[np.ndarray, Optional[List[str]]]:
+    """Column values to an array (and vocabulary for strings)."""
+    if kind == "float":
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64), None
+    if kind == "int":
+        return np.array([NULL_INT if v is None else v for v in values], dtype=np.int64), None
+    if kind == "bool":
+        return np.array([-1 if v is None else int(v) for v in values], dtype=np.int8), None
+    if kind == "datetime":
+        return np.array([NULL_INT if v is None else to_epoch_us(v) for v in values], dtype=np.int64), None
+    codes: Dict[str, int] = {}
+    encoded = [-1 if v is None else codes.setdefault(v, len(codes)) for v in values]
+    return np.array(encoded, dtype=np.int32), list(codes)
+
+
+def _decode_strings(codes: np.ndarray, vocab: List[str]) -> np.ndarray:
+    lookup = np.array(list(vocab) + [None], dtype=object)
+    return lookup[np.where(codes < 0, len(vocab), codes)]
+
+
+# ============================================================
+# CACHE
+# ============================================================
+
+class ColumnarCache:
+    """
+    Partitioned columnar files under one root directory.
+
+    Usage:
+        cache = ColumnarCache("/data/cache")
+        columns = cache.read("market_data", start, end, symbols=["BTC"],
+                             filters={"interval": "1m"})
+        closes = columns["close_price"]
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    # =========================================================
+    # LAYOUT
+    # =========================================================
+
+    def _table_dir(self, table: str) -> str:
+        if table not in CACHE_TABLES:
+            raise InvalidConfigError("table", table, f"not one of {sorted(CACHE_TABLES)}")
+        return os.path.join(self.root, table)
+
+    def _partition_dir(self, table: str, symbol: str, day: date) -> str:
+        return os.path.join(self._table_dir(table), quote(symbol, safe=""), day.isoformat())
+
+    def symbols(self, table: str) -> List[str]:
+        """Cached symbols of a table."""
+        table_dir = self._table_dir(table)
+        if not os.path.isdir(table_dir):
+            return []
+        return sorted(
+            unquote(name) for name in os.listdir(table_dir)
+            if os.path.isdir(os.path.join(table_dir, name))
+        )
+
+    def days(self, table: str, symbol: str) -> List[date]:
+        """Cached days of a symbol, ascending."""
+        symbol_dir = os.path.join(self._table_dir(table), quote(symbol, safe=""))
+        if not os.path.isdir(symbol_dir):
+            return []
+        return sorted(date.fromisoformat(name) for name in os.listdir(symbol_dir))
+
+    # =========================================================
+    # PARTITIONS
+    # =========================================================
+
+    def _current_version(self, partition_dir: str) -> Optional[str]:
+        try:
+            with open(os.path.join(partition_dir, CURRENT_FILE), "r", encoding="utf-8") as f:
+                return f.read().strip()
+        except FileNotFoundError:
+            return None
+
+    def _load_partition(
+        self,
+        partition_dir: str,
+        columns: Optional[Sequence[str]] = None,
+        mmap: bool = True,
+    ) -> Optional[Tuple[Dict[str, np.ndarray], Dict[str, Any]]]:
+        """(arrays, meta) of the live version, or None."""
+        for attempt in range(RETAINED_VERSIONS + 1):
+            version = self._current_version(partition_dir)
+            if version is None:
+                return None
+            version_dir = os.path.join(partition_dir, version)
+            try:
+                with open(os.path.join(version_dir, META_FILE), "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+                names = meta["kinds"] if columns is None else columns
+                arrays = {
+                    name: np.load(os.path.join(version_dir, f"{name}.npy"), mmap_mode="r" if mmap else None)
+                    for name in names
+                }
+                return arrays, meta
+            except FileNotFoundError:
+                # Version retired by concurrent appends; CURRENT has moved on
+                if attempt == RETAINED_VERSIONS:
+                    raise
+        return None
+
+    def append_partition(
+        self,
+        table: str,
+        symbol: str,
+        day: date,
+        arrays: Dict[str, np.ndarray],
+        kinds: Dict[str, str],
+        vocab: Dict[str, List[str]],
+    ) -> int:
+        """
+        Upsert rows into a partition.
+
+        Rows replace cached rows with the same id; rows identical to
+        the cached ones are skipped. The partition stays sorted by
+        (time, id). Returns the number of rows written.
+        """
+        spec = CACHE_TABLES[table]
+        partition_dir = self._partition_dir(table, symbol, day)
+        existing = self._load_partition(partition_dir, mmap=False)
+
+        if existing is not None:
+            old_arrays, old_meta = existing
+            if old_meta["kinds"] != kinds:
+                raise InvalidConfigError("kinds", kinds, f"schema changed for {partition_dir}")
+            merged_vocab = {}
+            remapped = {}
+            for name, kind in kinds.items():
+                new = arrays[name]
+                if kind == "str":
+                    words = list(old_meta["vocab"][name])
+                    index = {w: i for i, w in enumerate(words)}
+                    for word in vocab[name]:
+                        if word not in index:
+                            index[word] = len(words)
+                            words.append(word)
+                    remap = np.array([index[w] for w in vocab[name]] + [-1], dtype=np.int32)
+                    new = remap[np.where(new < 0, len(vocab[name]), new)]
+                    merged_vocab[name] = words
+                remapped[name] = new
+            arrays, vocab = remapped, merged_vocab
+
+            # Skip rows the partition already holds unchanged
+            old_ids = old_arrays[spec.id_column]
+            by_id = np.argsort(old_ids, kind="stable")
+            pos = np.searchsorted(old_ids, arrays[spec.id_column], sorter=by_id)
+            pos = by_id[np.minimum(pos, len(old_ids) - 1)]
+            changed = old_ids[pos] != arrays[spec.id_column]
+            for name in kinds:
+                old, new = old_arrays[name][pos], arrays[name]
+                same = old == new
+                if kinds[name] == "float":
+                    same |= np.isnan(old) & np.isnan(new)
+                changed |= ~same
+            if not changed.all():
+                arrays = {name: array[changed] for name, array in arrays.items()}
+            added = int(changed.sum())
+            if not added:
+                return 0
+
+            keep = ~np.isin(old_ids, arrays[spec.id_column])
+            arrays = {
+                name: np.concatenate([old_arrays[name][keep], arrays[name]])
+                for name in kinds
+            }
+            version_number = int(old_meta["version"]) + 1
+        else:
+            added = len(arrays[spec.time_column])
+            if not added:
+                return 0
+            vocab = {name: vocab[name] for name, kind in kinds.items() if kind == "str"}
+            version_number = 1
+
+        order = np.lexsort((arrays[spec.id_column], arrays[spec.time_column]))
+        arrays = {name: array[order] for name, array in arrays.items()}
+        times, ids = arrays[spec.time_column], arrays[spec.id_column]
+
+        version = f"v{version_number:06d}"
+        version_dir = os.path.join(partition_dir, version)
+        if os.path.isdir(version_dir):
+            shutil.rmtree(version_dir)  # Left over from an interrupted write
+        os.makedirs(version_dir)
+        for name, array in arrays.items():
+            np.save(os.path.join(version_dir, f"{name}.npy"), np.ascontiguousarray(array))
+        meta = {
+            "version": version_number,
+            "rows": len(arrays[spec.time_column]),
+            "kinds": kinds,
+            "vocab": vocab,
+            "last_key": [int(times[-1]), int(ids[-1])],
+        }
+        with open(os.path.join(version_dir, META_FILE), "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+        # Swap the live version
+        tmp_path = os.path.join(partition_dir, f"{CURRENT_FILE}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(version)
+        os.replace(tmp_path, os.path.join(partition_dir, CURRENT_FILE))
+
+        # Retire old versions, keeping the ones readers may have just opened
+        versions = sorted(name for name in os.listdir(partition_dir) if name.startswith("v"))
+        for name in versions[:-RETAINED_VERSIONS]:
+            shutil.rmtree(os.path.join(partition_dir, name), ignore_errors=True)
+        return added
+
+    # =========================================================
+    # WATERMARKS
+    # =========================================================
+
+    def watermark(self, table: str) -> Optional[SyncWatermark]:
+        """Sync position of a table (None = sync from the start)."""
+        try:
+            with open(os.path.join(self._table_dir(table), WATERMARK_FILE), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        if "updated_key" not in data:
+            return None  # Pre-upsert (time, id) watermark: resync, appends are idempotent
+        updated_us, record_id = data["updated_key"]
+        return SyncWatermark(updated_us, record_id, data.get("cutoff"))
+
+    def set_watermark(self, table: str, watermark: SyncWatermark) -> None:
+        table_dir = self._table_dir(table)
+        os.makedirs(table_dir, exist_ok=True)
+        tmp_path = os.path.join(table_dir, f"{WATERMARK_FILE}.tmp")
+        data = {
+            "updated_key": [int(watermark.updated_us), int(watermark.id)],
+            "cutoff": None if watermark.cutoff_us is None else int(watermark.cutoff_us),
+        }
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, os.path.join(table_dir, WATERMARK_FILE))
+
+    def clear(self, table: str) -> None:
+        """Remove every partition and the watermark of a table."""
+        shutil.rmtree(self._table_dir(table), ignore_errors=True)
+
+    # =========================================================
+    # READS
+    # =========================================================
+
+    def iter_partitions(
+        self,
+        table: str,
+        start: datetime,
+        end: datetime,
+        symbols: Optional[Sequence[str]] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Iterator[Tuple[str, date, Dict[str, np.ndarray], Dict[str, Any]]]:
+        """
+        (symbol, day, arrays, meta) for partitions overlapping [start, end).
+
+        Arrays are memory-mapped views sliced to the range; string
+        columns are still codes into meta["vocab"]. Ordered by day,
+        then symbol.
+        """
+        spec = CACHE_TABLES[table]
+        start_us, end_us = to_epoch_us(start), to_epoch_us(end)
+        first_day = from_epoch_us(start_us).date()
+        last_day = from_epoch_us(end_us - 1).date()
+        wanted = None
+        if columns is not None:
+            wanted = list(dict.fromkeys([*columns, spec.time_column]))
+
+        by_day: Dict[date, List[str]] = {}
+        for symbol in (symbols if symbols is not None else self.symbols(table)):
+            for day in self.days(table, symbol):
+                if first_day <= day <= last_day:
+                    by_day.setdefault(day, []).append(symbol)
+
+        for day in sorted(by_day):
+            for symbol in sorted(by_day[day]):
+                loaded = self._load_partition(self._partition_dir(table, symbol, day), wanted)
+                if loaded is None:
+                    continue
+                arrays, meta = loaded
+                times = arrays[spec.time_column]
+                lo = int(np.searchsorted(times, start_us, side="left"))
+                hi = int(np.searchsorted(times, end_us, side="left"))
+                if lo < hi:
+                    yield symbol, day, {name: a[lo:hi] for name, a in arrays.items()}, meta
+
+    def read(
+        self,
+        table: str,
+        start: datetime,
+        end: datetime,
+        symbols: Optional[Sequence[str]] = None,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Columns of rows with start <= time < end.
+
+        Rows are grouped by day, then symbol, and sorted by time
+        within a partition. A single-partition, unfiltered read
+        returns memory-mapped views; otherwise partitions are
+        concatenated. String columns are decoded to object arrays.
+
+        Args:
+            table: Cached table name
+            start: Inclusive start (naive = UTC)
+            end: Exclusive end
+            symbols: Restrict to these symbols (None = all)
+            columns: Columns to return (None = all)
+            filters: Column -> required value (equality)
+        """
+        return self._read(table, start, end, symbols, columns, filters)[0]
+
+    def _read(
+        self,
+        table: str,
+        start: datetime,
+        end: datetime,
+        symbols: Optional[Sequence[str]],
+        columns: Optional[Sequence[str]],
+        filters: Optional[Dict[str, Any]],
+    ) -> Tuple[Dict[str, np.ndarray], Dict[str, str]]:
+        filters = filters or {}
+        wanted = None
+        if columns is not None:
+            wanted = list(dict.fromkeys([*columns, *filters]))
+
+        parts: List[Dict[str, np.ndarray]] = []
+        kinds: Dict[str, str] = {}
+        for _, _, arrays, meta in self.iter_partitions(table, start, end, symbols, wanted):
+            kinds = meta["kinds"]
+            mask = None
+            for name, value in filters.items():
+                column = arrays[name]
+                if kinds[name] == "str":
+                    vocab = meta["vocab"][name]
+                    code = vocab.index(value) if value in vocab else -2
+                    match = column == code
+                elif kinds[name] == "datetime":
+                    match = column == to_epoch_us(value)
+                else:
+                    match = column == value
+                mask = match if mask is None else mask & match
+            decoded = {}
+            for name, array in arrays.items():
+                if columns is not None and name not in columns:
+                    continue
+                if mask is not None:
+                    array = array[mask]
+                if kinds[name] == "str":
+                    array = _decode_strings(np.asarray(array), meta["vocab"][name])
+                decoded[name] = array
+            parts.append(decoded)
+
+        if not parts:
+            return {}, kinds
+        if len(parts) == 1:
+            return parts[0], kinds
+        return {name: np.concatenate([p[name] for p in parts]) for name in parts[0]}, kinds
+
+    def read_arrow(self, table: str, start: datetime, end: datetime, **kwargs: Any) -> "pa.Table":
+        """read() as a pyarrow Table (numeric columns wrap the arrays)."""
+        if not ARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for read_arrow()")
+        columns = self.read(table, start, end, **kwargs)
+        return pa.table({name: pa.array(array) for name, array in columns.items()})
+
+    def iter_records(
+        self,
+        table: str,
+        start: datetime,
+        end: datetime,
+        symbols: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Rows as dicts in (time, id) order, one day in memory at a time.
+
+        Datetime columns are naive UTC datetimes, NULLs are None.
+        """
+        spec = CACHE_TABLES[table]
+        day = from_epoch_us(to_epoch_us(start)).date()
+        last_day = from_epoch_us(to_epoch_us(end) - 1).date()
+        while day <= last_day:
+            day_start = max(datetime.combine(day, datetime.min.time()), _naive(start))
+            day_end = min(datetime.combine(day + timedelta(days=1), datetime.min.time()), _naive(end))
+            columns, kinds = self._read(table, day_start, day_end, symbols, None, filters)
+            if columns:
+                yield from _records(columns, kinds, spec)
+            day += timedelta(days=1)
+
+
+def _naive(dt: datetime) -> datetime:
+    if dt.tzinfo is not None:
+        return dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def _records(
+    columns: Dict[str, np.ndarray],
+    kinds: Dict[str, str],
+    spec: CacheTableSpec,
+) -> Iterator[Dict[str, Any]]:
+    order = np.lexsort((columns[spec.id_column], columns[spec.time_column]))
+    values = {}
+    for name, array in columns.items():
+        raw = np.asarray(array)[order].tolist()
+        kind = kinds.get(name)
+        if kind == "float":
+            raw = [None if v != v else v for v in raw]
+        elif kind in ("int", "datetime"):
+            raw = [None if v == NULL_INT else v for v in raw]
+            if kind == "datetime":
+                raw = [None if v is None else from_epoch_us(v) for v in raw]
+        elif kind == "bool":
+            raw = [None if v < 0 else bool(v) for v in raw]
+        values[name] = raw
+    names = list(values)
+    for row in zip(*(values[n] for n in names)):
+        yield dict(zip(names, row))
+
+
+# ============================================================
+# SYNC
+# ============================================================
+
+class ColumnarCacheSync:
+    """
+    Mirrors database tables into a ColumnarCache.
+
+    Usage:
+        sync = ColumnarCacheSync(get_session, ColumnarCache("/data/cache"))
+        appended = sync.sync()  # {"market_data": 1440, ...}
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        cache: ColumnarCache,
+        chunk_size: int = 50_000,
+    ):
+        self._session_factory = session_factory
+        self.cache = cache
+        self.chunk_size = chunk_size
+
+    def sync(
+        self,
+        table: Optional[str] = None,
+        full: bool = False,
+        now: Optional[datetime] = None,
+    ) -> Dict[str, int]:
+        """
+        Mirror closed rows written since each table's watermark.
+
+        Args:
+            table: One table (None = all cached tables)
+            full: Drop the table's cache and rebuild it
+            now: Close-time cutoff (default: current UTC time)
+
+        Returns:
+            Rows written per table
+        """
+        cutoff = _naive(now) if now is not None else datetime.utcnow()
+        tables = [table] if table is not None else list(CACHE_TABLES)
+        return {name: self._sync_table(name, full, cutoff) for name in tables}
+
+    def _sync_table(self, table_name: str, full: bool, cutoff: datetime) -> int:
+        from database.models import MarketData, OnchainFlowRaw, ProcessedMarketData
+
+        models = {
+            "market_data": MarketData,
+            "processed_market_data": ProcessedMarketData,
+            "onchain_flow_raw": OnchainFlowRaw,
+        }
+        spec = CACHE_TABLES[table_name]
+        table = models[table_name].__table__
+        kinds = column_kinds(table)
+        names = list(kinds)
+        updated_col = table.c[spec.updated_column]
+        id_col = table.c[spec.id_column]
+        closed_col = table.c[spec.closed_column] if spec.closed_column else None
+
+        if full:
+            self.cache.clear(table_name)
+        stmt = select(*(table.c[n] for n in names)).order_by(updated_col, id_col)
+        if closed_col is not None:
+            stmt = stmt.where(closed_col <= cutoff)
+
+        # Without a completed cutoff, rows written earlier may have closed since
+        watermark = self.cache.watermark(table_name)
+        if watermark is not None and (closed_col is None or watermark.cutoff_us is not None):
+            written_since = tuple_(updated_col, id_col) > tuple_(
+                from_epoch_us(watermark.updated_us), watermark.id
+            )
+            if closed_col is not None:
+                # Rows last written while forming, closed since the last sync
+                written_since = written_since | (closed_col > from_epoch_us(watermark.cutoff_us))
+            stmt = stmt.where(written_since)
+
+        appended = 0
+        last_key = None if watermark is None else (watermark.updated_us, watermark.id)
+        previous_cutoff = None if watermark is None else watermark.cutoff_us
+        session = self._session_factory()
+        try:
+            result = session.execute(stmt.execution_options(yield_per=self.chunk_size))
+            for rows in result.partitions(self.chunk_size):
+                appended += self._append_chunk(table_name, spec, kinds, names, rows)
+                last_key = _row_key(rows[-1], names, spec)
+                self.cache.set_watermark(table_name, SyncWatermark(*last_key, previous_cutoff))
+        finally:
+            session.close()
+
+        # The cutoff only advances once every row closed before it is synced
+        self.cache.set_watermark(
+            table_name, SyncWatermark(*(last_key or (0, 0)), to_epoch_us(cutoff))
+        )
+
+        if appended:
+            logger.info(f"Columnar cache: appended {appended} rows to {table_name}")
+        return appended
+
+    def _append_chunk(
+        self,
+        table_name: str,
+        spec: CacheTableSpec,
+        kinds: Dict[str, str],
+        names: List[str],
+        rows: List[Any],
+    ) -> int:
+        arrays: Dict[str, np.ndarray] = {}
+        vocab: Dict[str, List[str]] = {}
+        for i, name in enumerate(names):
+            array, words = _encode(kinds[name], [row[i] for row in rows])
+            arrays[name] = array
+            if words is not None:
+                vocab[name] = words
+
+        # Group rows by (symbol, day); order within a group is kept
+        symbol_codes = arrays[spec.partition_column]
+        days = arrays[spec.time_column] // _DAY_US
+        group_keys = days * (len(vocab[spec.partition_column]) + 1) + symbol_codes
+        unique_keys, group_ids = np.unique(group_keys, return_inverse=True)
+        order = np.argsort(group_ids, kind="stable")
+        bounds = np.cumsum(np.bincount(group_ids, minlength=len(unique_keys)))[:-1]
+
+        written = 0
+        for index in np.split(order, bounds):
+            first = index[0]
+            symbol = vocab[spec.partition_column][symbol_codes[first]]
+            day = from_epoch_us(int(days[first]) * _DAY_US).date()
+            written += self.cache.append_partition(
+                table_name, symbol, day,
+                {name: array[index] for name, array in arrays.items()},
+                kinds, vocab,
+            )
+        return written
+
+
+def _row_key(row: Any, names: List[str], spec: CacheTableSpec) -> Tuple[int, int]:
+    """(updated-at epoch us, id) of a synced row."""
+    return (
+        to_epoch_us(row[names.index(spec.updated_column)]),
+        int(row[names.index(spec.id_column)]),
+    )
+
+
+__all__ = [
+    "ARROW_AVAILABLE",
+    "CACHE_TABLES",
+    "CacheTableSpec",
+    "ColumnarCache",
+    "ColumnarCacheSync",
+    "RETAINED_VERSIONS",
+    "SyncWatermark",
+    "from_epoch_us",
+    "to_epoch_us",
+]
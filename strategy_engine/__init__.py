@@ -150,6 +150,11 @@ Engine (engine.py)
 ------------------
 - StrategyEngine: Main orchestrator
 
+Batch Evaluation (batch.py)
+---------------------------
+- MarketStateFrame: Columnar market states for many symbols
+- compute_signal_columns(): Vectorized signal decisions
+
 Persistence (models.py, repository.py)
 --------------------------------------
 - TradeIntentRecord: ORM model for intents
@@ -250,6 +255,15 @@ from .engine import (
     format_intent_summary,
 )
 
+# ============================================================
+# BATCH EVALUATION EXPORTS
+# ============================================================
+
+from .batch import (
+    MarketStateFrame,
+    compute_signal_columns,
+)
+
 # ============================================================
 # MODEL EXPORTS
 # ============================================================
@@ -338,6 +352,10 @@ __all__ = [
     "StrategyEngine",
     "format_intent_summary",
     
+    # Batch evaluation
+    "MarketStateFrame",
+    "compute_signal_columns",
+    
     # Models
     "TradeIntentRecord",
     "NoTradeRecord",
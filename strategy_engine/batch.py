@@ -0,0 +1,442 @@
+"""
+Strategy Engine - Batch Signal Evaluation.
+
+============================================================
+PURPOSE
+============================================================
+Vectorized replacement for calling StrategyEngine.generate_signal
+once per ProcessedMarketState.
+
+- Market states for the whole universe are laid out as NumPy
+  columns (one row per symbol/timeframe)
+- Signal type, direction, reason code, confidence score and
+  tradeability are computed for all rows at once with lookup
+  tables and masked arithmetic - no per-state branching
+- Only the final StrategySignal objects are built per row
+
+============================================================
+PARITY
+============================================================
+Signals are identical to generate_signal (apart from signal_id
+and timestamps, which are set once per batch):
+- Enum-derived constants (volatility adjustment, direction
+  score, risk multiplier) are taken from the enums themselves
+- Confidence terms are added in the same order as
+  _calculate_confidence_from_state, so float results match
+  bit for bit
+- Missing optional values are NaN in the frame and None again
+  in supporting_features
+
+============================================================
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, List, Mapping, Optional, Sequence
+from uuid import uuid4
+
+import numpy as np
+
+from .types import (
+    ConfidenceLevel,
+    SignalType,
+    StrategyReasonCode,
+    StrategySignal,
+    TradeDirection,
+)
+from data_processing.contracts import (
+    LiquidityGrade,
+    ProcessedMarketState,
+    TrendState,
+    VolatilityLevel,
+)
+
+
+# ============================================================
+# CODE TABLES
+# ============================================================
+
+# Row codes index into these tuples
+TREND_STATES = tuple(TrendState)
+VOLATILITY_LEVELS = tuple(VolatilityLevel)
+LIQUIDITY_GRADES = tuple(LiquidityGrade)  # Best to worst
+DIRECTIONS = (TradeDirection.SHORT, TradeDirection.NEUTRAL, TradeDirection.LONG)  # code + 1
+CONFIDENCE_LEVELS = tuple(ConfidenceLevel)  # code - 1
+
+_TREND_CODE = {trend: code for code, trend in enumerate(TREND_STATES)}
+_VOLATILITY_CODE = {level: code for code, level in enumerate(VOLATILITY_LEVELS)}
+_EXTREME = _VOLATILITY_CODE[VolatilityLevel.EXTREME]
+
+# Signal type and reason code per trend (see _classify_signal_type)
+_TREND_SIGNAL = {
+    TrendState.STRONG_UPTREND: (SignalType.TREND_FOLLOWING, StrategyReasonCode.TREND_CONTINUATION_LONG),
+    TrendState.STRONG_DOWNTREND: (SignalType.TREND_FOLLOWING, StrategyReasonCode.TREND_CONTINUATION_SHORT),
+    TrendState.UPTREND: (SignalType.MOMENTUM, StrategyReasonCode.TREND_CONTINUATION_LONG),
+    TrendState.DOWNTREND: (SignalType.MOMENTUM, StrategyReasonCode.TREND_CONTINUATION_SHORT),
+    TrendState.RANGING: (SignalType.MEAN_REVERSION, None),
+}
+SIGNAL_TYPES = tuple(SignalType)
+REASON_CODES = (None,) + tuple(StrategyReasonCode)  # 0 = no reason code
+_SIGNAL_TYPE_CODE = {signal_type: code for code, signal_type in enumerate(SIGNAL_TYPES)}
+_REASON_CODE = {reason: code for code, reason in enumerate(REASON_CODES)}
+
+_TREND_SIGNAL_TYPE = np.array([
+    _SIGNAL_TYPE_CODE[_TREND_SIGNAL.get(t, (SignalType.NONE, None))[0]] for t in TREND_STATES
+], dtype=np.int16)
+_TREND_REASON = np.array([
+    _REASON_CODE[_TREND_SIGNAL.get(t, (SignalType.NONE, None))[1]] for t in TREND_STATES
+], dtype=np.int16)
+_TREND_HAS_SIGNAL = np.array([t in _TREND_SIGNAL for t in TREND_STATES])
+_HIGH_VOLATILITY = np.array([v in (VolatilityLevel.HIGH, VolatilityLevel.EXTREME) for v in VOLATILITY_LEVELS])
+
+_TREND_DIRECTION = np.array([1 if t.is_bullish else -1 if t.is_bearish else 0 for t in TREND_STATES], dtype=np.int8)
+_TREND_NEUTRAL = np.array([t.is_neutral for t in TREND_STATES])
+_TREND_DIRECTION_SCORE = np.array([t.direction_score for t in TREND_STATES])
+
+# Confidence terms (see _calculate_confidence_from_state)
+_TREND_CONTRIB = np.array([
+    0.3 if t in (TrendState.STRONG_UPTREND, TrendState.STRONG_DOWNTREND)
+    else 0.15 if t in (TrendState.UPTREND, TrendState.DOWNTREND)
+    else 0.0
+    for t in TREND_STATES
+])
+_VOLATILITY_ADJUSTMENT = np.array([max(-0.2, v.confidence_adjustment - 1.0) for v in VOLATILITY_LEVELS])
+_VOLATILITY_RISK_MULTIPLIER = np.array([v.risk_multiplier for v in VOLATILITY_LEVELS])
+
+# risk_score_hint volatility contribution (see ProcessedMarketState)
+_VOLATILITY_RISK_HINT = np.array([
+    {VolatilityLevel.VERY_LOW: -10, VolatilityLevel.LOW: -5, VolatilityLevel.NORMAL: 0,
+     VolatilityLevel.HIGH: 15, VolatilityLevel.EXTREME: 35}.get(v, 0)
+    for v in VOLATILITY_LEVELS
+], dtype=np.float64)
+
+# Optional numeric columns (None <-> NaN)
+OPTIONAL_COLUMNS = (
+    "trend_strength",
+    "data_quality_score",
+    "current_price",
+    "price_change_pct",
+    "volatility_raw",
+    "volatility_percentile",
+    "volume_ratio",
+)
+
+
+def _optional(values: np.ndarray) -> List[Optional[float]]:
+    """Column values as Python floats, NaN -> None."""
+    return [None if v != v else v for v in values.tolist()]
+
+
+def _float_column(values: Optional[Sequence[Any]], rows: int) -> np.ndarray:
+    if values is None:
+        return np.full(rows, np.nan)
+    return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+
+# ============================================================
+# MARKET STATE FRAME
+# ============================================================
+
+@dataclass
+class MarketStateFrame:
+    """
+    Market states for many symbols/timeframes in flat columns.
+
+    Row i holds one ProcessedMarketState. Categorical fields are
+    codes into TREND_STATES / VOLATILITY_LEVELS.
+    """
+
+    symbol: List[str]
+    timeframe: List[str]
+    exchange: List[str]
+    state_id: List[str]
+    trend: np.ndarray  # int8 codes into TREND_STATES
+    volatility: np.ndarray  # int8 codes into VOLATILITY_LEVELS
+    liquidity_score: np.ndarray
+    trend_strength: np.ndarray  # NaN = missing
+    data_quality_score: np.ndarray  # NaN = missing
+    current_price: np.ndarray  # NaN = missing
+    price_change_pct: np.ndarray  # NaN = missing
+    volatility_raw: np.ndarray  # NaN = missing
+    volatility_percentile: np.ndarray  # NaN = missing
+    volume_ratio: np.ndarray  # NaN = missing
+
+    @classmethod
+    def from_states(cls, states: Iterable[ProcessedMarketState]) -> "MarketStateFrame":
+        """Build a frame from ProcessedMarketState objects."""
+        states = list(states)
+        columns = {name: [getattr(s, name) for s in states] for name in OPTIONAL_COLUMNS}
+        return cls(
+            symbol=[s.symbol for s in states],
+            timeframe=[s.timeframe for s in states],
+            exchange=[s.exchange for s in states],
+            state_id=[str(s.state_id) for s in states],
+            trend=np.array([_TREND_CODE[s.trend_state] for s in states], dtype=np.int8),
+            volatility=np.array([_VOLATILITY_CODE[s.volatility_level] for s in states], dtype=np.int8),
+            liquidity_score=np.array([s.liquidity_score for s in states], dtype=np.float64),
+            **{name: _float_column(values, len(states)) for name, values in columns.items()},
+        )
+
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, Sequence[Any]]) -> "MarketStateFrame":
+        """
+        Build a frame from a columnar table.
+
+        Args:
+            columns: Column name -> values, named like the
+                     ProcessedMarketState fields (a dict of lists or a
+                     DataFrame). symbol, timeframe, trend_state,
+                     volatility_level and liquidity_score are required;
+                     enums may be given as members or values.
+        """
+        symbol = list(columns["symbol"])
+        rows = len(symbol)
+        trend = [TrendState(t) for t in columns["trend_state"]]
+        volatility = [VolatilityLevel(v) for v in columns["volatility_level"]]
+        liquidity = np.asarray(columns["liquidity_score"], dtype=np.float64)
+        if not np.all((liquidity >= 0.0) & (liquidity <= 1.0)):
+            raise ValueError("liquidity_score must be 0.0-1.0 for every row")
+
+        exchange = columns.get("exchange")
+        state_id = columns.get("state_id")
+        return cls(
+            symbol=symbol,
+            timeframe=list(columns["timeframe"]),
+            exchange=list(exchange) if exchange is not None else ["binance"] * rows,
+            state_id=[str(s) for s in state_id] if state_id is not None else [str(uuid4()) for _ in range(rows)],
+            trend=np.array([_TREND_CODE[t] for t in trend], dtype=np.int8),
+            volatility=np.array([_VOLATILITY_CODE[v] for v in volatility], dtype=np.int8),
+            liquidity_score=liquidity,
+            **{name: _float_column(columns.get(name), rows) for name in OPTIONAL_COLUMNS},
+        )
+
+    def __len__(self) -> int:
+        return len(self.symbol)
+
+    def liquidity_grade(self) -> np.ndarray:
+        """Codes into LIQUIDITY_GRADES (see LiquidityGrade.from_score)."""
+        score = self.liquidity_score
+        return (
+            (score < 0.9).astype(np.int8) + (score < 0.7) + (score < 0.5) + (score < 0.3)
+        ).astype(np.int8)
+
+
+# ============================================================
+# VECTORIZED EVALUATION
+# ============================================================
+
+@dataclass
+class SignalColumns:
+    """Per-row signal decisions for a MarketStateFrame."""
+
+    tradeable: np.ndarray  # bool
+    liquidity_grade: np.ndarray  # int8 codes into LIQUIDITY_GRADES
+    signal_type: np.ndarray  # int16 codes into SIGNAL_TYPES
+    reason_code: np.ndarray  # int16 codes into REASON_CODES (0 = None)
+    direction: np.ndarray  # int8: -1 SHORT, 0 NEUTRAL, +1 LONG
+    confidence_score: np.ndarray  # 0.0 to 1.0
+    confidence_level: np.ndarray  # int8 ConfidenceLevel values
+
+
+def compute_signal_columns(frame: MarketStateFrame) -> SignalColumns:
+    """
+    Classify every row of the frame at once.
+
+    Mirrors _classify_signal_type, _determine_direction_from_state
+    and _calculate_confidence_from_state.
+    """
+    trend = frame.trend
+    volatility = frame.volatility
+
+    grade = frame.liquidity_grade()
+    tradeable = (volatility != _EXTREME) & (grade <= 2)  # EXCELLENT, GOOD, ADEQUATE
+
+    # Trend decides the signal type; volatility only without one
+    has_trend_signal = _TREND_HAS_SIGNAL[trend]
+    signal_type = np.where(
+        has_trend_signal,
+        _TREND_SIGNAL_TYPE[trend],
+        np.where(_HIGH_VOLATILITY[volatility],
+                 _SIGNAL_TYPE_CODE[SignalType.VOLATILITY_EXPANSION],
+                 _SIGNAL_TYPE_CODE[SignalType.NONE]),
+    ).astype(np.int16)
+    reason_code = _TREND_REASON[trend]
+    direction = _TREND_DIRECTION[trend]
+
+    # Confidence: same terms, same order of addition
+    strength = np.where(np.isnan(frame.trend_strength), 0.0, frame.trend_strength)
+    quality = frame.data_quality_score
+    quality = np.where(np.isnan(quality) | (quality == 0.0), 0.5, quality)
+    quality_contrib = quality * 0.05
+    total = (
+        0.5
+        + _TREND_CONTRIB[trend]
+        + strength * 0.1
+        + _VOLATILITY_ADJUSTMENT[volatility]
+        + frame.liquidity_score * 0.15
+        + quality_contrib
+    )
+    confidence = np.where(
+        _TREND_NEUTRAL[trend],
+        np.maximum(0.0, 0.1 + quality_contrib),
+        np.minimum(1.0, np.maximum(0.0, total)),
+    )
+    level = (1 + (confidence >= 0.4) + (confidence >= 0.7) + (confidence >= 0.85)).astype(np.int8)
+
+    return SignalColumns(
+        tradeable=tradeable,
+        liquidity_grade=grade,
+        signal_type=signal_type,
+        reason_code=reason_code,
+        direction=direction,
+        confidence_score=confidence,
+        confidence_level=level,
+    )
+
+
+def risk_score_hint(frame: MarketStateFrame) -> np.ndarray:
+    """ProcessedMarketState.risk_score_hint for every row."""
+    hint = 50.0 + _VOLATILITY_RISK_HINT[frame.volatility] + (1.0 - frame.liquidity_score) * 20
+    return np.minimum(100.0, np.maximum(0.0, hint))
+
+
+# ============================================================
+# SIGNAL OBJECTS
+# ============================================================
+
+def build_signals(
+    frame: MarketStateFrame,
+    columns: SignalColumns,
+    risk_allows_trading: bool = True,
+    expiration_minutes: int = 60,
+    engine_version: str = "1.0.0",
+    now: Optional[datetime] = None,
+) -> List[StrategySignal]:
+    """
+    Build one StrategySignal per frame row.
+
+    Args:
+        frame: Market states
+        columns: Result of compute_signal_columns(frame)
+        risk_allows_trading: Whether risk module allows trading
+        expiration_minutes: Lifetime of directional signals
+        engine_version: Stamped on tradeable signals
+        now: Generation time (defaults to the current UTC time)
+    """
+    if not risk_allows_trading:
+        return [
+            StrategySignal(
+                signal_type=SignalType.NONE,
+                direction=TradeDirection.NEUTRAL,
+                confidence_score=0.0,
+                symbol=symbol,
+                timeframe=timeframe,
+                exchange=exchange,
+                explanation="Risk module does not allow trading",
+                source_state_id=state_id,
+            )
+            for symbol, timeframe, exchange, state_id in zip(
+                frame.symbol, frame.timeframe, frame.exchange, frame.state_id
+            )
+        ]
+
+    now = now or datetime.now(timezone.utc)
+    expires_at = now + timedelta(minutes=expiration_minutes)
+
+    trend_value = [TREND_STATES[c].value for c in frame.trend.tolist()]
+    volatility_value = [VOLATILITY_LEVELS[c].value for c in frame.volatility.tolist()]
+    grade_value = [LIQUIDITY_GRADES[c].value for c in columns.liquidity_grade.tolist()]
+    trend_direction = _TREND_DIRECTION_SCORE[frame.trend].tolist()
+    risk_multiplier = _VOLATILITY_RISK_MULTIPLIER[frame.volatility].tolist()
+    hints = risk_score_hint(frame).tolist()
+    liquidity = frame.liquidity_score.tolist()
+    optional = {name: _optional(getattr(frame, name)) for name in OPTIONAL_COLUMNS}
+
+    signals: List[StrategySignal] = []
+    rows = zip(
+        range(len(frame)), columns.tradeable.tolist(), columns.signal_type.tolist(),
+        columns.reason_code.tolist(), columns.direction.tolist(),
+        columns.confidence_score.tolist(), columns.confidence_level.tolist(),
+    )
+    for i, tradeable, type_code, reason, direction_code, score, level in rows:
+        symbol = frame.symbol[i]
+        timeframe = frame.timeframe[i]
+
+        if not tradeable:
+            signals.append(StrategySignal(
+                signal_type=SignalType.NONE,
+                direction=TradeDirection.NEUTRAL,
+                confidence_score=0.0,
+                symbol=symbol,
+                timeframe=timeframe,
+                exchange=frame.exchange[i],
+                explanation=f"Market state not tradeable: "
+                            f"volatility={volatility_value[i]}, "
+                            f"liquidity={grade_value[i]}",
+                source_state_id=frame.state_id[i],
+            ))
+            continue
+
+        signal_type = SIGNAL_TYPES[type_code]
+        direction = DIRECTIONS[direction_code + 1]
+        confidence_level = CONFIDENCE_LEVELS[level - 1]
+
+        if direction == TradeDirection.NEUTRAL:
+            explanation = (
+                f"{symbol} {timeframe}: "
+                f"No directional signal - trend={trend_value[i]}, "
+                f"volatility={volatility_value[i]}"
+            )
+        else:
+            dir_str = "bullish" if direction == TradeDirection.LONG else "bearish"
+            explanation = (
+                f"{symbol} {timeframe}: "
+                f"{signal_type.value} signal - {dir_str} with {confidence_level.name.lower()} confidence. "
+                f"Trend={trend_value[i]}, "
+                f"volatility={volatility_value[i]}, "
+                f"liquidity={grade_value[i]}"
+            )
+
+        signals.append(StrategySignal(
+            signal_type=signal_type,
+            direction=direction,
+            confidence_score=score,
+            confidence_level=confidence_level,
+            symbol=symbol,
+            timeframe=timeframe,
+            exchange=frame.exchange[i],
+            supporting_features={
+                "trend_state": trend_value[i],
+                "trend_direction_numeric": trend_direction[i],
+                "trend_strength": optional["trend_strength"][i],
+                "volatility_level": volatility_value[i],
+                "volatility_raw": optional["volatility_raw"][i],
+                "volatility_percentile": optional["volatility_percentile"][i],
+                "volatility_risk_multiplier": risk_multiplier[i],
+                "liquidity_score": liquidity[i],
+                "liquidity_grade": grade_value[i],
+                "current_price": optional["current_price"][i],
+                "price_change_pct": optional["price_change_pct"][i],
+                "volume_ratio": optional["volume_ratio"][i],
+                "data_quality_score": optional["data_quality_score"][i],
+                "is_tradeable": True,
+                "risk_score_hint": hints[i],
+            },
+            reason_code=REASON_CODES[reason],
+            explanation=explanation,
+            source_state_id=frame.state_id[i],
+            generated_at=now,
+            expires_at=expires_at,
+            engine_version=engine_version,
+        ))
+
+    return signals
+
+
+__all__ = [
+    "MarketStateFrame",
+    "SignalColumns",
+    "compute_signal_columns",
+    "build_signals",
+    "risk_score_hint",
+]
@@ -55,7 +55,7 @@ USAGE
 """
 
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, List, Dict, Any, Iterable, Union
 from uuid import uuid4
 import time
 
@@ -86,6 +86,7 @@ from .signals import (
     VolumeFlowSignalGenerator,
     SentimentModifierGenerator,
 )
+from .batch import MarketStateFrame, compute_signal_columns, build_signals
 
 # Import ProcessedMarketState for typed signals
 from data_processing.contracts import (
@@ -780,6 +781,9 @@ class StrategyEngine:
         """
         Generate signals for multiple symbols from a state bundle.
         
+        Evaluates all states in one vectorized pass
+        (see generate_signals_batch).
+        
         Args:
             state_bundle: Bundle of processed market states
             risk_allows_trading: Whether risk module allows trading
@@ -787,24 +791,51 @@ class StrategyEngine:
         Returns:
             SignalBundle with signals for all states in bundle
         """
+        return self.generate_signals_batch(
+            state_bundle.states.values(),
+            risk_allows_trading=risk_allows_trading,
+        )
+    
+    def generate_signals_batch(
+        self,
+        states: Union[MarketStateFrame, Iterable[ProcessedMarketState]],
+        risk_allows_trading: bool = True,
+    ) -> SignalBundle:
+        """
+        Generate signals for a whole universe of market states at once.
+        
+        ============================================================
+        PROCESS
+        ============================================================
+        1. Lay out the states as columns (MarketStateFrame)
+        2. Compute signal type, direction, reason code and
+           confidence for every row as array operations
+        3. Build one StrategySignal per row
+        
+        Signals are the same as generate_signal produces for each
+        state; one generation timestamp is used for the batch.
+        
+        Args:
+            states: MarketStateFrame (e.g. from a columnar table via
+                    MarketStateFrame.from_columns) or market states
+            risk_allows_trading: Whether risk module allows trading
+                                 (MUST be checked by caller, not bypassed)
+        
+        Returns:
+            SignalBundle with one signal per row, in row order
+        """
         start_time = time.time()
         evaluation_id = str(uuid4())[:8]
         
-        signals: List[StrategySignal] = []
-        symbols_evaluated: List[str] = []
-        timeframes_evaluated: List[str] = []
+        frame = states if isinstance(states, MarketStateFrame) else MarketStateFrame.from_states(states)
         
-        for key, state in state_bundle.states.items():
-            signal = self.generate_signal(
-                market_state=state,
-                risk_allows_trading=risk_allows_trading,
-            )
-            signals.append(signal)
-            
-            if state.symbol not in symbols_evaluated:
-                symbols_evaluated.append(state.symbol)
-            if state.timeframe not in timeframes_evaluated:
-                timeframes_evaluated.append(state.timeframe)
+        signals = build_signals(
+            frame,
+            compute_signal_columns(frame),
+            risk_allows_trading=risk_allows_trading,
+            expiration_minutes=self.config.lifecycle.default_expiration_minutes,
+            engine_version=self.config.engine_version,
+        )
         
         duration_ms = (time.time() - start_time) * 1000
         
@@ -812,8 +843,8 @@ class StrategyEngine:
             signals=signals,
             evaluation_id=evaluation_id,
             timestamp=datetime.now(timezone.utc),
-            symbols_evaluated=symbols_evaluated,
-            timeframes_evaluated=timeframes_evaluated,
+            symbols_evaluated=list(dict.fromkeys(frame.symbol)),
+            timeframes_evaluated=list(dict.fromkeys(frame.timeframe)),
             evaluation_duration_ms=duration_ms,
         )
     
@@ -1,3 +0,0 @@
-"""
-Tests package for monitoring subsystem.
-"""
@@ -0,0 +1,182 @@
+"""
+Tests for the indexed alert history.
+
+============================================================
+TEST SCENARIOS
+============================================================
+1. Every indexed view matches a full scan of the log through
+   random adds, acknowledgements, resolutions and trims
+2. Time-range queries bisect the log, including alerts that
+   arrive out of order
+3. Trimmed alerts leave every index
+4. The manager resolves an alert in the history when its
+   rule's condition clears
+
+============================================================
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from monitoring.alerts import (
+    AlertCategory,
+    AlertHistory,
+    AlertManager,
+    AlertRule,
+    AlertRuleConfig,
+)
+from monitoring.models import Alert, AlertTier
+
+
+T0 = datetime(2024, 3, 1, 12)
+CATEGORIES = ["system", "risk", "data"]
+RULES = ["halted", "drawdown", "stale", "margin"]
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+def make_alert(i, minutes=None, rng=random):
+    return Alert(
+        alert_id=f"a{i}",
+        tier=rng.choice(list(AlertTier)),
+        category=rng.choice(CATEGORIES),
+        title=f"Alert {i}",
+        message="",
+        triggered_at=T0 + timedelta(minutes=i if minutes is None else minutes),
+        triggered_by_rule=rng.choice(RULES),
+    )
+
+
+def ids(alerts):
+    return [a.alert_id for a in alerts]
+
+
+def assert_views_match_scan(history):
+    log = list(history._alerts)
+    assert ids(history.get_active()) == ids(a for a in log if not a.resolved)
+    assert ids(history.get_unacknowledged()) == ids(a for a in log if not a.acknowledged)
+    for tier in AlertTier:
+        assert ids(history.get_by_tier(tier)) == ids(a for a in log if a.tier == tier)
+    for category in CATEGORIES:
+        assert ids(history.get_by_category(category)) == ids(a for a in log if a.category == category)
+    for rule in RULES:
+        assert ids(history.get_by_rule(rule)) == ids(a for a in log if a.triggered_by_rule == rule)
+    assert ids(history.get_recent(7)) == ids(log[::-1][:7])
+
+
+class ToggleRule(AlertRule):
+    """Triggers while context["bad"] is set, resolves once it clears."""
+
+    def __init__(self):
+        super().__init__(AlertRuleConfig(
+            rule_id="toggle", rule_name="Toggle", category=AlertCategory.SYSTEM,
+            tier=AlertTier.WARNING, description="test", cooldown_seconds=0,
+        ))
+
+    def evaluate(self, context):
+        if context["bad"] and not self.is_active:
+            return self.trigger(title="Bad", message="bad")
+        if not context["bad"] and self.is_active:
+            self.resolve()
+        return None
+
+
+# ============================================================
+# INDEXES
+# ============================================================
+
+class TestIndexes:
+
+    def test_views_match_full_scan(self):
+        rng = random.Random(11)
+        history = AlertHistory(max_history=200)
+
+        for i in range(1000):
+            history.add(make_alert(i, rng=rng))
+            if rng.random() < 0.3:
+                target = f"a{rng.randint(0, i)}"
+                if rng.random() < 0.5:
+                    history.acknowledge(target, "operator")
+                else:
+                    history.resolve(target)
+            if i % 97 == 0:
+                assert_views_match_scan(history)
+
+        assert len(history) == 200
+        assert_views_match_scan(history)
+
+        stats = history.stats()
+        assert stats["total_alerts"] == 200
+        assert stats["active_alerts"] == len(history.get_active())
+        assert stats["unacknowledged"] == len(history.get_unacknowledged())
+        assert sum(stats["by_tier"].values()) == 200
+
+    def test_lifecycle_flags(self):
+        history = AlertHistory()
+        resolved = make_alert(1)
+        resolved.resolved = True
+        history.add(make_alert(0))
+        history.add(resolved)
+
+        assert ids(history.get_active()) == ["a0"]
+        assert history.acknowledge("a0", "operator")
+        assert history.get("a0").acknowledged_by == "operator"
+        assert ids(history.get_unacknowledged()) == ["a1"]
+        assert history.resolve("a0")
+        assert history.get("a0").resolved_at is not None
+        assert history.get_active() == []
+        assert not history.acknowledge("missing", "operator")
+        assert not history.resolve("missing")
+
+
+# ============================================================
+# TIME RANGES
+# ============================================================
+
+class TestTimeRanges:
+
+    def test_since_and_until(self):
+        history = AlertHistory()
+        for i in range(0, 100, 2):
+            history.add(make_alert(i))
+        history.add(make_alert(101, minutes=51))  # Late arrival
+
+        since = history.get_since(T0 + timedelta(minutes=50), until=T0 + timedelta(minutes=56))
+        assert ids(since) == ["a50", "a101", "a52", "a54"]
+        assert ids(history.get_since(T0 + timedelta(minutes=95))) == ["a96", "a98"]
+        assert history.get_since(T0 + timedelta(days=1)) == []
+        assert history.count_since(T0 + timedelta(minutes=90)) == 5
+        assert history.count_since(T0 - timedelta(days=1)) == 51
+
+    def test_trim_unindexes(self):
+        history = AlertHistory(max_history=3)
+        for i in range(5):
+            history.add(make_alert(i, rng=random.Random(0)))
+
+        assert ids(history.get_recent()) == ["a4", "a3", "a2"]
+        assert history.get("a0") is None
+        assert "a0" not in ids(history.get_active())
+        assert sum(len(history.get_by_category(c)) for c in CATEGORIES) == 3
+
+
+# ============================================================
+# MANAGER
+# ============================================================
+
+class TestManager:
+
+    @pytest.mark.asyncio
+    async def test_rule_resolution_reaches_history(self):
+        manager = AlertManager(rules=[ToggleRule()])
+
+        triggered = await manager.evaluate({"bad": True})
+        assert ids(manager.get_active_alerts()) == ids(triggered)
+
+        await manager.evaluate({"bad": False})
+        assert manager.get_active_alerts() == []
+        assert manager.history.get(triggered[0].alert_id).resolved
+        assert manager.get_alert_summary()["active_count"] == 0
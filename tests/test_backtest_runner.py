@@ -0,0 +1,222 @@
+"""
+Tests for the backtest runner and its columnar dataset.
+
+============================================================
+TEST SCENARIOS
+============================================================
+1. A dataset survives save/open (memory-mapped) unchanged
+2. Grid overrides copy nested configs and reject unknown paths
+3. A run trades through the risk budget and its metrics add up
+4. A process-pool sweep matches in-process runs, keeps grid
+   order and streams every result to the sink
+5. The result store writes one run and its metrics per result
+
+============================================================
+"""
+
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from backtesting import (
+    BacktestConfig,
+    BacktestDataset,
+    BacktestResultStore,
+    BacktestRunner,
+)
+from backtesting.backtest_runner import apply_overrides, expand_grid
+from core.exceptions import InvalidConfigError
+from strategy_engine.types import (
+    EnvironmentalContext,
+    MarketStructureInput,
+    SentimentInput,
+    StrategyInput,
+    VolumeFlowInput,
+)
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+def make_inputs(hours=24 * 6, symbols=("BTC/USDT", "ETH/USDT"), seed=1):
+    """Trending random walks with features the engine can act on."""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    prices = {s: 100.0 * (i + 1) for i, s in enumerate(symbols)}
+    inputs = []
+    for h in range(hours):
+        timestamp = start + timedelta(hours=h)
+        for symbol in symbols:
+            drift = math.sin(h / 12 + len(symbol))
+            prices[symbol] *= 1 + drift * 0.004 + rng.gauss(0, 0.006)
+            buy = min(0.95, max(0.05, 0.5 + drift * 0.25 + rng.gauss(0, 0.05)))
+            inputs.append(StrategyInput(
+                market_structure=MarketStructureInput(
+                    current_price=prices[symbol],
+                    trend_direction_1h=max(-1.0, min(1.0, drift + rng.gauss(0, 0.2))),
+                    trend_direction_4h=drift,
+                    trend_strength=abs(drift),
+                    higher_high=drift > 0.3 or None,
+                    lower_low=drift < -0.3 or None,
+                    breakout_direction=rng.choice(["UP", "DOWN", None]),
+                    data_timestamp=timestamp,
+                ),
+                volume_flow=VolumeFlowInput(
+                    volume_ratio_vs_average=rng.uniform(0.5, 2.5),
+                    buy_volume_ratio=buy,
+                    sell_volume_ratio=1 - buy,
+                    volume_expanding=rng.random() < 0.5,
+                ),
+                sentiment=SentimentInput(sentiment_score=rng.uniform(-1, 1)),
+                environment=EnvironmentalContext(
+                    risk_level=rng.choice(["LOW", "MEDIUM", "HIGH"]),
+                    risk_score_total=rng.randint(0, 5),
+                ),
+                timestamp=timestamp,
+                symbol=symbol,
+            ))
+    rng.shuffle(inputs)
+    return inputs
+
+
+@pytest.fixture(scope="module")
+def inputs():
+    return make_inputs()
+
+
+@pytest.fixture(scope="module")
+def dataset(inputs):
+    return BacktestDataset.from_inputs(inputs)
+
+
+GRID = {
+    "strategy.combination.min_structure_strength": [1, 2],
+    "risk.capital_tiers.0.per_trade.max_risk_pct": [0.25, 0.5],
+}
+
+
+# ============================================================
+# DATASET
+# ============================================================
+
+class TestDataset:
+
+    def test_save_and_open_round_trip(self, inputs, dataset, tmp_path):
+        shared = dataset.save(str(tmp_path / "window"))
+
+        assert isinstance(shared.columns["market_structure.current_price"], np.memmap)
+        expected = sorted(inputs, key=lambda i: i.timestamp)
+        assert list(shared.iter_inputs(block_size=50)) == expected
+        assert shared.time_range() == (expected[0].timestamp, expected[-1].timestamp)
+        assert sorted(shared.symbols()) == ["BTC/USDT", "ETH/USDT"]
+
+
+# ============================================================
+# OVERRIDES
+# ============================================================
+
+class TestOverrides:
+
+    def test_nested_overrides_copy(self):
+        base = BacktestConfig(name="base")
+        tier_risk = base.risk_config.capital_tiers[0].per_trade.max_risk_pct
+
+        updated = apply_overrides(base, {
+            "strategy.combination.min_structure_strength": 3,
+            "risk.capital_tiers.0.per_trade.max_risk_pct": 0.1,
+        })
+
+        assert updated.strategy_config.combination.min_structure_strength == 3
+        assert updated.risk_config.capital_tiers[0].per_trade.max_risk_pct == 0.1
+        assert base.risk_config.capital_tiers[0].per_trade.max_risk_pct == tier_risk
+        assert len(expand_grid(GRID)) == 4
+
+    @pytest.mark.parametrize("key", [
+        "strategy.combination.no_such_field",
+        "risk.capital_tiers.99.per_trade.max_risk_pct",
+        "execution.slippage_bps",
+    ])
+    def test_unknown_path_rejected(self, key):
+        with pytest.raises(InvalidConfigError):
+            apply_overrides(BacktestConfig(name="base"), {key: 1})
+
+
+# ============================================================
+# RUNS
+# ============================================================
+
+class TestRunner:
+
+    async def test_run_metrics(self, dataset):
+        result = await BacktestRunner(BacktestConfig(name="single"), dataset).run()
+
+        metrics = result.metrics
+        assert result.succeeded
+        assert metrics["total_trades"] == len(result.trades) > 6
+        assert metrics["intents"] > metrics["total_trades"]
+        assert metrics["risk_rejections"] > 0  # Daily budget caps trades per day
+        assert metrics["total_pnl"] == pytest.approx(sum(t.pnl for t in result.trades))
+        # Trades of several replayed days: the daily budget was reset
+        assert len({t.entry_time.date() for t in result.trades}) > 3
+        assert all(t.exit_time >= t.entry_time for t in result.trades)
+
+    async def test_sweep_matches_single_runs(self, dataset):
+        received = []
+        runner = BacktestRunner(BacktestConfig(name="sweep"), dataset, result_sink=received.append)
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = await runner.run_sweep(GRID, executor=executor)
+
+        assert [r.parameters for r in results] == expand_grid(GRID)
+        assert sorted(r.backtest_id for r in received) == sorted(r.backtest_id for r in results)
+        for result in results:
+            single = await BacktestRunner(BacktestConfig(name="single"), dataset).run(result.parameters)
+            assert result.metrics == single.metrics
+        assert len({r.metrics["total_pnl"] for r in results}) > 1
+
+
+# ============================================================
+# STORAGE
+# ============================================================
+
+class FakeSession:
+
+    def __init__(self, store):
+        self.store = store
+
+    def add(self, row):
+        self.store.append(row)
+
+    def add_all(self, rows):
+        self.store.extend(rows)
+
+    def commit(self):
+        self.store.append("commit")
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class TestResultStore:
+
+    async def test_writes_run_and_metrics(self, dataset):
+        rows = []
+        store = BacktestResultStore(lambda: FakeSession(rows))
+        result = await BacktestRunner(BacktestConfig(name="stored"), dataset, result_sink=store).run(
+            {"strategy.combination.min_structure_strength": 2}
+        )
+
+        run, *metrics, commit = rows
+        assert str(run.run_id) == result.backtest_id
+        assert run.status == "completed"
+        assert run.config_snapshot == {"parameters": {"strategy.combination.min_structure_strength": 2}}
+        assert {m.metric_name for m in metrics} == set(result.metrics)
+        assert commit == "commit"
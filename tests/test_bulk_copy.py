@@ -0,0 +1,122 @@
+"""
+Tests for the COPY bulk-load path.
+
+============================================================
+TEST SCENARIOS
+============================================================
+1. Batches above the COPY threshold go through copy_upsert
+2. Python-side column defaults (created_at) are loaded with
+   the rows, so NOT NULL columns are never left empty
+3. Values supplied by the caller are not overridden
+
+============================================================
+"""
+
+import csv
+import io
+from datetime import datetime
+
+from database.bulk import DEFAULT_COPY_THRESHOLD, bulk_upsert
+from database.models import MarketData
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+class FakeCursor:
+    """psycopg2-like cursor that captures COPY payloads."""
+
+    def __init__(self, copies):
+        self.copies = copies
+
+    def copy_expert(self, sql, buffer):
+        self.copies.append((sql, buffer.getvalue()))
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+    """Session exposing a COPY-capable DBAPI connection."""
+
+    def __init__(self):
+        self.copies = []
+        self.statements = []
+        cursor = lambda: FakeCursor(self.copies)
+        dbapi = type("DBAPI", (), {"cursor": staticmethod(cursor)})()
+        raw = type("Raw", (), {"dbapi_connection": dbapi})()
+        self._conn = type("Conn", (), {"connection": raw})()
+
+    def connection(self):
+        return self._conn
+
+    def execute(self, statement):
+        self.statements.append(str(statement))
+
+
+def kline_rows(count):
+    fetched = datetime(2026, 1, 1)
+    return [
+        {
+            "symbol": "BTC",
+            "pair": "BTCUSDT",
+            "exchange": "binance",
+            "open_price": 1.0,
+            "high_price": 2.0,
+            "low_price": 0.5,
+            "close_price": 1.5,
+            "volume": 10.0,
+            "interval": "1m",
+            "candle_open_time": datetime(2026, 1, 1, 0, i % 60),
+            "candle_close_time": datetime(2026, 1, 1, 0, i % 60, 59),
+            "fetched_at": fetched,
+        }
+        for i in range(count)
+    ]
+
+
+# ============================================================
+# TESTS
+# ============================================================
+
+class TestCopyUpsert:
+
+    def test_large_batch_fills_python_defaults(self):
+        session = FakeSession()
+        rows = kline_rows(DEFAULT_COPY_THRESHOLD + 1)
+
+        sent = bulk_upsert(
+            session,
+            MarketData,
+            rows,
+            conflict_constraint="uq_market_data",
+            update_columns=["close_price"],
+        )
+
+        assert sent == len(rows)
+        assert len(session.copies) == 1
+        sql, payload = session.copies[0]
+        assert '"created_at"' in sql
+        assert '"source_module"' in sql
+
+        loaded = list(csv.reader(io.StringIO(payload)))
+        header = [col.strip('"') for col in sql.split("(", 1)[1].split(")", 1)[0].split(", ")]
+        created = header.index("created_at")
+        assert len(loaded) == len(rows)
+        assert all(line[created] not in ("", "\\N") for line in loaded)
+
+        insert = next(s for s in session.statements if s.startswith("INSERT"))
+        assert '"created_at"' in insert
+
+    def test_caller_values_are_kept(self):
+        session = FakeSession()
+        rows = kline_rows(DEFAULT_COPY_THRESHOLD)
+
+        bulk_upsert(session, MarketData, rows)
+
+        sql, payload = session.copies[0]
+        header = [col.strip('"') for col in sql.split("(", 1)[1].split(")", 1)[0].split(", ")]
+        first = next(csv.reader(io.StringIO(payload)))
+        assert first[header.index("fetched_at")] == datetime(2026, 1, 1).isoformat()
+        assert first[header.index("source_module")] == "market_data_collector"
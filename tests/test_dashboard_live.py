@@ -0,0 +1,292 @@
+"""
+Tests for the push-based live dashboard.
+
+============================================================
+TEST SCENARIOS
+============================================================
+1. The views are computed once per change, however many
+   subscribers are connected, and not at all without any
+2. Subscribers get a snapshot, then deltas holding only the
+   views that changed
+3. Alert events refresh only the alert-driven views; rows
+   written by another process are picked up by the watermark
+4. A subscriber that falls behind is resynchronised with a
+   snapshot instead of blocking the publisher
+5. The API serves the snapshot and streams updates over SSE
+   and WebSocket
+6. One-off snapshot reads are served from memory until older
+   than max_staleness_seconds, then recomputed once however many
+   requests arrive together; a client resuming ahead of the
+   server gets a snapshot
+
+============================================================
+"""
+
+import asyncio
+import json
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from dashboard.live import WATERMARK_MODELS, PublisherConfig, SnapshotPublisher
+from database.models import SystemMonitoring
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+class FakeViews:
+    """View queries returning mutable state and counting calls."""
+
+    def __init__(self):
+        self.state = {"health": ["UP"], "alerts": [], "risk": {"score": 10}}
+        self.calls = {name: 0 for name in self.state}
+
+    def query(self, name):
+        def run(service):
+            self.calls[name] += 1
+            return list(self.state[name]) if isinstance(self.state[name], list) else dict(self.state[name])
+        return run
+
+    @property
+    def views(self):
+        return {name: self.query(name) for name in self.state}
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+    for model in WATERMARK_MODELS:
+        model.__table__.create(engine)
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def fake():
+    return FakeViews()
+
+
+@pytest.fixture
+async def publishers():
+    created = []
+    yield created
+    for publisher in created:
+        await publisher.stop()
+
+
+def make_publisher(publishers, session_factory, fake, **config):
+    config.setdefault("poll_interval_seconds", 0.02)
+    publisher = SnapshotPublisher(
+        session_factory=session_factory, config=PublisherConfig(**config), views=fake.views,
+    )
+    publishers.append(publisher)
+    return publisher
+
+
+# ============================================================
+# PUBLISHER
+# ============================================================
+
+class TestPublisher:
+
+    async def test_computed_once_for_all_subscribers(self, publishers, session_factory, fake):
+        publisher = make_publisher(publishers, session_factory, fake)
+        publisher.start()
+        await asyncio.sleep(0.1)
+        assert publisher.refreshes == 0  # Nobody watching
+
+        subscriptions = [publisher.subscribe() for _ in range(20)]
+        messages = [await s.get(timeout=1) for s in subscriptions]
+
+        assert all(m["type"] == "snapshot" and m["version"] == 1 for m in messages)
+        assert messages[0]["views"] == {"health": ["UP"], "alerts": [], "risk": {"score": 10}}
+        await asyncio.sleep(0.1)  # Several idle polls
+        assert publisher.refreshes == 1
+        assert fake.calls == {"health": 1, "alerts": 1, "risk": 1}
+
+        late = publisher.subscribe()
+        assert (await late.get(timeout=1))["version"] == 1
+        assert publisher.refreshes == 1
+
+        for s in subscriptions + [late]:
+            s.close()
+        assert publisher.subscriber_count == 0
+
+    async def test_deltas_hold_changed_views(self, publishers, session_factory, fake):
+        publisher = make_publisher(publishers, session_factory, fake)
+        await publisher.refresh()
+        subscription = publisher.subscribe()
+        assert (await subscription.get(timeout=1))["type"] == "snapshot"
+
+        fake.state["risk"] = {"score": 80}
+        assert await publisher.refresh() == {"risk": {"score": 80}}
+        delta = await subscription.get(timeout=1)
+        assert delta == {
+            "type": "delta", "version": 2,
+            "generated_at": delta["generated_at"], "views": {"risk": {"score": 80}},
+        }
+
+        assert await publisher.refresh() == {}
+        assert publisher.version == 2
+        assert await subscription.get(timeout=0.05) is None
+        assert publisher.snapshot()["views"]["risk"] == {"score": 80}
+
+    async def test_alert_event_refreshes_alert_views(self, publishers, session_factory, fake):
+        publisher = make_publisher(publishers, session_factory, fake, max_staleness_seconds=60)
+        subscription = publisher.subscribe()
+        await subscription.get(timeout=1)
+        await asyncio.sleep(0.05)  # Baseline watermark recorded
+
+        fake.state["alerts"] = ["margin"]
+        assert await publisher("alert") is True
+        delta = await subscription.get(timeout=1)
+
+        assert delta["views"] == {"alerts": ["margin"]}
+        assert fake.calls == {"health": 2, "alerts": 2, "risk": 1}
+
+    async def test_watermark_detects_external_writes(self, publishers, session_factory, fake):
+        publisher = make_publisher(publishers, session_factory, fake)
+        subscription = publisher.subscribe()
+        await subscription.get(timeout=1)
+        await asyncio.sleep(0.05)
+        assert publisher.refreshes == 1
+
+        session = session_factory()
+        session.add(SystemMonitoring(
+            id=1, event_type="health_check", severity="info",
+            module_name="orchestrator", message="cycle complete",
+        ))
+        session.commit()
+        fake.state["health"] = ["DEGRADED"]
+
+        delta = await subscription.get(timeout=1)
+        assert delta["views"] == {"health": ["DEGRADED"]}
+        assert fake.calls["risk"] == 2  # A cycle may change every view
+
+    async def test_slow_subscriber_is_resynced(self, publishers, session_factory, fake):
+        publisher = make_publisher(publishers, session_factory, fake, subscriber_queue_size=2)
+        await publisher.refresh()
+        subscription = publisher.subscribe()
+
+        for score in range(5):
+            fake.state["risk"] = {"score": score}
+            await publisher.refresh(["risk"])
+
+        # Deltas 2-6 overflowed twice; the backlog restarts from a snapshot
+        snapshot = await subscription.get(timeout=1)
+        assert snapshot["type"] == "snapshot" and snapshot["version"] == 5
+        assert snapshot["views"]["risk"] == {"score": 3}
+        delta = await subscription.get(timeout=1)
+        assert delta["version"] == 6 and delta["views"] == {"risk": {"score": 4}}
+        assert await subscription.get(timeout=0.05) is None
+
+
+# ============================================================
+# API
+# ============================================================
+
+class TestApi:
+
+    @pytest.fixture
+    def client(self, session_factory, fake):
+        testclient = pytest.importorskip("fastapi.testclient")
+        from dashboard.main import app
+        from dashboard.routers.live import get_publisher
+
+        publisher = SnapshotPublisher(
+            session_factory=session_factory,
+            config=PublisherConfig(poll_interval_seconds=0.02),
+            views=fake.views,
+        )
+        app.dependency_overrides[get_publisher] = lambda: publisher
+        try:
+            with testclient.TestClient(app) as client:
+                yield client
+        finally:
+            app.dependency_overrides.clear()
+
+    def test_snapshot(self, client, fake):
+        first = client.get("/live/snapshot").json()
+        second = client.get("/live/snapshot").json()
+
+        assert first["type"] == "snapshot" and first["version"] == 1
+        assert second == first
+        assert fake.calls["health"] == 1
+
+    async def test_snapshot_served_from_memory_until_stale(self, publishers, session_factory, fake):
+        from dashboard.routers.live import get_live_snapshot
+
+        publisher = make_publisher(
+            publishers, session_factory, fake, poll_interval_seconds=60, max_staleness_seconds=0.05,
+        )
+        subscription = publisher.subscribe()
+        assert (await subscription.get(timeout=1))["type"] == "snapshot"
+        await publisher.stop()  # Keep the loop from refreshing on its own
+        calls = fake.calls["health"]
+
+        fake.state["health"] = ["DOWN"]
+        assert (await get_live_snapshot(publisher=publisher))["views"]["health"] == ["UP"]
+        assert fake.calls["health"] == calls
+
+        await asyncio.sleep(0.06)
+        assert (await get_live_snapshot(publisher=publisher))["views"]["health"] == ["DOWN"]
+        subscription.close()
+
+    async def test_concurrent_reads_share_one_refresh(self, publishers, session_factory, fake):
+        from dashboard.routers.live import get_live_snapshot
+
+        publisher = make_publisher(publishers, session_factory, fake, max_staleness_seconds=0.05)
+        await publisher.ensure_fresh()
+        await asyncio.sleep(0.06)
+        fake.state["health"] = ["DOWN"]
+
+        snapshots = await asyncio.gather(*(get_live_snapshot(publisher=publisher) for _ in range(10)))
+
+        assert fake.calls["health"] == 2
+        assert all(s["views"]["health"] == ["DOWN"] and s["version"] == 2 for s in snapshots)
+
+    async def test_server_sent_events(self, publishers, session_factory, fake):
+        # TestClient buffers whole bodies, so read the endless stream directly
+        from dashboard.routers.live import stream_live
+
+        publisher = make_publisher(publishers, session_factory, fake)
+        response = await stream_live(since=None, publisher=publisher)
+        assert response.media_type == "text/event-stream"
+        events = response.body_iterator
+
+        first = await asyncio.wait_for(events.__anext__(), 1)
+        event, event_id, data = first.strip().split("\n")
+        assert (event, event_id) == ("event: snapshot", "id: 1")
+        assert json.loads(data[len("data: "):])["views"]["health"] == ["UP"]
+
+        fake.state["health"] = ["DOWN"]
+        publisher.notify("alert")
+        second = await asyncio.wait_for(events.__anext__(), 1)
+        assert second.startswith("event: delta\nid: 2\n")
+
+        await events.aclose()
+        assert publisher.subscriber_count == 0
+
+        # A client already at the current version only gets what follows
+        resumed = (await stream_live(since=2, publisher=publisher)).body_iterator
+        fake.state["risk"] = {"score": 99}
+        publisher.notify("cycle")
+        assert (await asyncio.wait_for(resumed.__anext__(), 1)).startswith("event: delta\nid: 3\n")
+        await resumed.aclose()
+
+        # A client ahead of the server (e.g. after a restart) is resynchronised
+        ahead = (await stream_live(since=50, publisher=publisher)).body_iterator
+        assert (await asyncio.wait_for(ahead.__anext__(), 1)).startswith("event: snapshot\nid: 3\n")
+        await ahead.aclose()
+
+    def test_websocket(self, client):
+        with client.websocket_connect("/live/ws") as websocket:
+            message = websocket.receive_json()
+
+        assert message["type"] == "snapshot"
+        assert message["views"]["risk"] == {"score": 10}
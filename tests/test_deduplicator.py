@@ -0,0 +1,166 @@
+"""
+Tests for the near-duplicate index.
+
+============================================================
+TEST SCENARIOS
+============================================================
+1. Batch SimHashes match the per-bit definition
+2. Matches differing in the high 32 bits are found
+3. Exact-recall probing finds every hash a full scan would
+4. Entries older than the time window are evicted on insert
+   and ignored by queries before that
+5. check_batch gives the same results as check_duplicate
+
+============================================================
+"""
+
+import hashlib
+import random
+from datetime import datetime, timedelta
+from uuid import UUID
+
+import numpy as np
+
+from data_processing.cleaning.deduplicator import (
+    Deduplicator,
+    DeduplicatorConfig,
+    SimHashIndex,
+    popcount64,
+)
+
+
+T0 = datetime(2026, 3, 1)
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+def reference_simhash(content, shingle_size=3):
+    words = content.split()
+    shingles = {" ".join(words[i:i + shingle_size]) for i in range(len(words) - shingle_size + 1)}
+    if not shingles:
+        return 0
+    v = [0] * 64
+    for shingle in shingles:
+        h = int(hashlib.md5(shingle.encode()).hexdigest(), 16) % (2 ** 64)
+        for i in range(64):
+            v[i] += 1 if h & (1 << i) else -1
+    return sum(1 << i for i in range(64) if v[i] > 0)
+
+
+def make_articles(count, seed=11, dup_rate=0.3):
+    rng = random.Random(seed)
+    vocab = [f"word{i}" for i in range(400)]
+    articles = []
+    for i in range(count):
+        if articles and rng.random() < dup_rate:
+            words = articles[rng.randrange(len(articles))][1].split()
+            for _ in range(rng.randint(0, 3)):
+                words[rng.randrange(len(words))] = rng.choice(vocab)
+        else:
+            words = [rng.choice(vocab) for _ in range(rng.randint(30, 60))]
+        articles.append((UUID(int=i + 1), " ".join(words), "test", T0 + timedelta(minutes=i)))
+    return articles
+
+
+# ============================================================
+# SIMHASH
+# ============================================================
+
+class TestSimHash:
+
+    def test_batch_matches_reference(self):
+        dedup = Deduplicator(DeduplicatorConfig())
+        contents = [text for _, text, _, _ in make_articles(50)] + ["", "too short"]
+
+        fingerprints = dedup.compute_simhashes(contents)
+
+        assert [int(f) for f in fingerprints] == [reference_simhash(c) for c in contents]
+
+    def test_popcount(self):
+        values = np.random.default_rng(1).integers(0, 2 ** 64, size=100, dtype=np.uint64)
+        assert popcount64(values).tolist() == [bin(int(v)).count("1") for v in values]
+
+
+# ============================================================
+# INDEX
+# ============================================================
+
+class TestSimHashIndex:
+
+    def test_high_bit_differences_are_found(self):
+        index = SimHashIndex(max_distance=9)
+        index.add(UUID(int=1), 0x0123456789ABCDEF, 0.0)
+
+        match = index.best_match(0x0123456789ABCDEF ^ (1 << 63) ^ (1 << 40) ^ (1 << 33))
+
+        assert match == (UUID(int=1), 3)
+
+    def test_exact_recall_matches_full_scan(self):
+        rng = np.random.default_rng(3)
+        stored = rng.integers(0, 2 ** 64, size=500, dtype=np.uint64)
+        index = SimHashIndex(max_distance=9, probe_bits=None)
+        for i, fingerprint in enumerate(stored.tolist()):
+            index.add(UUID(int=i), fingerprint, 0.0)
+
+        queries = []
+        for fingerprint in stored[:200].tolist():
+            flips = rng.choice(64, size=int(rng.integers(0, 12)), replace=False)
+            queries.append(fingerprint ^ sum(1 << int(b) for b in flips))
+        queries = np.array(queries, dtype=np.uint64)
+
+        matches = index.best_matches(queries, np.full(len(queries), -np.inf))
+        for query, match in zip(queries, matches):
+            distances = popcount64(stored ^ query)
+            if distances.min() <= 9:
+                assert match is not None and match[1] == distances.min()
+            else:
+                assert match is None
+        assert index.exact_recall
+
+    def test_eviction_on_insert(self):
+        dedup = Deduplicator(DeduplicatorConfig(time_window_hours=24))
+        text = "bitcoin etf approval expected by the end of the week say analysts"
+        dedup.check_duplicate(UUID(int=1), text, "a", T0)
+        dedup.check_duplicate(UUID(int=2), "unrelated story about ethereum staking yields", "a",
+                              T0 + timedelta(hours=30))
+
+        stats = dedup.get_index_stats()
+        assert stats["exact_hash_count"] == 1
+        assert stats["simhash_entry_count"] == 1
+        assert not dedup.check_duplicate(UUID(int=3), text, "b", T0 + timedelta(hours=31)).is_duplicate
+
+    def test_window_applies_before_eviction(self):
+        dedup = Deduplicator(DeduplicatorConfig(time_window_hours=24))
+        text = "solana network outage halts block production for hours"
+        dedup.check_duplicate(UUID(int=1), text, "a", T0)
+        dedup.check_duplicate(UUID(int=2), "unrelated story about ethereum staking yields", "a",
+                              T0 + timedelta(hours=10))
+
+        # Still indexed, but too old for an article 30 hours later
+        assert dedup.get_index_stats()["exact_hash_count"] == 2
+        assert not dedup.check_duplicate(UUID(int=3), text, "b", T0 + timedelta(hours=30)).is_duplicate
+
+
+# ============================================================
+# BATCH
+# ============================================================
+
+class TestBatch:
+
+    def test_batch_matches_sequential(self):
+        articles = make_articles(300)
+        config = DeduplicatorConfig(lsh_probe_bits=None)
+
+        sequential = Deduplicator(config)
+        expected = [sequential.check_duplicate(*article) for article in articles]
+        batched = Deduplicator(config)
+        actual = []
+        for start in range(0, len(articles), 64):
+            actual.extend(batched.check_batch(articles[start:start + 64]))
+
+        key = lambda r: (r.item_id, r.is_duplicate, r.duplicate_type, r.original_id, r.similarity_score)
+        assert [key(r) for r in actual] == [key(r) for r in expected]
+        assert sum(r.is_duplicate for r in actual) > 40
+        assert any(r.duplicate_type == "near" for r in actual)
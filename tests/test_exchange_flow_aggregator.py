@@ -0,0 +1,188 @@
+"""
+Tests for the incremental exchange flow aggregator.
+
+============================================================
+TEST SCENARIOS
+============================================================
+1. Buckets that gained raw rows since the watermark are summed
+   in full per (token, exchange); untouched buckets, other
+   tokens, flow types, retention or no exchange are left out
+2. A row committed late (lower id, after newer rows were folded)
+   is still counted, and re-running a cycle counts nothing twice
+3. Windows roll up the buckets from a bucket-aligned start,
+   with net flow, flow ratio and per-token dominance
+
+The bucket query is Postgres SQL; it runs here on SQLite with
+to_timestamp / timezone / floor stand-ins registered on the
+connection, and BIGINT ids declared as INTEGER so they autoincrement.
+
+============================================================
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event, select, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateTable
+
+from data_ingestion.exchange_flow_aggregator import (
+    ExchangeFlowAggregator,
+    ExchangeFlowAggregatorConfig,
+)
+from database.models import ExchangeFlowBucket, OnchainFlowRaw, PipelineWatermark
+
+NOW = datetime(2026, 3, 1, 12, 2, 30)
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+@pytest.fixture
+def session():
+    engine = create_engine(
+        "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+
+    @event.listens_for(engine, "connect")
+    def register_functions(dbapi_connection, _):
+        dbapi_connection.create_function(
+            "to_timestamp", 1,
+            lambda epoch: datetime.utcfromtimestamp(epoch).strftime("%Y-%m-%d %H:%M:%S.%f"),
+        )
+        dbapi_connection.create_function("timezone", 2, lambda zone, value: value)
+        dbapi_connection.create_function("floor", 1, lambda value: int(value // 1))
+
+    with engine.begin() as connection:
+        for model in (OnchainFlowRaw, ExchangeFlowBucket, PipelineWatermark):
+            ddl = str(CreateTable(model.__table__).compile(engine))
+            connection.execute(text(ddl.replace("id BIGINT NOT NULL", "id INTEGER NOT NULL")))
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def raw_flow(id, token, flow_type, entity, amount, amount_usd, event_time, created_at=NOW):
+    inflow = flow_type == "exchange_inflow"
+    return OnchainFlowRaw(
+        id=id, correlation_id=f"c{id}", token=token, chain="bitcoin", flow_type=flow_type,
+        amount=amount, amount_usd=amount_usd,
+        to_entity=entity if inflow else "wallet",
+        from_entity="wallet" if inflow else entity,
+        source_name="whale_alert", event_time=event_time, created_at=created_at,
+    )
+
+
+def bucket(id, token, exchange, start, inflow=0.0, outflow=0.0, inflow_usd=0.0,
+           outflow_usd=0.0, inflow_tx=0, outflow_tx=0):
+    return ExchangeFlowBucket(
+        id=id, token=token, exchange=exchange, bucket_start=start,
+        inflow_amount=inflow, outflow_amount=outflow,
+        inflow_usd=inflow_usd, outflow_usd=outflow_usd,
+        inflow_tx_count=inflow_tx, outflow_tx_count=outflow_tx,
+    )
+
+
+def at(hour, minute, second=0):
+    return datetime(2026, 3, 1, hour, minute, second)
+
+
+# ============================================================
+# TESTS
+# ============================================================
+
+class TestBuckets:
+
+    def test_touched_buckets_summed_in_full(self, session):
+        old = NOW - timedelta(hours=1)
+        session.add_all([
+            raw_flow(1, "BTC", "exchange_inflow", "binance", 100.0, 5000.0, at(11, 0), old),  # Touched bucket
+            raw_flow(2, "BTC", "exchange_inflow", " Binance ", 2.0, 100.0, at(11, 1, 10)),
+            raw_flow(3, "BTC", "exchange_inflow", "binance", 1.0, 50.0, at(11, 4, 59)),
+            raw_flow(4, "BTC", "exchange_outflow", "Binance", 0.5, 25.0, at(11, 5)),
+            raw_flow(5, "BTC", "exchange_outflow", "coinbase", 3.0, None, at(11, 2)),
+            raw_flow(6, "ETH", "exchange_inflow", "unknown", 9.0, 9.0, at(11, 2)),
+            raw_flow(7, "DOGE", "exchange_inflow", "binance", 9.0, 9.0, at(11, 2)),
+            raw_flow(8, "BTC", "whale_transfer", "binance", 9.0, 9.0, at(11, 2)),
+            raw_flow(9, "BTC", "exchange_inflow", "binance", 9.0, 9.0, NOW - timedelta(days=2)),
+            raw_flow(10, "BTC", "exchange_inflow", "binance", 9.0, 9.0, at(10, 40), old),  # Untouched
+        ])
+        session.commit()
+        aggregator = ExchangeFlowAggregator()
+
+        rows = session.execute(aggregator.bucket_totals(since=NOW - timedelta(minutes=10), now=NOW)).all()
+
+        buckets = {
+            (token, exchange, start[:16]): tuple(values[:6])
+            for token, exchange, start, *values in rows
+        }
+        assert buckets == {
+            # inflow, outflow, inflow_usd, outflow_usd, inflow_tx, outflow_tx
+            ("BTC", "binance", "2026-03-01 11:00"): (103.0, 0, 5150.0, 0, 3, 0),
+            ("BTC", "binance", "2026-03-01 11:05"): (0, 0.5, 0, 25.0, 0, 1),
+            ("BTC", "coinbase", "2026-03-01 11:00"): (0, 3.0, 0, 0, 0, 1),
+        }
+
+    def test_late_commit_counted_once(self, session):
+        aggregator = ExchangeFlowAggregator()
+
+        def cycle(now):
+            aggregator.update_buckets(session, now)
+            session.commit()
+            return session.execute(
+                select(ExchangeFlowBucket.inflow_amount, ExchangeFlowBucket.inflow_tx_count)
+            ).all()
+
+        session.add_all([
+            raw_flow(1, "BTC", "exchange_inflow", "binance", 1.0, 10.0, at(11, 0), at(11, 1)),
+            raw_flow(3, "BTC", "exchange_inflow", "binance", 2.0, 20.0, at(11, 1), at(11, 1)),
+        ])
+        session.commit()
+        assert cycle(at(11, 2)) == [(3.0, 2)]
+
+        # id 2 was created before the last cycle but committed after it
+        session.add(raw_flow(2, "BTC", "exchange_inflow", "binance", 4.0, 40.0, at(11, 1), at(11, 1, 30)))
+        session.commit()
+        assert cycle(at(11, 3)) == [(7.0, 3)]
+        assert cycle(at(11, 4)) == [(7.0, 3)]  # Re-reads replace, never add
+
+
+class TestRollup:
+
+    def test_window_rollup(self, session):
+        session.add_all([
+            bucket(1, "BTC", "binance", at(11, 0), inflow=3.0, inflow_usd=150.0, inflow_tx=2),
+            bucket(2, "BTC", "binance", at(11, 55), outflow=1.0, outflow_usd=50.0, outflow_tx=1),
+            bucket(3, "BTC", "coinbase", at(11, 30), inflow=1.0, inflow_usd=100.0, inflow_tx=1),
+            bucket(4, "BTC", "binance", at(10, 55), inflow=1.0, inflow_usd=60.0, inflow_tx=1),
+            bucket(5, "ETH", "kraken", at(11, 10)),  # No transactions
+        ])
+        session.commit()
+        aggregator = ExchangeFlowAggregator(ExchangeFlowAggregatorConfig(tokens=["BTC", "ETH"]))
+
+        hour = {
+            a["exchange"]: a
+            for a in aggregator.rollup(session, "1h", timedelta(hours=1), NOW)
+        }
+        four_hours = {
+            a["exchange"]: a
+            for a in aggregator.rollup(session, "4h", timedelta(hours=4), NOW)
+        }
+
+        assert set(hour) == {"binance", "coinbase"}
+        binance = hour["binance"]
+        assert binance["window_start"] == at(11, 0)  # 11:02:30 aligned down
+        assert binance["window_end"] == NOW
+        assert (binance["inflow_amount"], binance["outflow_amount"], binance["net_flow"]) == (3.0, 1.0, 2.0)
+        assert binance["net_flow_usd"] == 100.0
+        assert binance["flow_ratio"] == 3.0
+        assert binance["total_tx_count"] == 3
+        assert binance["dominance_pct"] == pytest.approx(200 / 300 * 100)
+        assert hour["coinbase"]["outflow_usd"] is None
+        assert hour["coinbase"]["flow_ratio"] is None
+        assert hour["coinbase"]["dominance_pct"] == pytest.approx(100 / 300 * 100)
+
+        assert four_hours["binance"]["inflow_amount"] == 4.0
+        assert four_hours["binance"]["dominance_pct"] == pytest.approx(260 / 360 * 100)
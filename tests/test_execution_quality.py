@@ -0,0 +1,208 @@
+"""
+Tests for database-side execution quality aggregates.
+
+============================================================
+TEST SCENARIOS
+============================================================
+1. The one-query aggregate matches the metrics computed over
+   the loaded records
+2. On PostgreSQL the aggregate uses percentile_cont and
+   count FILTER
+3. Recording an execution is one additive upsert into its
+   hourly bucket
+4. The bucket rollup gives the committee the same verdict as
+   the raw records
+
+============================================================
+"""
+
+import random
+from collections import defaultdict
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from database.execution_quality import (
+    LATENCY_BIN_COLUMNS,
+    execution_quality_stats,
+    histogram_p99,
+    latency_bin,
+    record_execution_quality,
+    rollup_execution_quality,
+)
+from database.models import ExecutionQualityBucket, ExecutionRecord
+from risk_committee import CommitteeSnapshotLoader, ExecutionQualityReviewer
+
+
+NOW = datetime(2024, 3, 1, 12, 30)
+SINCE = NOW - timedelta(hours=24)
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+def make_records(count=500, slow=0, seed=7):
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        latency = rng.choice([None, rng.randint(20, 900)])
+        if i < slow:
+            latency = rng.randint(6000, 9000)
+        records.append(ExecutionRecord(
+            id=i + 1, correlation_id="c", token="BTC", pair="BTCUSDT", exchange="binance",
+            order_type="market", side="buy", requested_size=1.0,
+            status=rng.choice(["filled"] * 8 + ["partial", "rejected", "cancelled", "pending"]),
+            slippage_percent=rng.choice([None, rng.uniform(0, 0.3)]),
+            latency_ms=latency,
+            created_at=NOW - timedelta(minutes=rng.randint(0, 24 * 60 - 1)),
+        ))
+    return records
+
+
+def buckets_for(records):
+    """What record_execution_quality accumulates, built in Python."""
+    buckets = defaultdict(lambda: defaultdict(int))
+    for r in records:
+        b = buckets[r.created_at.replace(minute=0, second=0, microsecond=0)]
+        b["order_count"] += 1
+        b["filled_count"] += r.status == "filled"
+        b["partial_count"] += r.status == "partial"
+        b["rejected_count"] += r.status in ("rejected", "failed", "cancelled")
+        if r.slippage_percent is not None:
+            b["slippage_count"] += 1
+            b["slippage_sum"] += r.slippage_percent
+            b["slippage_max"] = max(b.get("slippage_max", 0), r.slippage_percent)
+        if r.latency_ms is not None:
+            b["latency_count"] += 1
+            b["latency_sum"] += r.latency_ms
+            b["latency_max"] = max(b.get("latency_max", 0), r.latency_ms)
+            b[latency_bin(r.latency_ms)] += 1
+    return [
+        ExecutionQualityBucket(
+            id=i + 1, bucket_start=start, updated_at=NOW,
+            **{column: values.get(column, 0) for column in LATENCY_BIN_COLUMNS},
+            **{k: v for k, v in values.items() if k not in LATENCY_BIN_COLUMNS},
+        )
+        for i, (start, values) in enumerate(buckets.items())
+    ]
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    ExecutionRecord.__table__.create(engine)
+    ExecutionQualityBucket.__table__.create(engine)
+    with sessionmaker(bind=engine)() as session:
+        yield session
+
+
+def python_metrics(records):
+    """The reviewer's former in-Python computation."""
+    slippage = [r.slippage_percent * 100 for r in records if r.slippage_percent is not None]
+    latency = sorted(r.latency_ms for r in records if r.latency_ms is not None)
+    return {
+        "orders": len(records),
+        "avg_slippage_bps": sum(slippage) / len(slippage),
+        "max_slippage_bps": max(slippage),
+        "avg_latency_ms": sum(latency) / len(latency),
+        "p99_latency_ms": latency[int(len(latency) * 0.99)],
+        "filled": sum(r.status == "filled" for r in records),
+        "partial": sum(r.status == "partial" for r in records),
+        "rejected": sum(r.status in ("rejected", "failed", "cancelled") for r in records),
+    }
+
+
+# ============================================================
+# RAW RECORD AGGREGATE
+# ============================================================
+
+class TestExecutionQualityStats:
+
+    def test_matches_python_metrics(self, session):
+        records = make_records()
+        old = ExecutionRecord(id=10_000, correlation_id="c", token="BTC", pair="BTCUSDT",
+                              exchange="binance", order_type="market", side="buy",
+                              requested_size=1.0, status="failed", latency_ms=99_999,
+                              created_at=SINCE - timedelta(seconds=1))
+        session.add_all(records + [old])
+        session.commit()
+
+        stats = execution_quality_stats(session, SINCE)
+
+        expected = python_metrics(records)
+        assert stats._asdict() == pytest.approx(expected)
+
+    def test_postgres_query(self):
+        session = MagicMock()
+        session.get_bind.return_value.dialect.name = "postgresql"
+        session.execute.return_value.one.return_value = (0,) * 8
+
+        execution_quality_stats(session, SINCE)
+
+        stmt = session.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "WITHIN GROUP (ORDER BY execution_records.latency_ms)" in sql
+        assert sql.count("FILTER (WHERE") == 3
+        assert session.execute.call_count == 1
+
+
+# ============================================================
+# HOURLY ROLLUP
+# ============================================================
+
+class TestRollup:
+
+    def test_record_is_one_upsert(self):
+        session = MagicMock()
+        record = ExecutionRecord(status="filled", slippage_percent=0.1, latency_ms=3000,
+                                 created_at=datetime(2024, 3, 1, 12, 45, 10))
+
+        record_execution_quality(session, record)
+
+        stmt = session.execute.call_args.args[0]
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+        assert "ON CONFLICT (bucket_start) DO UPDATE" in sql
+        assert "order_count = (execution_quality_buckets.order_count + excluded.order_count)" in sql
+        assert "greatest(execution_quality_buckets.latency_max, excluded.latency_max)" in sql
+        params = compiled.params
+        assert params["bucket_start"] == datetime(2024, 3, 1, 12)
+        assert params["latency_le_5000"] == 1 and params["latency_le_2500"] == 0
+        assert params["filled_count"] == 1 and params["rejected_count"] == 0
+
+    def test_histogram_p99(self):
+        assert histogram_p99([0] * 9, None) == 0.0
+        assert histogram_p99([199, 1, 0, 0, 0, 0, 0, 0, 0], 180) == 100.0
+        assert histogram_p99([99, 1, 0, 0, 0, 0, 0, 0, 0], 180) == 180.0
+        assert histogram_p99([98, 0, 0, 0, 0, 0, 2, 0, 0], 7000) == 7000.0
+        assert histogram_p99([50, 0, 0, 0, 0, 0, 0, 0, 50], 45000) == 45000.0
+
+    @pytest.mark.parametrize("slow", [0, 3, 12])
+    def test_same_verdict_as_records(self, session, slow):
+        records = make_records(slow=slow)
+        session.add_all(records + buckets_for(records))
+        session.commit()
+
+        rollup = rollup_execution_quality(session, SINCE)
+        exact = execution_quality_stats(session, SINCE)
+
+        assert (rollup.orders, rollup.filled, rollup.partial, rollup.rejected) == (
+            exact.orders, exact.filled, exact.partial, exact.rejected)
+        assert rollup.avg_slippage_bps == pytest.approx(exact.avg_slippage_bps)
+        assert rollup.max_slippage_bps == pytest.approx(exact.max_slippage_bps)
+        assert rollup.avg_latency_ms == pytest.approx(exact.avg_latency_ms)
+        assert rollup.p99_latency_ms >= exact.p99_latency_ms
+
+        reviewer = ExecutionQualityReviewer(session)
+        from_rollup = reviewer.review("c", CommitteeSnapshotLoader(
+            session, now=NOW, execution_source="rollup").load(["executions"]))
+        from_records = reviewer.review("c", CommitteeSnapshotLoader(
+            session, now=NOW).load(["executions"]))
+        assert from_rollup.verdict.status == from_records.verdict.status
+        assert from_rollup.latency_stable == from_records.latency_stable
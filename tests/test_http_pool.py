@@ -0,0 +1,78 @@
+"""
+Tests for the shared HTTP client pool.
+
+============================================================
+TEST SCENARIOS
+============================================================
+1. A long-lived session keeps the shared connector open after
+   the last other owner releases the pool
+2. close_session() drops the session's reference
+3. Providers with long-lived sessions survive an ingestion
+   owner releasing the pool, and rebuild after a loop change
+
+============================================================
+"""
+
+import asyncio
+
+import pytest
+
+from core.http_pool import HttpClientRegistry, set_http_registry
+from sentiment.providers.cryptopanic import CryptoPanicSource
+
+
+@pytest.fixture
+def registry():
+    registry = HttpClientRegistry()
+    set_http_registry(registry)
+    yield registry
+    set_http_registry(HttpClientRegistry())
+
+
+class TestSessionReferences:
+
+    async def test_session_keeps_connector_open(self, registry):
+        await registry.open()
+        session = await registry.open_session(timeout=5)
+        connector = session.connector
+
+        await registry.release()  # e.g. RealIngestionModule.stop()
+
+        assert not connector.closed
+        assert registry.session_is_live(session)
+        assert registry.get_stats()["owners"] == 1
+
+        await registry.close_session(session)
+        assert connector.closed
+        assert registry.get_stats()["owners"] == 0
+
+    async def test_provider_session_survives_owner_release(self, registry):
+        source = CryptoPanicSource()
+        await registry.open()
+        session = await source._get_session()
+
+        await registry.release()
+
+        assert await source._get_session() is session
+        assert not session.connector.closed
+
+        await source.close()
+        assert session.closed
+        assert registry.get_stats()["owners"] == 0
+
+
+def test_provider_session_rebuilt_on_new_loop(registry):
+    source = CryptoPanicSource()
+    first = asyncio.run(source._get_session())
+
+    async def second_loop():
+        session = await source._get_session()
+        live = registry.session_is_live(session)
+        await source.close()
+        return session, live
+
+    second, live = asyncio.run(second_loop())
+
+    assert second is not first
+    assert live
+    assert registry.get_stats()["owners"] == 0
@@ -0,0 +1,150 @@
+"""
+Tests for the concurrent source fan-out of an ingestion cycle.
+
+============================================================
+TEST SCENARIOS
+============================================================
+1. Sources run concurrently; market records come back in
+   declaration order
+2. A source past its deadline fails alone; its siblings still
+   complete
+3. A deadline hit mid-persist is reported as unconfirmed, not
+   as a failure
+4. fail_fast raises on a critical source failure, counting it
+   as one error
+
+============================================================
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from core.http_pool import HttpClientRegistry
+from data_ingestion.real_ingestion_module import (
+    RealIngestionConfig,
+    RealIngestionModule,
+    _SourceSpec,
+)
+from monitoring.metrics import MetricsCollector
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+def make_source(name, records=1, fetch_seconds=0.0, persist_seconds=0.0,
+                error=None, market_data=False):
+    async def fetch():
+        await asyncio.sleep(fetch_seconds)
+        if error is not None:
+            raise error
+        return [{"source": name, "i": i} for i in range(records)]
+
+    async def persist(rows):
+        await asyncio.sleep(persist_seconds)
+        return len(rows)
+
+    return _SourceSpec(name, name.title(), True, fetch, persist, market_data=market_data)
+
+
+def make_module(sources, **config):
+    config.setdefault("exchange_flow_enabled", False)
+    module = RealIngestionModule(
+        config=RealIngestionConfig(**config),
+        http_registry=HttpClientRegistry(),
+        async_writer=object(),
+        metrics=MetricsCollector(),
+    )
+    module._get_enabled_sources = lambda: sources
+    return module
+
+
+# ============================================================
+# TESTS
+# ============================================================
+
+class TestFanOut:
+
+    async def test_sources_run_concurrently(self):
+        module = make_module([
+            make_source("coingecko", records=2, fetch_seconds=0.1, market_data=True),
+            make_source("binance", records=3, fetch_seconds=0.05, market_data=True),
+            make_source("cryptonews", records=4, fetch_seconds=0.1),
+        ])
+
+        started = time.monotonic()
+        records = await module.run_collection_cycle()
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 0.2
+        assert [r["source"] for r in records] == ["coingecko"] * 2 + ["binance"] * 3
+        result = module._last_result
+        assert result.total_fetched == 9 and result.total_stored == 9
+        assert result.total_errors == 0 and result.success
+
+    async def test_deadline_isolates_slow_source(self):
+        module = make_module(
+            [
+                make_source("coingecko", market_data=True),
+                make_source("nansen", fetch_seconds=5),
+            ],
+            source_deadline_overrides={"nansen": 0.05},
+        )
+
+        records = await module.run_collection_cycle()
+
+        result = module._last_result
+        assert len(records) == 1
+        assert result.failed_sources == ["nansen"]
+        assert "deadline of 0.1s exceeded" in result.errors[0]
+        assert result.total_errors == 0  # Best-effort source
+
+    async def test_deadline_during_persist_is_unconfirmed(self):
+        module = make_module(
+            [make_source("binance", persist_seconds=5, market_data=True)],
+            source_deadline_seconds=0.05,
+        )
+
+        await module.run_collection_cycle()
+
+        result = module._last_result
+        assert result.unconfirmed_sources == ["binance"]
+        assert result.failed_sources == []
+        assert result.total_errors == 0
+        assert "write outcome unknown" in result.errors[0]
+
+
+class TestFailFast:
+
+    async def test_critical_failure_counted_once(self):
+        module = make_module(
+            [
+                make_source("coingecko", error=ValueError("boom"), market_data=True),
+                make_source("cryptonews"),
+            ],
+            fail_fast=True,
+        )
+
+        with pytest.raises(RuntimeError, match=r"Critical source\(s\) failed: Coingecko"):
+            await module.run_collection_cycle()
+
+        result = module._last_result
+        assert result.total_errors == 1
+        assert result.errors == ["Coingecko: boom"]
+        assert result.cryptonews_stored == 1  # Siblings still completed
+
+    async def test_best_effort_failure_does_not_raise(self):
+        module = make_module(
+            [
+                make_source("coingecko", market_data=True),
+                make_source("cryptopanic", error=ValueError("down")),
+            ],
+            fail_fast=True,
+        )
+
+        records = await module.run_collection_cycle()
+
+        assert len(records) == 1
+        assert module._last_result.failed_sources == ["cryptopanic"]
@@ -0,0 +1,143 @@
+"""
+Tests for single-pass keyword matching.
+
+============================================================
+TEST SCENARIOS
+============================================================
+1. Hits equal one \\bkeyword\\b regex per keyword, including
+   overlapping keywords, case folding and fallback keywords
+2. Risk detections are identical to the per-keyword detector
+3. Topic classifications are identical to per-pattern findall
+4. Batch paths give the same results with a process pool
+
+============================================================
+"""
+
+import random
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from data_processing.labeling.keyword_matcher import KeywordMatcher
+from data_processing.labeling.risk_keyword_detector import RISK_KEYWORDS, RiskKeywordDetector
+from data_processing.labeling.topic_classifier import TOPIC_KEYWORDS, TopicClassifier
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+FILLER = [
+    "the", "market", "said", "on", "monday", "after", "hackers", "secure", "fined",
+    "l2s", "2l2", "under_score", "sec's", "ſec", "bıg", "İnvestigation", "crypto",
+    "re-hack", "--", "!", "\n", "  ", "é", "ban-ned", "BANNED", "Rug Pull",
+]
+
+
+def random_texts(count, seed=5):
+    rng = random.Random(seed)
+    words = FILLER + [k for group in RISK_KEYWORDS.values() for k in group]
+    words += [k for group in TOPIC_KEYWORDS.values() for k in group]
+    texts = []
+    for _ in range(count):
+        parts = [rng.choice(words) for _ in range(rng.randint(0, 80))]
+        separators = [rng.choice([" ", " ", " ", ", ", ".", "-", "_", "", "\t"]) for _ in parts]
+        texts.append("".join(p + s for p, s in zip(parts, separators)))
+    return texts
+
+
+def regex_hits(groups, text):
+    hits = []
+    for group, keywords in groups.items():
+        for index, keyword in enumerate(keywords):
+            pattern = re.compile(rf"\b{re.escape(keyword)}\b", re.IGNORECASE)
+            hits.extend((group, keyword, index, m.start(), m.end()) for m in pattern.finditer(text))
+    return sorted(hits)
+
+
+def reference_detections(text, categories):
+    """Per-keyword regex detection (previous implementation)."""
+    detector = RiskKeywordDetector()
+    text_lower = text.lower()
+    detections = []
+    for category in categories:
+        for keyword, severity in RISK_KEYWORDS[category].items():
+            pattern = re.compile(rf"\b{re.escape(keyword)}\b", re.IGNORECASE)
+            for match in pattern.finditer(text_lower):
+                detections.append((
+                    match.group(), category, str(severity),
+                    detector._extract_context(text, match.start(), len(match.group())),
+                    match.start(),
+                ))
+    return detections
+
+
+def reference_counts(text):
+    counts = {}
+    for topic, keywords in TOPIC_KEYWORDS.items():
+        counts[topic] = sum(
+            len(re.findall(rf"\b{re.escape(k)}\b", text, re.IGNORECASE)) for k in keywords
+        )
+    return counts
+
+
+# ============================================================
+# MATCHER
+# ============================================================
+
+class TestKeywordMatcher:
+
+    def test_matches_per_keyword_regexes(self):
+        groups = {
+            "a": ["sec", "sec investigation", "investigation", "x x", "k8s"],
+            "b": ["sec", "cross-chain", "café", "-dash", "layer 2"],
+        }
+        matcher = KeywordMatcher(groups)
+
+        for text in random_texts(300) + ["x x x x", "café, -dash cross-chain-x layer 2s"]:
+            text = text.lower()
+            assert sorted(tuple(h) for h in matcher.scan(text)) == regex_hits(groups, text)
+
+    def test_count(self):
+        matcher = KeywordMatcher({"t": ["hack", "rug pull"], "u": ["hack"]})
+
+        assert matcher.count("hack, rug pull hacked hack") == {"t": 3, "u": 2}
+
+
+# ============================================================
+# LABELERS
+# ============================================================
+
+class TestLabelers:
+
+    def test_risk_detections_unchanged(self):
+        detector = RiskKeywordDetector()
+        categories = detector.get_categories()
+
+        for text in random_texts(300):
+            result = detector.detect(text)
+            actual = [
+                (d.keyword, d.category, str(d.severity), d.context, d.position)
+                for d in result.detections
+            ]
+            assert actual == reference_detections(text, categories)
+
+    def test_topic_counts_unchanged(self):
+        classifier = TopicClassifier()
+
+        for text in random_texts(300):
+            text = text.lower()
+            counts = classifier._matcher.count(text)
+            expected = reference_counts(text)
+            assert {t: counts.get(t, 0) for t in expected} == expected
+
+    def test_batches_with_process_pool(self):
+        texts = random_texts(40, seed=9)
+        detector = RiskKeywordDetector()
+        classifier = TopicClassifier()
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            detections = detector.detect_batch(texts, executor=executor, chunk_size=8)
+            labels = classifier.classify_batch([(t, None) for t in texts], executor=executor, chunk_size=8)
+
+        assert [r.detections for r in detections] == [detector.detect(t).detections for t in texts]
+        assert [r.labels for r in labels] == [classifier.classify(t).labels for t in texts]
@@ -0,0 +1,306 @@
+"""
+Tests for the incremental Binance kline fetcher.
+
+============================================================
+TEST SCENARIOS
+============================================================
+1. A backlog is paged forward: each request starts one interval
+   after the last candle of the previous page
+2. The still-forming last candle is returned but never advances
+   the cursor, so the next cycle re-fetches (re-upserts) it
+3. A stored cursor is resumed: the first request starts right
+   after it instead of the initial lookback
+4. Without a stored cursor, the newest closed candle already in
+   market_data seeds it
+5. Ingestion saves cursors in the same writer job as the candles
+   and adopts them only after that job succeeded
+
+============================================================
+"""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from core.http_pool import HttpClientRegistry
+from data_ingestion import kline_fetcher as module
+from data_ingestion import real_ingestion_module
+from data_ingestion.kline_fetcher import INTERVAL_MS, KlineFetcher, KlineFetcherConfig
+from data_ingestion.real_ingestion_module import RealIngestionConfig, RealIngestionModule
+from database.models import MarketData
+
+HOUR_MS = INTERVAL_MS["1h"]
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+class FakeResponse:
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+class FakeBinance:
+    """Serves hourly klines up to (and including) the forming candle."""
+
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url, params):
+        self.requests.append(params["startTime"])
+        now_ms = int(datetime.now(timezone.utc).timestamp() * 1000)
+        open_ms = params["startTime"]
+        klines = []
+        while open_ms <= now_ms and len(klines) < params["limit"]:
+            klines.append([open_ms, "1", "2", "0.5", "1.5", "10", open_ms + HOUR_MS - 1, "15", 3])
+            open_ms += HOUR_MS
+        return FakeResponse(klines)
+
+
+class FakeRegistry:
+
+    def __init__(self, server):
+        self._server = server
+
+    def client(self, provider, timeout=None):
+        server = self._server
+
+        class Client:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def get(self, url, params):
+                return server.get(url, params)
+
+        return Client()
+
+
+@pytest.fixture
+def store(monkeypatch):
+    """Watermark store and market_data table behind the fetcher."""
+    engine = create_engine(
+        "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+    MarketData.__table__.create(engine)
+    factory = sessionmaker(bind=engine)
+    marks = {}
+
+    @contextmanager
+    def db_session():
+        session = factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    def load_watermarks(session, component):
+        return {
+            key: SimpleNamespace(watermark_time=mark["watermark_time"])
+            for (comp, key), mark in marks.items() if comp == component
+        }
+
+    def save_watermarks(session, component, watermarks):
+        for key, mark in watermarks.items():
+            marks[(component, key)] = mark
+        return len(watermarks)
+
+    monkeypatch.setattr(module, "get_db_session", db_session)
+    monkeypatch.setattr(module, "load_watermarks", load_watermarks)
+    monkeypatch.setattr(module, "save_watermarks", save_watermarks)
+    return SimpleNamespace(marks=marks, session_factory=factory)
+
+
+def make_fetcher(server, **config):
+    config.setdefault("interval", "1h")
+    return KlineFetcher(KlineFetcherConfig(**config), FakeRegistry(server))
+
+
+def persist(fetcher, records):
+    """Save and adopt the cursors of records, as the writer job does."""
+    advanced = fetcher.cursor_advances(records)
+    fetcher.save_cursors(None, advanced)
+    return fetcher.commit_cursors(advanced)
+
+
+class FakeWriter:
+    """Runs each job in one fake transaction; fail=True rolls it back."""
+
+    def __init__(self):
+        self.fail = False
+        self.jobs = []
+
+    async def submit(self, fn, rows=0, label="write"):
+        writes = []
+        self.jobs.append(writes)
+        result = fn(writes)
+        if self.fail:
+            raise RuntimeError("commit failed")
+        return result
+
+
+def current_open_ms():
+    now_ms = int(datetime.now(timezone.utc).timestamp() * 1000)
+    return now_ms // HOUR_MS * HOUR_MS
+
+
+# ============================================================
+# TESTS
+# ============================================================
+
+class TestPaging:
+
+    async def test_cursor_advances_across_pages(self, store):
+        server = FakeBinance()
+        fetcher = make_fetcher(server, page_limit=3, initial_lookback_candles=7)
+
+        result = await fetcher.fetch(["btcusdt"])
+
+        first = current_open_ms() - 6 * HOUR_MS
+        assert server.requests == [first, first + 3 * HOUR_MS, first + 6 * HOUR_MS]
+        opens = [int(r["candle_open_time"].timestamp() * 1000) for r in result.records]
+        assert opens == [first + i * HOUR_MS for i in range(7)]
+        assert result.requests_made == 3 and result.symbols_ok == 1
+
+    async def test_page_budget_continues_next_cycle(self, store):
+        server = FakeBinance()
+        fetcher = make_fetcher(
+            server, page_limit=2, initial_lookback_candles=7, max_pages_per_cycle=2,
+        )
+
+        result = await fetcher.fetch(["BTCUSDT"])
+        assert len(result.records) == 4
+        assert persist(fetcher, result.records) == 1
+
+        server.requests.clear()
+        await fetcher.fetch(["BTCUSDT"])
+        assert server.requests[0] == current_open_ms() - 2 * HOUR_MS
+
+
+class TestFormingCandle:
+
+    async def test_forming_candle_does_not_advance_cursor(self, store):
+        server = FakeBinance()
+        fetcher = make_fetcher(server, initial_lookback_candles=3)
+
+        result = await fetcher.fetch(["BTCUSDT"])
+        forming = result.records[-1]
+        assert forming["candle_close_time"] > forming["fetched_at"]
+
+        assert persist(fetcher, result.records) == 1
+        last_closed = datetime.fromtimestamp((current_open_ms() - HOUR_MS) / 1000, timezone.utc)
+        assert fetcher.get_cursor("BTCUSDT") == last_closed
+        assert store.marks[("binance_futures_klines", "BTCUSDT:1h")]["watermark_time"] == (
+            last_closed.replace(tzinfo=None)
+        )
+
+        # Next cycle starts at the forming candle and re-upserts it
+        server.requests.clear()
+        again = await fetcher.fetch(["BTCUSDT"])
+        assert server.requests == [current_open_ms()]
+        assert [r["candle_open_time"] for r in again.records] == [forming["candle_open_time"]]
+
+    async def test_only_forming_candle_commits_nothing(self, store):
+        fetcher = make_fetcher(FakeBinance(), initial_lookback_candles=1)
+
+        result = await fetcher.fetch(["BTCUSDT"])
+
+        assert len(result.records) == 1
+        assert persist(fetcher, result.records) == 0
+        assert store.marks == {}
+
+
+class TestResume:
+
+    async def test_resumes_from_stored_cursor(self, store):
+        cursor = datetime.fromtimestamp((current_open_ms() - 10 * HOUR_MS) / 1000, timezone.utc)
+        store.marks[("binance_futures_klines", "BTCUSDT:1h")] = {
+            "watermark_time": cursor.replace(tzinfo=None),
+        }
+        server = FakeBinance()
+        fetcher = make_fetcher(server, initial_lookback_candles=2)
+
+        result = await fetcher.fetch(["BTCUSDT"])
+
+        assert server.requests == [current_open_ms() - 9 * HOUR_MS]
+        assert len(result.records) == 10
+        assert fetcher.get_cursor("BTCUSDT") == cursor
+
+    async def test_seeds_cursor_from_market_data(self, store):
+        last_open = datetime.utcfromtimestamp((current_open_ms() - 4 * HOUR_MS) / 1000)
+        session = store.session_factory()
+        session.add(MarketData(
+            id=1, correlation_id="c", symbol="BTC", pair="BTCUSDT", exchange="binance_futures", interval="1h",
+            open_price=1, high_price=1, low_price=1, close_price=1, volume=1,
+            candle_open_time=last_open,
+            candle_close_time=last_open + timedelta(hours=1, milliseconds=-1),
+            source_module="test", fetched_at=datetime.utcnow(),
+        ))
+        session.commit()
+        session.close()
+        server = FakeBinance()
+        fetcher = make_fetcher(server)
+
+        await fetcher.fetch(["BTCUSDT"])
+
+        assert server.requests == [current_open_ms() - 3 * HOUR_MS]
+
+
+class TestIngestionPersistence:
+
+    @pytest.fixture
+    def ingestion(self, store, monkeypatch):
+        writer = FakeWriter()
+
+        def bulk_upsert(session, model, rows, **kwargs):
+            session.append(("market_data", len(rows)))
+            return len(rows)
+
+        def save_watermarks(session, component, watermarks):
+            session.append(("watermarks", sorted(watermarks)))
+            return len(watermarks)
+
+        monkeypatch.setattr(real_ingestion_module, "bulk_upsert", bulk_upsert)
+        monkeypatch.setattr(module, "save_watermarks", save_watermarks)
+        ingestion = RealIngestionModule(
+            config=RealIngestionConfig(exchange_flow_enabled=False),
+            http_registry=HttpClientRegistry(),
+            async_writer=writer,
+        )
+        ingestion._kline_fetcher = make_fetcher(FakeBinance(), initial_lookback_candles=3)
+        return SimpleNamespace(module=ingestion, writer=writer)
+
+    async def test_cursors_saved_in_market_data_job(self, ingestion):
+        fetcher = ingestion.module._kline_fetcher
+        result = await fetcher.fetch(["BTCUSDT"])
+
+        assert await ingestion.module._persist_binance_records(result.records) == 3
+
+        assert ingestion.writer.jobs == [[("market_data", 3), ("watermarks", ["BTCUSDT:1h"])]]
+        last_closed = datetime.fromtimestamp((current_open_ms() - HOUR_MS) / 1000, timezone.utc)
+        assert fetcher.get_cursor("BTCUSDT") == last_closed
+
+    async def test_failed_job_keeps_cursor(self, ingestion):
+        fetcher = ingestion.module._kline_fetcher
+        result = await fetcher.fetch(["BTCUSDT"])
+        ingestion.writer.fail = True
+
+        with pytest.raises(RuntimeError, match="Failed to persist binance records"):
+            await ingestion.module._persist_binance_records(result.records)
+
+        assert fetcher.get_cursor("BTCUSDT") is None
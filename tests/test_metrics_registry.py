@@ -0,0 +1,248 @@
+"""
+Tests for the monitoring metrics registry.
+
+============================================================
+TEST SCENARIOS
+============================================================
+1. Histogram quantiles (p50/p99/p999) track the exact values
+2. Label children are pre-bound and capped per metric
+3. Rolling counters count per-second windows in a ring buffer
+4. Exchange adapter stats keep their summary and report to the
+   registry
+5. Pipeline stages and cycles report to the registry
+6. /metrics serves the Prometheus text format
+
+============================================================
+"""
+
+import math
+import random
+import uuid
+
+import pytest
+
+from execution_engine.adapters.metrics import AdapterMetrics, CounterStats, LatencyStats
+from monitoring.metrics import (
+    OVERFLOW_LABEL_VALUE,
+    PROMETHEUS_CONTENT_TYPE,
+    MetricsCollector,
+    RollingCounter,
+    get_metrics_collector,
+    log_buckets,
+)
+from orchestrator.models import ExecutionStage as S, RuntimeMode
+from orchestrator.pipeline import ExecutionPipeline
+
+
+# ============================================================
+# HISTOGRAMS
+# ============================================================
+
+class TestHistogram:
+
+    def test_quantiles_track_exact_values(self):
+        rng = random.Random(3)
+        values = [rng.lognormvariate(3, 1) for _ in range(50_000)]
+        child = MetricsCollector().histogram("latency_ms").labels()
+        for value in values:
+            child.observe(value)
+
+        values.sort()
+        snapshot = child.snapshot()
+        for q in (0.5, 0.99, 0.999):
+            exact = values[math.ceil(q * len(values)) - 1]
+            assert snapshot.quantile(q) == pytest.approx(exact, rel=0.05)
+        assert snapshot.quantile(0.0) == values[0]
+        assert snapshot.quantile(1.0) == values[-1]
+        assert snapshot.count == len(values)
+        assert snapshot.mean == pytest.approx(sum(values) / len(values))
+
+    def test_empty_and_bounds(self):
+        assert MetricsCollector().histogram("h").labels().quantile(0.99) == 0.0
+        assert log_buckets(1, 100, per_decade=2) == (1.0, 3.16, 10.0, 31.6, 100.0)
+        with pytest.raises(ValueError):
+            log_buckets(0, 10)
+
+
+# ============================================================
+# LABELS
+# ============================================================
+
+class TestLabels:
+
+    def test_children_are_bound(self):
+        metrics = MetricsCollector()
+        requests = metrics.counter("requests_total", "Requests", labels=("exchange", "outcome"))
+
+        child = requests.labels("okx", "success")
+        assert requests.labels(exchange="okx", outcome="success") is child
+        child.inc()
+        child.inc(2)
+
+        assert metrics.counter("requests_total", labels=("exchange", "outcome")) is requests
+        assert metrics.get_metric("requests_total", {"exchange": "okx", "outcome": "success"}).value == 3
+        with pytest.raises(ValueError):
+            requests.labels("okx")
+        with pytest.raises(ValueError):
+            metrics.counter("requests_total", labels=("exchange",))
+        with pytest.raises(ValueError):
+            metrics.gauge("requests_total", labels=("exchange", "outcome"))
+
+    def test_cardinality_is_capped(self):
+        metrics = MetricsCollector()
+        errors = metrics.counter("errors_total", labels=("code",), max_series=3)
+
+        for i in range(10):
+            errors.labels(f"E{i}").inc()
+
+        series = {labels["code"]: child.value for labels, child in errors.series()}
+        assert series == {"E0": 1, "E1": 1, "E2": 1, OVERFLOW_LABEL_VALUE: 7}
+
+    def test_named_updates_and_sources(self):
+        metrics = MetricsCollector()
+        metrics.increment("decisions_total", {"action": "buy"})
+        metrics.set_gauge("positions", value=4)
+        metrics.observe("slippage_bps", 2.5)
+        metrics.register_source("cache", lambda: {"cache_hits_total": 7.0})
+
+        assert metrics.get_metric("decisions_total", {"action": "buy"}).value == 1
+        assert metrics.get_metric("positions").value == 4
+        assert metrics.get_metric("cache_hits_total").value == 7
+        assert metrics.get_metric("decisions_total") is None
+        assert metrics.get_histogram("slippage_bps").count == 1
+
+        collected = {(v.name, v.labels.get("quantile")) for v in metrics.collect()}
+        assert ("slippage_bps", "0.99") in collected
+        assert ("slippage_bps_count", None) in collected
+
+
+# ============================================================
+# ROLLING WINDOWS
+# ============================================================
+
+class TestRollingCounter:
+
+    def test_windows(self):
+        now = [1_000_000.0]
+        counter = RollingCounter(window_seconds=3600, clock=lambda: now[0])
+
+        for second in range(120):
+            now[0] = 1_000_000.0 + second
+            counter.add()
+            counter.add()
+
+        assert counter.sum(60) == 120
+        assert counter.sum() == 240
+        assert counter.total == 240
+
+        # A full window later every slot is stale and reused in place
+        now[0] += 3600
+        counter.add(5)
+        assert counter.sum(60) == 5
+        assert counter.sum() == 5
+        assert counter.total == 245
+
+    def test_adapter_stats(self):
+        counter = CounterStats()
+        for _ in range(5):
+            counter.increment()
+        assert (counter.total, counter.last_minute, counter.last_hour) == (5, 5, 5)
+
+        latency = LatencyStats()
+        for ms in range(1, 1001):
+            latency.record(float(ms))
+        assert latency.avg_ms == pytest.approx(500.5)
+        assert latency.p50_ms == pytest.approx(500, rel=0.03)
+        assert latency.p99_ms == pytest.approx(990, rel=0.03)
+        assert latency.p999_ms == pytest.approx(999, rel=0.03)
+
+
+# ============================================================
+# REPORTING
+# ============================================================
+
+class TestReporting:
+
+    def test_adapter_reports_to_registry(self):
+        exchange = f"test-{uuid.uuid4().hex[:6]}"
+        adapter = AdapterMetrics(exchange)
+
+        adapter.record_request("/order", 12.0, success=True)
+        adapter.record_request("/order", 30.0, success=False, error_code="RATE_LIMIT")
+        adapter.record_order_rejected("E1")
+
+        registry = get_metrics_collector()
+        assert registry.get_metric(
+            "exchange_requests_total", {"exchange": exchange, "endpoint": "/order", "outcome": "failure"}
+        ).value == 1
+        assert registry.get_histogram(
+            "exchange_request_latency_ms", {"exchange": exchange, "endpoint": "/order"}
+        ).count == 2
+        assert registry.get_metric(
+            "exchange_orders_total", {"exchange": exchange, "event": "order_rejected"}
+        ).value == 1
+
+        summary = adapter.get_summary()
+        assert summary["requests"]["last_minute"] == {"success": 1, "failure": 1}
+        assert summary["errors"]["rate_limit_hits"] == 1
+        assert summary["latency"]["max_ms"] == 30.0
+
+    async def test_pipeline_reports_stages(self):
+        async def handler():
+            return {}
+
+        metrics = MetricsCollector()
+        pipeline = ExecutionPipeline(
+            RuntimeMode.PROCESS,
+            {stage: handler for stage in S.get_ordered_stages()},
+            metrics=metrics,
+        )
+
+        result = await pipeline.execute_cycle()
+
+        assert result.success
+        assert metrics.get_metric("pipeline_cycles_total", {"outcome": "success"}).value == 1
+        stage = result.stage_results[0].stage.stage_id
+        assert metrics.get_metric(
+            "pipeline_stage_runs_total", {"stage": stage, "outcome": "success"}
+        ).value == 1
+        assert metrics.get_histogram("pipeline_stage_duration_seconds", {"stage": stage}).count == 1
+
+
+# ============================================================
+# PROMETHEUS EXPOSITION
+# ============================================================
+
+class TestPrometheus:
+
+    def test_text_format(self):
+        metrics = MetricsCollector()
+        metrics.counter("orders_total", "Orders\nplaced", labels=("side",)).labels('b"uy').inc(2)
+        latency = metrics.histogram("latency_ms", "Latency", buckets=(10, 100))
+        for value in (5, 50, 500):
+            latency.observe(value)
+        metrics.register_source("cache", lambda: {"cache_size": 3})
+
+        lines = metrics.render_prometheus().splitlines()
+
+        assert "# HELP orders_total Orders\\nplaced" in lines
+        assert "# TYPE orders_total counter" in lines
+        assert 'orders_total{side="b\\"uy"} 2.0' in lines
+        assert "# TYPE latency_ms histogram" in lines
+        assert 'latency_ms_bucket{le="10.0"} 1' in lines
+        assert 'latency_ms_bucket{le="100.0"} 2' in lines
+        assert 'latency_ms_bucket{le="+Inf"} 3' in lines
+        assert "latency_ms_sum 555.0" in lines
+        assert "latency_ms_count 3" in lines
+        assert "cache_size 3.0" in lines
+
+    def test_metrics_endpoint(self):
+        testclient = pytest.importorskip("fastapi.testclient")
+        from dashboard.api import app
+
+        get_metrics_collector().counter("dashboard_test_total").inc()
+        response = testclient.TestClient(app).get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == PROMETHEUS_CONTENT_TYPE
+        assert "dashboard_test_total 1.0" in response.text.splitlines()
@@ -0,0 +1,282 @@
+"""
+Tests for the outbound Telegram notification pipeline.
+
+============================================================
+TEST SCENARIOS
+============================================================
+1. The token-bucket limiter refills continuously and delays
+   rather than drops when waited on
+2. A burst of alerts is coalesced into one digest message
+3. CRITICAL alerts bypass the digest window; a critical storm
+   is digested
+4. Messages go to all chats concurrently
+5. AlertManager.evaluate returns without waiting for delivery
+6. Direct sends fail fast when rate limited; the queue sender
+   waits for a slot instead, even once the hourly budget is spent
+
+============================================================
+"""
+
+import asyncio
+import gc
+import time
+from datetime import datetime
+
+import pytest
+
+from monitoring.alerts import AlertCategory, AlertManager, AlertRule, AlertRuleConfig
+from monitoring.models import Alert, AlertTier
+from monitoring.notifications import (
+    NotificationQueue,
+    NotificationQueueConfig,
+    TelegramFormatter,
+    TelegramNotifier,
+    TelegramRateLimiter,
+)
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+class RecordingNotifier(TelegramNotifier):
+    """Records messages instead of calling the Telegram API."""
+
+    def __init__(self, chats=("chat-1",), send_seconds=0.0, **kwargs):
+        super().__init__(bot_token="token", chat_ids=list(chats), **kwargs)
+        self.send_seconds = send_seconds
+        self.sent = []
+
+    async def _send_message(self, chat_id, message, parse_mode="HTML"):
+        await asyncio.sleep(self.send_seconds)
+        self.sent.append((chat_id, message, time.monotonic()))
+        return True
+
+    @property
+    def messages(self):
+        return [message for _, message, _ in self.sent]
+
+
+def make_alert(i, tier=AlertTier.WARNING):
+    return Alert(
+        alert_id=f"a{i}", tier=tier, category="risk", title=f"Alert {i}",
+        message="", triggered_at=datetime(2024, 3, 1, 12), triggered_by_rule="test",
+    )
+
+
+@pytest.fixture
+async def queues():
+    created = []
+    yield created
+    for queue in created:
+        await queue.stop()
+
+
+def make_queue(queues, notifier, **config):
+    queue = NotificationQueue(notifier, NotificationQueueConfig(**config))
+    queue.start()
+    queues.append(queue)
+    return queue
+
+
+# ============================================================
+# RATE LIMITER
+# ============================================================
+
+class TestRateLimiter:
+
+    async def test_token_bucket(self):
+        now = [0.0]
+        limiter = TelegramRateLimiter(max_per_minute=2, max_per_hour=3, clock=lambda: now[0])
+
+        assert await limiter.acquire() is True
+        assert await limiter.acquire() is True
+        assert await limiter.acquire() is False
+        assert await limiter.wait(timeout=0) is False
+
+        now[0] += 30  # One minute token refilled
+        assert limiter.remaining_minute == 1
+        assert await limiter.acquire() is True
+        now[0] += 60  # Two minute tokens back, hourly budget spent
+        assert limiter.remaining_hour == 0
+        assert await limiter.acquire() is False
+
+    async def test_wait_delays_instead_of_dropping(self):
+        limiter = TelegramRateLimiter(max_per_minute=600, max_per_hour=100_000)
+        while await limiter.acquire():
+            pass
+
+        started = time.monotonic()
+        assert await limiter.wait() is True
+        assert await limiter.wait() is True
+        elapsed = time.monotonic() - started
+
+        assert 0.15 <= elapsed < 0.5  # Two tokens at 10 per second
+
+
+# ============================================================
+# QUEUE
+# ============================================================
+
+class TestQueue:
+
+    async def test_burst_is_one_digest(self, queues):
+        notifier = RecordingNotifier()
+        queue = make_queue(queues, notifier, digest_window_seconds=0.05)
+
+        for i in range(20):
+            assert queue.submit(make_alert(i))
+        await asyncio.sleep(0)
+        assert notifier.sent == []  # Window still open
+
+        await asyncio.sleep(0.1)
+        assert len(notifier.messages) == 1
+        assert "Alerts in digest: 20" in notifier.messages[0]
+        assert "... and 10 more" in notifier.messages[0]
+        assert queue.digests_sent == 1 and queue.pending == 0
+
+        queue.submit(make_alert(99))
+        await queue.drain()
+        assert notifier.messages[-1] == TelegramFormatter.format_alert(make_alert(99))
+
+    async def test_oversized_burst_is_split(self, queues):
+        notifier = RecordingNotifier()
+        queue = make_queue(queues, notifier, digest_window_seconds=10, max_digest_size=10)
+
+        for i in range(25):
+            queue.submit(make_alert(i))
+        await queue.drain()
+
+        assert [m.split("Alerts in digest: ")[1].split("\n")[0] for m in notifier.messages] == [
+            "10", "10", "5",
+        ]
+
+    async def test_critical_bypasses_digest(self, queues):
+        notifier = RecordingNotifier()
+        queue = make_queue(queues, notifier, digest_window_seconds=10)
+
+        queue.submit(make_alert(1))
+        queue.submit(make_alert(2, AlertTier.CRITICAL))
+        await asyncio.sleep(0.01)
+
+        assert notifier.messages == [TelegramFormatter.format_alert(make_alert(2, AlertTier.CRITICAL))]
+        assert queue.pending == 1
+
+    async def test_critical_storm_is_digested(self, queues):
+        notifier = RecordingNotifier()
+        queue = make_queue(queues, notifier, max_critical_backlog=3)
+
+        for i in range(10):
+            queue.submit(make_alert(i, AlertTier.CRITICAL))
+        await queue.drain()
+
+        assert len(notifier.messages) == 1
+        assert "Critical: 10" in notifier.messages[0]
+
+    async def test_filtered_alerts_are_not_queued(self, queues):
+        notifier = RecordingNotifier(min_tier=AlertTier.WARNING)
+        queue = make_queue(queues, notifier)
+
+        assert queue.submit(make_alert(1, AlertTier.INFO)) is False
+        notifier.disable()
+        assert queue.submit(make_alert(2)) is False
+        assert queue.pending == 0
+
+
+# ============================================================
+# DELIVERY
+# ============================================================
+
+class TestDelivery:
+
+    async def test_chats_are_sent_concurrently(self):
+        notifier = RecordingNotifier(chats=["a", "b", "c"], send_seconds=0.05)
+
+        started = time.monotonic()
+        assert await notifier.send_alert(make_alert(1))
+        elapsed = time.monotonic() - started
+
+        assert sorted(chat for chat, _, _ in notifier.sent) == ["a", "b", "c"]
+        assert elapsed < 0.12
+
+    async def test_direct_send_fails_fast_when_limited(self):
+        notifier = RecordingNotifier(rate_limiter=TelegramRateLimiter(max_per_minute=1))
+
+        assert await notifier.send_text("first")
+        started = time.monotonic()
+        assert await notifier.send_text("second") is False
+        assert time.monotonic() - started < 0.05
+        assert notifier.messages == ["first"]
+
+    async def test_queue_waits_for_rate_limit(self, queues):
+        limiter = TelegramRateLimiter(max_per_minute=240, max_per_hour=10_000)  # A token every 0.25s
+        notifier = RecordingNotifier(rate_limiter=limiter)
+        queue = make_queue(queues, notifier)
+        while await limiter.acquire():
+            pass
+
+        assert await notifier.send_text("direct") is False
+        queue.submit(make_alert(1, AlertTier.CRITICAL))
+        await queue.drain()
+
+        assert queue.messages_sent == 1
+        assert queue.messages_failed == 0
+        assert len(notifier.messages) == 1
+
+    async def test_queue_waits_out_hourly_budget(self, queues, monkeypatch):
+        now = [0.0]
+        real_sleep = asyncio.sleep
+
+        class FastForward:
+            """asyncio for the limiter, with sleeps that advance the fake clock."""
+
+            def __getattr__(self, name):
+                return getattr(asyncio, name)
+
+            @staticmethod
+            async def sleep(delay):
+                now[0] += delay + 1e-3  # Real sleeps overshoot a little too
+                await real_sleep(0)
+
+        monkeypatch.setattr("monitoring.notifications.telegram.asyncio", FastForward())
+        limiter = TelegramRateLimiter(max_per_minute=20, max_per_hour=100, clock=lambda: now[0])
+        notifier = RecordingNotifier(rate_limiter=limiter)
+        queue = make_queue(queues, notifier, digest_window_seconds=0.01)
+        while await limiter.acquire():
+            now[0] += 3  # Spend the hourly budget, not the per-minute one
+        spent_at = now[0]
+
+        for i in range(3):
+            queue.submit(make_alert(i, AlertTier.CRITICAL))
+        queue.submit(make_alert(9))
+        await queue.drain()
+
+        assert queue.messages_sent == 4 and queue.messages_failed == 0
+        assert now[0] - spent_at > 36  # Hour tokens refill every 36s
+
+    async def test_evaluate_does_not_wait_for_delivery(self, queues):
+        class StormRule(AlertRule):
+            def evaluate(self, context):
+                return self.trigger(title=self.rule_id, message="storm")
+
+        rules = [
+            StormRule(AlertRuleConfig(
+                rule_id=f"rule-{i}", rule_name="Storm", category=AlertCategory.RISK,
+                tier=AlertTier.WARNING, description="test",
+            ))
+            for i in range(30)
+        ]
+        notifier = RecordingNotifier(send_seconds=0.2)
+        queue = make_queue(queues, notifier, digest_window_seconds=0.01)
+        manager = AlertManager(rules=rules, notification_handlers=[queue])
+
+        gc.collect()  # Keep a full collection out of the timed call
+        started = time.monotonic()
+        triggered = await manager.evaluate({})
+        elapsed = time.monotonic() - started
+
+        assert len(triggered) == 30
+        assert elapsed < 0.1
+        await queue.drain()
+        assert len(notifier.messages) == 1
+        assert "Alerts in digest: 30" in notifier.messages[0]
@@ -0,0 +1,323 @@
+"""
+Tests for the historical replay engine.
+
+============================================================
+TEST SCENARIOS
+============================================================
+1. Table sources stream in (time, id) order; candles are
+   stamped at close; the merge orders ties by source. Each
+   source query is served by an index, without a sort
+2. Sequential mode: the clock equals the tick being handled
+3. Instant mode: bounded queues hold back the producer and the
+   clock never passes the slowest subscriber
+4. A checkpoint resumes to exactly the remaining events;
+   tampered checkpoints are rejected
+5. Seek repositions a running replay
+6. ReplayClock pause/set_speed do not deadlock
+
+============================================================
+"""
+
+import asyncio
+import json
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backtesting import (
+    ReplayCheckpoint,
+    ReplayConfig,
+    ReplayEngine,
+    ReplayEvent,
+    ReplaySource,
+)
+from backtesting.replay_engine import default_sources
+from core.clock import ClockFactory, ReplayClock
+from core.exceptions import DataValidationError
+from database.models import MarketData, OnchainFlowRaw, RawNews
+
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+END = START + timedelta(hours=2)
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+class ListSource(ReplaySource):
+    """In-memory source: one event per timestamp, key = (ts, i)."""
+
+    def __init__(self, name, timestamps, event_type="tick"):
+        self.name = name
+        self.event_type = event_type
+        self.timestamps = sorted(timestamps)
+
+    def stream(self, start, end, after=None, chunk_size=5000):
+        for i, ts in enumerate(self.timestamps):
+            key = (ts, i)
+            if start <= ts < end and (after is None or key > tuple(after)):
+                yield ReplayEvent(self.event_type, ts, {"i": i}, self.name, key)
+
+
+def minutes(*values):
+    return [START + timedelta(minutes=v) for v in values]
+
+
+def ids(events):
+    return [(e.source, e.data.get("i", e.data.get("id"))) for e in events]
+
+
+@pytest.fixture
+def session_factory():
+    # One shared connection: rows are fetched from a worker thread
+    engine = create_engine(
+        "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+    MarketData.__table__.create(engine)
+    OnchainFlowRaw.__table__.create(engine)
+    factory = sessionmaker(bind=engine)
+    rng = random.Random(4)
+
+    with factory() as session:
+        rows = []
+        for i in range(90):
+            open_time = START.replace(tzinfo=None) + timedelta(minutes=i % 30)
+            rows.append(MarketData(
+                id=i + 1, correlation_id="c", symbol=["BTC", "ETH", "SOL"][i // 30], pair="X",
+                exchange="binance", open_price=1, high_price=1, low_price=1, close_price=1,
+                volume=1, interval="1m", candle_open_time=open_time,
+                candle_close_time=open_time + timedelta(minutes=1),
+            ))
+        for i in range(40):
+            rows.append(OnchainFlowRaw(
+                id=i + 1, token=rng.choice(["BTC", "SOL"]), chain="x", flow_type="whale_transfer",
+                amount=1, source_name="test",
+                event_time=START.replace(tzinfo=None) + timedelta(minutes=rng.randint(0, 40)),
+            ))
+        rng.shuffle(rows)
+        session.add_all(rows)
+        session.commit()
+    return factory
+
+
+def config(**kwargs):
+    values = dict(start_time=START, end_time=END, install_clock=False, checkpoint_interval_seconds=0)
+    values.update(kwargs)
+    return ReplayConfig(**values)
+
+
+# ============================================================
+# ORDERING
+# ============================================================
+
+class TestOrdering:
+
+    async def test_table_sources_merge_in_time_order(self, session_factory):
+        cfg = config(symbols=["BTC", "ETH"], chunk_size=7, batch_size=10)
+        sources = default_sources(session_factory, cfg)[:2]  # raw_news needs JSONB
+        engine = ReplayEngine(cfg, sources=sources)
+        seen = []
+        engine.subscribe(seen.append)
+
+        state = await engine.start()
+
+        assert len(seen) == state.events_processed
+        assert {e.data["symbol"] for e in seen if e.source == "market_data"} == {"BTC", "ETH"}
+        assert {e.data["token"] for e in seen if e.source == "onchain_flow_raw"} == {"BTC"}
+        assert len([e for e in seen if e.source == "market_data"]) == 60
+        # Candles become visible at close
+        for e in seen:
+            if e.source == "market_data":
+                assert e.timestamp == e.data["candle_close_time"].replace(tzinfo=timezone.utc)
+        # Time order, candles before flows at equal time, ids ascending
+        order = [(e.timestamp, e.source != "market_data", e.data["id"]) for e in seen]
+        assert order == sorted(order)
+
+    def test_source_queries_use_replay_indexes(self):
+        engine = create_engine("sqlite://")
+        for model in (MarketData, OnchainFlowRaw, RawNews):
+            model.__table__.create(engine)
+        expected = {
+            "market_data": "idx_market_data_replay",
+            "onchain_flow_raw": "idx_onchain_replay",
+            "raw_news": "idx_raw_news_replay",
+        }
+
+        with engine.connect() as connection:
+            for source in default_sources(sessionmaker(bind=engine), config()):
+                for after in (None, (START.replace(tzinfo=None), 5)):
+                    query = source.build_query(START, END, after).compile(
+                        engine, compile_kwargs={"literal_binds": True}
+                    )
+                    plan = " ".join(
+                        row[-1] for row in connection.execute(text(f"EXPLAIN QUERY PLAN {query}"))
+                    )
+                    assert f"USING INDEX {expected[source.name]}" in plan
+                    assert "TEMP B-TREE" not in plan  # No sort step
+
+
+# ============================================================
+# MODES
+# ============================================================
+
+class TestModes:
+
+    async def test_sequential_clock_follows_ticks(self):
+        sources = [ListSource("a", minutes(1, 2, 2, 5)), ListSource("b", minutes(2, 3))]
+        cfg = config(batch_size=2, install_clock=True)
+        engine = ReplayEngine(cfg, sources=sources)
+        observed = []
+
+        async def handler(event):
+            await asyncio.sleep(0)
+            observed.append((event.timestamp, ClockFactory.get_clock().now()))
+
+        engine.subscribe(handler)
+        await engine.start()
+
+        assert [ts for ts, _ in observed] == minutes(1, 2, 2, 2, 3, 5)
+        assert all(ts == now for ts, now in observed)
+        assert not isinstance(ClockFactory.get_clock(), ReplayClock)
+
+    async def test_instant_backpressure_and_watermark(self):
+        sources = [ListSource("a", [START + timedelta(seconds=s) for s in range(200)])]
+        engine = ReplayEngine(config(replay_mode="instant", batch_size=10), sources=sources)
+        max_lead = 0
+        slow_seen = []
+
+        async def slow(event):
+            nonlocal max_lead
+            await asyncio.sleep(0)
+            assert engine.clock.now() <= event.timestamp
+            slow_seen.append(event.timestamp)
+            lead = engine.get_state().events_processed - len(slow_seen)
+            max_lead = max(max_lead, lead)
+
+        fast_seen = []
+        engine.subscribe(slow, max_pending_batches=2)
+        engine.subscribe(fast_seen.extend, batch=True)
+
+        state = await engine.start()
+
+        assert state.events_processed == 200
+        assert len(slow_seen) == len(fast_seen) == 200
+        # At most the queued batches, the one in hand and one being put
+        assert max_lead <= 10 * 4
+        assert engine.clock.now() == START + timedelta(seconds=199)
+
+    async def test_handler_error_is_raised(self):
+        engine = ReplayEngine(config(replay_mode="instant", batch_size=1), sources=[
+            ListSource("a", minutes(*range(50))),
+        ])
+
+        def failing(event):
+            if event.data["i"] == 3:
+                raise ValueError("boom")
+
+        engine.subscribe(failing, max_pending_batches=1)
+        with pytest.raises(ValueError):
+            await engine.start()
+        assert not engine.get_state().is_running
+
+
+# ============================================================
+# CHECKPOINTS AND SEEK
+# ============================================================
+
+class TestCheckpoints:
+
+    def sources(self):
+        rng = random.Random(2)
+        return [
+            ListSource("a", [START + timedelta(seconds=rng.randint(0, 3600)) for _ in range(300)]),
+            ListSource("b", [START + timedelta(seconds=rng.randint(0, 3600)) for _ in range(300)]),
+        ]
+
+    @pytest.mark.parametrize("mode", ["sequential", "instant"])
+    async def test_resume_is_exact(self, tmp_path, mode):
+        path = str(tmp_path / "replay.json")
+        full = []
+        engine = ReplayEngine(config(replay_mode=mode, batch_size=16), sources=self.sources())
+        engine.subscribe(full.append)
+        await engine.start()
+
+        first = []
+        engine = ReplayEngine(
+            config(replay_mode=mode, batch_size=16, checkpoint_path=path), sources=self.sources()
+        )
+
+        async def stop_midway(event):
+            first.append(event)
+            if len(first) == 250:
+                await engine.stop()
+
+        engine.subscribe(stop_midway)
+        await engine.start()
+
+        rest = []
+        engine = ReplayEngine(config(replay_mode=mode, batch_size=16), sources=self.sources())
+        engine.restore(ReplayCheckpoint.load(path))
+        engine.subscribe(rest.append)
+        state = await engine.start()
+
+        assert 250 <= len(first) < 600
+        assert ids(first + rest) == ids(full)
+        assert state.events_processed == 600
+
+    def test_tampered_checkpoint_rejected(self, tmp_path):
+        path = tmp_path / "replay.json"
+        engine = ReplayEngine(config(), sources=self.sources())
+        checkpoint = ReplayCheckpoint(
+            replay_time=START, events_processed=5, cursors={"a": (START.replace(tzinfo=None), 3)},
+            start_time=START, end_time=END, sources=["a", "b"],
+        )
+        checkpoint.save(str(path))
+        engine.restore(ReplayCheckpoint.load(str(path)))
+
+        document = json.loads(path.read_text())
+        document["payload"]["events_processed"] = 50
+        path.write_text(json.dumps(document))
+        with pytest.raises(DataValidationError):
+            ReplayCheckpoint.load(str(path))
+
+        other = ReplayEngine(config(end_time=END + timedelta(hours=1)), sources=self.sources())
+        with pytest.raises(DataValidationError):
+            other.restore(checkpoint)
+
+    async def test_seek_while_running(self):
+        engine = ReplayEngine(config(batch_size=4), sources=[ListSource("a", minutes(*range(60)))])
+        seen = []
+
+        async def handler(event):
+            seen.append(event.data["i"])
+            if event.data["i"] == 10:
+                await engine.seek(START + timedelta(minutes=50))
+
+        engine.subscribe(handler)
+        await engine.start()
+
+        assert seen == list(range(11)) + list(range(50, 60))
+
+
+# ============================================================
+# CLOCK
+# ============================================================
+
+class TestReplayClock:
+
+    def test_pause_and_speed_do_not_deadlock(self):
+        clock = ReplayClock(START, speed_multiplier=100)
+        clock.set_speed(10)
+        clock.pause()
+        paused_at = clock.now()
+        clock.resume()
+        clock.resume()
+        clock.pause()
+
+        assert clock.is_paused
+        assert clock.now() >= paused_at
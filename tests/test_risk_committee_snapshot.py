@@ -0,0 +1,227 @@
+"""
+Tests for the risk committee data snapshot.
+
+============================================================
+TEST SCENARIOS
+============================================================
+1. The snapshot holds what each reviewer reads and is immutable
+2. Reviewers give the same report from the shared snapshot as
+   from the parts they load on their own
+3. A committee session issues only the snapshot queries, all
+   before the reviewers run concurrently on the executor
+4. A snapshot lacking a reviewer's parts is rejected
+
+============================================================
+"""
+
+import dataclasses
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from database.models import (
+    ExecutionRecord,
+    MarketData,
+    MarketState,
+    PositionSizing,
+    RiskState,
+    SystemMonitoring,
+)
+from risk_committee import (
+    CapitalPreservationReviewer,
+    CommitteeSnapshotLoader,
+    DataIntegrityReviewer,
+    ExecutionQualityReviewer,
+    MarketRiskReviewer,
+    RiskCommitteeEngine,
+)
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_on_sqlite(type_, compiler, **kw):
+    return "JSON"
+
+
+NOW = datetime(2024, 3, 1, 12)
+TABLES = [MarketData, MarketState, RiskState, ExecutionRecord, PositionSizing, SystemMonitoring]
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+def seed(session):
+    rows = []
+    for i in range(120):
+        created = NOW - timedelta(minutes=15 * i)
+        rows.append(MarketData(
+            id=i + 1, correlation_id=f"cycle-{i // 4}", symbol="BTC", pair="BTCUSDT",
+            exchange="binance" if i % 2 else "coingecko",
+            open_price=1.0, high_price=1.0, low_price=1.0, close_price=1.0,
+            volume=30.0 if i == 0 else 100.0 + i, interval="1h",
+            candle_open_time=created, candle_close_time=created,
+            source_module="mock_feed" if i == 100 else "market_data_collector",
+            fetched_at=created, created_at=created,
+        ))
+    for i in range(5):
+        rows.append(MarketState(
+            id=i + 1, correlation_id="c", token="BTC", regime="ranging", regime_confidence=0.5,
+            trend_direction="up", trend_strength=0.5, volatility_percentile=50.0,
+            volatility_expanding=False, near_support=False, near_resistance=False,
+            current_price=1.0, created_at=NOW - timedelta(hours=i),
+        ))
+    rows.append(RiskState(
+        id=1, correlation_id="c", global_risk_score=40.0, risk_level="medium",
+        sentiment_risk_raw=0.0, flow_risk_raw=0.0, smart_money_risk_raw=0.0,
+        market_condition_risk_raw=0.0, sentiment_risk_normalized=0.0,
+        flow_risk_normalized=0.0, smart_money_risk_normalized=0.0,
+        market_condition_risk_normalized=0.0, weights={}, trading_allowed=True,
+        created_at=NOW - timedelta(minutes=5),
+    ))
+    for i in range(40):
+        rows.append(ExecutionRecord(
+            id=i + 1, correlation_id="c", token="BTC", pair="BTCUSDT", exchange="binance",
+            order_type="market", side="buy", requested_size=1.0,
+            status="filled" if i % 10 else "partial",
+            slippage_percent=0.05 * (i % 7), latency_ms=100 * i,
+            created_at=NOW - timedelta(minutes=30 * i),
+        ))
+    for i in range(12):
+        rows.append(PositionSizing(
+            id=i + 1, correlation_id="c", token="BTC", pair="BTCUSDT", calculated_size=1.0,
+            size_usd=100.0, size_percent_of_portfolio=2.0 + i, risk_per_trade=1.0,
+            risk_percent=1.0, portfolio_value=1000.0, available_balance=800.0,
+            current_exposure=200.0 + i, max_position_size=100.0,
+            final_size=1.0, final_size_usd=100.0, created_at=NOW - timedelta(hours=i),
+        ))
+    for i, message in enumerate(["rule override requested", "heartbeat", "limit BYPASS"]):
+        rows.append(SystemMonitoring(
+            id=i + 1, event_type="alert", severity="warning", module_name="risk",
+            message=message, event_time=NOW - timedelta(hours=i),
+        ))
+    session.add_all(rows)
+    session.commit()
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    for model in TABLES:
+        model.__table__.create(engine)
+    with sessionmaker(bind=engine)() as session:
+        seed(session)
+    return engine
+
+
+@pytest.fixture
+def session(engine):
+    with sessionmaker(bind=engine)() as session:
+        yield session
+
+
+@pytest.fixture(autouse=True)
+def frozen_now(monkeypatch):
+    class FrozenDatetime(datetime):
+        @classmethod
+        def utcnow(cls):
+            return NOW
+
+    monkeypatch.setattr("risk_committee.snapshot.datetime", FrozenDatetime)
+
+
+def reviewers(session):
+    return [
+        DataIntegrityReviewer(session, expected_sources=["binance", "coingecko", "kraken"]),
+        MarketRiskReviewer(session),
+        ExecutionQualityReviewer(session),
+        CapitalPreservationReviewer(session),
+    ]
+
+
+def outcome(report):
+    verdict = report.verdict
+    return verdict.status, verdict.reason, verdict.details, verdict.evidence, verdict.metrics
+
+
+# ============================================================
+# SNAPSHOT
+# ============================================================
+
+class TestSnapshot:
+
+    def test_contents(self, session):
+        snapshot = CommitteeSnapshotLoader(session, ["binance", "kraken"]).load()
+
+        assert snapshot.latest_for_source("binance") == NOW - timedelta(minutes=15)
+        assert snapshot.latest_for_source("kraken") is None
+        assert snapshot.mock_rows == 0  # The mock row is older than 24h
+        assert snapshot.ingestion_cycles == 25  # 24h inclusive
+        assert len(snapshot.recent_volumes) == 100
+        assert snapshot.recent_volumes[0] == 30.0
+        assert len(snapshot.market_states) == 5
+        assert snapshot.execution_stats.orders == 40
+        assert snapshot.execution_stats.p99_latency_ms == 3900
+        assert [p.current_exposure for p in snapshot.position_sizings][:2] == [200.0, 201.0]
+        assert len(snapshot.position_sizings) == 10
+        assert snapshot.override_attempts == 2
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snapshot.mock_rows = 1
+
+    def test_reviews_match_own_loads(self, session):
+        snapshot = CommitteeSnapshotLoader(session, ["binance", "coingecko", "kraken"]).load()
+
+        for reviewer in reviewers(session):
+            assert outcome(reviewer.review("c", snapshot)) == outcome(reviewer.review("c"))
+
+        data = reviewers(session)[0].review("c", snapshot)
+        assert data.source_statuses == {"binance": "OK", "coingecko": "OK", "kraken": "MISSING"}
+        assert reviewers(session)[1].review("c", snapshot).liquidity_condition == "DRY"
+        capital = reviewers(session)[3].review("c", snapshot)
+        assert capital.override_attempts == 2
+        assert capital.max_position_size_pct == 11.0
+
+    def test_rejects_partial_snapshot(self, session):
+        snapshot = CommitteeSnapshotLoader(session).load(["executions"])
+
+        ExecutionQualityReviewer(session).review("c", snapshot)
+        with pytest.raises(ValueError):
+            MarketRiskReviewer(session).review("c", snapshot)
+
+
+# ============================================================
+# COMMITTEE
+# ============================================================
+
+class TestCommittee:
+
+    def test_reviewers_run_on_executor_after_snapshot(self, engine, session):
+        statements = []
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append((threading.current_thread().name, statement.split()[0]))
+
+        with ThreadPoolExecutor(max_workers=4, thread_name_prefix="reviewers") as executor:
+            committee = RiskCommitteeEngine(
+                session=session, config={"expected_sources": ["binance"]}, executor=executor,
+            )
+            submitted = []
+            submit = executor.submit
+            executor.submit = lambda fn, *args: submitted.append(fn) or submit(fn, *args)
+
+            report = committee.convene_committee("cycle-1")
+
+        assert len(submitted) == 4
+        assert report.data_integrity and report.market_risk
+        assert report.execution_quality and report.capital_safety
+        selects = [s for s in statements if s[1] == "SELECT"]
+        assert len(selects) == 7
+        assert all(not name.startswith("reviewers") for name, _ in statements)
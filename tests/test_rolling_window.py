@@ -0,0 +1,185 @@
+"""
+Tests for incremental rolling-window processing.
+
+============================================================
+TEST SCENARIOS
+============================================================
+1. Incremental features track the full recompute cycle by cycle
+2. Forming candles are replaced until they close
+3. Late candles and changed closed candles rebuild the group
+4. Welford add/remove matches a direct variance
+
+============================================================
+"""
+
+import math
+import random
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from data_processing.processing_module import ProcessingPipelineModule
+from data_processing.rolling_window import IncrementalFeatureEngine, _Welford
+
+
+INTERVALS = [
+    ("1h", timedelta(hours=1)),
+    ("24h", timedelta(hours=24)),
+]
+
+NUMERIC_FIELDS = (
+    "open_price", "high_price", "low_price", "close_price", "vwap",
+    "total_volume", "total_quote_volume", "avg_volume", "price_return",
+    "volatility", "high_low_range", "volume_change", "volume_change_pct",
+    "candle_count", "trade_count", "data_quality_score",
+)
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+@pytest.fixture
+def module():
+    return ProcessingPipelineModule(session_factory=lambda: None)
+
+
+def make_series(start, minutes, symbols, seed=3):
+    """Final (closed) 1m candles per symbol."""
+    rng = random.Random(seed)
+    candles = []
+    for symbol in symbols:
+        price = rng.uniform(100, 1000)
+        for i in range(minutes):
+            open_price = price
+            price *= 1 + rng.gauss(0, 0.003)
+            open_time = start + timedelta(minutes=i)
+            candles.append(SimpleNamespace(
+                symbol=symbol,
+                exchange="binance",
+                interval="1m",
+                candle_open_time=open_time,
+                candle_close_time=open_time + timedelta(minutes=1),
+                open_price=open_price,
+                high_price=max(open_price, price) * 1.001,
+                low_price=min(open_price, price) * 0.999,
+                close_price=price,
+                volume=rng.uniform(1, 50),
+                quote_volume=rng.uniform(1e3, 1e5),
+                trade_count=rng.randint(1, 300),
+            ))
+    return candles
+
+
+def visible_at(candles, now):
+    """What the database holds at `now`: closed candles plus a partial forming one."""
+    naive_now = now.replace(tzinfo=None)
+    rows = []
+    for c in candles:
+        if c.candle_open_time >= naive_now:
+            continue
+        if c.candle_close_time > naive_now:
+            c = SimpleNamespace(**{**vars(c), "close_price": c.open_price, "volume": c.volume / 2})
+        rows.append(c)
+    rows.sort(key=lambda c: (c.symbol, c.candle_open_time))
+    return rows
+
+
+def assert_close(actual, expected):
+    key = lambda r: (r["symbol"], r["exchange"], r["interval"])
+    assert sorted(map(key, actual)) == sorted(map(key, expected))
+    expected_by_key = {key(r): r for r in expected}
+    for record in actual:
+        reference = expected_by_key[key(record)]
+        for name in NUMERIC_FIELDS:
+            if reference[name] is None:
+                assert record[name] is None, name
+            else:
+                assert record[name] == pytest.approx(reference[name], rel=1e-9, abs=1e-12), name
+        assert record["has_gaps"] == reference["has_gaps"]
+
+
+# ============================================================
+# ENGINE
+# ============================================================
+
+class TestIncrementalEngine:
+
+    def test_tracks_full_recompute(self, module):
+        start = datetime(2026, 3, 1)
+        candles = make_series(start, 52 * 60, ["BTC", "ETH"])
+        engine = IncrementalFeatureEngine(INTERVALS)
+
+        now = datetime(2026, 3, 3, 0, 0, 20, tzinfo=timezone.utc)
+        engine.load(visible_at(candles, now), now)
+
+        for _ in range(40):
+            previous = now
+            now = now + timedelta(minutes=7, seconds=13)
+            # Only rows "fetched" since the last cycle (plus the forming one)
+            rows = [
+                c for c in visible_at(candles, now)
+                if c.candle_close_time > previous.replace(tzinfo=None)
+            ]
+            engine.ingest(rows, now)
+
+            window = [c for c in visible_at(candles, now)
+                      if c.candle_open_time >= (now - timedelta(hours=48)).replace(tzinfo=None)]
+            expected = module._compute_interval_features(window, INTERVALS, now)
+            assert_close(engine.compute(now), expected)
+
+        assert engine.rebuild_count == 0
+
+    def test_late_and_changed_candles_rebuild_group(self, module):
+        start = datetime(2026, 3, 1)
+        candles = make_series(start, 50 * 60, ["BTC"])
+        now = datetime(2026, 3, 3, 1, 30, tzinfo=timezone.utc)
+
+        late = candles[-200]
+        available = [c for c in visible_at(candles, now) if c is not late]
+        engine = IncrementalFeatureEngine(INTERVALS)
+        engine.load(available, now)
+
+        changed = SimpleNamespace(**{**vars(candles[-150]), "volume": 999.0})
+        engine.ingest([late, changed], now)
+        assert engine.rebuild_count == 1
+
+        final = [changed if c is candles[-150] else c for c in visible_at(candles, now)]
+        window = [c for c in final
+                  if c.candle_open_time >= (now - timedelta(hours=48)).replace(tzinfo=None)]
+        expected = module._compute_interval_features(window, INTERVALS, now)
+        assert_close(engine.compute(now), expected)
+
+    def test_duplicate_rows_are_ignored(self):
+        start = datetime(2026, 3, 1)
+        candles = make_series(start, 3 * 60, ["SOL"])
+        now = datetime(2026, 3, 1, 3, 0, tzinfo=timezone.utc)
+
+        engine = IncrementalFeatureEngine(INTERVALS)
+        engine.load(visible_at(candles, now), now)
+        before = engine.compute(now)
+
+        engine.ingest(visible_at(candles, now), now)
+        after = engine.compute(now)
+
+        assert engine.rebuild_count == 0
+        assert_close(after, before)
+
+
+class TestWelford:
+
+    def test_add_remove_matches_direct_variance(self):
+        rng = random.Random(5)
+        values = [rng.gauss(0, 0.01) for _ in range(500)]
+        stats = _Welford()
+        for value in values:
+            stats.add(value)
+        for value in values[:200]:
+            stats.remove(value)
+
+        window = values[200:]
+        mean = sum(window) / len(window)
+        variance = sum((v - mean) ** 2 for v in window) / len(window)
+        assert stats.n == len(window)
+        assert stats.std == pytest.approx(math.sqrt(variance), rel=1e-9)
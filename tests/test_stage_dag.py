@@ -0,0 +1,187 @@
+"""
+Tests for DAG-based stage execution.
+
+============================================================
+TEST SCENARIOS
+============================================================
+1. Independent stages run concurrently
+2. A stage never starts before its dependencies finish
+3. Missing stages are bridged by their own dependencies
+4. Module dependencies from the registry add stage ordering
+5. max_concurrent_stages=1 keeps the strict stage order
+6. A failure stops new stages; the critical path is reported
+7. Cancelling a cycle cancels the stages still in flight
+
+============================================================
+"""
+
+import asyncio
+
+import pytest
+
+from orchestrator.models import ExecutionStage as S, RuntimeMode
+from orchestrator.pipeline import ExecutionPipeline, build_stage_graph
+from orchestrator.registry import ModuleRegistry
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+class Recorder:
+    """Stage handlers that log start/end events."""
+
+    def __init__(self):
+        self.events = []
+        self.running = 0
+        self.max_running = 0
+
+    def handler(self, stage, delay=0.0, fail=False):
+        async def run():
+            self.events.append(("start", stage))
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            await asyncio.sleep(delay)
+            self.running -= 1
+            self.events.append(("end", stage))
+            if fail:
+                raise RuntimeError(f"{stage.stage_id} failed")
+            return {"stage": stage.stage_id}
+        return run
+
+    def position(self, kind, stage):
+        return self.events.index((kind, stage))
+
+
+def all_handlers(recorder, delays=None, fail=()):
+    delays = delays or {}
+    return {
+        stage: recorder.handler(stage, delays.get(stage, 0.0), stage in fail)
+        for stage in S.get_ordered_stages()
+    }
+
+
+# ============================================================
+# GRAPH
+# ============================================================
+
+class TestStageGraph:
+
+    def test_missing_stages_are_bridged(self):
+        graph = build_stage_graph(S.get_stages_for_mode(RuntimeMode.PROCESS))
+
+        assert graph[S.RUN_PROCESSING] == {S.INIT_HEALTH}
+        assert graph[S.UPDATE_MONITORING] == {S.INIT_HEALTH}
+        assert S.RUN_MARKET_CLASSIFICATION in graph[S.PERSIST_RESULTS]
+
+    def test_registry_adds_module_ordering(self):
+        registry = ModuleRegistry()
+        registry.register("monitoring", object, required_stages=[S.UPDATE_MONITORING],
+                          dependencies=["ingestion"])
+        registry.register("ingestion", object, required_stages=[S.RUN_INGESTION])
+
+        stages = S.get_stages_for_mode(RuntimeMode.INGEST)
+        assert S.RUN_INGESTION not in build_stage_graph(stages)[S.UPDATE_MONITORING]
+        assert S.RUN_INGESTION in build_stage_graph(stages, registry)[S.UPDATE_MONITORING]
+
+
+# ============================================================
+# EXECUTION
+# ============================================================
+
+class TestDagExecution:
+
+    @pytest.mark.asyncio
+    async def test_independent_stages_overlap(self):
+        recorder = Recorder()
+        handlers = all_handlers(recorder, delays={
+            S.RUN_INGESTION: 0.05,
+            S.UPDATE_MONITORING: 0.05,
+        })
+        pipeline = ExecutionPipeline(RuntimeMode.INGEST, handlers)
+
+        result = await pipeline.execute_cycle()
+
+        assert result.success
+        assert recorder.max_running >= 2
+        # Monitoring started before ingestion ended
+        assert recorder.position("start", S.UPDATE_MONITORING) < recorder.position("end", S.RUN_INGESTION)
+        for stage, deps in pipeline.stage_graph.items():
+            for dep in deps:
+                assert recorder.position("end", dep) < recorder.position("start", stage)
+
+    @pytest.mark.asyncio
+    async def test_sequential_limit_keeps_stage_order(self):
+        recorder = Recorder()
+        pipeline = ExecutionPipeline(RuntimeMode.FULL, all_handlers(recorder), max_concurrent_stages=1)
+
+        result = await pipeline.execute_cycle()
+
+        started = [stage for kind, stage in recorder.events if kind == "start"]
+        assert result.success
+        assert started == S.get_ordered_stages()
+        assert recorder.max_running == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_stops_new_stages(self):
+        recorder = Recorder()
+        handlers = all_handlers(recorder, delays={S.UPDATE_MONITORING: 0.05}, fail={S.RUN_INGESTION})
+        pipeline = ExecutionPipeline(RuntimeMode.INGEST, handlers)
+
+        result = await pipeline.execute_cycle()
+
+        assert not result.success
+        assert result.failed_stage == S.RUN_INGESTION
+        assert ("start", S.PERSIST_RESULTS) not in recorder.events
+        # Already running stages finish
+        assert ("end", S.UPDATE_MONITORING) in recorder.events
+
+    @pytest.mark.asyncio
+    async def test_critical_path(self):
+        recorder = Recorder()
+        handlers = all_handlers(recorder, delays={S.RUN_INGESTION: 0.05, S.PERSIST_RESULTS: 0.02})
+        pipeline = ExecutionPipeline(RuntimeMode.INGEST, handlers)
+
+        result = await pipeline.execute_cycle()
+
+        assert result.critical_path[-2:] == [S.RUN_INGESTION, S.PERSIST_RESULTS]
+        assert S.UPDATE_MONITORING not in result.critical_path
+        assert result.critical_path_seconds <= result.duration_seconds
+        assert result.to_dict()["critical_path"][-1] == "persist_results"
+
+    @pytest.mark.asyncio
+    async def test_safety_gate_skips_trading_stage(self):
+        recorder = Recorder()
+        blocked = type("Safety", (), {"can_trade": False, "block_reason": "halted"})()
+        pipeline = ExecutionPipeline(
+            RuntimeMode.FULL, all_handlers(recorder), safety_checker=lambda: blocked
+        )
+
+        result = await pipeline.execute_cycle()
+
+        assert result.success
+        assert ("start", S.RUN_STRATEGY) not in recorder.events
+        assert ("start", S.RUN_EXECUTION) not in recorder.events
+        assert ("end", S.PERSIST_RESULTS) in recorder.events
+
+    @pytest.mark.asyncio
+    async def test_cancelled_cycle_cancels_running_stages(self):
+        recorder = Recorder()
+        handlers = all_handlers(recorder, delays={
+            S.RUN_INGESTION: 0.1,
+            S.UPDATE_MONITORING: 0.1,
+        })
+        pipeline = ExecutionPipeline(RuntimeMode.FULL, handlers)
+
+        cycle = asyncio.create_task(pipeline.execute_cycle())
+        await asyncio.sleep(0.03)
+        assert ("start", S.RUN_INGESTION) in recorder.events
+        cycle.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cycle
+
+        ended = len([e for e in recorder.events if e[0] == "end"])
+        await asyncio.sleep(0.2)
+        assert len([e for e in recorder.events if e[0] == "end"]) == ended
+        assert ("end", S.RUN_INGESTION) not in recorder.events
+        assert ("start", S.RUN_EXECUTION) not in recorder.events
@@ -0,0 +1,218 @@
+"""
+Tests for chunked stage processing.
+
+============================================================
+TEST SCENARIOS
+============================================================
+1. Chunked process_batch commits once per chunk
+2. A failing bulk write is retried record by record
+3. Parallel-safe stages compute in a process pool
+4. Stage transitions are one UPDATE ... = ANY(ids) per chunk
+5. The pipelined composite interleaves stage chunks and
+   leaves failed records behind without looping
+
+============================================================
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from unittest import mock
+from uuid import UUID
+
+from sqlalchemy.dialects import postgresql
+
+from data_processing.pipeline.base import BaseStageProcessor, CompositeProcessor
+from data_processing.pipeline.labelers import NewsLabelingProcessor
+from data_processing.pipeline.types import (
+    DataDomain,
+    ProcessingError,
+    ProcessingStage,
+    ProcessingStatus,
+)
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+def uid(i):
+    return UUID(int=i)
+
+
+class FakeSession:
+    """Stage table in memory; writes apply on commit."""
+
+    def __init__(self, count, stage="raw"):
+        self.db = {uid(i): stage for i in range(1, count + 1)}
+        self.staged = []
+        self.commits = []
+
+    @contextmanager
+    def begin_nested(self):
+        mark = len(self.staged)
+        try:
+            yield
+        except Exception:
+            del self.staged[mark:]
+            raise
+
+    def commit(self):
+        self.db.update(self.staged)
+        self.commits.append([(record_id, stage) for record_id, stage in self.staged])
+        self.staged = []
+
+    def rollback(self):
+        self.staged = []
+
+
+class FakeStage(BaseStageProcessor):
+    """Moves records between two stages; poisoned ids fail to persist."""
+
+    parallel_safe = True
+
+    def __init__(self, session, source, target, poison=(), bad=()):
+        self._source = source
+        self._target = target
+        self._poison = set(poison)
+        self._bad = set(bad)
+        super().__init__(session, DataDomain.NEWS)
+
+    @property
+    def from_stage(self):
+        return self._source
+
+    @property
+    def to_stage(self):
+        return self._target
+
+    def load_pending_records(self, limit=100):
+        pending = sorted(k for k, v in self._session.db.items() if v == self.from_stage.value)
+        return pending[:limit]
+
+    def get_record_id(self, record):
+        return record
+
+    def process_record(self, record):
+        if record in self._bad:
+            raise ProcessingError("bad record", self.to_stage, record)
+        return {"id": record, "stage": self.to_stage.value}
+
+    def persist_result(self, result, source_id):
+        if source_id in self._poison:
+            raise RuntimeError("constraint violation")
+        return source_id
+
+    def persist_results_bulk(self, items):
+        return [self.persist_result(result, source_id) for result, source_id in items]
+
+    def update_source_stage(self, source_id):
+        self._session.staged.append((source_id, self.to_stage.value))
+
+
+# ============================================================
+# PROCESS BATCH
+# ============================================================
+
+class TestChunkedBatch:
+
+    def test_one_commit_per_chunk(self):
+        session = FakeSession(10)
+        stage = FakeStage(session, ProcessingStage.RAW, ProcessingStage.CLEANED)
+
+        results = stage.process_batch(limit=10, chunk_size=4)
+
+        assert [r.record_id for r in results] == [uid(i) for i in range(1, 11)]
+        assert all(r.status == ProcessingStatus.SUCCESS for r in results)
+        assert [len(c) for c in session.commits] == [4, 4, 2]
+        assert set(session.db.values()) == {"cleaned"}
+        assert stage.get_metrics().records_succeeded == 10
+
+    def test_bulk_failure_falls_back_per_record(self):
+        session = FakeSession(5)
+        stage = FakeStage(
+            session, ProcessingStage.RAW, ProcessingStage.CLEANED, poison=[uid(3)], bad=[uid(5)]
+        )
+
+        results = stage.process_batch(limit=5, chunk_size=5)
+
+        failed = [r.record_id for r in results if r.status == ProcessingStatus.FAILED]
+        assert failed == [uid(3), uid(5)]
+        assert session.db[uid(3)] == "raw"
+        assert session.db[uid(5)] == "raw"
+        assert session.db[uid(4)] == "cleaned"
+
+    def test_process_pool_compute(self):
+        session = FakeSession(6)
+        stage = FakeStage(session, ProcessingStage.RAW, ProcessingStage.CLEANED, bad=[uid(2)])
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = stage.process_batch(limit=6, chunk_size=3, executor=executor)
+
+        assert [r.status for r in results].count(ProcessingStatus.FAILED) == 1
+        assert "bad record" in results[1].error_message
+        # The session never left this process
+        assert stage._session is session
+
+    def test_stage_update_uses_any(self):
+        session = mock.MagicMock()
+        labeler = NewsLabelingProcessor(session)
+        with mock.patch.object(labeler, "persist_results_bulk", return_value=[uid(1), uid(2)]):
+            labeler._persist_many([(None, uid(1)), (None, uid(2))])
+
+        stmt, params = session.execute.call_args.args
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "processing_stage" in sql
+        assert "= ANY (CAST(" in sql
+        assert params == {"ids": [uid(1), uid(2)]}
+
+
+# ============================================================
+# PIPELINED COMPOSITE
+# ============================================================
+
+class TestPipelinedComposite:
+
+    def make_composite(self, session, **kwargs):
+        stages = [
+            (ProcessingStage.RAW, ProcessingStage.CLEANED),
+            (ProcessingStage.CLEANED, ProcessingStage.NORMALIZED),
+            (ProcessingStage.NORMALIZED, ProcessingStage.LABELED),
+        ]
+        processors = [
+            FakeStage(session, source, target, **kwargs.get(target.value, {}))
+            for source, target in stages
+        ]
+        return CompositeProcessor(processors, DataDomain.NEWS)
+
+    def test_stages_interleave(self):
+        session = FakeSession(9)
+        composite = self.make_composite(session)
+
+        results = composite.process_all_stages(limit_per_stage=100, chunk_size=3)
+
+        assert set(session.db.values()) == {"labeled"}
+        assert all(len(r) == 9 for r in results.values())
+        # Cleaning's 2nd chunk is committed before labeling's 1st
+        commit_stages = [c[0][1] for c in session.commits]
+        assert commit_stages[:3] == ["cleaned", "cleaned", "normalized"]
+        assert commit_stages.index("labeled") < len(commit_stages) - 1
+
+    def test_failed_records_stay_behind(self):
+        session = FakeSession(6)
+        composite = self.make_composite(session, normalized={"bad": [uid(2)]})
+
+        results = composite.process_all_stages(limit_per_stage=100, chunk_size=4)
+
+        assert session.db[uid(2)] == "cleaned"
+        assert sum(v == "labeled" for v in session.db.values()) == 5
+        normalized = results[ProcessingStage.NORMALIZED]
+        assert [r.record_id for r in normalized].count(uid(2)) == 1
+
+    def test_limit_per_stage(self):
+        session = FakeSession(10)
+        composite = self.make_composite(session)
+
+        results = composite.process_all_stages(limit_per_stage=5, chunk_size=2)
+
+        assert len(results[ProcessingStage.CLEANED]) == 5
+        assert sum(v == "labeled" for v in session.db.values()) == 5
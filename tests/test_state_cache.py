@@ -0,0 +1,211 @@
+"""
+Tests for the latest market state cache.
+
+============================================================
+TEST SCENARIOS
+============================================================
+1. Published states are served without a database session
+2. Bundles are all-or-nothing and independent of the cache
+3. Newer cycles win over older states and stale database fills
+4. TTL expiry and invalidation fall back to the database
+5. Hit/miss counters are reported as metric values
+6. A processing cycle publishes every persisted state, one per
+   exchange for the same symbol and timeframe; states whose
+   upsert failed are never published
+
+============================================================
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import pytest
+
+from data_processing.contracts import (
+    ProcessedMarketState,
+    TrendState,
+    VolatilityLevel,
+)
+from data_processing.processing_module import ProcessingPipelineModule
+from data_processing.state_cache import (
+    METRIC_HITS,
+    METRIC_MISSES,
+    MarketStateCache,
+)
+
+
+T0 = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+def make_state(symbol, timeframe="1h", exchange="binance", at=T0, price=100.0):
+    return ProcessedMarketState(
+        symbol=symbol,
+        timeframe=timeframe,
+        exchange=exchange,
+        trend_state=TrendState.NEUTRAL,
+        volatility_level=VolatilityLevel.NORMAL,
+        liquidity_score=0.5,
+        current_price=price,
+        calculated_at=at,
+    )
+
+
+@pytest.fixture
+def cache():
+    return MarketStateCache()
+
+
+# ============================================================
+# READS
+# ============================================================
+
+class TestReads:
+
+    def test_module_reads_published_states_without_session(self, cache):
+        module = ProcessingPipelineModule(session_factory=lambda: None, state_cache=cache)
+        cache.publish([make_state("BTC"), make_state("ETH")])
+        session = mock.MagicMock()
+
+        bundle = module.get_latest_states_bundle(session, ["btc", "ETH"])
+        state = module.get_latest_market_state(session, "BTC", "1h")
+
+        assert bundle.symbols == {"BTC", "ETH"}
+        assert state.symbol == "BTC"
+        session.query.assert_not_called()
+
+    def test_bundle_is_all_or_nothing(self, cache):
+        cache.publish([make_state("BTC")])
+
+        assert cache.get_bundle(["BTC", "SOL"], "1h") is None
+        assert cache.get_bundle(["BTC"], "4h") is None
+        assert cache.get_bundle(["BTC"], "1h", exchange="okx") is None
+
+    def test_bundle_copy_does_not_change_cache(self, cache):
+        cache.publish([make_state("BTC")])
+
+        bundle = cache.get_bundle(["BTC"], "1h")
+        bundle.add(make_state("DOGE"))
+
+        assert cache.get("DOGE", "1h") is None
+        with pytest.raises(TypeError):
+            cache.snapshot().states[("X", "1h", "binance")] = make_state("X")
+
+
+# ============================================================
+# VERSIONING
+# ============================================================
+
+class TestVersioning:
+
+    def test_publish_merges_and_keeps_newer(self, cache):
+        cache.publish([make_state("BTC", at=T0, price=1.0), make_state("ETH")])
+        cache.publish([make_state("BTC", at=T0 - timedelta(hours=1), price=2.0)])
+        cache.publish([make_state("BTC", at=T0 + timedelta(hours=1), price=3.0)])
+
+        assert cache.version == 3
+        assert cache.get("BTC", "1h").current_price == 3.0
+        assert cache.get("ETH", "1h") is not None
+
+    def test_stale_fill_is_dropped(self, cache):
+        version = cache.version
+        cache.publish([make_state("BTC", price=1.0)])
+
+        assert not cache.publish([make_state("BTC", price=9.0)], if_version=version)
+        assert cache.get("BTC", "1h").current_price == 1.0
+        assert cache.get_stats()["stale_fills"] == 1
+
+    def test_ttl_expiry_and_invalidate(self):
+        cache = MarketStateCache(ttl_seconds=30)
+        with mock.patch("data_processing.state_cache.time.monotonic", return_value=1000.0):
+            cache.publish([make_state("BTC")])
+        with mock.patch("data_processing.state_cache.time.monotonic", return_value=1020.0):
+            assert cache.get("BTC", "1h") is not None
+        with mock.patch("data_processing.state_cache.time.monotonic", return_value=1031.0):
+            assert cache.get("BTC", "1h") is None
+        assert cache.get_stats()["expired"] == 1
+
+        cache.publish([make_state("ETH")])
+        cache.invalidate()
+        assert cache.snapshot() is None
+
+
+# ============================================================
+# METRICS
+# ============================================================
+
+class TestMetrics:
+
+    def test_hits_and_misses_are_reported(self, cache):
+        cache.publish([make_state("BTC")])
+        cache.get("BTC", "1h")
+        cache.get_bundle(["BTC"], "1h")
+        cache.get("ETH", "1h")
+
+        values = cache.metric_values()
+        assert values[METRIC_HITS] == 2
+        assert values[METRIC_MISSES] == 1
+        stats = cache.get_stats()
+        assert stats["hits"] == 2 and stats["misses"] == 1
+
+
+# ============================================================
+# PERSISTENCE
+# ============================================================
+
+@pytest.fixture
+def upserts(monkeypatch):
+    """Record multirow_upsert calls instead of hitting the database."""
+    class Calls(list):
+        failing = set()  # Symbols whose upsert fails (a batch with any fails)
+
+    calls = Calls()
+
+    def fake_upsert(session, model, rows, **kwargs):
+        calls.append([(row["symbol"], row["exchange"]) for row in rows])
+        if calls.failing and (len(rows) > 1 or rows[0]["symbol"] in calls.failing):
+            raise RuntimeError("constraint violation")
+        return len(rows)
+
+    monkeypatch.setattr("data_processing.processing_module.multirow_upsert", fake_upsert)
+    return calls
+
+
+class TestPersistence:
+
+    def test_every_exchange_is_published(self, cache, upserts):
+        module = ProcessingPipelineModule(session_factory=lambda: None, state_cache=cache)
+        cache.publish([
+            make_state("BTC", exchange="binance_futures", price=1.0),
+            make_state("BTC", exchange="coingecko", price=1.0),
+        ])
+        cycle_two = T0 + timedelta(hours=1)
+
+        persisted = module.persist_market_states(mock.MagicMock(), [
+            make_state("BTC", exchange="binance_futures", at=cycle_two, price=2.0),
+            make_state("BTC", exchange="coingecko", at=cycle_two, price=3.0),
+        ])
+        cache.publish(persisted)
+
+        assert upserts == [[("BTC", "binance_futures"), ("BTC", "coingecko")]]
+        assert cache.get("BTC", "1h", "binance_futures").current_price == 2.0
+        assert cache.get("BTC", "1h", "coingecko").current_price == 3.0
+
+    def test_failed_rows_are_not_published(self, cache, upserts):
+        module = ProcessingPipelineModule(session_factory=lambda: None, state_cache=cache)
+        cache.publish([make_state("ETH", price=1.0)])
+        upserts.failing = {"ETH"}
+
+        persisted = module.persist_market_states(mock.MagicMock(), [
+            make_state("BTC", at=T0 + timedelta(hours=1), price=2.0),
+            make_state("ETH", at=T0 + timedelta(hours=1), price=2.0),
+            make_state("SOL", at=T0 + timedelta(hours=1), price=2.0),
+        ])
+        cache.publish(persisted)
+
+        assert [state.symbol for state in persisted] == ["BTC", "SOL"]
+        assert upserts[1:] == [[("BTC", "binance")], [("ETH", "binance")], [("SOL", "binance")]]
+        assert cache.get("ETH", "1h").current_price == 1.0  # Still the committed state
@@ -0,0 +1,136 @@
+"""
+Tests for batch strategy signal evaluation.
+
+============================================================
+TEST SCENARIOS
+============================================================
+1. Batch signals equal generate_signal for every state,
+   including non-tradeable states and missing metrics
+2. Risk-blocked batches produce only NONE signals
+3. A columnar table gives the same signals as the states
+4. generate_signals_from_bundle keeps order and summaries
+
+============================================================
+"""
+
+import random
+
+import pytest
+
+from data_processing.contracts import (
+    ProcessedMarketState,
+    ProcessedMarketStateBundle,
+    TrendState,
+    VolatilityLevel,
+)
+from strategy_engine import MarketStateFrame, StrategyEngine
+
+
+# Fields that differ per call by design
+VOLATILE_FIELDS = ("signal_id", "generated_at", "expires_at")
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+def maybe(rng, value):
+    return None if rng.random() < 0.2 else value
+
+
+def make_states(count, seed=3):
+    rng = random.Random(seed)
+    states = []
+    for i in range(count):
+        states.append(ProcessedMarketState(
+            symbol=f"SYM{i}",
+            timeframe=rng.choice(["1h", "4h", "24h"]),
+            trend_state=rng.choice(list(TrendState)),
+            volatility_level=rng.choice(list(VolatilityLevel)),
+            liquidity_score=rng.choice([0.0, 0.3, 0.5, 0.7, 0.9, 1.0, rng.random()]),
+            current_price=maybe(rng, rng.uniform(0.01, 60_000)),
+            price_change_pct=maybe(rng, rng.gauss(0, 3)),
+            volatility_raw=maybe(rng, rng.random()),
+            volatility_percentile=maybe(rng, rng.uniform(0, 100)),
+            volume_ratio=maybe(rng, rng.uniform(0, 4)),
+            trend_strength=maybe(rng, rng.choice([0.0, rng.random()])),
+            data_quality_score=maybe(rng, rng.choice([0.0, rng.random()])),
+            exchange=rng.choice(["binance", "okx"]),
+        ))
+    return states
+
+
+def comparable(signal):
+    fields = dict(vars(signal))
+    for name in VOLATILE_FIELDS:
+        fields.pop(name)
+    return fields
+
+
+@pytest.fixture
+def engine():
+    return StrategyEngine()
+
+
+# ============================================================
+# PARITY
+# ============================================================
+
+class TestBatchParity:
+
+    @pytest.mark.parametrize("risk_allows_trading", [True, False])
+    def test_matches_generate_signal(self, engine, risk_allows_trading):
+        states = make_states(500)
+
+        bundle = engine.generate_signals_batch(states, risk_allows_trading=risk_allows_trading)
+
+        expected = [engine.generate_signal(s, risk_allows_trading) for s in states]
+        assert [comparable(s) for s in bundle.signals] == [comparable(s) for s in expected]
+        if not risk_allows_trading:
+            assert not any(s.is_actionable for s in bundle.signals)
+        else:
+            assert sum(s.is_actionable for s in bundle.signals) > 50
+
+    def test_columnar_table(self, engine):
+        states = make_states(100, seed=8)
+        fields = [
+            "symbol", "timeframe", "exchange", "state_id", "liquidity_score",
+            "current_price", "price_change_pct", "volatility_raw",
+            "volatility_percentile", "volume_ratio", "trend_strength", "data_quality_score",
+        ]
+        table = {name: [getattr(s, name) for s in states] for name in fields}
+        table["trend_state"] = [s.trend_state.value for s in states]
+        table["volatility_level"] = [s.volatility_level.value for s in states]
+
+        from_table = engine.generate_signals_batch(MarketStateFrame.from_columns(table))
+        from_states = engine.generate_signals_batch(states)
+
+        assert [comparable(s) for s in from_table.signals] == [comparable(s) for s in from_states.signals]
+
+    def test_columnar_table_validates_liquidity(self):
+        with pytest.raises(ValueError):
+            MarketStateFrame.from_columns({
+                "symbol": ["BTC"], "timeframe": ["1h"], "trend_state": ["uptrend"],
+                "volatility_level": ["normal"], "liquidity_score": [1.5],
+            })
+
+
+# ============================================================
+# BUNDLE
+# ============================================================
+
+class TestBundle:
+
+    def test_bundle_uses_batch(self, engine):
+        bundle = ProcessedMarketStateBundle()
+        for state in make_states(30, seed=5):
+            bundle.add(state)
+
+        result = engine.generate_signals_from_bundle(bundle)
+
+        assert [s.source_state_id for s in result.signals] == [
+            str(s.state_id) for s in bundle.states.values()
+        ]
+        assert result.symbols_evaluated == [s.symbol for s in bundle.states.values()]
+        assert set(result.timeframes_evaluated) == {s.timeframe for s in bundle.states.values()}
+        assert len({s.generated_at for s in result.signals if s.supporting_features}) <= 1
@@ -0,0 +1,287 @@
+"""
+Tests for in-process cycle tracing.
+
+============================================================
+TEST SCENARIOS
+============================================================
+1. Spans nest, time on the monotonic clock and break down
+   into total and self time per call path
+2. Spans outside a sampled trace are no-ops
+3. The ring buffer keeps only the most recent traces
+4. Traces export as Chrome trace JSON
+5. A pipeline cycle is one trace with a span per stage;
+   database statements (also those run on the DB writer
+   thread) and exchange requests join it
+6. The dashboard serves trace lists, breakdowns and
+   Chrome exports
+
+============================================================
+"""
+
+import asyncio
+import time
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from database.async_writer import AsyncBatchWriter
+from execution_engine.adapters.bybit import BybitAdapter
+from monitoring.tracing import (
+    NOOP_SPAN,
+    RingBufferExporter,
+    Tracer,
+    current_span,
+    get_tracer,
+    instrument_engine,
+    traced,
+)
+from orchestrator.models import ExecutionStage as S, RuntimeMode
+from orchestrator.pipeline import ExecutionPipeline
+
+
+# ============================================================
+# SPANS
+# ============================================================
+
+class TestSpans:
+
+    def test_nesting_and_breakdown(self):
+        tracer = Tracer()
+
+        with tracer.trace("cycle", trace_id="t1") as root:
+            with tracer.span("fetch", source="binance") as span:
+                time.sleep(0.02)
+                span.set(records=3)
+            for _ in range(2):
+                with tracer.span("persist"):
+                    with tracer.span("db.query"):
+                        time.sleep(0.005)
+            with pytest.raises(ValueError):
+                with tracer.span("parse"):
+                    raise ValueError("bad")
+
+        trace = tracer.exporter.get("t1")
+        assert trace is not None and trace.name == "cycle"
+        assert trace.duration_ms >= 30
+        assert current_span() is NOOP_SPAN
+
+        spans = {s.name: s for s in trace.spans}
+        assert spans["fetch"].parent_id == root.span_id
+        assert spans["fetch"].attributes == {"source": "binance", "records": 3}
+        assert spans["db.query"].parent_id == spans["persist"].span_id
+        assert spans["parse"].error == "ValueError"
+
+        rows = {row["path"]: row for row in trace.breakdown()}
+        assert list(rows) == ["cycle", "cycle;fetch", "cycle;persist",
+                              "cycle;persist;db.query", "cycle;parse"]
+        assert rows["cycle;persist"]["count"] == 2
+        assert rows["cycle;persist;db.query"]["depth"] == 2
+        assert rows["cycle;parse"]["errors"] == 1
+        assert rows["cycle;fetch"]["total_ms"] >= 20
+        assert rows["cycle"]["self_ms"] < rows["cycle"]["total_ms"] - 30
+        assert rows["cycle;persist"]["self_ms"] == pytest.approx(
+            rows["cycle;persist"]["total_ms"] - rows["cycle;persist;db.query"]["total_ms"]
+        )
+        assert "cycle;fetch " in trace.folded()
+
+    def test_noop_outside_trace(self):
+        tracer = Tracer()
+
+        with tracer.span("orphan") as span:
+            span.set(ignored=True)
+        assert span is NOOP_SPAN
+        tracer.record("db.query", 0, 10)
+
+        unsampled = Tracer(sample_rate=0.0)
+        with unsampled.trace("cycle") as root:
+            assert unsampled.span("child") is NOOP_SPAN
+        assert root is NOOP_SPAN
+        assert len(unsampled.exporter) == 0
+
+        with pytest.raises(ValueError):
+            Tracer(sample_rate=1.5)
+
+    async def test_nested_trace_joins_current(self):
+        tracer = Tracer()
+
+        @traced("work.async")
+        async def work():
+            await asyncio.sleep(0)
+            current_span().set(done=True)
+
+        @traced()
+        def helper():
+            return 1
+
+        with tracer.trace("outer", trace_id="t2"):
+            with Tracer().trace("inner"):
+                await asyncio.gather(work(), work())
+                helper()
+
+        trace = tracer.exporter.get("t2")
+        assert [row["path"] for row in trace.breakdown()] == [
+            "outer", "outer;inner", "outer;inner;work.async",
+            "outer;inner;TestSpans.test_nested_trace_joins_current.<locals>.helper",
+        ]
+        assert all(s.attributes == {"done": True} for s in trace.spans if s.name == "work.async")
+
+    def test_max_spans(self):
+        tracer = Tracer(max_spans_per_trace=3)
+        with tracer.trace("cycle", trace_id="t3"):
+            for _ in range(5):
+                with tracer.span("step"):
+                    pass
+
+        trace = tracer.exporter.get("t3")
+        assert [s.name for s in trace.spans] == ["step", "step", "step", "cycle"]
+        assert trace.dropped_spans == 2
+
+
+# ============================================================
+# EXPORT
+# ============================================================
+
+class TestExport:
+
+    def test_ring_buffer(self):
+        tracer = Tracer(exporter=RingBufferExporter(capacity=3))
+        for i in range(5):
+            with tracer.trace("cycle", trace_id=f"c{i}"):
+                pass
+
+        assert [t.trace_id for t in tracer.exporter.recent()] == ["c4", "c3", "c2"]
+        assert [t.trace_id for t in tracer.exporter.recent(1)] == ["c4"]
+        assert tracer.exporter.get("c0") is None
+
+    def test_chrome_trace(self):
+        tracer = Tracer()
+        with tracer.trace("cycle", trace_id="t4"):
+            with tracer.span("stage.a", symbol="BTC"):
+                time.sleep(0.002)
+
+        chrome = tracer.exporter.get("t4").to_chrome_trace()
+
+        events = [e for e in chrome["traceEvents"] if e["ph"] == "X"]
+        assert [e["name"] for e in events] == ["cycle", "stage.a"]
+        root, stage = events
+        assert root["ts"] == 0
+        assert stage["ts"] >= 0 and stage["dur"] >= 2000
+        assert stage["ts"] + stage["dur"] <= root["dur"]
+        assert stage["cat"] == "stage"
+        assert stage["args"] == {"symbol": "BTC"}
+        assert chrome["otherData"]["trace_id"] == "t4"
+        metadata = [e for e in chrome["traceEvents"] if e["ph"] == "M"]
+        assert metadata[0]["args"] == {"name": "cycle"}
+
+
+# ============================================================
+# INSTRUMENTATION
+# ============================================================
+
+class TestInstrumentation:
+
+    async def test_pipeline_cycle(self):
+        async def slow():
+            await asyncio.sleep(0.01)
+            return {}
+
+        async def fast():
+            return {}
+
+        tracer = Tracer()
+        handlers = {stage: fast for stage in S.get_ordered_stages()}
+        handlers[S.RUN_PROCESSING] = slow
+        pipeline = ExecutionPipeline(RuntimeMode.PROCESS, handlers, tracer=tracer)
+
+        result = await pipeline.execute_cycle()
+
+        trace = tracer.exporter.get(result.cycle_id)
+        assert trace.name == "pipeline.cycle"
+        rows = {row["path"]: row for row in trace.breakdown()}
+        stage_paths = [f"pipeline.cycle;stage.{r.stage.stage_id}" for r in result.stage_results]
+        assert set(stage_paths) <= set(rows)
+        assert rows[f"pipeline.cycle;stage.{S.RUN_PROCESSING.stage_id}"]["total_ms"] >= 10
+        root = next(s for s in trace.spans if s.parent_id is None)
+        assert root.attributes["success"] is True
+
+    def test_database_statements(self):
+        engine = create_engine("sqlite://")
+        instrument_engine(engine)
+        tracer = Tracer()
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            with tracer.trace("cycle", trace_id="t5"):
+                with tracer.span("persist"):
+                    conn.execute(text("SELECT 2"))
+                    with pytest.raises(Exception):
+                        conn.execute(text("SELECT * FROM missing"))
+                    conn.execute(text("SELECT 3"))
+
+        queries = [s for s in tracer.exporter.get("t5").spans if s.name == "db.query"]
+        assert [q.attributes["statement"] for q in queries] == ["SELECT 2", "SELECT 3"]
+        assert all(q.end_ns >= q.start_ns > 0 for q in queries)
+
+    async def test_writer_thread_statements(self):
+        engine = create_engine(
+            "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+        )
+        instrument_engine(engine)
+        writer = AsyncBatchWriter(session_factory=sessionmaker(bind=engine))
+        tracer = Tracer()
+
+        try:
+            with tracer.trace("cycle", trace_id="t7"):
+                with tracer.span("ingestion.persist") as persist:
+                    await writer.submit(lambda session: session.execute(text("SELECT 7")))
+        finally:
+            await writer.stop()
+
+        spans = tracer.exporter.get("t7").spans
+        query = next(s for s in spans if s.attributes.get("statement") == "SELECT 7")
+        assert query.parent_id == persist.span_id
+        assert query.lane == "db-writer"
+
+    async def test_exchange_request(self):
+        tracer = Tracer()
+
+        with tracer.trace("cycle", trace_id="t6"):
+            with pytest.raises(Exception):
+                await BybitAdapter()._request("GET", "/v5/market/time")
+
+        span = next(s for s in tracer.exporter.get("t6").spans if s.name == "exchange.request")
+        assert span.attributes == {"exchange": "bybit", "method": "GET", "endpoint": "/v5/market/time"}
+        assert span.error is not None
+
+
+# ============================================================
+# DASHBOARD
+# ============================================================
+
+class TestDashboard:
+
+    def test_trace_endpoints(self):
+        testclient = pytest.importorskip("fastapi.testclient")
+        from dashboard.api import app
+
+        tracer = get_tracer()
+        with tracer.trace("pipeline.cycle", trace_id="dashboard-test"):
+            with tracer.span("stage.data_ingestion"):
+                pass
+        client = testclient.TestClient(app)
+
+        listed = client.get("/traces").json()
+        assert listed[0]["trace_id"] == "dashboard-test"
+
+        breakdown = client.get("/traces/dashboard-test").json()
+        assert [row["path"] for row in breakdown["breakdown"]] == [
+            "pipeline.cycle", "pipeline.cycle;stage.data_ingestion",
+        ]
+
+        chrome = client.get("/traces/dashboard-test/chrome").json()
+        assert {e["name"] for e in chrome["traceEvents"] if e["ph"] == "X"} == {
+            "pipeline.cycle", "stage.data_ingestion",
+        }
+        assert client.get("/traces/unknown").status_code == 404
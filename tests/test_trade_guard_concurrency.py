@@ -0,0 +1,267 @@
+"""
+Tests for concurrent Trade Guard evaluation.
+
+============================================================
+TEST SCENARIOS
+============================================================
+1. Serial evaluation still decides EXECUTE / BLOCK
+2. Concurrent evaluation takes as long as the slowest
+   validator, not the sum
+3. A validator missing its deadline is a BLOCK, returned at
+   the deadline
+4. A BLOCK cancels lower-priority validators not yet started
+5. The reported BLOCK is the highest-priority one, whichever
+   validator finishes first
+6. Results are memoized per input fingerprint within a cycle
+   (never across cycles, never for timeouts, never past the TTL)
+
+============================================================
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+
+from trade_guard_absolute.config import TradeGuardConfig
+from trade_guard_absolute.engine import TradeGuardAbsolute
+from trade_guard_absolute.types import (
+    AccountState,
+    BlockCategory,
+    BlockReason,
+    EnvironmentalContext,
+    ExecutionHealthMetrics,
+    GlobalHaltState,
+    GuardDecision,
+    GuardInput,
+    SystemStateSnapshot,
+    TradeIntent,
+)
+from trade_guard_absolute.validators import (
+    BaseValidator,
+    create_block_result,
+    create_pass_result,
+)
+from trade_guard_absolute.validators.base import ValidatorMeta
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+class StubValidator(BaseValidator):
+    """Sleeps, counts its calls and passes or blocks."""
+
+    def __init__(self, name, sleep_ms=0.0, block_reason=None):
+        self._meta = ValidatorMeta(
+            name=name, category=BlockCategory.RULE_VIOLATION, description="stub",
+        )
+        self.sleep_ms = sleep_ms
+        self.block_reason = block_reason
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    @property
+    def meta(self):
+        return self._meta
+
+    def _validate(self, guard_input):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.sleep_ms / 1000)
+        if self.block_reason:
+            return create_block_result(self.meta.name, self.block_reason)
+        return create_pass_result(self.meta.name)
+
+
+def make_input(position_size=0.1):
+    return GuardInput(
+        trade_intent=TradeIntent(
+            intent_id="intent-1", request_id="request-1", symbol="BTCUSDT",
+            exchange="binance", direction="LONG", entry_price=100.0,
+            stop_loss_price=95.0, position_size=position_size,
+            created_at=datetime(2024, 3, 1, 12),
+        ),
+        system_state=SystemStateSnapshot(snapshot_time=datetime(2024, 3, 1, 12)),
+        execution_health=ExecutionHealthMetrics(),
+        halt_state=GlobalHaltState(),
+        account_state=AccountState(),
+        environmental_context=EnvironmentalContext(),
+    )
+
+
+def make_guard(validators, concurrent=True, executor=None, validator_timeout_ms=20.0):
+    config = TradeGuardConfig()
+    config.timing.concurrent_validation = concurrent
+    config.timing.validator_timeout_ms = validator_timeout_ms
+    guard = TradeGuardAbsolute(config, executor=executor)
+    guard._validators = validators
+    return guard
+
+
+@pytest.fixture
+def guards():
+    created = []
+    yield created
+    for guard in created:
+        guard.close()
+
+
+# ============================================================
+# SERIAL
+# ============================================================
+
+class TestSerial:
+
+    def test_execute_and_block(self):
+        passing = [StubValidator(f"v{i}") for i in range(5)]
+        result = make_guard(passing, concurrent=False).evaluate(make_input())
+
+        assert result.decision == GuardDecision.EXECUTE
+        assert [r.validator_name for r in result.validation_results] == [f"v{i}" for i in range(5)]
+
+        blocking = [StubValidator("a"), StubValidator("b", block_reason=BlockReason.RV_SYSTEM_HALT_STATE),
+                    StubValidator("c")]
+        result = make_guard(blocking, concurrent=False).evaluate(make_input())
+
+        assert result.decision == GuardDecision.BLOCK
+        assert result.reason == BlockReason.RV_SYSTEM_HALT_STATE
+        assert result.category == BlockCategory.RULE_VIOLATION
+        assert blocking[2].calls == 0
+
+
+# ============================================================
+# CONCURRENT
+# ============================================================
+
+class TestConcurrent:
+
+    def test_latency_is_slowest_validator(self, guards):
+        validators = [StubValidator(f"v{i}", sleep_ms=8) for i in range(5)]
+        guard = make_guard(validators)
+        guards.append(guard)
+
+        started = time.perf_counter()
+        result = guard.evaluate(make_input())
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        assert result.decision == GuardDecision.EXECUTE
+        assert len(result.validation_results) == 5
+        assert elapsed_ms < 5 * 8
+
+    def test_deadline_blocks(self, guards):
+        slow = StubValidator("slow", sleep_ms=300)
+        guard = make_guard([StubValidator("fast"), slow])
+        guards.append(guard)
+
+        started = time.perf_counter()
+        result = guard.evaluate(make_input())
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        assert result.decision == GuardDecision.BLOCK
+        assert result.reason == BlockReason.IE_TIMEOUT
+        assert result.validation_results[1].validator_name == "slow"
+        assert elapsed_ms < 150
+
+    def test_first_block_cancels_the_rest(self):
+        # One worker: validators queue behind the slow second one
+        blocker = StubValidator("blocker", block_reason=BlockReason.RV_SYSTEM_HALT_STATE)
+        running = StubValidator("running", sleep_ms=100)
+        queued = [StubValidator(f"queued{i}") for i in range(3)]
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            guard = make_guard([blocker, running, *queued], executor=executor,
+                               validator_timeout_ms=500)
+            started = time.perf_counter()
+            result = guard.evaluate(make_input())
+            elapsed_ms = (time.perf_counter() - started) * 1000
+
+        assert result.decision == GuardDecision.BLOCK
+        assert result.reason == BlockReason.RV_SYSTEM_HALT_STATE
+        assert elapsed_ms < 100
+        assert [v.calls for v in queued] == [0, 0, 0]
+        assert [r.validator_name for r in result.validation_results] == ["blocker"]
+
+    def test_highest_priority_block_wins(self, guards):
+        # The low-priority block finishes first; the slower
+        # higher-priority block must still be the one reported
+        first = StubValidator("first", sleep_ms=30, block_reason=BlockReason.RV_SYSTEM_HALT_STATE)
+        second = StubValidator("second")
+        last = StubValidator("last", block_reason=BlockReason.IE_GUARD_INTERNAL_ERROR)
+        guard = make_guard([first, second, last], validator_timeout_ms=500)
+        guards.append(guard)
+
+        result = guard.evaluate(make_input())
+
+        assert result.reason == BlockReason.RV_SYSTEM_HALT_STATE
+        assert result.validation_results[0].validator_name == "first"
+
+
+# ============================================================
+# MEMOIZATION
+# ============================================================
+
+class TestMemoization:
+
+    @pytest.mark.parametrize("concurrent", [False, True])
+    def test_memoized_within_cycle(self, guards, concurrent):
+        validators = [StubValidator(f"v{i}") for i in range(3)]
+        guard = make_guard(validators, concurrent=concurrent)
+        guards.append(guard)
+
+        guard.evaluate(make_input())
+        guard.evaluate(make_input())
+        assert validators[0].calls == 2  # No cycle, no memo
+
+        guard.begin_cycle("cycle-1")
+        first = guard.evaluate(make_input())
+        second = guard.evaluate(make_input())
+        assert validators[0].calls == 3
+        assert second.decision == first.decision == GuardDecision.EXECUTE
+        assert second.validation_results == first.validation_results
+
+        guard.evaluate(make_input(position_size=0.2))
+        assert validators[0].calls == 4
+
+        guard.begin_cycle("cycle-1")
+        guard.evaluate(make_input())
+        assert validators[0].calls == 4
+
+        guard.begin_cycle("cycle-2")
+        guard.evaluate(make_input())
+        assert validators[0].calls == 5
+
+    def test_memo_expires_after_ttl(self, guards):
+        validators = [StubValidator("v0")]
+        guard = make_guard(validators)
+        guard.config.timing.memo_ttl_ms = 20
+        guards.append(guard)
+        guard.begin_cycle("cycle-1")
+
+        guard.evaluate(make_input())
+        guard.evaluate(make_input())
+        assert validators[0].calls == 1
+
+        time.sleep(0.03)
+        guard.evaluate(make_input())
+        assert validators[0].calls == 2
+
+    def test_timeouts_not_memoized(self, guards):
+        slow = StubValidator("slow", sleep_ms=40)
+        guard = make_guard([slow])
+        guards.append(guard)
+        guard.begin_cycle("cycle-1")
+
+        assert guard.evaluate(make_input()).reason == BlockReason.IE_TIMEOUT
+        time.sleep(0.05)  # Let the abandoned validator free its worker
+        assert guard.evaluate(make_input()).reason == BlockReason.IE_TIMEOUT
+        assert slow.calls == 2
+
+    def test_fingerprint_ignores_evaluation_metadata(self):
+        a, b = make_input(), make_input()
+
+        assert a.evaluation_id != b.evaluation_id
+        assert TradeGuardAbsolute.fingerprint(a) == TradeGuardAbsolute.fingerprint(b)
+        assert TradeGuardAbsolute.fingerprint(a) != TradeGuardAbsolute.fingerprint(make_input(0.2))
@@ -497,6 +497,36 @@ class TimingConfig:
     Whether to enforce strict timing.
     If True, timeout = BLOCK.
     """
+    
+    concurrent_validation: bool = False
+    """
+    Run the validators concurrently instead of in priority order.
+    Default: False
+    
+    RATIONALE:
+    - Validators are independent of each other
+    - Latency becomes the slowest validator, not the sum
+    - Each validator gets a hard deadline (validator_timeout_ms)
+    - A BLOCK cancels the lower-priority validators still pending
+    """
+    
+    memoize_within_cycle: bool = True
+    """
+    Reuse validation results for an identical input within a
+    cycle (see TradeGuardAbsolute.begin_cycle).
+    Timeouts and internal errors are never reused.
+    """
+    
+    memo_ttl_ms: float = 1000.0
+    """
+    Maximum age of a memoized validation result.
+    Default: 1000ms
+    
+    RATIONALE:
+    - Validators compare input timestamps against now
+      (e.g. market data age)
+    - A stale PASS must not outlive those freshness limits
+    """
 
 
 # ============================================================
@@ -578,6 +608,10 @@ class TradeGuardConfig:
             },
             "timing": {
                 "max_evaluation_time_ms": self.timing.max_evaluation_time_ms,
+                "validator_timeout_ms": self.timing.validator_timeout_ms,
+                "concurrent_validation": self.timing.concurrent_validation,
+                "memoize_within_cycle": self.timing.memoize_within_cycle,
+                "memo_ttl_ms": self.timing.memo_ttl_ms,
             },
             "block_on_internal_error": self.block_on_internal_error,
         }
@@ -692,6 +726,29 @@ def load_config_from_dict(data: Dict[str, Any]) -> TradeGuardConfig:
             config.environmental.block_on_critical_risk,
         )
     
+    if "timing" in data:
+        timing = data["timing"]
+        config.timing.max_evaluation_time_ms = timing.get(
+            "max_evaluation_time_ms",
+            config.timing.max_evaluation_time_ms,
+        )
+        config.timing.validator_timeout_ms = timing.get(
+            "validator_timeout_ms",
+            config.timing.validator_timeout_ms,
+        )
+        config.timing.concurrent_validation = timing.get(
+            "concurrent_validation",
+            config.timing.concurrent_validation,
+        )
+        config.timing.memoize_within_cycle = timing.get(
+            "memoize_within_cycle",
+            config.timing.memoize_within_cycle,
+        )
+        config.timing.memo_ttl_ms = timing.get(
+            "memo_ttl_ms",
+            config.timing.memo_ttl_ms,
+        )
+    
     if "alerting" in data:
         alert = data["alerting"]
         config.alerting.enabled = alert.get("enabled", config.alerting.enabled)
@@ -35,12 +35,39 @@ CRITICAL BEHAVIOR
    - No randomness
    - No machine learning
 
+============================================================
+CONCURRENT EVALUATION
+============================================================
+With timing.concurrent_validation the validators run at once
+on an executor instead of one after another:
+- Every validator has a hard deadline (validator_timeout_ms,
+  capped by max_evaluation_time_ms); a missed deadline = BLOCK
+- A BLOCK cancels the lower-priority validators still pending;
+  higher-priority ones are still awaited, so the reported
+  reason is the same as in priority order
+- A running validator cannot be interrupted; its late result
+  is discarded (the owned pool keeps headroom for stragglers)
+
+Within a cycle (begin_cycle) validation results are memoized
+per input fingerprint for at most timing.memo_ttl_ms, so an
+identical input is decided without re-running the validators
+while time-dependent checks (data age) stay fresh.
+
 ============================================================
 """
 
+import hashlib
+import threading
 import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 
 from .types import (
@@ -68,6 +95,11 @@ from .validators import (
 logger = logging.getLogger(__name__)
 
 
+# Owned pool size per validator: room for validators abandoned
+# at a deadline without starving the next evaluation
+VALIDATOR_POOL_HEADROOM = 3
+
+
 class TradeGuardAbsolute:
     """
     The Final Execution Gate.
@@ -90,15 +122,26 @@ class TradeGuardAbsolute:
     def __init__(
         self,
         config: Optional[TradeGuardConfig] = None,
+        executor: Optional[Executor] = None,
     ):
         """
         Initialize Trade Guard Absolute.
         
         Args:
             config: Guard configuration (uses defaults if None)
+            executor: Executor for concurrent validation (optional,
+                a pool sized VALIDATOR_POOL_HEADROOM threads per
+                validator is created on first use if None)
         """
         self._config = config or TradeGuardConfig()
         self._validators: List[BaseValidator] = []
+        self._executor = executor
+        self._owns_executor = executor is None
+        
+        # Per-cycle memo: input fingerprint -> (stored at, validation outcome)
+        self._cycle_id: Optional[str] = None
+        self._memo: Dict[str, Tuple[float, List[ValidationResult], Optional[ValidationResult]]] = {}
+        self._memo_lock = threading.Lock()
         
         # Initialize validators
         self._init_validators()
@@ -122,6 +165,72 @@ class TradeGuardAbsolute:
         """Get current configuration."""
         return self._config
     
+    def _get_executor(self) -> Executor:
+        """Get validator executor."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=len(self._validators) * VALIDATOR_POOL_HEADROOM,
+                thread_name_prefix="trade-guard",
+            )
+            self._owns_executor = True
+        return self._executor
+    
+    def close(self) -> None:
+        """Shut the executor down if we own it."""
+        if self._owns_executor and self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
+    async def stop(self) -> None:
+        """Module stop hook: drop memoized results and the executor."""
+        self.end_cycle()
+        self.close()
+    
+    # ============================================================
+    # CYCLE MEMOIZATION
+    # ============================================================
+    
+    def begin_cycle(self, cycle_id: str) -> None:
+        """
+        Start a new evaluation cycle.
+        
+        Memoized validation results belong to one cycle; they
+        are dropped when a different cycle begins and expire
+        after timing.memo_ttl_ms. Without a cycle nothing is
+        memoized.
+        
+        Args:
+            cycle_id: Identifier of the cycle
+        """
+        with self._memo_lock:
+            if cycle_id != self._cycle_id:
+                self._cycle_id = cycle_id
+                self._memo.clear()
+    
+    def end_cycle(self) -> None:
+        """End the current cycle and drop its memoized results."""
+        with self._memo_lock:
+            self._cycle_id = None
+            self._memo.clear()
+    
+    @staticmethod
+    def fingerprint(guard_input: GuardInput) -> str:
+        """
+        Fingerprint of everything the validators read.
+        
+        Excludes evaluation_id and received_at, which differ
+        for every submission of the same input.
+        """
+        payload = repr((
+            guard_input.trade_intent,
+            guard_input.system_state,
+            guard_input.execution_health,
+            guard_input.halt_state,
+            guard_input.account_state,
+            guard_input.environmental_context,
+        ))
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
     def evaluate(
         self,
         guard_input: GuardInput,
@@ -186,36 +295,10 @@ class TradeGuardAbsolute:
             validation_results.append(input_result)
             first_failure = input_result
         
-        # Run validators (stop on first failure for efficiency)
+        # Run validators
         if first_failure is None:
-            for validator in self._validators:
-                # Check timeout
-                elapsed_ms = (time.perf_counter() - start_time) * 1000
-                if elapsed_ms > self._config.timing.max_evaluation_time_ms:
-                    timeout_result = create_block_result(
-                        validator_name="TradeGuardAbsolute",
-                        reason=BlockReason.IE_TIMEOUT,
-                        severity=BlockSeverity.HIGH,
-                        details={
-                            "elapsed_ms": elapsed_ms,
-                            "timeout_ms": self._config.timing.max_evaluation_time_ms,
-                            "message": "Evaluation timeout exceeded",
-                        },
-                    )
-                    validation_results.append(timeout_result)
-                    first_failure = timeout_result
-                    break
-                
-                # Run validator
-                result = validator.validate(
-                    guard_input=guard_input,
-                    timeout_ms=self._config.timing.validator_timeout_ms,
-                )
-                validation_results.append(result)
-                
-                if not result.is_valid:
-                    first_failure = result
-                    break  # Stop on first failure
+            results, first_failure = self._run_validators(guard_input, start_time)
+            validation_results.extend(results)
         
         # Calculate timing
         total_elapsed_ms = (time.perf_counter() - start_time) * 1000
@@ -250,6 +333,160 @@ class TradeGuardAbsolute:
                 evaluation_time_ms=total_elapsed_ms,
             )
     
+    def _run_validators(
+        self,
+        guard_input: GuardInput,
+        start_time: float,
+    ) -> Tuple[List[ValidationResult], Optional[ValidationResult]]:
+        """
+        Run the validators, reusing this cycle's results for an
+        identical input.
+        
+        Returns:
+            (validation results, first failure or None)
+        """
+        timing = self._config.timing
+        key = None
+        if timing.memoize_within_cycle and self._cycle_id is not None:
+            key = self.fingerprint(guard_input)
+            now = time.monotonic()
+            with self._memo_lock:
+                memoized = self._memo.get(key)
+                if memoized is not None and (now - memoized[0]) * 1000 > timing.memo_ttl_ms:
+                    del self._memo[key]
+                    memoized = None
+            if memoized is not None:
+                logger.debug(f"Guard validation memoized for cycle {self._cycle_id}")
+                return list(memoized[1]), memoized[2]
+        
+        if timing.concurrent_validation:
+            outcome = self._run_concurrent(guard_input, start_time)
+        else:
+            outcome = self._run_serial(guard_input, start_time)
+        
+        # Timeouts and internal errors are transient - never reused
+        results, first_failure = outcome
+        if key is not None and not any(
+            r.reason and r.reason.get_category() == BlockCategory.INTERNAL_ERROR
+            for r in results
+        ):
+            with self._memo_lock:
+                self._memo[key] = (time.monotonic(), list(results), first_failure)
+        
+        return outcome
+    
+    def _run_serial(
+        self,
+        guard_input: GuardInput,
+        start_time: float,
+    ) -> Tuple[List[ValidationResult], Optional[ValidationResult]]:
+        """Run validators in priority order, stopping on first failure."""
+        validation_results: List[ValidationResult] = []
+        
+        for validator in self._validators:
+            # Check timeout
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            if elapsed_ms > self._config.timing.max_evaluation_time_ms:
+                timeout_result = create_block_result(
+                    validator_name="TradeGuardAbsolute",
+                    reason=BlockReason.IE_TIMEOUT,
+                    severity=BlockSeverity.HIGH,
+                    details={
+                        "elapsed_ms": elapsed_ms,
+                        "timeout_ms": self._config.timing.max_evaluation_time_ms,
+                        "message": "Evaluation timeout exceeded",
+                    },
+                )
+                validation_results.append(timeout_result)
+                return validation_results, timeout_result
+            
+            # Run validator
+            result = validator.validate(
+                guard_input=guard_input,
+                timeout_ms=self._config.timing.validator_timeout_ms,
+            )
+            validation_results.append(result)
+            
+            if not result.is_valid:
+                return validation_results, result  # Stop on first failure
+        
+        return validation_results, None
+    
+    def _run_concurrent(
+        self,
+        guard_input: GuardInput,
+        start_time: float,
+    ) -> Tuple[List[ValidationResult], Optional[ValidationResult]]:
+        """
+        Run all validators at once with a hard deadline.
+        
+        Once a validator blocks, only validators of higher
+        priority are still awaited, so the reported failure does
+        not depend on thread timing. Lower-priority validators
+        are cancelled (or, if already running, abandoned); any
+        higher-priority validator missing the deadline = BLOCK.
+        """
+        timing = self._config.timing
+        executor = self._get_executor()
+        
+        futures: Dict[Future, BaseValidator] = {
+            executor.submit(validator.validate, guard_input, timing.validator_timeout_ms): validator
+            for validator in self._validators
+        }
+        
+        # Validators start together, so they share one deadline
+        submitted = time.perf_counter()
+        deadline_ms = min(
+            timing.validator_timeout_ms,
+            timing.max_evaluation_time_ms - (submitted - start_time) * 1000,
+        )
+        deadline = submitted + deadline_ms / 1000
+        
+        rank = {validator: i for i, validator in enumerate(self._validators)}
+        finished: Dict[BaseValidator, ValidationResult] = {}
+        pending = set(futures)
+        # Priority of the highest-priority BLOCK so far
+        block_rank = len(self._validators)
+        
+        while pending:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                validator = futures[future]
+                result = future.result()
+                finished[validator] = result
+                if not result.is_valid:
+                    block_rank = min(block_rank, rank[validator])
+            
+            # Lower-priority validators can no longer change the outcome
+            for future in [f for f in pending if rank[futures[f]] > block_rank]:
+                future.cancel()
+                pending.discard(future)
+        
+        # Deadline - anything still pending outranks every BLOCK seen
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        for future in pending:
+            future.cancel()
+            validator = futures[future]
+            finished[validator] = create_block_result(
+                validator_name=validator.meta.name,
+                reason=BlockReason.IE_TIMEOUT,
+                severity=BlockSeverity.HIGH,
+                details={
+                    "validator": validator.meta.name,
+                    "elapsed_ms": elapsed_ms,
+                    "timeout_ms": deadline_ms,
+                    "message": f"Validator missed its deadline: {elapsed_ms:.2f}ms > {deadline_ms:.2f}ms",
+                },
+            )
+        
+        # Report in priority order, so the highest-priority failure wins
+        validation_results = [finished[v] for v in self._validators if v in finished]
+        first_failure = next((r for r in validation_results if not r.is_valid), None)
+        return validation_results, first_failure
+    
     def _validate_input(
         self,
         guard_input: GuardInput,
@@ -375,7 +612,10 @@ class TradeGuardAbsolute:
                 "block_on_internal_error": self._config.block_on_internal_error,
                 "block_on_missing_input": self._config.block_on_missing_input,
                 "max_evaluation_time_ms": self._config.timing.max_evaluation_time_ms,
+                "concurrent_validation": self._config.timing.concurrent_validation,
             },
+            "cycle_id": self._cycle_id,
+            "memoized_inputs": len(self._memo),
         }
 
 
@@ -666,7 +666,7 @@ class GuardInput:
     account_state: AccountState
     """Current account state."""
     
-    environment: EnvironmentalContext
+    environmental_context: EnvironmentalContext
     """Environmental context."""
     
     # Evaluation Metadata
@@ -687,37 +687,37 @@ class ValidationResult:
     Result of a single validation check.
     """
     
-    validator_name: str
-    """Name of the validator."""
-    
-    passed: bool
+    is_valid: bool
     """Whether validation passed."""
     
-    block_reason: Optional[BlockReason] = None
+    reason: Optional[BlockReason] = None
     """Reason if blocked."""
     
     severity: Optional[BlockSeverity] = None
     """Severity if blocked."""
     
-    details: Optional[str] = None
+    details: Dict[str, Any] = field(default_factory=dict)
     """Additional details."""
     
+    validator_name: str = ""
+    """Name of the validator."""
+    
     checked_at: datetime = field(default_factory=datetime.utcnow)
     """When check was performed."""
     
-    check_duration_ms: float = 0.0
+    validation_time_ms: float = 0.0
     """Duration of check in milliseconds."""
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
             "validator_name": self.validator_name,
-            "passed": self.passed,
-            "block_reason": self.block_reason.value if self.block_reason else None,
+            "is_valid": self.is_valid,
+            "reason": self.reason.value if self.reason else None,
             "severity": self.severity.value if self.severity else None,
             "details": self.details,
             "checked_at": self.checked_at.isoformat(),
-            "check_duration_ms": self.check_duration_ms,
+            "validation_time_ms": self.validation_time_ms,
         }
 
 
@@ -736,40 +736,47 @@ class GuardDecisionOutput:
     evaluation_id: str
     """Unique evaluation identifier."""
     
-    intent_id: str
-    """ID of the trade intent evaluated."""
+    trade_intent: Optional[TradeIntent] = None
+    """The trade intent evaluated."""
     
     # Block Details (if blocked)
-    block_reason: Optional[BlockReason] = None
+    reason: Optional[BlockReason] = None
     """Primary block reason if blocked."""
     
-    block_category: Optional[BlockCategory] = None
+    category: Optional[BlockCategory] = None
     """Category of block reason."""
     
     severity: Optional[BlockSeverity] = None
     """Severity level if blocked."""
     
-    block_details: Optional[str] = None
-    """Human-readable block details."""
+    details: Dict[str, Any] = field(default_factory=dict)
+    """Block details ("message" is the human-readable summary)."""
     
     # All Validation Results
     validation_results: List[ValidationResult] = field(default_factory=list)
     """Results of all validation checks."""
     
-    failed_validations: List[ValidationResult] = field(default_factory=list)
-    """Only the failed validations."""
-    
     # Timing
-    decision_timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=datetime.utcnow)
     """When decision was made."""
     
-    evaluation_duration_ms: float = 0.0
+    evaluation_time_ms: float = 0.0
     """Total evaluation duration."""
     
     # Metadata
     guard_version: str = "1.0.0"
     """Trade Guard version."""
     
+    @property
+    def intent_id(self) -> str:
+        """ID of the trade intent evaluated."""
+        return self.trade_intent.intent_id if self.trade_intent else "UNKNOWN"
+    
+    @property
+    def failed_validations(self) -> List[ValidationResult]:
+        """Only the failed validations."""
+        return [r for r in self.validation_results if not r.is_valid]
+    
     def is_blocked(self) -> bool:
         """Check if trade is blocked."""
         return self.decision == GuardDecision.BLOCK
@@ -785,7 +792,7 @@ class GuardDecisionOutput:
         else:
             return (
                 f"🛑 BLOCK | Intent: {self.intent_id} | "
-                f"Reason: {self.block_reason.value if self.block_reason else 'UNKNOWN'} | "
+                f"Reason: {self.reason.value if self.reason else 'UNKNOWN'} | "
                 f"Severity: {self.severity.name if self.severity else 'UNKNOWN'}"
             )
     
@@ -798,17 +805,18 @@ class GuardDecisionOutput:
             "🛑 *TRADE BLOCKED*",
             "",
             f"Intent: `{self.intent_id}`",
-            f"Reason: `{self.block_reason.value if self.block_reason else 'UNKNOWN'}`",
-            f"Category: {self.block_category.value if self.block_category else 'UNKNOWN'}",
+            f"Reason: `{self.reason.value if self.reason else 'UNKNOWN'}`",
+            f"Category: {self.category.value if self.category else 'UNKNOWN'}",
             f"Severity: {self.severity.name if self.severity else 'UNKNOWN'}",
         ]
         
-        if self.block_details:
-            lines.extend(["", f"Details: {self.block_details}"])
+        message = self.details.get("message") if self.details else None
+        if message:
+            lines.extend(["", f"Details: {message}"])
         
         lines.extend([
             "",
-            f"🕐 {self.decision_timestamp.strftime('%Y-%m-%d %H:%M:%S')} UTC",
+            f"🕐 {self.timestamp.strftime('%Y-%m-%d %H:%M:%S')} UTC",
         ])
         
         return "\n".join(lines)
@@ -819,14 +827,13 @@ class GuardDecisionOutput:
             "decision": self.decision.value,
             "evaluation_id": self.evaluation_id,
             "intent_id": self.intent_id,
-            "block_reason": self.block_reason.value if self.block_reason else None,
-            "block_category": self.block_category.value if self.block_category else None,
+            "reason": self.reason.value if self.reason else None,
+            "category": self.category.value if self.category else None,
             "severity": self.severity.value if self.severity else None,
-            "block_details": self.block_details,
+            "details": self.details,
             "validation_results": [v.to_dict() for v in self.validation_results],
-            "failed_validations": [v.to_dict() for v in self.failed_validations],
-            "decision_timestamp": self.decision_timestamp.isoformat(),
-            "evaluation_duration_ms": self.evaluation_duration_ms,
+            "timestamp": self.timestamp.isoformat(),
+            "evaluation_time_ms": self.evaluation_time_ms,
             "guard_version": self.guard_version,
         }
 